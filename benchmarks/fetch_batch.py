@@ -0,0 +1,121 @@
+"""
+Benchmark of batch fetchers against one request per identifier.
+
+Resolves UniProt accessions and PubChem CIDs through a `FetchEngine` whose client
+answers every request after a fixed latency, which stands in for the round trip
+to the database. Single-ID fetchers send one request per identifier, which
+PubChem additionally limits to five per second. Batch fetchers send one request
+per chunk of identifiers. Reports the time and the number of requests.
+
+Usage:
+    python benchmarks/fetch_batch.py [--identifiers 50] [--latency 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from pyenzyme.fetcher import (
+    FetchEngine,
+    fetch_pubchem_async,
+    fetch_pubchem_batch_async,
+    fetch_uniprot_async,
+    fetch_uniprot_batch_async,
+)
+
+
+def uniprot_entry(accession: str) -> dict:
+    return {
+        "primaryAccession": accession,
+        "uniProtkbId": f"{accession}_HUMAN",
+        "annotationScore": 5.0,
+        "proteinDescription": {
+            "recommendedName": {
+                "fullName": {"value": f"Protein {accession}"},
+                "ecNumbers": None,
+            }
+        },
+    }
+
+
+def pubchem_compound(cid: int) -> dict:
+    return {
+        "id": {"id": {"cid": cid}},
+        "props": [
+            {
+                "urn": {"label": "IUPAC Name", "name": "Preferred"},
+                "value": {"sval": f"compound {cid}"},
+            }
+        ],
+    }
+
+
+def create_client(latency: float) -> httpx.AsyncClient:
+    """Creates a client that answers UniProt and PubChem requests after the latency."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        path = request.url.path
+
+        if path.endswith("/accessions"):
+            accessions = request.url.params["accessions"].split(",")
+            return httpx.Response(
+                200, json={"results": [uniprot_entry(a) for a in accessions]}
+            )
+
+        if path.startswith("/uniprotkb/"):
+            return httpx.Response(200, json=uniprot_entry(path.split("/")[-1][:-5]))
+
+        cids = [int(cid) for cid in path.split("/")[-3].split(",")]
+        return httpx.Response(
+            200, json={"PC_Compounds": [pubchem_compound(cid) for cid in cids]}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def run(fetch, latency: float):
+    """Runs a fetch with a new engine and returns the time and the requests sent."""
+    async with create_client(latency) as client:
+        engine = FetchEngine(client=client)
+
+        start = time.perf_counter()
+        await fetch(engine)
+        elapsed = time.perf_counter() - start
+
+    return elapsed, engine.requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--identifiers", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    accessions = [f"P{10000 + i}" for i in range(args.identifiers)]
+    cids = [str(1000 + i) for i in range(args.identifiers)]
+
+    fetches = {
+        "uniprot single": lambda engine: asyncio.gather(
+            *(fetch_uniprot_async(a, engine) for a in accessions)
+        ),
+        "uniprot batch": lambda engine: fetch_uniprot_batch_async(accessions, engine),
+        "pubchem single": lambda engine: asyncio.gather(
+            *(fetch_pubchem_async(cid, engine) for cid in cids)
+        ),
+        "pubchem batch": lambda engine: fetch_pubchem_batch_async(cids, engine),
+    }
+
+    print(f"{args.identifiers} identifiers, {args.latency * 1e3:.0f} ms latency\n")
+
+    for name, fetch in fetches.items():
+        elapsed, requests = asyncio.run(run(fetch, args.latency))
+        print(f"  {name:<16} {elapsed:8.2f} s {requests:5d} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of resolving compose identifiers one after another against concurrently.
+
+Composes a document from ChEBI identifiers through a `FetchEngine` whose client
+answers every request after a fixed latency, which stands in for the round trip
+to the database. With `max_concurrency=1` the identifiers are resolved one after
+another, as the synchronous fetchers do, with higher values they are resolved
+concurrently. Every identifier is requested twice to show that identical
+requests are only sent once.
+
+Usage:
+    python benchmarks/fetch_engine.py [--identifiers 40] [--latency 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from pyenzyme.composer import compose_async
+from pyenzyme.fetcher import FetchEngine
+
+
+def create_client(latency: float) -> httpx.AsyncClient:
+    """Creates a client that answers ChEBI searches after the given latency."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        chebi_id = request.url.params["term"]
+        source = {
+            "chebi_accession": chebi_id,
+            "ascii_name": f"molecule {chebi_id.split(':')[-1]}",
+        }
+        return httpx.Response(
+            200,
+            json={"results": [{"_source": source}], "total": 1, "number_pages": 1},
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def compose(identifiers: list[str], latency: float, max_concurrency: int):
+    """Composes a document and returns the elapsed time and the requests sent."""
+    async with create_client(latency) as client:
+        engine = FetchEngine(
+            max_concurrency=max_concurrency, default_rate=None, client=client
+        )
+
+        start = time.perf_counter()
+        doc = await compose_async(
+            "benchmark", small_molecules=identifiers, engine=engine
+        )
+        elapsed = time.perf_counter() - start
+
+    assert len(doc.small_molecules) == len(set(identifiers))
+
+    return elapsed, engine.requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--identifiers", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    identifiers = [f"CHEBI:{15000 + i}" for i in range(args.identifiers)] * 2
+    print(
+        f"{len(identifiers)} identifiers ({args.identifiers} unique), "
+        f"{args.latency * 1e3:.0f} ms latency\n"
+    )
+
+    for max_concurrency in [1, 4, 8, 16]:
+        elapsed, requests = asyncio.run(
+            compose(identifiers, args.latency, max_concurrency)
+        )
+        print(
+            f"  max_concurrency={max_concurrency:<3} {elapsed:8.2f} s "
+            f"{requests:5d} requests"
+        )
+
+
+if __name__ == "__main__":
+    main()
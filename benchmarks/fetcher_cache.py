@@ -0,0 +1,90 @@
+"""
+Benchmark of fetcher cache lookups.
+
+Fills an on-disk `FetcherCache` with ChEBI entries and reports the time to store
+an entry and the time per cached lookup, which replaces a network round trip of
+typically 100 ms or more. For scale, the time to validate the same entry from
+raw JSON, which the fetchers do after every request, is reported as well. Also
+reports the hit rate of lookups with repeated identifiers under a size limit that
+keeps only a quarter of the entries.
+
+Usage:
+    python benchmarks/fetcher_cache.py [--entries 2000] [--lookups 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from pyenzyme.fetcher import FetcherCache
+from pyenzyme.fetcher.chebi import ChebiSearchResponse
+
+
+def create_response(i: int) -> str:
+    """Returns the raw JSON of a ChEBI search response."""
+    source = {
+        "chebi_accession": f"CHEBI:{i}",
+        "ascii_name": f"molecule {i}",
+        "smiles": "C" * 40,
+        "inchi": "InChI=1S/" + "C" * 80,
+        "inchikey": "XLYOFNOQVPJJNP-UHFFFAOYSA-N",
+        "definition": "A molecule. " * 20,
+        "formula": "C40H82",
+        "mass": 563.1,
+    }
+    return json.dumps({"results": [{"_source": source}], "total": 1, "number_pages": 1})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    responses = [create_response(i) for i in range(args.entries)]
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = FetcherCache(Path(directory) / "fetcher.sqlite")
+
+        start = time.perf_counter()
+        for i, response in enumerate(responses):
+            source = ChebiSearchResponse.model_validate_json(response).results[0]
+            cache.set("chebi", f"CHEBI:{i}", source.source)
+        fill = (time.perf_counter() - start) / args.entries
+
+        keys = [f"CHEBI:{rng.randrange(args.entries)}" for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        for key in keys:
+            cache.get("chebi", key)
+        lookup = (time.perf_counter() - start) / args.lookups
+
+        start = time.perf_counter()
+        for key in keys:
+            ChebiSearchResponse.model_validate_json(responses[int(key[6:])])
+        validate = (time.perf_counter() - start) / args.lookups
+
+        print(f"{args.entries} entries, {cache.size / 1024:.0f} KiB\n")
+        print(f"  parse and store     {fill * 1e6:8.1f} us")
+        print(f"  cached lookup       {lookup * 1e6:8.1f} us")
+        print(f"  validate raw JSON   {validate * 1e6:8.1f} us")
+
+        # Zipf-like lookups under a size limit of a quarter of the entries
+        limited = FetcherCache(
+            Path(directory) / "limited.sqlite", max_size=cache.size // 4
+        )
+        weights = [1 / (rank + 1) for rank in range(args.entries)]
+        for i in rng.choices(range(args.entries), weights, k=args.lookups):
+            limited.get_or_fetch("chebi", f"CHEBI:{i}", lambda: f"molecule {i}")
+
+        print(f"\n  hit rate at 25% capacity (Zipf lookups): {limited.hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark of `pyenzyme.tabular.from_dataframe` on a multi-measurement DataFrame.
+
+Compares splitting the DataFrame with the single-pass `split_by_id` against the
+previous approach, which filtered the DataFrame once per measurement ID.
+
+Usage:
+    python benchmarks/from_dataframe.py [--measurements 10000] [--points 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyenzyme.tabular import from_dataframe, split_by_id
+
+
+def create_dataframe(n_measurements: int, n_points: int) -> pd.DataFrame:
+    """Creates a DataFrame with synthetic measurements in long blocks."""
+    rng = np.random.default_rng(0)
+    n_rows = n_measurements * n_points
+
+    return pd.DataFrame(
+        {
+            "id": np.repeat([f"m{i}" for i in range(n_measurements)], n_points),
+            "time": np.tile(np.linspace(0.0, 100.0, n_points), n_measurements),
+            "s0": rng.random(n_rows),
+            "s1": rng.random(n_rows),
+        }
+    )
+
+
+def legacy_split(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """The previous approach, filtering the DataFrame once per ID."""
+    return {
+        id: df[df["id"] == id].drop(columns=["id"]).reset_index(drop=True)
+        for id in df["id"].unique()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--measurements", type=int, default=10000)
+    parser.add_argument("--points", type=int, default=20)
+    args = parser.parse_args()
+
+    df = create_dataframe(args.measurements, args.points)
+    print(f"{args.measurements} measurements, {len(df)} rows\n")
+
+    timings = {}
+    for name, func in [("legacy", legacy_split), ("split_by_id", split_by_id)]:
+        start = time.perf_counter()
+        func(df)
+        timings[name] = time.perf_counter() - start
+        print(f"  {name:<14} {timings[name] * 1000:10.1f} ms")
+
+    print(f"\n  speedup        {timings['legacy'] / timings['split_by_id']:10.1f}x")
+
+    start = time.perf_counter()
+    from_dataframe(df, data_unit="mmol / l", time_unit="s")
+    print(f"\n  from_dataframe {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of fitting initial rates against fitting full time courses.
+
+Simulates a screen of many wells with varying substrate concentrations on the
+modeling fixture and fits k_cat and K_M, once to the time courses with
+`ThinLayerScipy` and once to the initial rates with `ThinLayerInitialRates`.
+Time-course fits integrate the model for every well and residual evaluation,
+initial-rate fits evaluate the rate equation once per well.
+
+Usage:
+    python benchmarks/initial_rates.py [--wells 10000] [--timecourse-wells 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.initial_rates import ThinLayerInitialRates
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy
+from pyenzyme.versions import v2
+
+FIXTURE = "tests/fixtures/modeling/enzmldoc_reaction.json"
+TRUTH = {"k_cat": 0.85, "K_M": 82.0, "k_ie": 0.0012}
+START = {"k_cat": 0.5, "K_M": 50.0}
+
+# Standard deviation of the simulated readouts
+NOISE = 0.005
+
+
+def create_screen(n_wells: int, seed: int = 0) -> v2.EnzymeMLDocument:
+    """Simulates a screen of n_wells substrate concentrations with noisy readouts."""
+    doc = pe.read_enzymeml(FIXTURE)
+    doc.measurements = doc.measurements[:1]
+
+    simulator = ThinLayerScipy(doc)
+    simulator.set_start_values(TRUTH)
+
+    substrate = np.geomspace(5.0, 500.0, n_wells)
+    times = np.linspace(0.0, 300.0, 7)
+    results = simulator.integrate_batch(
+        simulator.enzmldoc,
+        [{"abts": float(s), "slac": 0.079} for s in substrate],
+        [times] * n_wells,
+    )
+
+    rng = np.random.default_rng(seed)
+    measurements = []
+
+    for i, (s0, (trajectories, _)) in enumerate(zip(substrate, results)):
+        abts = np.asarray(trajectories["abts"])
+        measurement = v2.Measurement(id=f"well{i}", name=f"well{i}")
+        measurement.add_to_species_data(
+            species_id="abts",
+            initial=float(s0),
+            time=times.tolist(),
+            data=(abts + NOISE * rng.standard_normal(abts.shape)).tolist(),
+        )
+        measurement.add_to_species_data(species_id="slac", initial=0.079)
+        measurements.append(measurement)
+
+    doc.measurements = measurements
+    for param in doc.parameters:
+        if param.symbol in START:
+            param.value = START[param.symbol]
+        else:
+            param.value = TRUTH[param.symbol]
+            param.fit = False
+
+    return doc
+
+
+def fit(layer) -> tuple[float, dict]:
+    """Fits a thin layer and returns the elapsed time and the fitted values."""
+    start = time.perf_counter()
+    result = layer.optimize()
+    return time.perf_counter() - start, result.params
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wells", type=int, default=10000)
+    parser.add_argument("--timecourse-wells", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"true values: {TRUTH}\n")
+
+    for n_wells, layers in [
+        (
+            args.timecourse_wells,
+            {
+                "time course": lambda doc: ThinLayerScipy(doc, batched=True),
+                "initial rates": lambda doc: ThinLayerInitialRates(
+                    doc, n_points=5, degree=2
+                ),
+            },
+        ),
+        (
+            args.wells,
+            {
+                "initial rates": lambda doc: ThinLayerInitialRates(
+                    doc, n_points=5, degree=2
+                )
+            },
+        ),
+    ]:
+        doc = create_screen(n_wells)
+        print(f"{n_wells} wells")
+
+        for name, create in layers.items():
+            layer = create(doc)
+            elapsed, params = fit(layer)
+            values = ", ".join(f"{k}={v:.4g}" for k, v in params.items())
+            print(f"  {name:<14} {elapsed * 1000:10.1f} ms   {values}")
+
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of the batched integration of `ThinLayerScipy`.
+
+Simulates a kinetic screen of many initial substrate concentrations on the
+modeling fixture, once condition by condition and once as a single stacked
+system via `integrate_batch`.
+
+Usage:
+    python benchmarks/integrate_batch.py [--conditions 500] [--method LSODA]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy
+
+FIXTURE = "tests/fixtures/modeling/enzmldoc_reaction.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--conditions", type=int, default=500)
+    parser.add_argument("--method", default="LSODA")
+    args = parser.parse_args()
+
+    layer = ThinLayerScipy(pe.read_enzymeml(FIXTURE), method=args.method)
+
+    initial_conditions = [
+        {"abts": float(abts), "slac": 0.079}
+        for abts in np.linspace(1.0, 150.0, args.conditions)
+    ]
+    times = [np.linspace(0.0, 15.0, 16) for _ in range(args.conditions)]
+
+    print(f"{args.conditions} conditions, {args.method}\n")
+
+    timings = {}
+
+    start = time.perf_counter()
+    for init, grid in zip(initial_conditions, times):
+        layer.integrate_batch(layer.enzmldoc, [init], [grid])
+    timings["sequential"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    layer.integrate_batch(layer.enzmldoc, initial_conditions, times)
+    timings["batched"] = time.perf_counter() - start
+
+    for name, timing in timings.items():
+        print(f"  {name:<12} {timing * 1000:10.1f} ms")
+
+    print(f"\n  speedup      {timings['sequential'] / timings['batched']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of lookups in a local ChEBI mirror.
+
+Imports a synthetic ChEBI SDF dump into a `LocalMirror` and reports the import
+time and the mean latency of lookups by ID and InChIKey, of exact name searches
+and of fuzzy searches for misspelled names, which no name contains.
+
+Usage:
+    python benchmarks/local_mirror.py [--entries 100000] [--lookups 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from pyenzyme.fetcher import LocalMirror
+
+SYLLABLES = ["eth", "an", "ol", "meth", "yl", "prop", "ox", "ide", "ac", "et", "ate"]
+
+
+def write_sdf(path: Path, n_entries: int) -> list:
+    """Writes a SDF dump with random names and returns the names by entry."""
+    rng = random.Random(0)
+    names = []
+
+    with open(path, "w") as handle:
+        for i in range(n_entries):
+            name = "".join(rng.choices(SYLLABLES, k=rng.randint(3, 6))) + str(i)
+            names.append(name)
+            handle.write(
+                f"\nM  END\n> <ChEBI ID>\nCHEBI:{i}\n\n> <ChEBI Name>\n{name}\n\n"
+                f"> <InChIKey>\nKEY{i:011d}-UHFFFAOYSA-N\n\n"
+                f"> <Synonyms>\n{name} synonym\n\n$$$$\n"
+            )
+
+    return names
+
+
+def measure(lookup, arguments: list) -> float:
+    """Returns the mean latency of a lookup in microseconds."""
+    start = time.perf_counter()
+    for argument in arguments:
+        lookup(argument)
+
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        names = write_sdf(Path(directory) / "chebi.sdf", args.entries)
+        mirror = LocalMirror(Path(directory) / "mirror.sqlite")
+
+        start = time.perf_counter()
+        mirror.import_chebi(Path(directory) / "chebi.sdf")
+        print(
+            f"Imported {args.entries} entries in {time.perf_counter() - start:.2f} s\n"
+        )
+
+        rng = random.Random(1)
+        ids = [rng.randrange(args.entries) for _ in range(args.lookups)]
+
+        lookups = {
+            "id": (mirror.get_chebi, [f"CHEBI:{i}" for i in ids]),
+            "inchikey": (
+                mirror.get_chebi_by_inchikey,
+                [f"KEY{i:011d}-UHFFFAOYSA-N" for i in ids],
+            ),
+            "exact name": (mirror.search_chebi, [names[i] for i in ids]),
+            "fuzzy name": (mirror.search_chebi, [names[i][:-1] + "x" for i in ids]),
+        }
+
+        for name, (lookup, arguments) in lookups.items():
+            print(f"  {name:<12} {measure(lookup, arguments):10.1f} us")
+
+        mirror.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of constructing thin layers with and without the model cache.
+
+Compares the construction time of `ThinLayerPysces` and `ThinLayerCopasi` when
+the model is compiled from scratch, loaded from the files of the on-disk cache,
+as in a fresh process, and copied from the in-memory cache.
+
+Usage:
+    python benchmarks/model_cache.py [--repeats 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import timeit
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.cache import ModelCache
+
+FIXTURE = "tests/fixtures/modeling/enzmldoc_reaction.json"
+
+
+def time_construction(cls, doc, model_dir: str, repeats: int) -> dict[str, float]:
+    """Returns the mean construction time in seconds per cache state."""
+    cache = ModelCache(directory=f"{model_dir}/cache")
+    cls(doc, model_dir, cache=cache)
+
+    def from_disk():
+        cache.clear()
+        cls(doc, model_dir, cache=cache)
+
+    timings = {
+        "compiled": timeit.timeit(
+            lambda: cls(doc, model_dir, cache=None), number=repeats
+        ),
+        "disk": timeit.timeit(from_disk, number=repeats),
+    }
+
+    # Refill the memory after the last disk run
+    cls(doc, model_dir, cache=cache)
+    timings["memory"] = timeit.timeit(
+        lambda: cls(doc, model_dir, cache=cache), number=repeats
+    )
+
+    return {name: timing / repeats for name, timing in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    doc = pe.read_enzymeml(FIXTURE)
+    layers = {}
+
+    try:
+        from pyenzyme.thinlayers.psyces import ThinLayerPysces
+
+        layers["pysces"] = ThinLayerPysces
+    except ModuleNotFoundError:
+        pass
+
+    try:
+        from pyenzyme.thinlayers.basico import ThinLayerCopasi
+
+        layers["copasi"] = ThinLayerCopasi
+    except ModuleNotFoundError:
+        pass
+
+    for name, cls in layers.items():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            timings = time_construction(cls, doc, tmp_dir, args.repeats)
+
+        print(f"{name}, {args.repeats} constructions\n")
+
+        for state, timing in timings.items():
+            print(f"  {state:<10} {timing * 1e3:10.1f} ms per construction")
+
+        print(f"\n  speedup    {timings['compiled'] / timings['memory']:10.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
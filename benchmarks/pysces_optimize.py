@@ -0,0 +1,87 @@
+"""
+Benchmark of `ThinLayerPysces.optimize` on the modeling fixture.
+
+Compares the persistent worker pool, in which each worker loads the PySCeS model
+once, against the previous approach, which started a `joblib.Parallel` per
+residual call and serialized the whole model for every condition.
+
+Usage:
+    python benchmarks/pysces_optimize.py [--repeats 3] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from joblib import Parallel, delayed
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.psyces import ThinLayerPysces
+
+FIXTURE = "tests/fixtures/modeling/enzmldoc_reaction.json"
+
+
+class LegacyThinLayerPysces(ThinLayerPysces):
+    """The previous implementation, spawning a joblib pool per residual call."""
+
+    def _simulate_experiment(self, parameters):
+        self.model.__dict__.update(parameters.valuesdict())
+
+        def simulate(init_map):
+            model = init_map.to_pysces_model(self.model)
+            model.Simulate(userinit=1)
+            return [getattr(model.sim, species) for species in model.species]
+
+        output = Parallel(n_jobs=-1)(
+            delayed(simulate)(init_conc) for init_conc in self.inits
+        )
+
+        return np.hstack(output)
+
+
+def measure(layer: ThinLayerPysces, repeats: int) -> tuple[float, int]:
+    """Returns the mean wall-clock time per optimization and the evaluations."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = layer.optimize()
+        timings.append(time.perf_counter() - start)
+
+    return float(np.mean(timings)), result.nfev
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    doc = pe.read_enzymeml(FIXTURE)
+    print(f"{len(doc.measurements)} measurements, {args.repeats} repeats\n")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        timings = {}
+        layers = [
+            ("legacy", LegacyThinLayerPysces(doc, tmp_dir)),
+            ("serial", ThinLayerPysces(doc, tmp_dir, n_workers=1)),
+            ("pool", ThinLayerPysces(doc, tmp_dir, n_workers=args.workers)),
+        ]
+
+        for name, layer in layers:
+            with layer:
+                timings[name], nfev = measure(layer, args.repeats)
+
+            print(
+                f"  {name:<8} {timings[name] * 1000:10.1f} ms per optimize()"
+                f"  ({nfev} evaluations)"
+            )
+
+    print(f"\n  speedup (serial) {timings['legacy'] / timings['serial']:8.1f}x")
+    print(f"  speedup (pool)   {timings['legacy'] / timings['pool']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
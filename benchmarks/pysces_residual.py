@@ -0,0 +1,83 @@
+"""
+Microbenchmark of the residual computation of `ThinLayerPysces`.
+
+Measures the per-call overhead of turning a simulation into residuals, excluding
+the simulation itself. The previous implementation built a DataFrame of the
+simulation on every call, dropped the unobserved columns and subtracted two
+aligned DataFrames. The current one indexes the simulated array with integer maps
+precomputed in `_get_experimental_data`.
+
+Usage:
+    python benchmarks/pysces_residual.py [--calls 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.psyces import ThinLayerPysces
+
+FIXTURE = "tests/fixtures/modeling/enzmldoc_reaction.json"
+
+
+def legacy_residual(
+    experimental_data: pd.DataFrame, species: list, simulated: np.ndarray
+) -> np.ndarray:
+    """The previous residual computation on pandas DataFrames."""
+    simulated_data = pd.DataFrame(simulated.T, columns=species)
+    simulated_data = simulated_data.drop(
+        simulated_data.columns.difference(experimental_data.columns), axis=1
+    )
+
+    return np.array(experimental_data - simulated_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=10000)
+    args = parser.parse_args()
+
+    doc = pe.read_enzymeml(FIXTURE)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with ThinLayerPysces(doc, tmp_dir, n_workers=1) as layer:
+            layer._get_experimental_data()
+            parameters = layer._initialize_parameters()
+
+            # Replay a single simulation to isolate the residual computation
+            simulated = layer._simulate_experiment(parameters)
+            layer._simulate_experiment = lambda _: simulated  # type: ignore
+
+            # The experimental DataFrame was built once per optimization before
+            experimental_data = layer.df.drop(columns=["id", "time"])
+            species = list(layer.model.species)  # type: ignore
+
+            timings = {
+                "dataframe": timeit.timeit(
+                    lambda: legacy_residual(experimental_data, species, simulated),
+                    number=args.calls,
+                ),
+                "array": timeit.timeit(
+                    lambda: layer._calculate_residual(parameters), number=args.calls
+                ),
+            }
+
+    print(
+        f"{simulated.shape[1]} time points, {experimental_data.shape[1]} observed "
+        f"species, {args.calls} calls\n"
+    )
+
+    for name, timing in timings.items():
+        print(f"  {name:<10} {timing / args.calls * 1e6:10.1f} µs per call")
+
+    print(f"\n  speedup    {timings['dataframe'] / timings['array']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
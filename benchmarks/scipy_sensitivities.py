@@ -0,0 +1,61 @@
+"""
+Benchmark of the residual Jacobian of `ThinLayerScipy.optimize`.
+
+Fits the modeling fixture with finite difference Jacobians and with the Jacobian
+obtained from the forward sensitivity equations. Finite differences simulate every
+measurement once more per fitted parameter and Jacobian evaluation, whereas the
+sensitivities are integrated alongside the model in a single simulation.
+
+Usage:
+    python benchmarks/scipy_sensitivities.py [--repeats 3] [--batched]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy
+
+FIXTURE = "tests/fixtures/modeling/enzmldoc_reaction.json"
+JACOBIANS = ["2-point", "3-point", "sensitivities"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--batched", action="store_true")
+    args = parser.parse_args()
+
+    doc = pe.read_enzymeml(FIXTURE)
+    n_params = sum(param.fit is not False for param in doc.parameters)
+
+    print(f"{len(doc.measurements)} measurements, {n_params} fitted parameters\n")
+    print(f"  {'jacobian':<14} {'time':>10} {'nfev':>6} {'njev':>6}   cost")
+
+    timings = {}
+    for jac in JACOBIANS:
+        # Compile outside of the timed region, it is shared by all fits
+        layer = ThinLayerScipy(doc, batched=args.batched)
+        layer.sensitivity_system
+        initial = dict(layer.values)
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            layer.values = dict(initial)
+            result = layer.optimize(jac=jac)
+        timings[jac] = (time.perf_counter() - start) / args.repeats
+
+        print(
+            f"  {jac:<14} {timings[jac] * 1000:8.1f} ms {result.nfev:6d} "
+            f"{result.njev:6d}   {result.cost:.6g}"
+        )
+
+    print(
+        f"\n  speedup over 2-point  {timings['2-point'] / timings['sensitivities']:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark of integrator settings across thin layers.
+
+Simulates every measurement of the modeling fixtures at its measurement time points
+with different `SolverSettings` and reports the time per simulation of all
+measurements, the largest relative deviation from a reference solution computed
+with tight tolerances, and the time of a full fit. Thin layers whose simulator is
+not installed, and settings a simulator does not support, are skipped.
+
+Usage:
+    python benchmarks/solver_settings.py [--repeats 10] [--no-fit]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+import pyenzyme as pe
+from pyenzyme.thinlayers import SolverSettings
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy
+from pyenzyme.versions import v2
+
+FIXTURES = [
+    "tests/fixtures/modeling/enzmldoc_reaction.json",
+    "tests/fixtures/modeling/enzmldoc.json",
+]
+
+REFERENCE = SolverSettings(method="Radau", rtol=1e-12, atol=1e-14)
+
+CONFIGURATIONS: Dict[str, Optional[SolverSettings]] = {
+    "default": None,
+    "LSODA": SolverSettings(method="LSODA"),
+    "LSODA tight": SolverSettings(method="LSODA", rtol=1e-10, atol=1e-12),
+    "LSODA max_step=10": SolverSettings(method="LSODA", max_step=10.0),
+    "BDF": SolverSettings(method="BDF"),
+    "Radau": SolverSettings(method="Radau"),
+    "CVODE": SolverSettings(method="CVODE"),
+}
+
+
+def thinlayers(model_dir: str) -> Dict[str, Callable]:
+    """Returns factories of the installed thin layers by name."""
+    layers: Dict[str, Callable] = {
+        "scipy": lambda doc, solver: ThinLayerScipy(doc, solver=solver),
+    }
+
+    try:
+        from pyenzyme.thinlayers.psyces import ThinLayerPysces
+
+        layers["pysces"] = lambda doc, solver: ThinLayerPysces(
+            doc, model_dir, n_workers=1, solver=solver
+        )
+    except ModuleNotFoundError:
+        pass
+
+    try:
+        from pyenzyme.thinlayers.basico import ThinLayerCopasi
+
+        layers["copasi"] = lambda doc, solver: ThinLayerCopasi(
+            doc, model_dir, solver=solver
+        )
+    except ModuleNotFoundError:
+        pass
+
+    return layers
+
+
+def simulate(layer, doc: v2.EnzymeMLDocument) -> List[np.ndarray]:
+    """Simulates the observed species of all measurements at their time points."""
+    simulated = []
+
+    for meas in doc.measurements:
+        observed = [data for data in meas.species_data if data.time]
+        times = observed[0].time
+        initial_conditions = {
+            data.species_id: data.initial
+            for data in meas.species_data
+            if data.initial is not None
+        }
+
+        trajectories, _ = layer.integrate(
+            layer.enzmldoc, initial_conditions, times[0], times[-1], times=times
+        )
+        simulated.append(np.array([trajectories[data.species_id] for data in observed]))
+
+    return simulated
+
+
+def max_deviation(simulated: List[np.ndarray], reference: List[np.ndarray]) -> float:
+    """Returns the largest relative deviation from the reference solution."""
+    return max(
+        float(np.max(np.abs(s - r) / np.maximum(np.abs(r), 1e-12)))
+        for s, r in zip(simulated, reference)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--no-fit", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        layers = thinlayers(model_dir)
+
+        for path in FIXTURES:
+            doc = pe.read_enzymeml(path)
+            reference = simulate(ThinLayerScipy(doc, solver=REFERENCE), doc)
+
+            print(f"{path}, {len(doc.measurements)} measurements\n")
+            print(
+                f"  {'thin layer':<8} {'settings':<18} {'simulate':>12} "
+                f"{'deviation':>10} {'fit':>10}"
+            )
+
+            for name, create in layers.items():
+                for label, solver in CONFIGURATIONS.items():
+                    try:
+                        layer = create(doc, solver)
+                    except ValueError:
+                        continue
+
+                    simulated = simulate(layer, doc)
+
+                    start = time.perf_counter()
+                    for _ in range(args.repeats):
+                        simulate(layer, doc)
+                    elapsed = (time.perf_counter() - start) / args.repeats
+
+                    fit = "-"
+                    if not args.no_fit:
+                        start = time.perf_counter()
+                        layer.optimize()
+                        fit = f"{(time.perf_counter() - start) * 1e3:.0f} ms"
+
+                    print(
+                        f"  {name:<8} {label:<18} {elapsed * 1e3:9.2f} ms "
+                        f"{max_deviation(simulated, reference):10.1e} {fit:>10}"
+                    )
+
+            print()
+
+
+if __name__ == "__main__":
+    main()
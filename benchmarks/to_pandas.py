@@ -0,0 +1,103 @@
+"""
+Benchmark of `pyenzyme.tabular.to_pandas` on a large synthetic document.
+
+Compares the single-pass columnar builder against the previous implementation,
+which created and concatenated one DataFrame per measurement.
+
+Usage:
+    python benchmarks/to_pandas.py [--measurements 5000] [--points 50] [--species 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import pyenzyme as pe
+from pyenzyme.tabular import to_pandas
+
+
+def create_document(
+    n_measurements: int,
+    n_points: int,
+    n_species: int,
+) -> pe.EnzymeMLDocument:
+    """Creates a document with synthetic time courses."""
+    rng = np.random.default_rng(0)
+    time = np.linspace(0.0, 100.0, n_points).tolist()
+    doc = pe.EnzymeMLDocument(name="Benchmark")
+
+    for i in range(n_measurements):
+        meas = doc.add_to_measurements(id=f"m{i}", name=f"Measurement {i}")
+        for j in range(n_species):
+            meas.add_to_species_data(
+                species_id=f"s{j}",
+                data=rng.random(n_points).tolist(),
+                time=time,
+                data_unit="mmol / l",
+                time_unit="s",
+            )
+
+    return doc
+
+
+def legacy_to_pandas(enzmldoc: pe.EnzymeMLDocument) -> pd.DataFrame:
+    """The previous implementation, building one DataFrame per measurement."""
+    dfs = []
+    for meas in enzmldoc.measurements:
+        times = pd.DataFrame(
+            {
+                species.species_id + "_time": species.time
+                for species in meas.species_data
+                if species.time
+            }
+        )
+        assert times.apply(lambda col: col.equals(times.iloc[:, 0])).all()
+
+        data = {"time": meas.species_data[0].time}
+        for species in meas.species_data:
+            if species.data:
+                data[species.species_id] = species.data
+
+        df = pd.DataFrame(data)
+        df["id"] = [meas.id] * len(df)
+        dfs.append(df)
+
+    return pd.concat(dfs, ignore_index=True).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--measurements", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=50)
+    parser.add_argument("--species", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    doc = create_document(args.measurements, args.points, args.species)
+
+    expected = legacy_to_pandas(doc)
+    result = to_pandas(doc)
+    assert result is not None
+    assert result.astype({"id": object}).equals(expected), "Results differ"
+
+    print(
+        f"{args.measurements} measurements, {args.species} species, "
+        f"{args.points} time points ({len(result)} rows)\n"
+    )
+
+    timings = {}
+    for name, func in [("legacy", legacy_to_pandas), ("columnar", to_pandas)]:
+        timings[name] = min(
+            timeit.repeat(lambda: func(doc), number=1, repeat=args.repeat)
+        )
+        print(f"  {name:<10} {timings[name] * 1000:10.1f} ms")
+
+    print(f"\n  speedup    {timings['legacy'] / timings['columnar']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from mdmodels.units.unit_definition import UnitDefinition, UnitType
 
-from .composer import compose
+from .composer import compose, compose_async
 from .fetcher import *  # noqa: F403
 from .plotting import plot, plot_interactive
 from .pretty import summary
@@ -16,11 +16,17 @@ from_csv = EnzymeMLHandler.from_csv
 from_dataframe = EnzymeMLHandler.from_dataframe
 from_excel = EnzymeMLHandler.from_excel
 from_sbml = EnzymeMLHandler.from_sbml
+iter_csv = EnzymeMLHandler.iter_csv
+iter_excel = EnzymeMLHandler.iter_excel
+iter_measurements = EnzymeMLHandler.iter_measurements
 read_enzymeml = EnzymeMLHandler.read_enzymeml
 read_enzymeml_from_string = EnzymeMLHandler.read_enzymeml_from_string
 
 # Output functions
 to_pandas = EnzymeMLHandler.to_pandas
+to_long_format = EnzymeMLHandler.to_long_format
+to_arrow = EnzymeMLHandler.to_arrow
+to_parquet = EnzymeMLHandler.to_parquet
 to_sbml = EnzymeMLHandler.to_sbml
 to_petab = EnzymeMLHandler.to_petab
 write_enzymeml = EnzymeMLHandler.write_enzymeml
@@ -34,11 +40,18 @@ __all__ = [
     "from_dataframe",
     "from_excel",
     "from_sbml",
+    "iter_csv",
+    "iter_excel",
+    "iter_measurements",
     "read_enzymeml",
     "to_pandas",
+    "to_long_format",
+    "to_arrow",
+    "to_parquet",
     "to_sbml",
     "write_enzymeml",
     "compose",
+    "compose_async",
     "plot",
     "plot_interactive",
     "summary",
@@ -0,0 +1,186 @@
+"""
+Apache Arrow and Parquet export of EnzymeML measurement data.
+
+The measurement data is exported in long format, with one row per data point, and
+is built directly from the measurement buffers without intermediate pandas frames.
+The identifier and unit columns are dictionary encoded. The resulting tables can be
+consumed by Arrow-native tools such as DuckDB, Polars or Spark, which may push
+predicates on e.g. `measurement_id` or `species_id` down into the Parquet reader.
+
+`pyarrow` is an optional dependency and can be installed via `pip install pyarrow`.
+
+Example:
+    >>> import pyenzyme as pe
+    >>> doc = pe.read_enzymeml("path/to/enzmldoc.json")
+    >>> table = pe.to_arrow(doc)
+    >>> pe.to_parquet(doc, "measurements.parquet")
+
+    >>> # Stream measurements from a large CSV file to disk
+    >>> from pyenzyme.arrow import stream_to_parquet
+    >>> stream_to_parquet(pe.iter_csv("data.tsv", "mmol / l", "s"), "data.parquet")
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from pyenzyme.tabular import _long_format_columns
+from pyenzyme.versions import v2
+
+SCHEMA_ORDER = (
+    "measurement_id",
+    "species_id",
+    "time",
+    "value",
+    "data_type",
+    "unit",
+    "time_unit",
+)
+
+
+def to_arrow(
+    enzmldoc: v2.EnzymeMLDocument,
+    ignore: list[str] | None = None,
+):
+    """Converts the measurement data of a document to a long-format Arrow table.
+
+    The table contains the columns `measurement_id`, `species_id`, `time`, `value`,
+    `data_type`, `unit` and `time_unit`. See `pyenzyme.tabular.to_long_format` for
+    a description of the columns.
+
+    Args:
+        enzmldoc (v2.EnzymeMLDocument): The document to convert.
+        ignore (list[str], optional): A list of measurement IDs to ignore.
+            Defaults to None.
+
+    Returns:
+        pyarrow.Table: The measurement data in long format.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the data and time arrays of a species differ in length.
+    """
+    return _build_table(enzmldoc.measurements, ignore, {"enzymeml:name": enzmldoc.name})
+
+
+def to_parquet(
+    enzmldoc: v2.EnzymeMLDocument,
+    path: Path | str,
+    ignore: list[str] | None = None,
+    **kwargs,
+) -> None:
+    """Writes the measurement data of a document to a long-format Parquet file.
+
+    Args:
+        enzmldoc (v2.EnzymeMLDocument): The document to convert.
+        path (Path | str): The path of the Parquet file.
+        ignore (list[str], optional): A list of measurement IDs to ignore.
+            Defaults to None.
+        **kwargs: Additional keyword arguments passed to `pyarrow.parquet.write_table`.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the data and time arrays of a species differ in length.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_table(to_arrow(enzmldoc, ignore), path, **kwargs)
+
+
+def stream_to_parquet(
+    measurements: Iterable[v2.Measurement],
+    path: Path | str,
+    row_group_size: int = 1_000_000,
+    **kwargs,
+) -> int:
+    """Writes measurements to a long-format Parquet file as they arrive.
+
+    The measurements are consumed one at a time and written as a row group once
+    `row_group_size` data points have been collected, hence an iterator such as
+    `pyenzyme.tabular.iter_csv` can be written to disk in bounded memory.
+
+    Args:
+        measurements (Iterable[v2.Measurement]): The measurements to write.
+        path (Path | str): The path of the Parquet file.
+        row_group_size (int): The number of data points to collect before a row
+            group is written. Defaults to 1000000.
+        **kwargs: Additional keyword arguments passed to `pyarrow.parquet.ParquetWriter`.
+
+    Returns:
+        int: The number of measurements written.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the data and time arrays of a species differ in length.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    writer, batch, n_points, n_measurements = None, [], 0, 0
+
+    def write_batch():
+        nonlocal writer
+
+        table = _build_table(batch)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema, **kwargs)
+
+        writer.write_table(table)
+
+    try:
+        for measurement in measurements:
+            batch.append(measurement)
+            n_measurements += 1
+            n_points += sum(len(m.data) for m in measurement.species_data)
+
+            if n_points >= row_group_size:
+                write_batch()
+                batch, n_points = [], 0
+
+        if batch or writer is None:
+            write_batch()
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return n_measurements
+
+
+def _build_table(
+    measurements: Iterable[v2.Measurement],
+    ignore: list[str] | None = None,
+    metadata: dict[str, str] | None = None,
+):
+    """Builds a long-format Arrow table from measurements."""
+    pa = _import_pyarrow()
+    numeric, categorical = _long_format_columns(measurements, ignore)
+
+    columns = {name: pa.array(values) for name, values in numeric.items()}
+    for name, (codes, categories) in categorical.items():
+        columns[name] = pa.DictionaryArray.from_arrays(
+            pa.array(codes, type=pa.int32(), mask=codes < 0),
+            pa.array(categories, type=pa.string()),
+        )
+
+    return pa.table(
+        [columns[name] for name in SCHEMA_ORDER],
+        names=list(SCHEMA_ORDER),
+        metadata=metadata,
+    )
+
+
+def _import_pyarrow():
+    """Imports the optional Arrow library."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            f"Arrow export requires 'pyarrow'. Install it via 'pip install pyarrow': {e}"
+        )
+
+    return pyarrow
+
+
+__all__ = ["to_arrow", "to_parquet", "stream_to_parquet"]
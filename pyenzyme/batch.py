@@ -0,0 +1,257 @@
+"""
+Batch conversion of OMEX archives into EnzymeML JSON documents.
+
+Converting a large collection of (legacy) OMEX archives one after another is bound by
+the SBML parser, which runs on a single core. `convert_directory` fans the conversion
+out over a pool of worker processes or threads. Every file is converted in isolation,
+hence a malformed archive is reported in its `ConversionResult` instead of aborting
+the whole batch.
+
+The conversion is also available as a console script:
+
+    pyenzyme-convert path/to/archives -o path/to/output --jobs 8
+
+Example:
+    >>> from pyenzyme.batch import convert_directory
+    >>> results = convert_directory("path/to/archives", "path/to/output")
+    >>> failed = [result for result in results if not result.ok]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Literal
+
+import rich
+from rich.progress import Progress
+
+from pyenzyme.sbml.parser import read_sbml
+from pyenzyme.versions import v2
+from pyenzyme.versions.io import EnzymeMLHandler
+
+EXECUTORS: dict[str, type[Executor]] = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+
+@dataclass
+class ConversionResult:
+    """The outcome of converting a single file.
+
+    Attributes:
+        source (Path): The converted OMEX archive.
+        target (Path | None): The written EnzymeML document, None if the conversion
+            failed.
+        error (str | None): A description of the error, None if the conversion
+            succeeded.
+    """
+
+    source: Path
+    target: Path | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the conversion succeeded."""
+        return self.error is None
+
+
+def convert_file(source: Path | str, target: Path | str) -> ConversionResult:
+    """Converts an OMEX archive into an EnzymeML JSON document.
+
+    Errors are not raised but returned as part of the result, hence this function can
+    safely be mapped over many files.
+
+    Args:
+        source (Path | str): The OMEX archive to convert.
+        target (Path | str): The path of the EnzymeML JSON document to write.
+
+    Returns:
+        ConversionResult: The outcome of the conversion.
+    """
+    source, target = Path(source), Path(target)
+
+    try:
+        enzmldoc = read_sbml(v2.EnzymeMLDocument, source)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = EnzymeMLHandler.write_enzymeml(enzmldoc)
+        target.write_text(data, encoding="utf-8")  # type: ignore
+    except Exception as e:
+        return ConversionResult(source=source, error=f"{type(e).__name__}: {e}")
+
+    return ConversionResult(source=source, target=target)
+
+
+def convert_directory(
+    source: Path | str,
+    out: Path | str | None = None,
+    pattern: str = "*.omex",
+    recursive: bool = False,
+    max_workers: int | None = None,
+    executor: Literal["process", "thread"] = "process",
+    progress: bool = True,
+) -> list[ConversionResult]:
+    """Converts all OMEX archives in a directory into EnzymeML JSON documents.
+
+    Each archive `name.omex` is written to `out/name.json`. When searching
+    recursively, the directory structure below `source` is mirrored in `out`.
+
+    Args:
+        source (Path | str): The directory containing the OMEX archives.
+        out (Path | str | None, optional): The output directory. Defaults to None,
+            which writes the documents next to the archives.
+        pattern (str, optional): The glob pattern of the archives. Defaults to "*.omex".
+        recursive (bool, optional): Whether to search subdirectories. Defaults to False.
+        max_workers (int | None, optional): The number of workers. Defaults to None,
+            which uses the number of CPUs. A value of 1 converts in the calling thread.
+        executor (Literal["process", "thread"], optional): Whether to use a process or
+            a thread pool. Defaults to "process".
+        progress (bool, optional): Whether to show a progress bar. Defaults to True.
+
+    Returns:
+        list[ConversionResult]: The results in the order of the sorted file paths.
+
+    Raises:
+        ValueError: If the source is not a directory or the executor is unknown.
+    """
+    source = Path(source)
+    out = Path(out) if out is not None else source
+
+    if not source.is_dir():
+        raise ValueError(f"The path '{source}' is not a directory.")
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unknown executor '{executor}'. Expected one of: {', '.join(EXECUTORS)}"
+        )
+
+    files = sorted(source.rglob(pattern) if recursive else source.glob(pattern))
+    jobs = [
+        (path, (out / path.relative_to(source)).with_suffix(".json"))
+        for path in files
+        if path.is_file()
+    ]
+
+    return _run(jobs, max_workers, EXECUTORS[executor], progress)
+
+
+def _run(
+    jobs: list[tuple[Path, Path]],
+    max_workers: int | None,
+    executor_cls: type[Executor],
+    progress: bool,
+) -> list[ConversionResult]:
+    """Runs the conversion jobs and reports their progress."""
+    results: dict[Path, ConversionResult] = {}
+
+    with Progress(disable=not progress, transient=True) as bar:
+        task = bar.add_task("Converting", total=len(jobs))
+
+        if max_workers == 1 or len(jobs) <= 1:
+            for source, target in jobs:
+                results[source] = convert_file(source, target)
+                bar.advance(task)
+        else:
+            with executor_cls(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(convert_file, source, target): source
+                    for source, target in jobs
+                }
+
+                for future in as_completed(futures):
+                    source = futures[future]
+
+                    try:
+                        results[source] = future.result()
+                    except Exception as e:
+                        # The worker itself failed, e.g. a crashed process
+                        results[source] = ConversionResult(
+                            source=source,
+                            error=f"{type(e).__name__}: {e}",
+                        )
+
+                    bar.advance(task)
+
+    return [results[source] for source, _ in jobs]
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    """Entry point of the `pyenzyme-convert` console script."""
+    parser = argparse.ArgumentParser(
+        prog="pyenzyme-convert",
+        description="Converts OMEX archives into EnzymeML JSON documents.",
+    )
+    parser.add_argument("source", type=Path, help="Directory with OMEX archives")
+    parser.add_argument(
+        "-o",
+        "--out",
+        type=Path,
+        default=None,
+        help="Output directory (default: next to the archives)",
+    )
+    parser.add_argument(
+        "-p",
+        "--pattern",
+        default="*.omex",
+        help="Glob pattern of the archives (default: *.omex)",
+    )
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="Search subdirectories",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of workers (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Use a thread pool instead of a process pool",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Do not show a progress bar",
+    )
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    results = convert_directory(
+        source=args.source,
+        out=args.out,
+        pattern=args.pattern,
+        recursive=args.recursive,
+        max_workers=args.jobs,
+        executor="thread" if args.threads else "process",
+        progress=not args.quiet,
+    )
+
+    failed = [result for result in results if not result.ok]
+
+    for result in failed:
+        rich.print(f"  [red]✗[/red] {result.source}: {result.error}")
+
+    rich.print(
+        f"\n  Converted [green][bold]{len(results) - len(failed)}[/bold][/green] "
+        f"of {len(results)} archives\n"
+    )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+"""
+Columnar, NumPy-backed representation of EnzymeML measurement data.
+
+The generated models in `pyenzyme.versions.v2` store `MeasurementData.data` and
+`MeasurementData.time` as `list[float]`, which pydantic validates element by element
+on construction and on every assignment. For large time courses this dominates memory
+and load time. The classes in this module are drop-in subclasses of the generated
+models that keep both fields as contiguous float64 NumPy buffers instead.
+
+The representation is opt-in and serializes to exactly the same JSON as the list-based
+models, hence documents can be written and read back by any EnzymeML consumer.
+
+Example:
+    >>> import pyenzyme as pe
+    >>> doc = pe.read_enzymeml("path/to/enzmldoc.json", columnar=True)
+    >>> doc.measurements[0].species_data[0].data
+    array([0. , 0.5, 1. ])
+
+    >>> # Convert an existing document
+    >>> from pyenzyme.columnar import to_columnar
+    >>> doc = to_columnar(doc)
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Optional, Sequence  # noqa: F401
+
+import numpy as np
+from mdmodels.units.annotation import UnitDefinitionAnnot  # noqa: F401
+from pydantic import Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+from pyenzyme.versions import v2
+from pyenzyme.versions.v2 import (  # noqa: F401
+    Complex,
+    Creator,
+    DataTypes,
+    Equation,
+    Parameter,
+    Protein,
+    Reaction,
+    SmallMolecule,
+    Vessel,
+)
+
+ARRAY_FIELDS = ("data", "time")
+
+
+def as_array(values: Sequence[float] | np.ndarray | None) -> np.ndarray:
+    """Returns the given values as a contiguous float64 NumPy array.
+
+    Arrays that already are contiguous float64 buffers are returned as-is without
+    copying, which makes this the preferred accessor for consumers that need to
+    handle both list-based and columnar measurement data.
+
+    Args:
+        values (Sequence[float] | np.ndarray | None): The values to convert.
+
+    Returns:
+        np.ndarray: A one-dimensional float64 array.
+    """
+    if values is None:
+        return np.empty(0, dtype=np.float64)
+
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _validate_array(values) -> np.ndarray:
+    """Validates a one-dimensional float64 buffer."""
+    array = as_array(values)
+
+    if array.ndim != 1:
+        raise ValueError(f"Expected a one-dimensional array, got {array.ndim} dims")
+
+    return array
+
+
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(_validate_array),
+    PlainSerializer(lambda array: array.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
+class ArrayMeasurementData(v2.MeasurementData):
+    """MeasurementData whose `data` and `time` are float64 NumPy buffers."""
+
+    data: FloatArray = Field(
+        default_factory=lambda: np.empty(0, dtype=np.float64),
+        description="""Data that was measured.""",
+    )
+    time: FloatArray = Field(
+        default_factory=lambda: np.empty(0, dtype=np.float64),
+        description="""Corresponding time points of the .""",
+    )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, v2.MeasurementData):
+            return NotImplemented
+
+        others = set(self.__class__.model_fields) - set(ARRAY_FIELDS)
+
+        return all(
+            getattr(self, name) == getattr(other, name, None) for name in others
+        ) and all(
+            np.array_equal(getattr(self, name), as_array(getattr(other, name)))
+            for name in ARRAY_FIELDS
+        )
+
+
+class ArrayMeasurement(v2.Measurement):
+    """Measurement that holds ArrayMeasurementData objects."""
+
+    species_data: list[ArrayMeasurementData] = Field(
+        default_factory=list,
+        description="""Measurement data of all species that were part
+        of the measurement. A species refers to a
+        Protein, Complex, or SmallMolecule.""",
+    )
+
+    def add_to_species_data(self, *args, **kwargs):
+        super().add_to_species_data(*args, **kwargs)
+        self.species_data[-1] = _convert(self.species_data[-1], ArrayMeasurementData)
+
+        return self.species_data[-1]
+
+    def pack(self) -> None:
+        """Packs the species data into a single contiguous buffer.
+
+        All species with the same number of data points share one two-dimensional
+        float64 buffer, of which each `MeasurementData.data` is a row view. Identical
+        time arrays are stored once and shared between species.
+        """
+        with_data = [m for m in self.species_data if len(m.data) > 0]
+
+        if not with_data or len({len(m.data) for m in with_data}) > 1:
+            return
+
+        buffer = np.vstack([meas_data.data for meas_data in with_data])
+        shared_time = with_data[0].time
+
+        for row, meas_data in zip(buffer, with_data):
+            meas_data.data = row
+
+            if np.array_equal(meas_data.time, shared_time):
+                meas_data.time = shared_time
+
+
+class ArrayEnzymeMLDocument(v2.EnzymeMLDocument):
+    """EnzymeMLDocument whose measurements are backed by NumPy buffers."""
+
+    measurements: list[ArrayMeasurement] = Field(
+        default_factory=list,
+        description="""Contains descriptions of all measurements that
+        are part of the experiment.""",
+    )
+
+    def add_to_measurements(self, *args, **kwargs):
+        super().add_to_measurements(*args, **kwargs)
+        self.measurements[-1] = _convert(self.measurements[-1], ArrayMeasurement)
+
+        return self.measurements[-1]
+
+
+def to_columnar(enzmldoc: v2.EnzymeMLDocument) -> ArrayEnzymeMLDocument:
+    """Converts an EnzymeMLDocument into its NumPy-backed counterpart.
+
+    The measurement data of every measurement is packed into a contiguous buffer,
+    see `ArrayMeasurement.pack`. The input document is not modified.
+
+    Args:
+        enzmldoc (v2.EnzymeMLDocument): The document to convert.
+
+    Returns:
+        ArrayEnzymeMLDocument: The converted document.
+    """
+    if isinstance(enzmldoc, ArrayEnzymeMLDocument):
+        return enzmldoc
+
+    columnar = _convert(enzmldoc, ArrayEnzymeMLDocument)
+
+    for measurement in columnar.measurements:
+        measurement.pack()
+
+    return columnar
+
+
+def is_columnar(enzmldoc: v2.EnzymeMLDocument) -> bool:
+    """Checks whether a document is backed by NumPy buffers."""
+    return isinstance(enzmldoc, ArrayEnzymeMLDocument)
+
+
+def _convert(obj, cls):
+    """Re-validates a model instance as one of the columnar classes."""
+    if isinstance(obj, cls):
+        return obj
+
+    return cls.model_validate(obj.model_dump())
+
+
+ArrayMeasurementData.model_rebuild()
+ArrayMeasurement.model_rebuild()
+ArrayEnzymeMLDocument.model_rebuild()
+
+__all__ = [
+    "ArrayEnzymeMLDocument",
+    "ArrayMeasurement",
+    "ArrayMeasurementData",
+    "FloatArray",
+    "as_array",
+    "is_columnar",
+    "to_columnar",
+]
@@ -1,28 +1,31 @@
+import asyncio
 import re
-from typing import List, Optional, Tuple, Callable, Any
+from typing import Awaitable, Dict, List, Optional, Callable, Any
 
 from rich.console import Console
 
-from pyenzyme.fetcher.chebi import fetch_chebi
-from pyenzyme.fetcher.pdb import fetch_pdb
-from pyenzyme.fetcher.pubchem import fetch_pubchem
-from pyenzyme.fetcher.rhea import fetch_rhea
-from pyenzyme.fetcher.uniprot import fetch_uniprot
+from pyenzyme.fetcher.chebi import fetch_chebi_async
+from pyenzyme.fetcher.engine import FetchEngine, run_sync
+from pyenzyme.fetcher.pdb import fetch_pdb_async
+from pyenzyme.fetcher.pubchem import fetch_pubchem_async
+from pyenzyme.fetcher.rhea import fetch_rhea_async
+from pyenzyme.fetcher.uniprot import fetch_uniprot_async
 from pyenzyme.versions import v2
 
-PROTEIN_FETCHERS = [
-    fetch_uniprot,
-    fetch_pdb,
-]
+# Fetchers by database, in the order of the fallback chain for ambiguous identifiers
+PROTEIN_FETCHERS = {
+    "uniprot": fetch_uniprot_async,
+    "pdb": fetch_pdb_async,
+}
 
-SMALL_MOLECULE_FETCHERS = [
-    fetch_pubchem,
-    fetch_chebi,
-]
+SMALL_MOLECULE_FETCHERS = {
+    "pubchem": fetch_pubchem_async,
+    "chebi": fetch_chebi_async,
+}
 
-REACTION_FETCHERS = [
-    fetch_rhea,
-]
+REACTION_FETCHERS = {
+    "rhea": fetch_rhea_async,
+}
 
 console = Console()
 
@@ -38,6 +41,9 @@ def compose(
     """
     Compose an EnzymeML document from proteins, small molecules, and reactions.
 
+    All identifiers are resolved concurrently through a single fetch engine, see
+    `compose_async`.
+
     Args:
         name: Name of the EnzymeML document
         proteins: List of protein identifiers to fetch
@@ -47,43 +53,101 @@ def compose(
 
     Returns:
         A complete EnzymeML document with fetched entities
-    """
 
-    proteins = proteins or []
-    small_molecules = small_molecules or []
-    reactions = reactions or []
+    Raises:
+        ValueError: If no fetcher can handle one of the identifiers
+    """
 
-    protein_objects = []
-    small_molecule_objects = []
-    reaction_objects = []
-    small_molecule_reaction_objects = []
+    with console.status("[bold cyan]Fetching entities..."):
+        doc = run_sync(
+            compose_async(
+                name=name,
+                proteins=proteins,
+                small_molecules=small_molecules,
+                reactions=reactions,
+                vessel=vessel,
+                id_mapping=id_mapping,
+            )
+        )
 
-    # Fetch proteins
     if proteins:
-        with console.status("[bold cyan]Fetching proteins...") as status:
-            protein_objects = [_fetch_protein(p) for p in proteins]
-            status.update("[bold cyan]Proteins fetched successfully")
         console.print("[bold green]Proteins fetched successfully")
-
-    # Fetch small molecules
     if small_molecules:
-        with console.status("[bold cyan]Fetching small molecules...") as status:
-            small_molecule_objects = [
-                _fetch_small_molecule(sm) for sm in small_molecules
-            ]
-            status.update("[bold cyan]Small molecules fetched successfully")
         console.print("[bold green]Small molecules fetched successfully")
-
-    # Fetch reactions
     if reactions:
-        with console.status("[bold cyan]Fetching reactions...") as status:
-            for r in reactions:
-                reaction, smallmols = _fetch_reaction(r)
-                reaction_objects.append(reaction)
-                small_molecule_reaction_objects.extend(smallmols)
-            status.update("[bold cyan]Reactions fetched successfully")
         console.print("[bold green]Reactions fetched successfully")
 
+    return doc
+
+
+async def compose_async(
+    name: str,
+    proteins: Optional[list[str]] = None,
+    small_molecules: Optional[list[str]] = None,
+    reactions: Optional[list[str]] = None,
+    vessel: Optional[v2.Vessel] = None,
+    id_mapping: Optional[dict[str, str]] = None,
+    engine: Optional[FetchEngine] = None,
+) -> v2.EnzymeMLDocument:
+    """
+    Compose an EnzymeML document from proteins, small molecules, and reactions.
+
+    Proteins, small molecules and reactions, including the participants of the
+    reactions, are fetched concurrently through one pooled connection. Identical
+    requests, such as a ChEBI entry that takes part in several reactions, are
+    sent only once.
+
+    Identifiers with a database prefix or accession format are fetched from that
+    database only, see `IdentifierResolver`. Ambiguous identifiers, such as bare
+    numbers, are tried with every fetcher of their entity type in turn. The
+    routing counts are kept on the resolver of the engine, `engine.resolver`.
+
+    Args:
+        name: Name of the EnzymeML document
+        proteins: List of protein identifiers to fetch
+        small_molecules: List of small molecule identifiers to fetch
+        reactions: List of reaction identifiers to fetch
+        vessel: Optional vessel to associate with the entities
+        engine: Optional fetch engine to send the requests with. Defaults to a
+            new engine that is closed afterwards.
+
+    Returns:
+        A complete EnzymeML document with fetched entities
+
+    Raises:
+        ValueError: If no fetcher can handle one of the identifiers
+    """
+
+    proteins = proteins or []
+    small_molecules = small_molecules or []
+    reactions = reactions or []
+
+    if engine is None:
+        async with FetchEngine() as engine:
+            return await compose_async(
+                name, proteins, small_molecules, reactions, vessel, id_mapping, engine
+            )
+
+    protein_objects, small_molecule_objects, reaction_results = await asyncio.gather(
+        _gather_in_order(
+            _fetch_with_fetchers(p, PROTEIN_FETCHERS, "protein", engine)
+            for p in proteins
+        ),
+        _gather_in_order(
+            _fetch_with_fetchers(sm, SMALL_MOLECULE_FETCHERS, "small molecule", engine)
+            for sm in small_molecules
+        ),
+        _gather_in_order(
+            _fetch_with_fetchers(r, REACTION_FETCHERS, "reaction", engine)
+            for r in reactions
+        ),
+    )
+
+    reaction_objects = [reaction for reaction, _ in reaction_results]
+    small_molecule_reaction_objects = [
+        smallmol for _, smallmols in reaction_results for smallmol in smallmols
+    ]
+
     # Merge small molecules from reactions with explicitly provided ones
     small_molecule_objects.extend(small_molecule_reaction_objects)
 
@@ -130,84 +194,74 @@ def compose(
     )
 
 
-def _fetch_protein(protein_id: str) -> v2.Protein:
+async def _fetch_with_fetchers(
+    entity_id: str,
+    fetchers: Dict[str, Callable[..., Awaitable[Any]]],
+    entity_type: str,
+    engine: FetchEngine,
+) -> Any:
     """
-    Fetch protein information using available fetchers.
+    Fetch an entity with the fetcher of its database, or try multiple fetchers.
 
     Args:
-        protein_id: Identifier for the protein to fetch
+        entity_id: Identifier for the entity to fetch
+        fetchers: Asynchronous fetcher functions by database, in the order to try
+            them for ambiguous identifiers
+        entity_type: Type of entity being fetched (for error message)
+        engine: The engine that sends the requests
 
     Returns:
-        Protein object with fetched data
+        Fetched entity data
 
     Raises:
-        ValueError: If no fetcher can handle the given protein ID
-    """
-    return _fetch_with_fetchers(protein_id, PROTEIN_FETCHERS, "protein")
-
-
-def _fetch_small_molecule(small_molecule_id: str) -> v2.SmallMolecule:
+        ValueError: If no fetcher can handle the given entity ID
     """
-    Fetch small molecule information using available fetchers.
+    resolution = engine.resolver.route(entity_id, list(fetchers))
+
+    if resolution.database is None:
+        candidates = list(fetchers.values())
+    else:
+        candidates = [
+            fetcher
+            for database, fetcher in fetchers.items()
+            if database == resolution.database
+        ]
+
+    error = None
+    for fetcher in candidates:
+        try:
+            return await fetcher(resolution.identifier, engine)
+        except Exception as e:
+            error = e
+            continue
 
-    Args:
-        small_molecule_id: Identifier for the small molecule to fetch
+    fetcher_names = ", ".join(f.__name__ for f in fetchers.values())
+    raise ValueError(
+        f"No {entity_type} fetcher found for {entity_id}. "
+        f"Supported fetchers: {fetcher_names}"
+    ) from error
 
-    Returns:
-        SmallMolecule object with fetched data
 
-    Raises:
-        ValueError: If no fetcher can handle the given small molecule ID
+async def _gather_in_order(awaitables) -> List[Any]:
     """
-    return _fetch_with_fetchers(
-        small_molecule_id, SMALL_MOLECULE_FETCHERS, "small molecule"
-    )
+    Await all awaitables concurrently and return their results in order.
 
-
-def _fetch_reaction(reaction_id: str) -> Tuple[v2.Reaction, List[v2.SmallMolecule]]:
-    """
-    Fetch reaction information using available fetchers.
+    Unlike a plain `asyncio.gather`, all awaitables run to completion before
+    the error of the first failed one, in input order, is raised.
 
     Args:
-        reaction_id: Identifier for the reaction to fetch
+        awaitables: The awaitables to run
 
     Returns:
-        Tuple containing the Reaction object and a list of associated SmallMolecule objects
-
-    Raises:
-        ValueError: If no fetcher can handle the given reaction ID
-    """
-    return _fetch_with_fetchers(reaction_id, REACTION_FETCHERS, "reaction")
-
-
-def _fetch_with_fetchers(
-    entity_id: str, fetchers: List[Callable], entity_type: str
-) -> Any:
+        The results in the order of the awaitables
     """
-    Generic function to attempt fetching with multiple fetchers.
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
 
-    Args:
-        entity_id: Identifier for the entity to fetch
-        fetchers: List of fetcher functions to try
-        entity_type: Type of entity being fetched (for error message)
-
-    Returns:
-        Fetched entity data
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
-    Raises:
-        ValueError: If no fetcher can handle the given entity ID
-    """
-    for fetcher in fetchers:
-        try:
-            return fetcher(entity_id)
-        except Exception:
-            continue
-
-    fetcher_names = ", ".join(f.__name__ for f in fetchers)
-    raise ValueError(
-        f"No {entity_type} fetcher found for {entity_id}. "
-        f"Supported fetchers: {fetcher_names}"
-    )
+    return list(results)
 
 
 def _remove_duplicates(objects: List[Any]) -> List[Any]:
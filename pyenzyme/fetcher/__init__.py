@@ -1,13 +1,51 @@
-from .chebi import fetch_chebi
-from .pdb import fetch_pdb
-from .pubchem import fetch_pubchem
-from .uniprot import fetch_uniprot
-from .rhea import fetch_rhea
+from .cache import FetcherCache, get_fetcher_cache, set_fetcher_cache
+from .chebi import (
+    fetch_chebi,
+    fetch_chebi_async,
+    fetch_chebi_batch,
+    fetch_chebi_batch_async,
+)
+from .engine import FetchEngine
+from .mirror import LocalMirror, get_local_mirror, set_local_mirror
+from .pdb import fetch_pdb, fetch_pdb_async
+from .pubchem import (
+    fetch_pubchem,
+    fetch_pubchem_async,
+    fetch_pubchem_batch,
+    fetch_pubchem_batch_async,
+)
+from .resolver import IdentifierResolver
+from .uniprot import (
+    fetch_uniprot,
+    fetch_uniprot_async,
+    fetch_uniprot_batch,
+    fetch_uniprot_batch_async,
+)
+from .rhea import fetch_rhea, fetch_rhea_async
 
 __all__ = [
+    "FetchEngine",
+    "FetcherCache",
+    "IdentifierResolver",
+    "LocalMirror",
+    "get_fetcher_cache",
+    "set_fetcher_cache",
+    "get_local_mirror",
+    "set_local_mirror",
     "fetch_chebi",
+    "fetch_chebi_async",
+    "fetch_chebi_batch",
+    "fetch_chebi_batch_async",
     "fetch_pdb",
+    "fetch_pdb_async",
     "fetch_pubchem",
+    "fetch_pubchem_async",
+    "fetch_pubchem_batch",
+    "fetch_pubchem_batch_async",
     "fetch_uniprot",
+    "fetch_uniprot_async",
+    "fetch_uniprot_batch",
+    "fetch_uniprot_batch_async",
     "fetch_rhea",
+    "fetch_rhea_async",
 ]
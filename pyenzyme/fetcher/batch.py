@@ -0,0 +1,124 @@
+"""
+Batch resolution of identifiers through multi-ID endpoints.
+
+UniProt, PubChem and ChEBI accept many identifiers per request. `fetch_batch`
+resolves a list of identifiers with a handful of such requests instead of one
+request per identifier:
+
+1. Identifiers are normalized and deduplicated, and entries in the fetcher cache
+   are taken from there.
+2. The remaining identifiers are split into chunks sized for the service, which
+   are sent concurrently through a `FetchEngine`.
+3. Identifiers that are missing from the response of their chunk, or whose chunk
+   failed as a whole, are fetched one by one. This yields the same entries and
+   errors as the single-ID fetchers, e.g. for a malformed accession that makes
+   UniProt reject the entire chunk.
+
+Results are returned in input order, with the error of every identifier that
+could not be resolved in its place.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar, Union
+
+from pyenzyme.fetcher.cache import get_fetcher_cache
+
+T = TypeVar("T")
+
+
+async def fetch_batch(
+    ids: List[str],
+    source: str,
+    normalize: Callable[[str], str],
+    fetch_chunk: Callable[[List[str]], Awaitable[Dict[str, T]]],
+    fetch_one: Callable[[str], Awaitable[T]],
+    chunk_size: int,
+) -> List[Union[T, Exception]]:
+    """
+    Resolves identifiers in chunks and returns the entries in input order.
+
+    Args:
+        ids (List[str]): The identifiers to resolve.
+        source (str): The database of the entries in the fetcher cache.
+        normalize (Callable[[str], str]): Normalizes an identifier. Errors are
+            returned in place of the entry.
+        fetch_chunk (Callable[[List[str]], Awaitable[Dict[str, T]]]): Fetches a
+            chunk of normalized identifiers and returns the entries by identifier.
+        fetch_one (Callable[[str], Awaitable[T]]): Fetches a single normalized
+            identifier.
+        chunk_size (int): The maximum number of identifiers per chunk.
+
+    Returns:
+        List[Union[T, Exception]]: The entry or the error of every identifier.
+    """
+    keys: List[Union[str, Exception]] = []
+
+    for entity_id in ids:
+        try:
+            keys.append(normalize(entity_id))
+        except Exception as e:
+            keys.append(e)
+
+    cache = get_fetcher_cache()
+    entries: Dict[str, Union[T, Exception]] = {}
+    pending: List[str] = []
+
+    for key in dict.fromkeys(k for k in keys if isinstance(k, str)):
+        entry = cache.get(source, key) if cache is not None else None
+
+        if entry is not None:
+            entries[key] = entry
+        elif cache is not None and cache.offline:
+            entries[key] = ConnectionError(
+                f"{source} entry '{key}' is not cached and the fetcher cache is offline"
+            )
+        else:
+            pending.append(key)
+
+    chunks = [pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    responses = await asyncio.gather(
+        *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    missing: List[str] = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, BaseException):
+            missing.extend(chunk)
+            continue
+
+        for key in chunk:
+            if key in response:
+                entries[key] = response[key]
+            else:
+                missing.append(key)
+
+    singles = await asyncio.gather(
+        *(fetch_one(key) for key in missing), return_exceptions=True
+    )
+    entries.update(zip(missing, singles))
+
+    if cache is not None:
+        for key in pending:
+            if not isinstance(entries[key], BaseException):
+                cache.set(source, key, entries[key])
+
+    return [entries[key] if isinstance(key, str) else key for key in keys]
+
+
+def raise_first(results: List[Union[Any, Exception]]) -> List[Any]:
+    """
+    Raises the first error of a batch, in input order.
+
+    Args:
+        results (List[Union[Any, Exception]]): The results of a batch.
+
+    Returns:
+        List[Any]: The results, if none of them is an error.
+    """
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return results
@@ -0,0 +1,356 @@
+"""
+Persistent on-disk cache shared by all database fetchers.
+
+Fetchers resolve the same identifiers over and over, across sessions and
+pipelines. `FetcherCache` stores the parsed response models of the databases,
+such as `UniProtEntry` or `ChebiSearchSource`, in a SQLite file keyed by the
+database and the normalized identifier. Entries are pickled, hence a cache hit
+returns the model without validating the raw JSON again.
+
+- Entries older than `ttl` seconds are fetched again.
+- If the stored entries exceed `max_size` bytes, the least recently used ones
+  are evicted.
+- In offline mode, cached entries are served regardless of their age and
+  identifiers that are not cached raise a ConnectionError instead of sending a
+  request.
+
+The cache is disabled by default and enabled for all fetchers with
+`set_fetcher_cache`:
+
+Example:
+    >>> from pyenzyme.fetcher import FetcherCache, fetch_chebi, set_fetcher_cache
+    >>> cache = set_fetcher_cache(FetcherCache("fetcher.sqlite"))
+    >>> water = fetch_chebi("CHEBI:15377")  # Sends a request
+    >>> water = fetch_chebi("CHEBI:15377")  # Served from the cache
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+Only use cache files you created yourself, since entries are unpickled when read.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 30 * 24 * 3600.0
+DEFAULT_MAX_SIZE = 256 * 1024**2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (source, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def default_cache_path() -> Path:
+    """Returns the default location of the cache file in the user cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pyenzyme" / "fetcher.sqlite"
+
+
+class FetcherCache:
+    """
+    SQLite cache of parsed database entries.
+
+    Attributes:
+        path (str): The path of the SQLite file, or ":memory:".
+        ttl (Optional[float]): Seconds after which an entry is fetched again. None
+            keeps entries until they are evicted.
+        max_size (Optional[int]): The maximum size of all entries in bytes. None
+            does not evict entries.
+        offline (bool): Whether to serve from the cache only.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that were not cached or expired.
+    """
+
+    path: str
+    ttl: Optional[float]
+    max_size: Optional[int]
+    offline: bool
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        ttl: Optional[float] = DEFAULT_TTL,
+        max_size: Optional[int] = DEFAULT_MAX_SIZE,
+        offline: bool = False,
+    ):
+        """
+        Initialize the FetcherCache instance.
+
+        Args:
+            path (Union[str, Path, None]): The path of the SQLite file. Defaults to
+                None, which uses `default_cache_path()`. ":memory:" keeps the cache
+                in memory.
+            ttl (Optional[float]): Seconds after which an entry is fetched again.
+                Defaults to 30 days.
+            max_size (Optional[int]): The maximum size of all entries in bytes.
+                Defaults to 256 MiB.
+            offline (bool): Whether to serve from the cache only. Defaults to False.
+
+        Raises:
+            ValueError: If the TTL or the maximum size is not positive.
+        """
+        if ttl is not None and not ttl > 0:
+            raise ValueError(f"The TTL must be positive, got {ttl}")
+
+        if max_size is not None and not max_size > 0:
+            raise ValueError(f"The maximum size must be positive, got {max_size}")
+
+        if path is None:
+            path = default_cache_path()
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+
+        # Fetchers may run in another thread, e.g. compose in Jupyter
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+        # The cache can be rebuilt, hence durability is traded for fast commits
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = OFF")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+
+        return count
+
+    @property
+    def size(self) -> int:
+        """The size of all entries in bytes."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, source: str, key: str) -> Optional[Any]:
+        """
+        Returns a cached entry and marks it as recently used.
+
+        Args:
+            source (str): The database of the entry, e.g. "chebi".
+            key (str): The normalized identifier of the entry.
+
+        Returns:
+            Optional[Any]: The cached entry, or None if it is not cached or expired.
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created FROM entries WHERE source = ? AND key = ?",
+                (source, key),
+            ).fetchone()
+
+            if row is None or (not self.offline and self._expired(row[1], now)):
+                self.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET accessed = ? WHERE source = ? AND key = ?",
+                (now, source, key),
+            )
+            self._connection.commit()
+            self.hits += 1
+
+        return pickle.loads(row[0])
+
+    def set(self, source: str, key: str, value: Any):
+        """
+        Stores an entry and evicts the least recently used ones beyond `max_size`.
+
+        Args:
+            source (str): The database of the entry, e.g. "chebi".
+            key (str): The normalized identifier of the entry.
+            value (Any): The parsed entry.
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (source, key, blob, len(blob), now, now),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def get_or_fetch(self, source: str, key: str, fetch: Callable[[], T]) -> T:
+        """
+        Returns a cached entry, or fetches and stores it.
+
+        Args:
+            source (str): The database of the entry, e.g. "chebi".
+            key (str): The normalized identifier of the entry.
+            fetch (Callable[[], T]): Fetches and parses the entry.
+
+        Returns:
+            T: The cached or fetched entry.
+
+        Raises:
+            ConnectionError: If the entry is not cached in offline mode.
+        """
+        value = self.get(source, key)
+
+        if value is None:
+            self._check_online(source, key)
+            value = fetch()
+            self.set(source, key, value)
+
+        return value
+
+    async def get_or_fetch_async(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Returns a cached entry, or fetches and stores it asynchronously.
+
+        Args:
+            source (str): The database of the entry, e.g. "chebi".
+            key (str): The normalized identifier of the entry.
+            fetch (Callable[[], Awaitable[T]]): Fetches and parses the entry.
+
+        Returns:
+            T: The cached or fetched entry.
+
+        Raises:
+            ConnectionError: If the entry is not cached in offline mode.
+        """
+        value = self.get(source, key)
+
+        if value is None:
+            self._check_online(source, key)
+            value = await fetch()
+            self.set(source, key, value)
+
+        return value
+
+    def clear(self):
+        """Removes all entries and resets the counters."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Closes the SQLite connection."""
+        self._connection.close()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def _check_online(self, source: str, key: str):
+        if self.offline:
+            raise ConnectionError(
+                f"{source} entry '{key}' is not cached and the fetcher cache is offline"
+            )
+
+    def _evict(self):
+        """Deletes the least recently used entries until the size limit is met."""
+        if self.max_size is None:
+            return
+
+        excess = (
+            self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+            - self.max_size
+        )
+
+        if excess <= 0:
+            return
+
+        evicted = []
+        for rowid, size in self._connection.execute(
+            "SELECT rowid, size FROM entries ORDER BY accessed"
+        ):
+            evicted.append((rowid,))
+            excess -= size
+
+            if excess <= 0:
+                break
+
+        self._connection.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+
+
+_CACHE: Optional[FetcherCache] = None
+
+
+def set_fetcher_cache(cache: Optional[FetcherCache]) -> Optional[FetcherCache]:
+    """
+    Sets the cache used by all fetchers.
+
+    Args:
+        cache (Optional[FetcherCache]): The cache, or None to disable caching.
+
+    Returns:
+        Optional[FetcherCache]: The cache.
+    """
+    global _CACHE
+    _CACHE = cache
+    return cache
+
+
+def get_fetcher_cache() -> Optional[FetcherCache]:
+    """Returns the cache used by all fetchers, or None if caching is disabled."""
+    return _CACHE
+
+
+def cached(source: str, key: str, fetch: Callable[[], T]) -> T:
+    """Fetches an entry through the fetcher cache, if one is set."""
+    if _CACHE is None:
+        return fetch()
+
+    return _CACHE.get_or_fetch(source, key, fetch)
+
+
+async def cached_async(
+    source: str,
+    key: str,
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """Fetches an entry asynchronously through the fetcher cache, if one is set."""
+    if _CACHE is None:
+        return await fetch()
+
+    return await _CACHE.get_or_fetch_async(source, key, fetch)
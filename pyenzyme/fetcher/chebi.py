@@ -5,16 +5,28 @@ This module provides functionality to fetch chemical entity data from the
 ChEBI database by ID and map it to the PyEnzyme data model (v2).
 """
 
+from __future__ import annotations
+
 import re
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import httpx
 from pydantic import BaseModel, ConfigDict, Field
 
+from pyenzyme.fetcher.batch import fetch_batch, raise_first
+from pyenzyme.fetcher.cache import cached, cached_async
+from pyenzyme.fetcher.engine import run_with_engine
+from pyenzyme.fetcher.mirror import get_local_mirror
 from pyenzyme.versions import v2
 
+if TYPE_CHECKING:
+    from pyenzyme.fetcher.engine import FetchEngine
+
 DEFAULT_TIMEOUT = 5.0
 
+# ChEBI IDs per search request
+BATCH_SIZE = 50
+
 
 class ChEBIError(Exception):
     """Error class for ChEBI-specific errors."""
@@ -84,8 +96,7 @@ class ChEBIClient:
             ChEBIError: If the ChEBI ID is invalid or not found
             ChEBIError: If the connection to the ChEBI server fails
         """
-        if not chebi_id.startswith("CHEBI:"):
-            chebi_id = f"CHEBI:{chebi_id}"
+        chebi_id = normalize_chebi_id(chebi_id)
 
         try:
             with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
@@ -93,29 +104,74 @@ class ChEBIClient:
                 response = client.get(self.SEARCH_URL, params=params)
                 response.raise_for_status()
 
-            if response.status_code == 200:
-                try:
-                    search_response = ChebiSearchResponse(**response.json())
+            return self._parse_entry(response, chebi_id)
+
+        except httpx.HTTPStatusError as e:
+            raise ChEBIError(f"Failed to fetch ChEBI ID {chebi_id}: {str(e)}", e)
 
-                    if not search_response.results or len(search_response.results) == 0:
-                        raise ChEBIError(f"No data found for ChEBI ID {chebi_id}")
+    async def get_entry_by_id_async(
+        self, chebi_id: str, engine: FetchEngine
+    ) -> ChebiSearchSource:
+        """
+        Fetch a ChEBI entry by its ID through a fetch engine.
 
-                    return search_response.results[0].source
+        Args:
+            chebi_id: The ChEBI ID to fetch, can be with or without the 'CHEBI:' prefix
+            engine: The engine that sends the request
 
-                except Exception as e:
-                    if isinstance(e, ChEBIError):
-                        raise e
-                    raise ChEBIError(f"Failed to parse ChEBI response: {str(e)}", e)
-            else:
-                raise ChEBIError(f"HTTP {response.status_code}: {response.text}")
+        Returns:
+            ChebiSearchSource object with the parsed response data
+
+        Raises:
+            ChEBIError: If the ChEBI ID is invalid or not found
+            ChEBIError: If the connection to the ChEBI server fails
+        """
+        chebi_id = normalize_chebi_id(chebi_id)
 
+        try:
+            params = {"term": chebi_id, "page": "1", "size": "1"}
+            response = await engine.get(self.SEARCH_URL, params=params)
         except httpx.HTTPStatusError as e:
             raise ChEBIError(f"Failed to fetch ChEBI ID {chebi_id}: {str(e)}", e)
+        except httpx.RequestError as e:
+            raise ChEBIError(f"Connection to ChEBI failed: {str(e)}", e)
+
+        return self._parse_entry(response, chebi_id)
+
+    @staticmethod
+    def _parse_entry(response: httpx.Response, chebi_id: str) -> ChebiSearchSource:
+        """
+        Parse the search response of a single ChEBI ID.
+
+        Args:
+            response: The response of the search API
+            chebi_id: The requested ChEBI ID
+
+        Returns:
+            ChebiSearchSource object of the first result
+
+        Raises:
+            ChEBIError: If the response has no results or cannot be parsed
+        """
+        if response.status_code != 200:
+            raise ChEBIError(f"HTTP {response.status_code}: {response.text}")
+
+        try:
+            search_response = ChebiSearchResponse(**response.json())
+        except Exception as e:
+            raise ChEBIError(f"Failed to parse ChEBI response: {str(e)}", e)
+
+        if not search_response.results:
+            raise ChEBIError(f"No data found for ChEBI ID {chebi_id}")
+
+        return search_response.results[0].source
 
     def get_entries_batch(self, chebi_ids: List[str]) -> List[ChebiSearchSource]:
         """
         Fetch multiple ChEBI entries by their IDs using the search API.
 
+        The IDs are searched in chunks of `BATCH_SIZE`, which are sent concurrently.
+
         Args:
             chebi_ids: List of ChEBI IDs to fetch
 
@@ -129,16 +185,75 @@ class ChEBIClient:
         if not chebi_ids:
             return []
 
-        results = []
-        for chebi_id in chebi_ids:
-            try:
-                entry = self.get_entry_by_id(chebi_id)
-                results.append(entry)
-            except ChEBIError as e:
-                # Continue with other IDs even if one fails
-                raise ChEBIError(f"Failed to fetch ChEBI ID {chebi_id}: {str(e)}", e)
+        return raise_first(run_with_engine(self.get_entries_batch_async, chebi_ids))
+
+    async def get_entries_batch_async(
+        self, chebi_ids: List[str], engine: FetchEngine
+    ) -> List[Union[ChebiSearchSource, ChEBIError]]:
+        """
+        Fetch multiple ChEBI entries by their IDs through a fetch engine.
+
+        Args:
+            chebi_ids: List of ChEBI IDs to fetch
+            engine: The engine that sends the requests
 
-        return results
+        Returns:
+            The ChebiSearchSource object, or the ChEBIError, of every ID in order
+        """
+        mirrored = [_from_mirror(chebi_id) for chebi_id in chebi_ids]
+        missing = [i for i, source in zip(chebi_ids, mirrored) if source is None]
+
+        if not missing:
+            return mirrored
+
+        fetched = iter(
+            await fetch_batch(
+                missing,
+                source="chebi",
+                normalize=normalize_chebi_id,
+                fetch_chunk=lambda chunk: self.search_ids_async(chunk, engine),
+                fetch_one=lambda chebi_id: self.get_entry_by_id_async(chebi_id, engine),
+                chunk_size=BATCH_SIZE,
+            )
+        )
+
+        return [next(fetched) if source is None else source for source in mirrored]
+
+    async def search_ids_async(
+        self, chebi_ids: List[str], engine: FetchEngine
+    ) -> Dict[str, ChebiSearchSource]:
+        """
+        Search for multiple ChEBI IDs with a single request.
+
+        Args:
+            chebi_ids: The normalized ChEBI IDs to search for
+            engine: The engine that sends the request
+
+        Returns:
+            The entries by ChEBI ID. IDs without an exact match are missing.
+
+        Raises:
+            ChEBIError: If the search request fails or cannot be parsed
+        """
+        params = {
+            "term": " OR ".join(chebi_ids),
+            "page": "1",
+            "size": str(len(chebi_ids)),
+        }
+
+        try:
+            response = await engine.get(self.SEARCH_URL, params=params)
+            search_response = ChebiSearchResponse(**response.json())
+        except Exception as e:
+            raise ChEBIError(f"Failed to search ChEBI: {str(e)}", e)
+
+        requested = set(chebi_ids)
+
+        return {
+            result.source.chebi_accession: result.source
+            for result in search_response.results
+            if result.source.chebi_accession in requested
+        }
 
     def search_entries(
         self, query: str, size: Optional[int] = None, page: int = 1
@@ -245,34 +360,117 @@ def fetch_chebi(
         ValueError: If the ChEBI ID is invalid or not found
         ConnectionError: If the connection to the ChEBI server fails
     """
+    chebi_source = _from_mirror(chebi_id)
+    if chebi_source is not None:
+        return _to_small_molecule(chebi_source, smallmol_id, vessel_id)
+
     try:
         client = ChEBIClient()
-        chebi_source = client.get_entry_by_id(chebi_id)
+        chebi_source = cached(
+            "chebi",
+            normalize_chebi_id(chebi_id),
+            lambda: client.get_entry_by_id(chebi_id),
+        )
+    except ChEBIError as e:
+        raise _convert_error(e) from e
 
-        small_molecule = process_search_result(chebi_source)
+    return _to_small_molecule(chebi_source, smallmol_id, vessel_id)
 
-        if smallmol_id is not None:
-            small_molecule.id = smallmol_id
-        if vessel_id is not None:
-            small_molecule.vessel_id = vessel_id
 
-        return small_molecule
+async def fetch_chebi_async(
+    chebi_id: str,
+    engine: FetchEngine,
+    smallmol_id: Optional[str] = None,
+    vessel_id: Optional[str] = None,
+) -> v2.SmallMolecule:
+    """
+    Fetch a ChEBI entry by ID through a fetch engine and convert it to a SmallMolecule object.
+
+    Args:
+        chebi_id: The ChEBI ID to fetch
+        engine: The engine that sends the request
+        smallmol_id: Optional custom ID for the small molecule
+        vessel_id: The ID of the vessel to add the small molecule to
+
+    Returns:
+        A SmallMolecule object with data from ChEBI
+
+    Raises:
+        ValueError: If the ChEBI ID is invalid or not found
+        ConnectionError: If the connection to the ChEBI server fails
+    """
+    chebi_source = _from_mirror(chebi_id)
+    if chebi_source is not None:
+        return _to_small_molecule(chebi_source, smallmol_id, vessel_id)
+
+    try:
+        client = ChEBIClient()
+        chebi_source = await cached_async(
+            "chebi",
+            normalize_chebi_id(chebi_id),
+            lambda: client.get_entry_by_id_async(chebi_id, engine),
+        )
     except ChEBIError as e:
-        if "Connection" in str(e) and "400" not in str(e) and "404" not in str(e):
-            raise ConnectionError(str(e)) from e
-        else:
-            raise ValueError(str(e)) from e
+        raise _convert_error(e) from e
+
+    return _to_small_molecule(chebi_source, smallmol_id, vessel_id)
+
+
+def _from_mirror(chebi_id: str) -> Optional[ChebiSearchSource]:
+    """Looks a ChEBI entry up in the local mirror, if one is set."""
+    mirror = get_local_mirror()
+
+    if mirror is None:
+        return None
+
+    return mirror.get_chebi(normalize_chebi_id(chebi_id))
+
+
+def _to_small_molecule(
+    chebi_source: ChebiSearchSource,
+    smallmol_id: Optional[str],
+    vessel_id: Optional[str],
+) -> v2.SmallMolecule:
+    """Converts a ChEBI entry and applies the custom small molecule and vessel IDs."""
+    small_molecule = process_search_result(chebi_source)
+
+    if smallmol_id is not None:
+        small_molecule.id = smallmol_id
+    if vessel_id is not None:
+        small_molecule.vessel_id = vessel_id
+
+    return small_molecule
+
 
+def _convert_error(error: ChEBIError) -> Exception:
+    """Converts a ChEBIError to the ConnectionError or ValueError of the fetchers."""
+    message = str(error)
 
-def fetch_chebi_batch(chebi_ids: List[str]) -> List[v2.SmallMolecule]:
+    if "Connection" in message and "400" not in message and "404" not in message:
+        return ConnectionError(message)
+
+    return ValueError(message)
+
+
+def fetch_chebi_batch(
+    chebi_ids: List[str],
+    vessel_id: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> List[Union[v2.SmallMolecule, ChEBIError]]:
     """
     Fetch multiple ChEBI entries by their IDs and convert them to SmallMolecule objects.
 
+    The IDs are searched in chunks of `BATCH_SIZE`, which are sent concurrently.
+    IDs the chunk search does not match exactly are fetched one by one.
+
     Args:
         chebi_ids: List of ChEBI IDs to fetch
+        vessel_id: The ID of the vessel to add the small molecules to
+        return_exceptions: Whether to return the error of an ID that could not be
+            fetched in its place, instead of raising it
 
     Returns:
-        List of SmallMolecule objects with data from ChEBI
+        List of SmallMolecule objects, or errors, in the order of the IDs
 
     Raises:
         ChEBIError: If any ChEBI ID is invalid or not found
@@ -281,10 +479,46 @@ def fetch_chebi_batch(chebi_ids: List[str]) -> List[v2.SmallMolecule]:
     if not chebi_ids:
         return []
 
-    client = ChEBIClient()
-    chebi_sources = client.get_entries_batch(chebi_ids)
+    return run_with_engine(
+        fetch_chebi_batch_async,
+        chebi_ids,
+        vessel_id=vessel_id,
+        return_exceptions=return_exceptions,
+    )
+
 
-    return [process_search_result(source) for source in chebi_sources]
+async def fetch_chebi_batch_async(
+    chebi_ids: List[str],
+    engine: FetchEngine,
+    vessel_id: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> List[Union[v2.SmallMolecule, ChEBIError]]:
+    """
+    Fetch multiple ChEBI entries by their IDs through a fetch engine and convert them to SmallMolecule objects.
+
+    Args:
+        chebi_ids: List of ChEBI IDs to fetch
+        engine: The engine that sends the requests
+        vessel_id: The ID of the vessel to add the small molecules to
+        return_exceptions: Whether to return the error of an ID that could not be
+            fetched in its place, instead of raising it
+
+    Returns:
+        List of SmallMolecule objects, or errors, in the order of the IDs
+
+    Raises:
+        ChEBIError: If any ChEBI ID is invalid or not found
+        ChEBIError: If the connection to the ChEBI server fails
+    """
+    sources = await ChEBIClient().get_entries_batch_async(chebi_ids, engine)
+    small_molecules = [
+        source
+        if isinstance(source, Exception)
+        else _to_small_molecule(source, None, vessel_id)
+        for source in sources
+    ]
+
+    return small_molecules if return_exceptions else raise_first(small_molecules)
 
 
 def search_chebi(query: str, size: Optional[int] = None) -> List[v2.SmallMolecule]:
@@ -292,7 +526,8 @@ def search_chebi(query: str, size: Optional[int] = None) -> List[v2.SmallMolecul
     Search for ChEBI entries by query string.
 
     This function searches the ChEBI database using the EBI search API and returns
-    a list of SmallMolecule objects for each matching entry.
+    a list of SmallMolecule objects for each matching entry. If a local mirror
+    with ChEBI entries is set, its names and synonyms are searched instead.
 
     Args:
         query: The search query string to find ChEBI entries
@@ -311,12 +546,32 @@ def search_chebi(query: str, size: Optional[int] = None) -> List[v2.SmallMolecul
         # Search for ATP entries
         atp_results = search_chebi('ATP', 5)
     """
-    client = ChEBIClient()
-    chebi_sources = client.search_entries(query, size)
+    mirror = get_local_mirror()
+
+    if mirror is not None and mirror.n_chebi:
+        chebi_sources = mirror.search_chebi(query, size or 10)
+    else:
+        chebi_sources = ChEBIClient().search_entries(query, size)
 
     return [process_search_result(source) for source in chebi_sources]
 
 
+def normalize_chebi_id(chebi_id: str) -> str:
+    """
+    Normalize a ChEBI ID to the 'CHEBI:<number>' form.
+
+    Args:
+        chebi_id: The ChEBI ID, with or without the 'CHEBI:' prefix
+
+    Returns:
+        The ChEBI ID with the 'CHEBI:' prefix
+    """
+    if not chebi_id.startswith("CHEBI:"):
+        chebi_id = f"CHEBI:{chebi_id}"
+
+    return chebi_id
+
+
 def process_id(name: str) -> str:
     """
     Process a name string to create a valid identifier.
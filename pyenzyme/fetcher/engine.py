@@ -0,0 +1,270 @@
+"""
+Asynchronous fetch engine shared by all database fetchers.
+
+The synchronous fetchers open a new HTTP connection for every request and resolve
+one identifier after another. `FetchEngine` instead sends all requests through a
+single pooled `httpx.AsyncClient`, hence connections and TLS sessions are reused,
+and lets the `*_async` fetchers resolve many identifiers concurrently:
+
+- The number of requests in flight is bounded by `max_concurrency`.
+- Requests to the same host are spaced according to its rate limit, e.g. PubChem
+  allows at most five requests per second. Requests waiting for their host do not
+  take up a concurrency slot, hence do not hold up requests to other hosts.
+- Identical requests share a single response for the lifetime of the engine, so a
+  ChEBI entry that takes part in several reactions is only fetched once. Failed
+  requests are not kept and are sent again when requested again.
+
+Example:
+    >>> import asyncio
+    >>> from pyenzyme.fetcher import FetchEngine, fetch_chebi_async
+    >>> async def main():
+    ...     async with FetchEngine() as engine:
+    ...         return await asyncio.gather(
+    ...             fetch_chebi_async("CHEBI:15377", engine),
+    ...             fetch_chebi_async("CHEBI:16236", engine),
+    ...         )
+    >>> water, ethanol = asyncio.run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from pyenzyme.fetcher.resolver import IdentifierResolver
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT = 5.0
+
+# Requests per second by host, following the usage policies of the services
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "pubchem.ncbi.nlm.nih.gov": 5.0,
+}
+
+
+class FetchEngine:
+    """
+    Sends the requests of the fetchers through one pooled asynchronous client.
+
+    Attributes:
+        max_concurrency (int): The maximum number of requests in flight.
+        rate_limits (Dict[str, float]): Requests per second by host.
+        default_rate (Optional[float]): Requests per second for hosts without an
+            entry in `rate_limits`. None does not limit them.
+        requests (int): The number of requests sent.
+        resolver (IdentifierResolver): Routes the identifiers resolved through the
+            engine to their fetcher and counts the fetcher attempts it saves.
+    """
+
+    max_concurrency: int
+    rate_limits: Dict[str, float]
+    default_rate: Optional[float]
+    requests: int
+    resolver: IdentifierResolver
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        rate_limits: Optional[Dict[str, float]] = None,
+        default_rate: Optional[float] = 10.0,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize the FetchEngine instance.
+
+        Args:
+            max_concurrency (int): The maximum number of requests in flight, which
+                is also the size of the connection pool. Defaults to 8.
+            rate_limits (Optional[Dict[str, float]]): Requests per second by host.
+                Defaults to None, which uses `DEFAULT_RATE_LIMITS`.
+            default_rate (Optional[float]): Requests per second for all other
+                hosts. Defaults to 10.
+            timeout (float): Timeout of a single request in seconds. Defaults to 5.
+            client (Optional[httpx.AsyncClient]): The client to send requests with.
+                Defaults to None, which creates a client that is closed with the
+                engine.
+
+        Raises:
+            ValueError: If the concurrency or a rate is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"At least one concurrent request is required, got {max_concurrency}"
+            )
+
+        rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        rates = list(rate_limits.values())
+
+        if default_rate is not None:
+            rates.append(default_rate)
+
+        if any(rate <= 0 for rate in rates):
+            raise ValueError("Rate limits must be positive")
+
+        self.max_concurrency = max_concurrency
+        self.rate_limits = rate_limits
+        self.default_rate = default_rate
+        self.requests = 0
+        self.resolver = IdentifierResolver()
+
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            follow_redirects=True,
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, _HostLimiter] = {}
+        self._responses: Dict[Tuple, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "FetchEngine":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the client, if it was created by the engine."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a GET request, or waits for an identical one.
+
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, str]]): Query parameters of the request.
+
+        Returns:
+            httpx.Response: The successful response.
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status.
+            httpx.RequestError: If the request could not be sent.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        task = self._responses.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._send(url, params))
+            task.add_done_callback(lambda done: self._forget_failed(key, done))
+            self._responses[key] = task
+
+        # Shielded, since a cancelled caller must not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _forget_failed(self, key: Tuple, task: asyncio.Task):
+        """Drops a failed request, such that the next identical one is sent again."""
+        if task.cancelled() or task.exception() is not None:
+            if self._responses.get(key) is task:
+                del self._responses[key]
+
+    async def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]],
+    ) -> httpx.Response:
+        """Sends a request within the concurrency and rate limits."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        host = urlsplit(url).hostname or ""
+        rate = self.rate_limits.get(host, self.default_rate)
+
+        # Waiting for the host outside of the semaphore keeps the slots free for
+        # requests to other hosts
+        if rate is not None:
+            limiter = self._hosts.setdefault(host, _HostLimiter(rate))
+            await limiter.wait()
+
+        async with self._semaphore:
+            self.requests += 1
+            response = await self._client.get(url, params=params)
+
+        response.raise_for_status()
+
+        return response
+
+
+class _HostLimiter:
+    """Spaces the requests to a single host by the inverse of its rate."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self.lock:
+            now = time.monotonic()
+            delay = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def run_with_engine(
+    func: Callable[..., Awaitable[T]],
+    *args,
+    **kwargs,
+) -> T:
+    """
+    Runs an asynchronous fetcher with a new engine from synchronous code.
+
+    Args:
+        func (Callable[..., Awaitable[T]]): The fetcher, which takes the engine as
+            `engine` keyword argument.
+        *args: Positional arguments of the fetcher.
+        **kwargs: Keyword arguments of the fetcher.
+
+    Returns:
+        T: The result of the fetcher.
+    """
+
+    async def main() -> T:
+        async with FetchEngine() as engine:
+            return await func(*args, engine=engine, **kwargs)
+
+    return run_sync(main())
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Runs a coroutine to completion from synchronous code.
+
+    Within a running event loop, e.g. in a Jupyter notebook, the coroutine is run
+    in a separate thread with its own event loop.
+
+    Args:
+        awaitable (Awaitable[T]): The coroutine to run.
+
+    Returns:
+        T: The result of the coroutine.
+    """
+
+    async def main() -> T:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, main()).result()
@@ -0,0 +1,583 @@
+"""
+Local mirror of the ChEBI and Rhea databases built from their bulk dumps.
+
+Compute nodes without internet access cannot reach the ChEBI and Rhea APIs.
+`LocalMirror` imports the flat-file dumps both databases publish into an indexed
+SQLite file, which `fetch_chebi`, `fetch_rhea` and `search_chebi` resolve against
+before sending any request:
+
+- ChEBI: the SDF dump, e.g. "ChEBI_complete.sdf.gz", which holds the structure,
+  names and synonyms of every entry.
+- Rhea: the flat-file dump "rhea-reactions.txt.gz" or a TSV export with the
+  columns "Reaction identifier", "Equation" and "ChEBI identifier", as returned by
+  the Rhea search with `columns=rhea-id,equation,chebi-id`. Neither records
+  whether a reaction is balanced or a transport reaction, hence the JSON export
+  of the same search, which carries both flags, is imported as well.
+
+Entries are indexed by ID, InChIKey and name, hence lookups take microseconds.
+Names and synonyms additionally support fuzzy search, which replaces the ChEBI
+search API.
+
+Example:
+    >>> from pyenzyme.fetcher import LocalMirror, fetch_rhea, set_local_mirror
+    >>> mirror = LocalMirror("mirror.sqlite")
+    >>> mirror.import_chebi("ChEBI_complete.sdf.gz")
+    >>> mirror.import_rhea("rhea-reactions.txt.gz")
+    >>> mirror.import_rhea("rhea.json")
+    >>> set_local_mirror(mirror)
+    >>> reaction, small_molecules = fetch_rhea("RHEA:22864")  # No request
+"""
+
+from __future__ import annotations
+
+import csv
+import difflib
+import gzip
+import io
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, TextIO, Union
+
+if TYPE_CHECKING:
+    from pyenzyme.fetcher.chebi import ChebiSearchSource
+    from pyenzyme.fetcher.rhea import RheaClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chebi (
+    accession TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    smiles TEXT,
+    inchi TEXT,
+    inchikey TEXT,
+    definition TEXT,
+    formula TEXT,
+    charge INTEGER,
+    mass REAL,
+    monoisotopicmass REAL,
+    stars INTEGER
+);
+CREATE INDEX IF NOT EXISTS chebi_inchikey ON chebi (inchikey);
+CREATE TABLE IF NOT EXISTS chebi_names (
+    name TEXT NOT NULL,
+    accession TEXT NOT NULL,
+    PRIMARY KEY (name, accession)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS chebi_names_accession ON chebi_names (accession);
+CREATE TABLE IF NOT EXISTS chebi_words (
+    word TEXT NOT NULL,
+    name TEXT NOT NULL,
+    accession TEXT NOT NULL,
+    PRIMARY KEY (word, name, accession)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS chebi_words_accession ON chebi_words (accession);
+CREATE TABLE IF NOT EXISTS rhea (
+    id TEXT PRIMARY KEY,
+    equation TEXT NOT NULL,
+    chebi_ids TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rhea_flags (
+    id TEXT PRIMARY KEY,
+    balanced INTEGER NOT NULL,
+    transport INTEGER NOT NULL
+);
+"""
+
+# SDF fields by column, in order of preference
+_SDF_FIELDS: Dict[str, List[str]] = {
+    "accession": ["chebi id"],
+    "name": ["chebi name", "name"],
+    "smiles": ["smiles"],
+    "inchi": ["inchi"],
+    "inchikey": ["inchikey"],
+    "definition": ["definition"],
+    "formula": ["formulae", "formula"],
+    "charge": ["charge"],
+    "mass": ["mass"],
+    "monoisotopicmass": ["monoisotopic mass"],
+    "stars": ["star", "stars"],
+}
+
+# SDF fields with further names of an entry
+_SDF_SYNONYMS = ["synonyms", "iupac names", "inn"]
+
+_CHEBI_ID = re.compile(r"CHEBI:\d+")
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Candidates of a name search, and of a fuzzy search, that are ranked at most
+_MAX_CANDIDATES = 2000
+_MAX_FUZZY_CANDIDATES = 500
+
+# Similarity a name needs to match a misspelled query
+_MIN_SIMILARITY = 0.6
+
+
+class LocalMirror:
+    """
+    SQLite store of ChEBI entries and Rhea reactions imported from dumps.
+
+    Attributes:
+        path (str): The path of the SQLite file, or ":memory:".
+    """
+
+    path: str
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the LocalMirror instance.
+
+        Args:
+            path (Union[str, Path]): The path of the SQLite file, which is created if
+                it does not exist. ":memory:" keeps the mirror in memory.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    @property
+    def n_chebi(self) -> int:
+        """The number of ChEBI entries."""
+        return self._count("chebi")
+
+    @property
+    def n_rhea(self) -> int:
+        """The number of Rhea reactions."""
+        return self._count("rhea")
+
+    def close(self):
+        """Closes the SQLite connection."""
+        self._connection.close()
+
+    def import_chebi(self, path: Union[str, Path]) -> int:
+        """
+        Imports the entries of a ChEBI SDF dump.
+
+        Existing entries with the same ID are replaced.
+
+        Args:
+            path (Union[str, Path]): The SDF file, optionally gzip-compressed.
+
+        Returns:
+            int: The number of imported entries.
+
+        Raises:
+            ValueError: If the file contains no ChEBI entries.
+        """
+        entries = []
+        names = []
+        words = []
+
+        with _open_text(path) as handle:
+            for fields in _read_sdf(handle):
+                entry = {
+                    column: _first(fields, keys) for column, keys in _SDF_FIELDS.items()
+                }
+
+                if not entry["accession"] or not entry["name"]:
+                    continue
+
+                entries.append(
+                    (
+                        entry["accession"],
+                        entry["name"],
+                        entry["smiles"],
+                        entry["inchi"],
+                        entry["inchikey"],
+                        entry["definition"],
+                        entry["formula"],
+                        _to_number(entry["charge"], int),
+                        _to_number(entry["mass"], float),
+                        _to_number(entry["monoisotopicmass"], float),
+                        _to_number(entry["stars"], int),
+                    )
+                )
+
+                synonyms = [entry["name"]]
+                for key in _SDF_SYNONYMS:
+                    synonyms.extend(fields.get(key, "").splitlines())
+
+                for name in dict.fromkeys(n.strip().lower() for n in synonyms):
+                    if name:
+                        names.append((name, entry["accession"]))
+                        words.extend(
+                            (word, name, entry["accession"])
+                            for word in set(_WORD.findall(name))
+                        )
+
+        if not entries:
+            raise ValueError(f"No ChEBI entries found in {path}")
+
+        with self._lock:
+            for table in ("chebi_names", "chebi_words"):
+                self._connection.executemany(
+                    f"DELETE FROM {table} WHERE accession = ?",
+                    [(entry[0],) for entry in entries],
+                )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO chebi VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                entries,
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO chebi_names VALUES (?, ?)", names
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO chebi_words VALUES (?, ?, ?)", words
+            )
+            self._connection.commit()
+
+        return len(entries)
+
+    def import_rhea(self, path: Union[str, Path]) -> int:
+        """
+        Imports the reactions of a Rhea flat-file dump, TSV export or JSON export.
+
+        The flat file and the TSV export hold the equations and participants, the
+        JSON export of the Rhea search holds whether a reaction is balanced and a
+        transport reaction, as the API returns it. Both are needed to resolve a
+        reaction from the mirror, and may be imported in any order. Existing
+        entries with the same ID are replaced.
+
+        Args:
+            path (Union[str, Path]): The "rhea-reactions.txt" flat file, a TSV
+                export with the columns "Reaction identifier", "Equation" and
+                "ChEBI identifier", or a JSON export of the Rhea search,
+                optionally gzip-compressed.
+
+        Returns:
+            int: The number of imported reactions.
+
+        Raises:
+            ValueError: If the file contains no Rhea reactions.
+        """
+        with _open_text(path) as handle:
+            first_line = handle.readline()
+            handle.seek(0)
+
+            if first_line.lstrip().startswith("{"):
+                table, reactions = "rhea_flags", list(_read_rhea_json(handle))
+            elif first_line.startswith("ENTRY"):
+                table, reactions = "rhea", list(_read_rhea_flat_file(handle))
+            else:
+                table, reactions = "rhea", list(_read_rhea_tsv(handle))
+
+        if not reactions:
+            raise ValueError(f"No Rhea reactions found in {path}")
+
+        with self._lock:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?)", reactions
+            )
+            self._connection.commit()
+
+        return len(reactions)
+
+    def get_chebi(self, chebi_id: str) -> Optional[ChebiSearchSource]:
+        """
+        Returns a ChEBI entry by its ID.
+
+        Args:
+            chebi_id (str): The ChEBI ID, with or without the 'CHEBI:' prefix.
+
+        Returns:
+            Optional[ChebiSearchSource]: The entry, or None if it is not mirrored.
+        """
+        if not chebi_id.upper().startswith("CHEBI:"):
+            chebi_id = f"CHEBI:{chebi_id}"
+
+        rows = self._select_chebi("accession = ?", (chebi_id.upper(),))
+
+        return rows[0] if rows else None
+
+    def get_chebi_by_inchikey(self, inchikey: str) -> List[ChebiSearchSource]:
+        """
+        Returns the ChEBI entries with an InChIKey.
+
+        Args:
+            inchikey (str): The InChIKey.
+
+        Returns:
+            List[ChebiSearchSource]: The entries with the InChIKey.
+        """
+        return self._select_chebi("inchikey = ?", (inchikey.strip().upper(),))
+
+    def search_chebi(self, query: str, size: int = 10) -> List[ChebiSearchSource]:
+        """
+        Searches ChEBI entries by name and synonyms, tolerating typos.
+
+        Exact matches rank first, followed by names starting with the query and
+        names containing it at the start of a word. If no name matches, names
+        sharing the first three characters of the query are ranked by similarity
+        instead.
+
+        Args:
+            query (str): The name to search for.
+            size (int): The maximum number of entries. Defaults to 10.
+
+        Returns:
+            List[ChebiSearchSource]: The matching entries, best match first.
+        """
+        query = query.strip().lower()
+
+        if not query:
+            return []
+
+        words = _WORD.findall(query)
+        word = max(words, key=len) if words else query
+
+        with self._lock:
+            candidates = self._connection.execute(
+                "SELECT name, accession FROM chebi_names "
+                "WHERE name >= ? AND name < ? LIMIT ?",
+                (query, query + "\uffff", _MAX_CANDIDATES),
+            ).fetchall()
+            candidates += self._connection.execute(
+                "SELECT name, accession FROM chebi_words "
+                "WHERE word >= ? AND word < ? LIMIT ?",
+                (word, word + "\uffff", _MAX_CANDIDATES),
+            ).fetchall()
+
+        scores: Dict[str, float] = {}
+        for name, accession in candidates:
+            if name == query:
+                score = 3.0
+            elif name.startswith(query):
+                score = 2.0 + len(query) / len(name)
+            elif query in name:
+                score = 1.0 + len(query) / len(name)
+            else:
+                continue
+
+            scores[accession] = max(score, scores.get(accession, 0.0))
+
+        if not scores:
+            scores = self._search_similar(query)
+
+        ranked = sorted(scores, key=lambda accession: -scores[accession])[:size]
+        entries = {
+            source.chebi_accession: source
+            for source in self._select_chebi(
+                f"accession IN ({', '.join('?' * len(ranked))})", tuple(ranked)
+            )
+        }
+
+        return [entries[accession] for accession in ranked if accession in entries]
+
+    def _search_similar(self, query: str) -> Dict[str, float]:
+        """Scores the names sharing the first characters of a query by similarity."""
+        prefix = query[:3]
+
+        with self._lock:
+            candidates = self._connection.execute(
+                "SELECT name, accession FROM chebi_names "
+                "WHERE name >= ? AND name < ? LIMIT ?",
+                (prefix, prefix + "\uffff", _MAX_FUZZY_CANDIDATES),
+            ).fetchall()
+
+        # The quick ratios are upper bounds of the ratio, see difflib.get_close_matches
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(query)
+
+        scores: Dict[str, float] = {}
+        for name, accession in candidates:
+            matcher.set_seq1(name)
+
+            if (
+                matcher.real_quick_ratio() < _MIN_SIMILARITY
+                or matcher.quick_ratio() < _MIN_SIMILARITY
+            ):
+                continue
+
+            ratio = matcher.ratio()
+            if ratio >= _MIN_SIMILARITY:
+                scores[accession] = max(ratio, scores.get(accession, 0.0))
+
+        return scores
+
+    def get_rhea(self, rhea_id: str) -> Optional[RheaClient]:
+        """
+        Returns a Rhea reaction by its ID.
+
+        Args:
+            rhea_id (str): The Rhea ID, with or without the 'RHEA:' prefix.
+
+        Returns:
+            Optional[RheaClient]: The reaction, or None if it is not mirrored or
+                its flags have not been imported.
+        """
+        from pyenzyme.fetcher.rhea import RheaClient, RheaResult
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT rhea.id, equation, chebi_ids, balanced, transport FROM rhea "
+                "JOIN rhea_flags ON rhea_flags.id = rhea.id WHERE rhea.id = ?",
+                (rhea_id.split(":")[-1].strip(),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return RheaClient(
+            json_content=RheaResult(
+                id=row[0],
+                equation=row[1],
+                balanced=bool(row[3]),
+                transport=bool(row[4]),
+            ),
+            chebi_ids=row[2].split(";"),
+        )
+
+    def _select_chebi(self, where: str, params: tuple) -> List[ChebiSearchSource]:
+        from pyenzyme.fetcher.chebi import ChebiSearchSource
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT accession, name, smiles, inchi, inchikey, definition, "
+                f"formula, charge, mass, monoisotopicmass, stars FROM chebi WHERE {where}",
+                params,
+            ).fetchall()
+
+        return [
+            ChebiSearchSource(
+                chebi_accession=row[0],
+                name=row[1],
+                ascii_name=row[1],
+                smiles=row[2],
+                inchi=row[3],
+                inchikey=row[4],
+                definition=row[5],
+                formula=row[6],
+                charge=row[7],
+                mass=row[8],
+                monoisotopicmass=row[9],
+                stars=row[10],
+            )
+            for row in rows
+        ]
+
+    def _count(self, table: str) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                f"SELECT COUNT(*) FROM {table}"
+            ).fetchone()
+
+        return count
+
+
+_MIRROR: Optional[LocalMirror] = None
+
+
+def set_local_mirror(mirror: Optional[LocalMirror]) -> Optional[LocalMirror]:
+    """
+    Sets the mirror the ChEBI and Rhea fetchers resolve against.
+
+    Args:
+        mirror (Optional[LocalMirror]): The mirror, or None to disable it.
+
+    Returns:
+        Optional[LocalMirror]: The mirror.
+    """
+    global _MIRROR
+    _MIRROR = mirror
+    return mirror
+
+
+def get_local_mirror() -> Optional[LocalMirror]:
+    """Returns the mirror the fetchers resolve against, or None if none is set."""
+    return _MIRROR
+
+
+def _open_text(path: Union[str, Path]) -> TextIO:
+    """Opens a text file, which may be gzip-compressed."""
+    if str(path).endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8")
+
+    return open(path, "r", encoding="utf-8")
+
+
+def _read_sdf(handle: TextIO) -> Iterator[Dict[str, str]]:
+    """Yields the data fields of every record of an SDF file by lower-case name."""
+    fields: Dict[str, str] = {}
+    field: Optional[str] = None
+
+    for line in handle:
+        line = line.rstrip("\r\n")
+
+        if line == "$$$$":
+            yield fields
+            fields, field = {}, None
+        elif line.startswith(">") and "<" in line:
+            field = line[line.index("<") + 1 : line.rindex(">")].strip().lower()
+            fields[field] = ""
+        elif field is not None:
+            if line:
+                fields[field] = f"{fields[field]}\n{line}" if fields[field] else line
+            else:
+                field = None
+
+    if fields:
+        yield fields
+
+
+def _read_rhea_flat_file(handle: TextIO) -> Iterator[tuple]:
+    """Yields the ID, equation and ChEBI IDs of every entry of the flat-file dump."""
+    entry: Dict[str, str] = {}
+
+    for line in handle:
+        if line.startswith("///"):
+            if entry.get("ENTRY") and entry.get("EQUATION"):
+                yield (
+                    entry["ENTRY"].split(":")[-1],
+                    entry.get("DEFINITION", ""),
+                    ";".join(_CHEBI_ID.findall(entry["EQUATION"])),
+                )
+            entry = {}
+        elif line.strip():
+            key, _, value = line.partition(" ")
+            entry[key] = value.strip()
+
+
+def _read_rhea_tsv(handle: TextIO) -> Iterator[tuple]:
+    """Yields the ID, equation and ChEBI IDs of every row of a TSV export."""
+    for row in csv.DictReader(handle, delimiter="\t"):
+        rhea_id = row.get("Reaction identifier") or ""
+        chebi_ids = row.get("ChEBI identifier") or ""
+
+        if rhea_id and chebi_ids:
+            yield rhea_id.split(":")[-1], row.get("Equation") or "", chebi_ids
+
+
+def _read_rhea_json(handle: TextIO) -> Iterator[tuple]:
+    """Yields the ID and the balance and transport flags of every JSON result."""
+    for result in json.load(handle).get("results", []):
+        rhea_id = str(result.get("id") or "")
+
+        if rhea_id and "balanced" in result and "transport" in result:
+            yield (
+                rhea_id.split(":")[-1],
+                bool(result["balanced"]),
+                bool(result["transport"]),
+            )
+
+
+def _first(fields: Dict[str, str], keys: List[str]) -> Optional[str]:
+    """Returns the first non-empty field of the keys."""
+    for key in keys:
+        if fields.get(key):
+            return fields[key].strip()
+
+    return None
+
+
+def _to_number(value: Optional[str], kind: type) -> Optional[Union[int, float]]:
+    """Converts a field to a number, or None if it is missing or malformed."""
+    try:
+        return kind(value) if value is not None else None
+    except ValueError:
+        return None
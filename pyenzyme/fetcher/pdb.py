@@ -5,14 +5,21 @@ This module provides functionality to fetch protein data from the
 Protein Data Bank by ID and map it to the PyEnzyme data model (v2).
 """
 
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import httpx
 from pydantic import BaseModel, Field
 
+from pyenzyme.fetcher.cache import cached, cached_async
 from pyenzyme.fetcher.chebi import process_id
 from pyenzyme.versions import v2
 
+if TYPE_CHECKING:
+    from pyenzyme.fetcher.engine import FetchEngine
+
 DEFAULT_TIMEOUT = 5.0
 
 
@@ -94,55 +101,122 @@ class PDBClient:
                     entity_data = self._fetch_json(
                         f"{self.BASE_URL}/polymer_entity/{pdb_id}/{entity_id}"
                     )
+                    polymer_entities[entity_id] = self._parse_entity(entity_data)
 
-                    # Extract entity information
-                    polymer_entities[entity_id] = EntityInfo(
-                        description=entity_data.get("struct", {}).get(
-                            "pdbx_descriptor"
-                        ),
-                        polymer_type=entity_data.get("entity_poly", {}).get("type"),
-                        ec_number=entity_data.get("rcsb_polymer_entity", {}).get(
-                            "enzyme_class"
-                        ),
-                        sequence=entity_data.get("entity_poly", {}).get(
-                            "pdbx_seq_one_letter_code"
-                        ),
-                        organism_scientific_name=entity_data.get(
-                            "rcsb_polymer_entity_container_identifiers", {}
-                        ).get("taxonomy_organism_scientific_name"),
-                        organism_taxid=entity_data.get(
-                            "rcsb_polymer_entity_container_identifiers", {}
-                        ).get("taxonomy_id"),
-                    )
-
-            # Get citation data
-            citation = [
-                Citation.model_validate(c) for c in entry_data.get("citation", [])
-            ]
-
-            # Construct the PDBResponse
-            return PDBResponse(
-                pdb_id=pdb_id,
-                citation=citation,
-                struct=StructInfo(
-                    title=entry_data.get("struct", {}).get("title"),
-                    experimental_method=entry_data.get("rcsb_entry_info", {}).get(
-                        "experimental_method"
-                    ),
-                    resolution=entry_data.get("rcsb_entry_info", {}).get(
-                        "resolution_combined", [None]
-                    )[0],
-                ),
-                polymer_entities=polymer_entities,
-                rcsb_primary_citation=entry_data.get("rcsb_primary_citation"),
-                rcsb_entry_info=entry_data.get("rcsb_entry_info"),
-            )
+            return self._parse_entry(pdb_id, entry_data, polymer_entities)
 
         except ValueError as e:
             raise ValueError(f"Failed to retrieve PDB entry: {str(e)}")
         except ConnectionError as e:
             raise ValueError(f"Connection to PDB server failed: {str(e)}")
 
+    async def get_entry_by_id_async(
+        self,
+        pdb_id: str,
+        engine: FetchEngine,
+    ) -> PDBResponse:
+        """
+        Fetch a PDB entry by its ID through a fetch engine.
+
+        The polymer entities of the entry are fetched concurrently.
+
+        Args:
+            pdb_id: The PDB ID to fetch (e.g., '4HHB')
+            engine: The engine that sends the requests
+
+        Returns:
+            PDBResponse object with parsed data
+
+        Raises:
+            ValueError: If the PDB ID is invalid, not found or the connection fails
+        """
+        pdb_id = pdb_id.upper()
+
+        try:
+            response = await engine.get(f"{self.BASE_URL}/entry/{pdb_id}")
+            entry_data = response.json()
+
+            entity_ids = entry_data.get("rcsb_entry_container_identifiers", {}).get(
+                "polymer_entity_ids", []
+            )
+            responses = await asyncio.gather(
+                *(
+                    engine.get(f"{self.BASE_URL}/polymer_entity/{pdb_id}/{entity_id}")
+                    for entity_id in entity_ids
+                )
+            )
+            polymer_entities = {
+                entity_id: self._parse_entity(response.json())
+                for entity_id, response in zip(entity_ids, responses)
+            }
+
+            return self._parse_entry(pdb_id, entry_data, polymer_entities)
+
+        except httpx.HTTPError as e:
+            raise ValueError(f"Connection to PDB server failed: {str(e)}")
+        except ValueError as e:
+            raise ValueError(f"Failed to retrieve PDB entry: {str(e)}")
+
+    @staticmethod
+    def _parse_entity(entity_data: dict) -> EntityInfo:
+        """
+        Extract the entity information from a polymer entity response.
+
+        Args:
+            entity_data: The parsed JSON of the polymer entity
+
+        Returns:
+            EntityInfo object with the entity information
+        """
+        return EntityInfo(
+            description=entity_data.get("struct", {}).get("pdbx_descriptor"),
+            polymer_type=entity_data.get("entity_poly", {}).get("type"),
+            ec_number=entity_data.get("rcsb_polymer_entity", {}).get("enzyme_class"),
+            sequence=entity_data.get("entity_poly", {}).get("pdbx_seq_one_letter_code"),
+            organism_scientific_name=entity_data.get(
+                "rcsb_polymer_entity_container_identifiers", {}
+            ).get("taxonomy_organism_scientific_name"),
+            organism_taxid=entity_data.get(
+                "rcsb_polymer_entity_container_identifiers", {}
+            ).get("taxonomy_id"),
+        )
+
+    @staticmethod
+    def _parse_entry(
+        pdb_id: str,
+        entry_data: dict,
+        polymer_entities: Dict[str, EntityInfo],
+    ) -> PDBResponse:
+        """
+        Construct the PDBResponse from an entry response and its polymer entities.
+
+        Args:
+            pdb_id: The PDB ID of the entry
+            entry_data: The parsed JSON of the entry
+            polymer_entities: The polymer entities of the entry by entity ID
+
+        Returns:
+            PDBResponse object with parsed data
+        """
+        citation = [Citation.model_validate(c) for c in entry_data.get("citation", [])]
+
+        return PDBResponse(
+            pdb_id=pdb_id,
+            citation=citation,
+            struct=StructInfo(
+                title=entry_data.get("struct", {}).get("title"),
+                experimental_method=entry_data.get("rcsb_entry_info", {}).get(
+                    "experimental_method"
+                ),
+                resolution=entry_data.get("rcsb_entry_info", {}).get(
+                    "resolution_combined", [None]
+                )[0],
+            ),
+            polymer_entities=polymer_entities,
+            rcsb_primary_citation=entry_data.get("rcsb_primary_citation"),
+            rcsb_entry_info=entry_data.get("rcsb_entry_info"),
+        )
+
     def _fetch_json(self, url: str) -> dict:
         """
         Helper method to fetch and parse JSON from a URL.
@@ -204,8 +278,54 @@ def fetch_pdb(
     if pdb_id.lower().startswith("pdb:"):
         pdb_id = pdb_id.split(":", 1)[-1]
 
-    pdb_response = client.get_entry_by_id(pdb_id)
+    pdb_response = cached("pdb", pdb_id.upper(), lambda: client.get_entry_by_id(pdb_id))
+
+    return _to_protein(pdb_response, pdb_id, protein_id, entity_id, vessel_id)
+
 
+async def fetch_pdb_async(
+    pdb_id: str,
+    engine: FetchEngine,
+    protein_id: Optional[str] = None,
+    entity_id: str = "1",
+    vessel_id: Optional[str] = None,
+) -> v2.Protein:
+    """
+    Fetch a PDB entry by ID through a fetch engine and convert it to a Protein object.
+
+    Args:
+        pdb_id: The PDB ID to fetch (e.g., '4HHB')
+        engine: The engine that sends the requests
+        protein_id: Optional custom ID for the protein (derived from PDB if not provided)
+        entity_id: The entity ID within the PDB structure (default is "1")
+        vessel_id: The ID of the vessel to add the protein to
+
+    Returns:
+        A Protein object with data from PDB
+
+    Raises:
+        ValueError: If the PDB ID is invalid, not found or the connection fails
+    """
+    if pdb_id.lower().startswith("pdb:"):
+        pdb_id = pdb_id.split(":", 1)[-1]
+
+    pdb_response = await cached_async(
+        "pdb",
+        pdb_id.upper(),
+        lambda: PDBClient().get_entry_by_id_async(pdb_id, engine),
+    )
+
+    return _to_protein(pdb_response, pdb_id, protein_id, entity_id, vessel_id)
+
+
+def _to_protein(
+    pdb_response: Optional[PDBResponse],
+    pdb_id: str,
+    protein_id: Optional[str],
+    entity_id: str,
+    vessel_id: Optional[str],
+) -> v2.Protein:
+    """Converts an entity of a PDB entry to a Protein object."""
     if not pdb_response:
         raise ValueError(f"No data found for PDB ID {pdb_id}")
 
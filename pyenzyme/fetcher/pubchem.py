@@ -1,13 +1,24 @@
-from typing import ClassVar, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Union
 
 import httpx
 from pydantic import BaseModel, Field, field_validator
 
+from pyenzyme.fetcher.batch import fetch_batch, raise_first
+from pyenzyme.fetcher.cache import cached, cached_async
 from pyenzyme.fetcher.chebi import process_id
+from pyenzyme.fetcher.engine import run_with_engine
 from pyenzyme.versions import v2
 
+if TYPE_CHECKING:
+    from pyenzyme.fetcher.engine import FetchEngine
+
 DEFAULT_TIMEOUT = 5.0
 
+# CIDs per request, which keeps the URL and the response at a moderate size
+BATCH_SIZE = 100
+
 
 class PCUrn(BaseModel):
     """
@@ -100,6 +111,56 @@ class PubChemClient(BaseModel):
 
         return PubChemQuery(**response.json())
 
+    @staticmethod
+    async def from_cid_async(cid: int, engine: FetchEngine) -> PubChemQuery:
+        """
+        Fetches compound data from PubChem by CID through a fetch engine.
+
+        Args:
+            cid: The PubChem Compound ID
+            engine: The engine that sends the request
+
+        Returns:
+            A PubChemQuery object containing the compound data
+
+        Raises:
+            httpx.HTTPError: If the PubChem API request fails
+        """
+        response = await engine.get(PubChemClient.BASE_CID_URL.format(cid))
+
+        return PubChemQuery(**response.json())
+
+    @staticmethod
+    async def from_cids_async(
+        cids: List[int], engine: FetchEngine
+    ) -> Dict[int, PubChemQuery]:
+        """
+        Fetches the data of multiple compounds from PubChem with a single request.
+
+        Args:
+            cids: The PubChem Compound IDs
+            engine: The engine that sends the request
+
+        Returns:
+            A PubChemQuery object of every compound by CID. CIDs that were not
+            found or could not be parsed are missing.
+
+        Raises:
+            httpx.HTTPError: If the PubChem API request fails
+        """
+        url = PubChemClient.BASE_CID_URL.format(",".join(str(cid) for cid in cids))
+        response = await engine.get(url)
+
+        queries = {}
+        for compound in response.json().get("PC_Compounds", []):
+            try:
+                cid = compound["id"]["id"]["cid"]
+                queries[cid] = PubChemQuery(PC_Compounds=[compound])
+            except Exception:
+                continue
+
+        return queries
+
     @staticmethod
     def extract_value(
         query: PCCompound,
@@ -170,7 +231,150 @@ def fetch_pubchem(
     if cid.lower().startswith("pubchem:"):
         cid = cid.split(":", 1)[-1]
 
-    query = PubChemClient.from_cid(int(cid))
+    query = cached("pubchem", str(int(cid)), lambda: PubChemClient.from_cid(int(cid)))
+
+    return _to_small_molecule(query, cid, smallmol_id, vessel_id)
+
+
+async def fetch_pubchem_async(
+    cid: str,
+    engine: FetchEngine,
+    smallmol_id: Optional[str] = None,
+    vessel_id: Optional[str] = None,
+) -> v2.SmallMolecule:
+    """
+    Fetches a compound from PubChem by CID through a fetch engine and converts it to a SmallMolecule object.
+
+    Args:
+        cid: The PubChem Compound ID
+        engine: The engine that sends the request
+        smallmol_id: Optional custom ID for the small molecule
+        vessel_id: Optional vessel ID for the small molecule
+
+    Returns:
+        A SmallMolecule object with data from PubChem
+
+    Raises:
+        ValueError: If the CID is invalid or required data is missing
+        httpx.HTTPError: If the PubChem API request fails
+    """
+    if cid.lower().startswith("pubchem:"):
+        cid = cid.split(":", 1)[-1]
+
+    query = await cached_async(
+        "pubchem",
+        str(int(cid)),
+        lambda: PubChemClient.from_cid_async(int(cid), engine),
+    )
+
+    return _to_small_molecule(query, cid, smallmol_id, vessel_id)
+
+
+def fetch_pubchem_batch(
+    cids: List[str],
+    vessel_id: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> List[Union[v2.SmallMolecule, Exception]]:
+    """
+    Fetches multiple compounds from PubChem by CID and converts them to SmallMolecule objects.
+
+    The CIDs are fetched in chunks of `BATCH_SIZE` with comma-separated CID
+    requests, which are sent concurrently within the PubChem rate limit.
+
+    Args:
+        cids: The PubChem Compound IDs
+        vessel_id: Optional vessel ID for the small molecules
+        return_exceptions: Whether to return the error of a CID that could not be
+            fetched in its place, instead of raising it
+
+    Returns:
+        A list of SmallMolecule objects, or errors, in the order of the CIDs
+
+    Raises:
+        ValueError: If a CID is invalid or not found
+        ConnectionError: If the connection to the PubChem server fails
+    """
+    return run_with_engine(
+        fetch_pubchem_batch_async,
+        cids,
+        vessel_id=vessel_id,
+        return_exceptions=return_exceptions,
+    )
+
+
+async def fetch_pubchem_batch_async(
+    cids: List[str],
+    engine: FetchEngine,
+    vessel_id: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> List[Union[v2.SmallMolecule, Exception]]:
+    """
+    Fetches multiple compounds from PubChem by CID through a fetch engine and converts them to SmallMolecule objects.
+
+    Args:
+        cids: The PubChem Compound IDs
+        engine: The engine that sends the requests
+        vessel_id: Optional vessel ID for the small molecules
+        return_exceptions: Whether to return the error of a CID that could not be
+            fetched in its place, instead of raising it
+
+    Returns:
+        A list of SmallMolecule objects, or errors, in the order of the CIDs
+
+    Raises:
+        ValueError: If a CID is invalid or not found
+        ConnectionError: If the connection to the PubChem server fails
+    """
+
+    async def fetch_chunk(chunk: List[str]) -> Dict[str, PubChemQuery]:
+        queries = await PubChemClient.from_cids_async([int(c) for c in chunk], engine)
+        return {str(cid): query for cid, query in queries.items()}
+
+    async def fetch_one(cid: str) -> PubChemQuery:
+        try:
+            return await PubChemClient.from_cid_async(int(cid), engine)
+        except httpx.HTTPStatusError as e:
+            raise ValueError(f"Failed to fetch PubChem CID {cid}: {str(e)}")
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Connection to PubChem failed: {str(e)}")
+
+    queries = await fetch_batch(
+        cids,
+        source="pubchem",
+        normalize=_normalize_cid,
+        fetch_chunk=fetch_chunk,
+        fetch_one=fetch_one,
+        chunk_size=BATCH_SIZE,
+    )
+
+    small_molecules = []
+    for cid, query in zip(cids, queries):
+        if not isinstance(query, Exception):
+            try:
+                query = _to_small_molecule(query, _normalize_cid(cid), None, vessel_id)
+            except ValueError as e:
+                query = e
+
+        small_molecules.append(query)
+
+    return small_molecules if return_exceptions else raise_first(small_molecules)
+
+
+def _normalize_cid(cid: str) -> str:
+    """Removes the 'pubchem:' prefix of a CID and checks that it is a number."""
+    if cid.lower().startswith("pubchem:"):
+        cid = cid.split(":", 1)[-1]
+
+    return str(int(cid))
+
+
+def _to_small_molecule(
+    query: PubChemQuery,
+    cid: str,
+    smallmol_id: Optional[str],
+    vessel_id: Optional[str],
+) -> v2.SmallMolecule:
+    """Converts the first compound of a PubChem query to a SmallMolecule object."""
     pc_compound = query.pc_compounds[0]
     name = _extract_name(pc_compound, int(cid))
 
@@ -0,0 +1,169 @@
+"""
+Classification of database identifiers.
+
+`compose` used to try every fetcher of an entity type in turn until one
+succeeded, hence an unprefixed PDB code first cost a failed UniProt request and a
+PubChem CID a failed ChEBI search. `IdentifierResolver` instead classifies an
+identifier up front, by its prefix or by the accession format of the database,
+and routes it straight to the fetcher of that database:
+
+- Prefixes: "CHEBI:", "PUBCHEM:" or "CID:", "RHEA:", "UNIPROT:" and "PDB:",
+  in any case.
+- Formats: UniProt accessions, e.g. "P07327" or "A0A023GPI8", and PDB codes of a
+  digit followed by three characters, e.g. "1A23".
+
+Identifiers that match no or several databases, such as a bare number that may
+be a PubChem CID or a ChEBI ID, are ambiguous and still go through the
+fallback chain of the entity type. The same applies to identifiers whose format
+matches a database outside the chain, e.g. a four-digit PubChem CID that looks
+like a PDB code.
+
+Every `FetchEngine` holds its own resolver, hence the counters of concurrent
+`compose` calls with separate engines do not mix.
+
+Example:
+    >>> resolver = IdentifierResolver()
+    >>> resolver.classify("cid:702")
+    Resolution(database='pubchem', identifier='702', strategy='prefix')
+    >>> resolver.route("1A23", ["uniprot", "pdb"])
+    Resolution(database='pdb', identifier='1A23', strategy='pattern')
+    >>> resolver.calls_saved
+    Counter({'pattern': 1})
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+# Identifier prefixes by database
+PREFIXES: Dict[str, str] = {
+    "chebi": "chebi",
+    "pubchem": "pubchem",
+    "cid": "pubchem",
+    "rhea": "rhea",
+    "uniprot": "uniprot",
+    "pdb": "pdb",
+}
+
+# Accession formats by database
+PATTERNS: Dict[str, re.Pattern] = {
+    "uniprot": re.compile(
+        r"^(?:[OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9](?:[A-Z][A-Z0-9]{2}[0-9]){1,2})$",
+        re.IGNORECASE,
+    ),
+    "pdb": re.compile(r"^[0-9][A-Z0-9]{3}$", re.IGNORECASE),
+}
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """
+    The database an identifier belongs to.
+
+    Attributes:
+        database (Optional[str]): The database, or None if the identifier is
+            ambiguous.
+        identifier (str): The identifier in the form the fetcher of the database
+            expects, e.g. "CHEBI:15377" or "702" for "cid:702".
+        strategy (str): How the identifier was classified, either "prefix",
+            "pattern" or "fallback".
+    """
+
+    database: Optional[str]
+    identifier: str
+    strategy: str
+
+
+class IdentifierResolver:
+    """
+    Routes identifiers to the fetcher of their database.
+
+    Attributes:
+        routed (Counter): The number of identifiers by strategy.
+        calls_saved (Counter): The number of fetcher attempts skipped by strategy.
+            Routing an identifier skips the fetchers ahead of its database in the
+            fallback chain, each of which would have cost at least one failed
+            request. Identifiers routed to a database outside the chain save
+            nothing, since no fetcher is attempted.
+    """
+
+    routed: Counter
+    calls_saved: Counter
+
+    def __init__(self):
+        """Initialize the IdentifierResolver instance."""
+        self.routed = Counter()
+        self.calls_saved = Counter()
+
+    def classify(self, identifier: str) -> Resolution:
+        """
+        Classifies an identifier by its prefix or accession format.
+
+        Args:
+            identifier (str): The identifier, e.g. "CHEBI:15377" or "P07327".
+
+        Returns:
+            Resolution: The database and normalized identifier, or an ambiguous
+                resolution with the identifier unchanged.
+        """
+        identifier = identifier.strip()
+        prefix, separator, rest = identifier.partition(":")
+
+        if separator and prefix.lower() in PREFIXES:
+            database = PREFIXES[prefix.lower()]
+            return Resolution(database, _normalize(database, rest), "prefix")
+
+        matches = [db for db, pattern in PATTERNS.items() if pattern.match(identifier)]
+
+        if len(matches) == 1:
+            return Resolution(matches[0], identifier, "pattern")
+
+        return Resolution(None, identifier, "fallback")
+
+    def route(self, identifier: str, databases: Sequence[str]) -> Resolution:
+        """
+        Classifies an identifier and records the fetcher attempts it saves.
+
+        Args:
+            identifier (str): The identifier to route.
+            databases (Sequence[str]): The fallback chain of the entity type.
+
+        Returns:
+            Resolution: The resolution of the identifier. A format match of a
+                database outside of the chain is ambiguous, whereas a prefix of
+                such a database is kept, hence none of the fetchers is attempted.
+        """
+        resolution = self.classify(identifier)
+
+        if resolution.strategy == "pattern" and resolution.database not in databases:
+            resolution = Resolution(None, identifier.strip(), "fallback")
+
+        self.routed[resolution.strategy] += 1
+
+        if resolution.database in databases:
+            saved = list(databases).index(resolution.database)
+
+            if saved:
+                self.calls_saved[resolution.strategy] += saved
+
+        return resolution
+
+    def reset(self):
+        """Resets the counters."""
+        self.routed.clear()
+        self.calls_saved.clear()
+
+
+def _normalize(database: str, identifier: str) -> str:
+    """Puts an identifier without prefix into the form the fetcher expects."""
+    identifier = identifier.strip()
+
+    if database == "chebi":
+        return f"CHEBI:{identifier}"
+    if database == "rhea":
+        return f"RHEA:{identifier}"
+
+    return identifier
@@ -5,17 +5,25 @@ This module provides functionality to fetch reaction data from the
 Rhea database by ID and map it to the PyEnzyme data model (v2).
 """
 
+from __future__ import annotations
+
+import asyncio
 import re
 from io import StringIO
-from typing import ClassVar, List, Optional, Tuple
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Tuple
 
 import httpx
 import pandas as pd
 from pydantic import BaseModel, ConfigDict
 
-from pyenzyme.fetcher.chebi import fetch_chebi
+from pyenzyme.fetcher.cache import cached, cached_async
+from pyenzyme.fetcher.chebi import fetch_chebi, fetch_chebi_async
+from pyenzyme.fetcher.mirror import get_local_mirror
 from pyenzyme.versions import v2
 
+if TYPE_CHECKING:
+    from pyenzyme.fetcher.engine import FetchEngine
+
 DEFAULT_TIMEOUT = 5.0
 
 
@@ -91,6 +99,61 @@ class RheaClient(BaseModel):
         tsv_content = cls.fetch_tsv(rhea_id)
         json_content = cls.fetch_json(rhea_id)
 
+        return cls._from_contents(rhea_id, tsv_content, json_content)
+
+    @classmethod
+    async def from_id_async(cls, rhea_id: str, engine: FetchEngine) -> "RheaClient":
+        """
+        Create a RheaClient instance from a Rhea ID through a fetch engine.
+
+        The TSV and JSON representations of the entry are fetched concurrently.
+
+        Args:
+            rhea_id: The Rhea ID to fetch, can be with or without the 'RHEA:' prefix
+            engine: The engine that sends the requests
+
+        Returns:
+            A RheaClient instance with the fetched data
+
+        Raises:
+            ValueError: If no results are found for the given Rhea ID
+            HTTPError: If the request to the Rhea API fails
+        """
+        if rhea_id.startswith("RHEA:"):
+            rhea_id = rhea_id.split(":")[-1]
+
+        tsv_response, json_response = await asyncio.gather(
+            engine.get(cls.BASE_URL.format(rhea_id, "tsv")),
+            engine.get(cls.BASE_URL.format(rhea_id, "json")),
+        )
+
+        return cls._from_contents(
+            rhea_id,
+            pd.read_csv(StringIO(tsv_response.text), sep="\t"),
+            RheaQuery.model_validate(json_response.json()),
+        )
+
+    @classmethod
+    def _from_contents(
+        cls,
+        rhea_id: str,
+        tsv_content: pd.DataFrame,
+        json_content: RheaQuery,
+    ) -> "RheaClient":
+        """
+        Create a RheaClient instance from the TSV and JSON responses of an entry.
+
+        Args:
+            rhea_id: The Rhea ID without the 'RHEA:' prefix
+            tsv_content: The parsed TSV response
+            json_content: The parsed JSON response
+
+        Returns:
+            A RheaClient instance with the fetched data
+
+        Raises:
+            ValueError: If no results are found for the given Rhea ID
+        """
         if len(json_content.results) == 0:
             raise ValueError(f"No results found for RHEA ID: {rhea_id}")
 
@@ -154,7 +217,8 @@ def fetch_rhea(
 
     This function retrieves reaction data from the Rhea database and
     converts it to the PyEnzyme data model, including fetching all
-    associated small molecules from ChEBI.
+    associated small molecules from ChEBI. Reactions and small molecules in
+    the local mirror, if one is set, are not requested.
 
     Args:
         rhea_id: The Rhea ID to fetch, can be with or without the 'RHEA:' prefix
@@ -168,9 +232,81 @@ def fetch_rhea(
         ValueError: If the Rhea ID is invalid or not found
         ConnectionError: If the connection to the Rhea server fails
     """
-    client = RheaClient.from_id(rhea_id)
-    rhea_id = client.json_content.id
+    client = _from_mirror(rhea_id) or cached(
+        "rhea", rhea_id.split(":")[-1], lambda: RheaClient.from_id(rhea_id)
+    )
+    n_reactants, n_products = _count_participants(client)
+
+    small_molecules = [
+        fetch_chebi(chebi_id, vessel_id=vessel_id)
+        for chebi_id in client.chebi_ids[: n_reactants + n_products]
+    ]
+
+    return _to_reaction(client, small_molecules, n_reactants), small_molecules
 
+
+async def fetch_rhea_async(
+    rhea_id: str,
+    engine: FetchEngine,
+    vessel_id: Optional[str] = None,
+) -> Tuple[v2.Reaction, List[v2.SmallMolecule]]:
+    """
+    Fetch a Rhea entry by ID through a fetch engine and convert it to a Reaction object.
+
+    All associated small molecules are fetched from ChEBI concurrently.
+
+    Args:
+        rhea_id: The Rhea ID to fetch, can be with or without the 'RHEA:' prefix
+        engine: The engine that sends the requests
+        vessel_id: The ID of the vessel to add the small molecules to
+    Returns:
+        A tuple containing:
+            - A Reaction object with data from Rhea
+            - A list of SmallMolecule objects for all reactants and products
+
+    Raises:
+        ValueError: If the Rhea ID is invalid or not found
+        ConnectionError: If the connection to the Rhea server fails
+    """
+    client = _from_mirror(rhea_id) or await cached_async(
+        "rhea",
+        rhea_id.split(":")[-1],
+        lambda: RheaClient.from_id_async(rhea_id, engine),
+    )
+    n_reactants, n_products = _count_participants(client)
+
+    small_molecules = list(
+        await asyncio.gather(
+            *(
+                fetch_chebi_async(chebi_id, engine, vessel_id=vessel_id)
+                for chebi_id in client.chebi_ids[: n_reactants + n_products]
+            )
+        )
+    )
+
+    return _to_reaction(client, small_molecules, n_reactants), small_molecules
+
+
+def _from_mirror(rhea_id: str) -> Optional[RheaClient]:
+    """Looks a Rhea reaction up in the local mirror, if one is set."""
+    mirror = get_local_mirror()
+
+    if mirror is None:
+        return None
+
+    return mirror.get_rhea(rhea_id)
+
+
+def _count_participants(client: RheaClient) -> Tuple[int, int]:
+    """
+    Count the reactants and products in the equation of a Rhea entry.
+
+    Args:
+        client: The RheaClient of the entry
+
+    Returns:
+        The number of reactants and the number of products
+    """
     equation = client.json_content.equation
 
     # Split equation into reactants and products sides
@@ -178,32 +314,39 @@ def fetch_rhea(
     reactant_species = _split_chemical_equation_side(equation_sides[0])
     product_species = _split_chemical_equation_side(equation_sides[1])
 
-    n_reactants = len(reactant_species)
-    n_products = len(product_species)
+    return len(reactant_species), len(product_species)
+
+
+def _to_reaction(
+    client: RheaClient,
+    small_molecules: List[v2.SmallMolecule],
+    n_reactants: int,
+) -> v2.Reaction:
+    """
+    Convert a Rhea entry and its participants to a Reaction object.
+
+    Args:
+        client: The RheaClient of the entry
+        small_molecules: The reactants followed by the products of the reaction
+        n_reactants: The number of reactants
+
+    Returns:
+        A Reaction object with data from Rhea
+    """
+    rhea_id = client.json_content.id
 
-    small_molecules = []
     reactants = []
     products = []
 
-    # Process each chemical species in the reaction
-    for i in range(n_reactants + n_products):
-        small_molecule = fetch_chebi(
-            client.chebi_ids[i],
-            vessel_id=vessel_id,
+    for i, small_molecule in enumerate(small_molecules):
+        reaction_element = v2.ReactionElement(
+            species_id=small_molecule.id,
+            stoichiometry=1,
         )
-        small_molecules.append(small_molecule)
 
         if i < n_reactants:
-            reaction_element = v2.ReactionElement(
-                species_id=small_molecule.id,
-                stoichiometry=1,
-            )
             reactants.append(reaction_element)
         else:
-            reaction_element = v2.ReactionElement(
-                species_id=small_molecule.id,
-                stoichiometry=1,
-            )
             products.append(reaction_element)
 
     reaction = v2.Reaction(
@@ -224,7 +367,7 @@ def fetch_rhea(
     # Set linked data identifier
     reaction.ld_id = f"rhea:{rhea_id}"
 
-    return reaction, small_molecules
+    return reaction
 
 
 def _split_chemical_equation_side(equation_side: str) -> List[str]:
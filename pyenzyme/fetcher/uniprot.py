@@ -5,12 +5,24 @@ This module provides functionality to fetch protein data from the
 UniProt database by ID and map it to the PyEnzyme data model (v2).
 """
 
+from __future__ import annotations
+
+import httpx
 import requests
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
+from pyenzyme.fetcher.batch import fetch_batch, raise_first
+from pyenzyme.fetcher.cache import cached, cached_async
 from pyenzyme.fetcher.chebi import process_id
+from pyenzyme.fetcher.engine import run_with_engine
 from pyenzyme.versions import v2
 
+if TYPE_CHECKING:
+    from pyenzyme.fetcher.engine import FetchEngine
+
+# Accessions per request to the accessions endpoint, which accepts up to 1000
+BATCH_SIZE = 100
+
 
 class ECNumber(BaseModel):
     """Model for EC number in UniProt API"""
@@ -69,6 +81,7 @@ class UniProtClient:
     """Client for accessing the UniProt API to fetch protein data."""
 
     BASE_URL = "https://rest.uniprot.org/uniprotkb"
+    ACCESSIONS_URL = "https://rest.uniprot.org/uniprotkb/accessions"
 
     def __init__(self):
         """Initialize the UniProt client."""
@@ -109,6 +122,75 @@ class UniProtClient:
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Connection to UniProt server failed: {str(e)}")
 
+    async def get_entry_by_id_async(
+        self, uniprot_id: str, engine: FetchEngine
+    ) -> UniProtEntry:
+        """
+        Fetch a UniProt entry by its ID through a fetch engine.
+
+        Args:
+            uniprot_id: The UniProt ID to fetch
+            engine: The engine that sends the request
+
+        Returns:
+            UniProtEntry object with the parsed response data
+
+        Raises:
+            ValueError: If the UniProt ID is invalid or not found
+            ConnectionError: If the connection to the UniProt server fails
+        """
+        url = f"{self.BASE_URL}/{uniprot_id}.json"
+
+        try:
+            response = await engine.get(url)
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Connection to UniProt server failed: {str(e)}")
+
+        try:
+            return UniProtEntry.model_validate(response.json())
+        except Exception as e:
+            raise ValueError(f"Failed to parse UniProt response: {str(e)}")
+
+    async def get_entries_by_ids_async(
+        self, uniprot_ids: List[str], engine: FetchEngine
+    ) -> Dict[str, UniProtEntry]:
+        """
+        Fetch multiple UniProt entries with a single request to the accessions endpoint.
+
+        Args:
+            uniprot_ids: The UniProt accessions to fetch
+            engine: The engine that sends the request
+
+        Returns:
+            The entries by primary and secondary accession. Accessions that were not
+            found or could not be parsed are missing.
+
+        Raises:
+            ConnectionError: If the request fails, e.g. for a malformed accession
+        """
+        params = {
+            "accessions": ",".join(uniprot_ids),
+            "format": "json",
+            "size": str(len(uniprot_ids)),
+        }
+
+        try:
+            response = await engine.get(self.ACCESSIONS_URL, params=params)
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Connection to UniProt server failed: {str(e)}")
+
+        entries = {}
+        for result in response.json().get("results", []):
+            try:
+                entry = UniProtEntry.model_validate(result)
+            except Exception:
+                continue
+
+            for accession in [entry.accession, *result.get("secondaryAccessions", [])]:
+                entries[accession] = entry
+
+        return entries
+
 
 def fetch_uniprot(
     uniprot_id: str,
@@ -134,11 +216,142 @@ def fetch_uniprot(
     if uniprot_id.lower().startswith("uniprot:"):
         uniprot_id = uniprot_id.split(":", 1)[-1]
 
-    uniprot_entry = client.get_entry_by_id(uniprot_id)
+    uniprot_entry = cached(
+        "uniprot",
+        uniprot_id.upper(),
+        lambda: client.get_entry_by_id(uniprot_id),
+    )
 
     if not uniprot_entry:
         raise ValueError(f"No data found for UniProt ID {uniprot_id}")
 
+    return _to_protein(uniprot_entry, uniprot_id, protein_id, vessel_id)
+
+
+async def fetch_uniprot_async(
+    uniprot_id: str,
+    engine: FetchEngine,
+    protein_id: Optional[str] = None,
+    vessel_id: Optional[str] = None,
+) -> v2.Protein:
+    """
+    Fetch a UniProt entry by ID through a fetch engine and convert it to a Protein object.
+
+    Args:
+        uniprot_id: The UniProt ID to fetch
+        engine: The engine that sends the request
+        protein_id: Optional custom ID for the protein
+        vessel_id: The ID of the vessel to add the protein to
+
+    Returns:
+        A Protein object with data from UniProt
+
+    Raises:
+        ValueError: If the UniProt ID is invalid or not found
+        ConnectionError: If the connection to the UniProt server fails
+    """
+    if uniprot_id.lower().startswith("uniprot:"):
+        uniprot_id = uniprot_id.split(":", 1)[-1]
+
+    uniprot_entry = await cached_async(
+        "uniprot",
+        uniprot_id.upper(),
+        lambda: UniProtClient().get_entry_by_id_async(uniprot_id, engine),
+    )
+
+    return _to_protein(uniprot_entry, uniprot_id, protein_id, vessel_id)
+
+
+def fetch_uniprot_batch(
+    uniprot_ids: List[str],
+    vessel_id: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> List[Union[v2.Protein, Exception]]:
+    """
+    Fetch multiple UniProt entries by ID and convert them to Protein objects.
+
+    The accessions are fetched in chunks of `BATCH_SIZE` from the accessions
+    endpoint, which are sent concurrently.
+
+    Args:
+        uniprot_ids: The UniProt IDs to fetch
+        vessel_id: The ID of the vessel to add the proteins to
+        return_exceptions: Whether to return the error of an ID that could not be
+            fetched in its place, instead of raising it
+
+    Returns:
+        A list of Protein objects, or errors, in the order of the IDs
+
+    Raises:
+        ValueError: If an UniProt ID is invalid or not found
+        ConnectionError: If the connection to the UniProt server fails
+    """
+    return run_with_engine(
+        fetch_uniprot_batch_async,
+        uniprot_ids,
+        vessel_id=vessel_id,
+        return_exceptions=return_exceptions,
+    )
+
+
+async def fetch_uniprot_batch_async(
+    uniprot_ids: List[str],
+    engine: FetchEngine,
+    vessel_id: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> List[Union[v2.Protein, Exception]]:
+    """
+    Fetch multiple UniProt entries by ID through a fetch engine and convert them to Protein objects.
+
+    Args:
+        uniprot_ids: The UniProt IDs to fetch
+        engine: The engine that sends the requests
+        vessel_id: The ID of the vessel to add the proteins to
+        return_exceptions: Whether to return the error of an ID that could not be
+            fetched in its place, instead of raising it
+
+    Returns:
+        A list of Protein objects, or errors, in the order of the IDs
+
+    Raises:
+        ValueError: If an UniProt ID is invalid or not found
+        ConnectionError: If the connection to the UniProt server fails
+    """
+    client = UniProtClient()
+    entries = await fetch_batch(
+        uniprot_ids,
+        source="uniprot",
+        normalize=_normalize_id,
+        fetch_chunk=lambda chunk: client.get_entries_by_ids_async(chunk, engine),
+        fetch_one=lambda uniprot_id: client.get_entry_by_id_async(uniprot_id, engine),
+        chunk_size=BATCH_SIZE,
+    )
+
+    proteins = [
+        entry
+        if isinstance(entry, Exception)
+        else _to_protein(entry, _normalize_id(uniprot_id), None, vessel_id)
+        for uniprot_id, entry in zip(uniprot_ids, entries)
+    ]
+
+    return proteins if return_exceptions else raise_first(proteins)
+
+
+def _normalize_id(uniprot_id: str) -> str:
+    """Removes the 'uniprot:' prefix and converts a UniProt ID to upper case."""
+    if uniprot_id.lower().startswith("uniprot:"):
+        uniprot_id = uniprot_id.split(":", 1)[-1]
+
+    return uniprot_id.upper()
+
+
+def _to_protein(
+    uniprot_entry: UniProtEntry,
+    uniprot_id: str,
+    protein_id: Optional[str],
+    vessel_id: Optional[str],
+) -> v2.Protein:
+    """Converts a UniProt entry to a Protein object."""
     # Extract protein name
     name = uniprot_id
     if (
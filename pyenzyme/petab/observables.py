@@ -51,14 +51,14 @@ class ObservableRow(BaseRow):
         observables = {
             meas_data.species_id
             for meas_data in first_measurement.species_data
-            if meas_data.data
+            if len(meas_data.data) > 0
         }
 
         for measurement in enzmldoc.measurements[1:]:
             current_observables = {
                 meas_data.species_id
                 for meas_data in measurement.species_data
-                if meas_data.data
+                if len(meas_data.data) > 0
             }
 
             missing = current_observables - observables
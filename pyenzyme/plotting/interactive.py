@@ -375,7 +375,7 @@ def _get_fit(
     }
 
     # Get the time points from the measurement
-    time = next((s.time for s in measurement.species_data if s.time), None)
+    time = next((s.time for s in measurement.species_data if len(s.time) > 0), None)
 
     if time is None:
         raise ValueError("Time is not set for any species in the measurement")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import IO
 
@@ -20,6 +21,26 @@ from .versions.handler import VersionHandler, SupportedVersions
 from .utils import _get_unit
 
 
+@dataclass
+class _ParserContext:
+    """
+    State shared by the parsing functions while reading a single SBML document.
+
+    Every call of `read_sbml` creates its own context, hence documents can be read
+    concurrently from multiple threads.
+
+    Attributes:
+        version (VersionHandler): The handler for the EnzymeML version of the document.
+        enzmldoc: The EnzymeML document that is being populated.
+        units (dict[str, pe.UnitDefinition]): The unit definitions of the SBML model,
+            keyed by their ID.
+    """
+
+    version: VersionHandler
+    enzmldoc: pe.EnzymeMLDocument
+    units: dict[str, pe.UnitDefinition] = field(default_factory=dict)
+
+
 def read_sbml(cls, path: Path | str):
     """
     Reads an SBML file and initializes an EnzymeML document.
@@ -29,6 +50,9 @@ def read_sbml(cls, path: Path | str):
     different versions of the EnzymeML format and maps SBML elements to their
     corresponding EnzymeML entities.
 
+    The function does not rely on module-level state and is safe to call from
+    multiple threads at once.
+
     Args:
         cls: The class to instantiate the EnzymeML document.
         path (Path | str): The path to the OMEX archive containing the SBML file.
@@ -39,58 +63,58 @@ def read_sbml(cls, path: Path | str):
     """
     add_logger(name="SBML")
 
-    # Create globals to use in the functions
-    global units
-    global path_prefix
-    global version
-    global enzmldoc
-
     # Read the OMEX archive and extract the SBML and TSV paths
     sbml_handler, data = read_sbml_omex(path)
 
-    # Find out which version of the SBML file we are dealing with
-    namespaces = xmlutils.extract_namespaces(sbml_handler.read())
-    version = VersionHandler.from_uri(namespaces)
-    sbml_handler.seek(0)
+    with sbml_handler:
+        # Find out which version of the SBML file we are dealing with
+        namespaces = xmlutils.extract_namespaces(sbml_handler.read())
+        version = VersionHandler.from_uri(namespaces)
+        sbml_handler.seek(0)
 
-    # Read the SBML file and init an EnzymeML document
-    model = _init_and_read_sbml(sbml_handler)
-    enzmldoc = cls(name=model.getName())
+        # Read the SBML file and init an EnzymeML document
+        model = _init_and_read_sbml(sbml_handler)
+
+    ctx = _ParserContext(version=version, enzmldoc=cls(name=model.getName()))
+    enzmldoc = ctx.enzmldoc
 
     # Extract units to map these to the EnzymeML entities
-    units = {  # type: ignore
+    ctx.units = {
         unit.getId(): _parse_unit(unit) for unit in model.getListOfUnitDefinitions()
     }
 
     # Extract and sort species
-    species = [_parse_species(species) for species in model.getListOfSpecies()]
+    species = [_parse_species(ctx, species) for species in model.getListOfSpecies()]
     enzmldoc.small_molecules = [s for s in species if isinstance(s, pe.SmallMolecule)]
     enzmldoc.proteins = [s for s in species if isinstance(s, pe.Protein)]
     enzmldoc.complexes = [s for s in species if isinstance(s, pe.Complex)]
 
     # Extract vessels
-    enzmldoc.vessels = [_parse_vessel(comp) for comp in model.getListOfCompartments()]
+    enzmldoc.vessels = [
+        _parse_vessel(ctx, comp) for comp in model.getListOfCompartments()
+    ]
 
     # Extract equations and parameters
     enzmldoc.parameters = [
-        _parse_parameter(param) for param in model.getListOfParameters()
+        _parse_parameter(ctx, param) for param in model.getListOfParameters()
     ]  # type: ignore
     enzmldoc.equations += [
-        _parse_equation(rule, pe.EquationType.INITIAL_ASSIGNMENT)
+        _parse_equation(ctx, rule, pe.EquationType.INITIAL_ASSIGNMENT)
         for rule in model.getListOfInitialAssignments()
     ]
 
     enzmldoc.equations += [
-        _parse_equation(rule, pe.EquationType.ODE)
+        _parse_equation(ctx, rule, pe.EquationType.ODE)
         for rule in model.getListOfRules()
         if rule.isRate()
     ]
 
     enzmldoc.reactions = [
-        _parse_reaction(reaction) for reaction in model.getListOfReactions()
+        _parse_reaction(ctx, reaction) for reaction in model.getListOfReactions()
     ]
 
     enzmldoc.measurements = _parse_measurements(
+        ctx,
         model=model,
         list_of_reactions=model.getListOfReactions(),
         meas_data=data,
@@ -165,7 +189,7 @@ def _parse_unit(unit: sbml.UnitDefinition):
     return enzml_unit
 
 
-def _parse_species(species: sbml.Species):
+def _parse_species(ctx: _ParserContext, species: sbml.Species):
     """
     Parse a species from an SBML model into EnzymeML small molecule or protein.
 
@@ -173,6 +197,7 @@ def _parse_species(species: sbml.Species):
     the appropriate parsing function to create the corresponding EnzymeML entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         species (sbml.Species): The SBML species.
 
     Returns:
@@ -184,18 +209,18 @@ def _parse_species(species: sbml.Species):
     sbo_term = species.getSBOTermID()
 
     if sbo_term == "SBO:0000247":
-        return _parse_small_molecule(species)
+        return _parse_small_molecule(ctx, species)
     elif sbo_term == "SBO:0000252":
-        return _parse_protein(species)
+        return _parse_protein(ctx, species)
     elif sbo_term == "SBO:0000296":
-        return _parse_complex(species)
+        return _parse_complex(ctx, species)
     else:
         logger.error(
             f"Unknown SBO term for species '{species.getId()}': {sbo_term}. Unable to parse species."
         )
 
 
-def _parse_small_molecule(species: sbml.Species):
+def _parse_small_molecule(ctx: _ParserContext, species: sbml.Species):
     """
     Parse a species from an SBML model into an EnzymeML small molecule.
 
@@ -204,14 +229,15 @@ def _parse_small_molecule(species: sbml.Species):
     molecule entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         species (sbml.Species): The SBML species with SBO term for small molecule.
 
     Returns:
         An EnzymeML small molecule with properties extracted from the SBML species
         and its annotations.
     """
-    parsed = version.parse_annotation(annotation=species.getAnnotationString())
-    annots = version.extract(parsed, "small_molecule")
+    parsed = ctx.version.parse_annotation(annotation=species.getAnnotationString())
+    annots = ctx.version.extract(parsed, "small_molecule")
 
     small_molecule = pe.SmallMolecule(
         id=species.getId(),
@@ -226,7 +252,7 @@ def _parse_small_molecule(species: sbml.Species):
     return small_molecule
 
 
-def _parse_protein(species: sbml.Species):
+def _parse_protein(ctx: _ParserContext, species: sbml.Species):
     """
     Parse a species from an SBML model into an EnzymeML protein.
 
@@ -234,14 +260,15 @@ def _parse_protein(species: sbml.Species):
     indicating it's a protein and creates an equivalent EnzymeML protein entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         species (sbml.Species): The SBML species with SBO term for protein.
 
     Returns:
         An EnzymeML protein with properties extracted from the SBML species
         and its annotations.
     """
-    parsed = version.parse_annotation(annotation=species.getAnnotationString())
-    annots = version.extract(parsed, "protein")
+    parsed = ctx.version.parse_annotation(annotation=species.getAnnotationString())
+    annots = ctx.version.extract(parsed, "protein")
 
     protein = pe.Protein(
         id=species.getId(),
@@ -256,7 +283,7 @@ def _parse_protein(species: sbml.Species):
     return protein
 
 
-def _parse_complex(species: sbml.Species):
+def _parse_complex(ctx: _ParserContext, species: sbml.Species):
     """
     Parse a species from an SBML model into an EnzymeML complex.
 
@@ -264,14 +291,15 @@ def _parse_complex(species: sbml.Species):
     indicating it's a complex and creates an equivalent EnzymeML complex entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         species (sbml.Species): The SBML species with SBO term for complex.
 
     Returns:
         An EnzymeML complex with properties extracted from the SBML species
         and its annotations.
     """
-    parsed = version.parse_annotation(annotation=species.getAnnotationString())
-    annots = version.extract(parsed, "complex")
+    parsed = ctx.version.parse_annotation(annotation=species.getAnnotationString())
+    annots = ctx.version.extract(parsed, "complex")
 
     complex_ = pe.Complex(
         id=species.getId(),
@@ -285,7 +313,7 @@ def _parse_complex(species: sbml.Species):
     return complex_
 
 
-def _parse_vessel(compartment: sbml.Compartment):
+def _parse_vessel(ctx: _ParserContext, compartment: sbml.Compartment):
     """
     Parse a compartment from an SBML model into an EnzymeML vessel.
 
@@ -293,6 +321,7 @@ def _parse_vessel(compartment: sbml.Compartment):
     an equivalent EnzymeML vessel entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         compartment (sbml.Compartment): The SBML compartment.
 
     Returns:
@@ -306,7 +335,7 @@ def _parse_vessel(compartment: sbml.Compartment):
         id=compartment.getId(),
         name=compartment.getName(),
         volume=_check_nan(compartment.getSize()),  # type: ignore
-        unit=_get_unit(compartment.getUnits(), units),  # type: ignore
+        unit=_get_unit(compartment.getUnits(), ctx.units),  # type: ignore
     )
 
     parse_sbml_rdf_annotation(compartment, vessel)
@@ -314,7 +343,7 @@ def _parse_vessel(compartment: sbml.Compartment):
     return vessel
 
 
-def _parse_parameter(parameter: sbml.Parameter):
+def _parse_parameter(ctx: _ParserContext, parameter: sbml.Parameter):
     """
     Parse a parameter from an SBML model into an EnzymeML parameter.
 
@@ -322,6 +351,7 @@ def _parse_parameter(parameter: sbml.Parameter):
     an equivalent EnzymeML parameter entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         parameter (sbml.Parameter): The SBML parameter.
 
     Returns:
@@ -331,8 +361,8 @@ def _parse_parameter(parameter: sbml.Parameter):
     Note:
         The function prints the parameter annotation string for debugging purposes.
     """
-    parsed = version.parse_annotation(annotation=parameter.getAnnotationString())
-    annots = version.extract(parsed, "parameter")
+    parsed = ctx.version.parse_annotation(annotation=parameter.getAnnotationString())
+    annots = ctx.version.extract(parsed, "parameter")
 
     parameter = pe.Parameter(
         id=parameter.getId(),
@@ -340,14 +370,18 @@ def _parse_parameter(parameter: sbml.Parameter):
         symbol=parameter.getId(),
         value=_check_nan(parameter.getValue()),
         constant=parameter.getConstant(),
-        unit=_get_unit(parameter.getUnits(), units),  # type: ignore
+        unit=_get_unit(parameter.getUnits(), ctx.units),  # type: ignore
         **annots,
     )
 
     return parameter
 
 
-def _parse_equation(rule: sbml.Rule, rule_type: pe.EquationType):
+def _parse_equation(
+    ctx: _ParserContext,
+    rule: sbml.Rule,
+    rule_type: pe.EquationType,
+):
     """
     Parse a rule from an SBML model into an EnzymeML equation.
 
@@ -355,6 +389,7 @@ def _parse_equation(rule: sbml.Rule, rule_type: pe.EquationType):
     EnzymeML equation entity based on the specified equation type.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         rule (sbml.Rule): The SBML rule.
         rule_type (pe.EquationType): The type of the equation (INITIAL_ASSIGNMENT, ODE, or RATE_LAW).
 
@@ -377,11 +412,11 @@ def _parse_equation(rule: sbml.Rule, rule_type: pe.EquationType):
         case _:
             raise ValueError(f"Unknown rule type: {rule_type}")
 
-    parsed = version.parse_annotation(annotation=rule.getAnnotationString())
-    annots = version.extract(parsed, "variables")
+    parsed = ctx.version.parse_annotation(annotation=rule.getAnnotationString())
+    annots = ctx.version.extract(parsed, "variables")
 
-    if version.version == SupportedVersions.VERSION1:
-        _map_v1_variables(annots, equation)
+    if ctx.version.version == SupportedVersions.VERSION1:
+        _map_v1_variables(ctx, annots, equation)
 
     equation = pe.Equation(
         equation_type=rule_type,
@@ -393,7 +428,7 @@ def _parse_equation(rule: sbml.Rule, rule_type: pe.EquationType):
     return equation
 
 
-def _map_v1_variables(annots: dict, equation: str):
+def _map_v1_variables(ctx: _ParserContext, annots: dict, equation: str):
     """
     Map variables for version 1 of the EnzymeML format.
 
@@ -401,6 +436,7 @@ def _map_v1_variables(annots: dict, equation: str):
     species in the EnzymeML document and adds them to the annotations.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         annots (dict): The annotations dictionary to update with variables.
         equation (str): The equation string to search for variables.
     """
@@ -408,9 +444,9 @@ def _map_v1_variables(annots: dict, equation: str):
         annots["variables"] = []
 
     all_species = [
-        *[s.id for s in enzmldoc.small_molecules],
-        *[p.id for p in enzmldoc.proteins],
-        *[c.id for c in enzmldoc.complexes],
+        *[s.id for s in ctx.enzmldoc.small_molecules],
+        *[p.id for p in ctx.enzmldoc.proteins],
+        *[c.id for c in ctx.enzmldoc.complexes],
     ]
     for species in all_species:
         if bool(re.search(rf"\b{species}\b", equation)):
@@ -423,7 +459,7 @@ def _map_v1_variables(annots: dict, equation: str):
             )
 
 
-def _parse_reaction(reaction: sbml.Reaction):
+def _parse_reaction(ctx: _ParserContext, reaction: sbml.Reaction):
     """
     Parse a reaction from an SBML model into an EnzymeML reaction.
 
@@ -431,6 +467,7 @@ def _parse_reaction(reaction: sbml.Reaction):
     products, modifiers, and kinetic law, and creates an equivalent EnzymeML reaction.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         reaction (sbml.Reaction): The SBML reaction.
 
     Returns:
@@ -439,11 +476,13 @@ def _parse_reaction(reaction: sbml.Reaction):
     products = [_parse_element(product) for product in reaction.getListOfProducts()]
     reactants = [_parse_element(reactant) for reactant in reaction.getListOfReactants()]
     modifiers = [
-        _parse_modifier(modifier) for modifier in reaction.getListOfModifiers()
+        _parse_modifier(ctx, modifier) for modifier in reaction.getListOfModifiers()
     ]
 
     # Get the kinetic law
-    kinetic_law = _parse_equation(reaction.getKineticLaw(), pe.EquationType.RATE_LAW)
+    kinetic_law = _parse_equation(
+        ctx, reaction.getKineticLaw(), pe.EquationType.RATE_LAW
+    )
 
     # Create the EnzymeML reaction
     enzml_reaction = pe.Reaction(
@@ -477,7 +516,7 @@ def _parse_element(species: sbml.SpeciesReference):
     )
 
 
-def _parse_modifier(modifier: sbml.SpeciesReference):
+def _parse_modifier(ctx: _ParserContext, modifier: sbml.SpeciesReference):
     """
     Parse a modifier from an SBML model into an EnzymeML modifier.
 
@@ -485,13 +524,14 @@ def _parse_modifier(modifier: sbml.SpeciesReference):
     EnzymeML modifier entity.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         modifier (sbml.SpeciesReference): The SBML modifier.
 
     Returns:
         An EnzymeML modifier with properties extracted from the SBML modifier.
     """
-    parsed = version.parse_annotation(annotation=modifier.getAnnotationString())
-    annots = version.extract(parsed, "modifier")
+    parsed = ctx.version.parse_annotation(annotation=modifier.getAnnotationString())
+    annots = ctx.version.extract(parsed, "modifier")
 
     return pe.ModifierElement(
         species_id=modifier.getSpecies(),
@@ -501,6 +541,7 @@ def _parse_modifier(modifier: sbml.SpeciesReference):
 
 
 def _parse_measurements(
+    ctx: _ParserContext,
     model: sbml.Model,
     list_of_reactions: sbml.ListOfReactions,
     meas_data: dict[str, pd.DataFrame],
@@ -512,6 +553,7 @@ def _parse_measurements(
     EnzymeML version and creates EnzymeML measurement objects.
 
     Args:
+        ctx (_ParserContext): The state of the current parse.
         model (sbml.Model): The SBML model.
         list_of_reactions (sbml.ListOfReactions): The list of reactions in the SBML model.
         meas_data (dict[str, pd.DataFrame]): The measurement data extracted from the OMEX archive.
@@ -522,17 +564,19 @@ def _parse_measurements(
     Raises:
         ValueError: If the EnzymeML version is unknown or not supported.
     """
-    match version.version:
+    match ctx.version.version:
         case SupportedVersions.VERSION1:
-            parsed = version.parse_annotation(list_of_reactions.getAnnotationString())
+            parsed = ctx.version.parse_annotation(
+                list_of_reactions.getAnnotationString()
+            )
             if parsed.data:
-                return parsed.data.to_measurements(meas_data, units)
+                return parsed.data.to_measurements(meas_data, ctx.units)
         case SupportedVersions.VERSION2:
-            parsed = version.parse_annotation(model.getAnnotationString())
+            parsed = ctx.version.parse_annotation(model.getAnnotationString())
             if parsed.data:
-                return parsed.data.to_measurements(meas_data, units)
+                return parsed.data.to_measurements(meas_data, ctx.units)
         case _:
-            raise ValueError(f"Unknown version: {version.version}")
+            raise ValueError(f"Unknown version: {ctx.version.version}")
 
 
 def _check_nan(value: float):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, List
 
@@ -22,6 +22,36 @@ NSMAP = {"enzymeml": "https://www.enzymeml.org/v2"}
 CELSIUS_CONVERSION_FACTOR = 273.15
 
 
+@dataclass
+class _SerializerContext:
+    """
+    State shared by the serialization functions while writing a single document.
+
+    Every call of `to_sbml` creates its own context, hence documents can be
+    serialized concurrently from multiple threads.
+
+    The document itself is never modified. Unit IDs and temperatures converted to
+    Kelvin are kept in the context instead, as overlays on the original entities.
+
+    Attributes:
+        doc (pe.EnzymeMLDocument): The EnzymeML document being serialized.
+        model (libsbml.Model): The SBML model the entities are added to.
+        units (dict[str, UnitDefinition]): Copies of the unique unit definitions with
+            assigned IDs, keyed by their content. See `_unit_key`.
+        temperatures (list[tuple[float | None, UnitDefinition | None]]): The
+            temperature and its unit of each measurement, in SBML-compatible units.
+        print_warnings (bool): Whether to log SBML validation warnings.
+    """
+
+    doc: pe.EnzymeMLDocument
+    model: libsbml.Model
+    units: dict[str, UnitDefinition] = field(default_factory=dict)
+    temperatures: list[tuple[float | None, UnitDefinition | None]] = field(
+        default_factory=list
+    )
+    print_warnings: bool = False
+
+
 def to_sbml(
     enzmldoc: pe.EnzymeMLDocument,
     out: Path | str | None = None,
@@ -34,6 +64,9 @@ def to_sbml(
     an EnzymeML document to an SBML document. Prior to serialization the EnzymeML
     document is validated for SBML export.
 
+    The function does not rely on module-level state and is safe to call from
+    multiple threads at once.
+
     Example:
         >> import pyenzyme as pe
         >> doc = pe.EnzymeMLDocument()
@@ -57,12 +90,6 @@ def to_sbml(
     if not validate_sbml_export(enzmldoc):
         raise ValueError("EnzymeML document is not valid for SBML export")
 
-    global print_warnings
-    global units
-    global model
-    global doc
-
-    doc = deepcopy(enzmldoc)
     sbmldoc = libsbml.SBMLDocument()
 
     ns = libsbml.XMLNamespaces()
@@ -71,34 +98,51 @@ def to_sbml(
     sbmldoc.setNamespaces(ns)
     sbmldoc.setPackageRequired("enzymeml", True)
 
-    for measurement in doc.measurements:
-        _convert_temperature_to_kelvin(measurement)
-
     model = sbmldoc.createModel()
-    model.setName(doc.name)
-    units = _assign_ids_to_units(tools.find_unique(doc, pe.UnitDefinition))
-
-    # Add units that have been defined by the custom UnitDefinition
-    convert_unit_classes(doc, units)
-
-    print_warnings = verbose
+    model.setName(enzmldoc.name)
+
+    temperatures = [_temperature_in_kelvin(meas) for meas in enzmldoc.measurements]
+
+    # The units of converted temperatures are replaced by their Kelvin copy where
+    # they occur. Celsius units that are referenced elsewhere, e.g. by measurements
+    # without a temperature, are kept alongside. A unit object shared with such a
+    # measurement is replaced everywhere, hence the temperature units are added.
+    kelvin_units = {
+        id(meas.temperature_unit): unit
+        for meas, (_, unit) in zip(enzmldoc.measurements, temperatures)
+        if unit is not meas.temperature_unit
+    }
+    doc_units = [
+        kelvin_units.get(id(unit), unit)
+        for unit in tools.extract(enzmldoc, pe.UnitDefinition)
+    ]
+    doc_units += [unit for _, unit in temperatures if unit is not None]
+    units = _assign_ids_to_units(doc_units)
+
+    ctx = _SerializerContext(
+        doc=enzmldoc,
+        model=model,
+        units=units,
+        temperatures=temperatures,
+        print_warnings=verbose,
+    )
 
     _xml.register_namespaces(nsmap=NSMAP)
 
     # Add entities
-    [_add_unit_definitions(unit) for unit in units]
-    [_add_vessel(vessel) for vessel in doc.vessels]
-    [_add_protein(protein) for protein in doc.proteins]
-    [_add_complex(complex_) for complex_ in doc.complexes]
-    [_add_small_mol(small_mol) for small_mol in doc.small_molecules]
-    [_add_equation(equation) for equation in doc.equations]
-    [_add_reaction(reaction, i) for i, reaction in enumerate(doc.reactions)]
+    [_add_unit_definitions(ctx, unit) for unit in units.values()]
+    [_add_vessel(ctx, vessel) for vessel in enzmldoc.vessels]
+    [_add_protein(ctx, protein) for protein in enzmldoc.proteins]
+    [_add_complex(ctx, complex_) for complex_ in enzmldoc.complexes]
+    [_add_small_mol(ctx, small_mol) for small_mol in enzmldoc.small_molecules]
+    [_add_equation(ctx, equation) for equation in enzmldoc.equations]
+    [_add_reaction(ctx, reaction, i) for i, reaction in enumerate(enzmldoc.reactions)]
 
-    if doc.measurements:
-        _add_measurements(doc.measurements)
+    if enzmldoc.measurements:
+        _add_measurements(ctx, enzmldoc.measurements)
 
     for parameter in enzmldoc.parameters:
-        _add_parameter(parameter)
+        _add_parameter(ctx, parameter)
 
     if isinstance(out, str):
         out = Path(out)
@@ -109,47 +153,29 @@ def to_sbml(
         out = out.with_suffix(".omex")
 
     xml_string = libsbml.writeSBMLToString(sbmldoc)
+    data = to_pandas(enzmldoc)
 
     if out:
-        _validate_sbml(sbmldoc)
+        _validate_sbml(ctx, sbmldoc)
         create_sbml_omex(
-            sbml_doc=libsbml.writeSBMLToString(sbmldoc),
-            data=to_pandas(doc),
+            sbml_doc=xml_string,
+            data=data,
             out=out,
         )
         logger.info(f"OMEX archive written to {out}")
 
-    return xml_string, to_pandas(doc)
+    return xml_string, data
 
 
-def convert_unit_classes(doc: pe.EnzymeMLDocument, custom_units: list[UnitDefinition]):
-    """
-    Converts unit classes from the EnzymeML document to custom units.
-
-    This function extends the list of custom units with unique unit definitions
-    found in the EnzymeML document.
-
-    Args:
-        doc (pe.EnzymeMLDocument): The EnzymeML document containing units.
-        custom_units (list[UnitDefinition]): The list of custom units to extend.
-    """
-    custom_units.extend(
-        [
-            pe.UnitDefinition(**unit.model_dump())
-            for unit in _assign_ids_to_units(tools.find_unique(doc, pe.UnitDefinition))
-            if unit.id not in [unit.id for unit in custom_units]
-        ]
-    )
-
-
-def _add_unit_definitions(unit: UnitDefinition):
+def _add_unit_definitions(ctx: _SerializerContext, unit: UnitDefinition):
     """
     Add unit definitions to the SBML model.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         unit (UnitDefinition): The unit definition to add to the SBML model.
     """
-    sbml_unitdef = model.createUnitDefinition()
+    sbml_unitdef = ctx.model.createUnitDefinition()
 
     sbml_unitdef.setId(unit.id)
     sbml_unitdef.setName(unit.name)
@@ -166,17 +192,18 @@ def _add_unit_definitions(unit: UnitDefinition):
             sbml_unit.setMultiplier(base_unit.multiplier)
 
 
-def _add_vessel(vessel: pe.Vessel):
+def _add_vessel(ctx: _SerializerContext, vessel: pe.Vessel):
     """
     Add vessels to the SBML model as compartments.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         vessel (pe.Vessel): The vessel to add to the SBML model.
 
     Raises:
         ValueError: If the vessel's unit is not found in the available units.
     """
-    compartment = model.createCompartment()
+    compartment = ctx.model.createCompartment()
     compartment.initDefaults()
     compartment.setId(vessel.id)
     compartment.setName(vessel.name)
@@ -185,20 +212,21 @@ def _add_vessel(vessel: pe.Vessel):
     compartment.setAnnotation(rdf.to_rdf_xml(vessel))
 
     if vessel.unit:
-        compartment.setUnits(_get_unit_id(vessel.unit))
-        model.setVolumeUnits(_get_unit_id(vessel.unit))
+        compartment.setUnits(_get_unit_id(ctx, vessel.unit))
+        ctx.model.setVolumeUnits(_get_unit_id(ctx, vessel.unit))
     else:
         raise ValueError(f"Unit {vessel.unit} not found in units")
 
 
-def _add_small_mol(small_mol: pe.SmallMolecule):
+def _add_small_mol(ctx: _SerializerContext, small_mol: pe.SmallMolecule):
     """
     Add small molecules to the SBML model as species.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         small_mol (pe.SmallMolecule): The small molecule to add to the SBML model.
     """
-    species = model.createSpecies()
+    species = ctx.model.createSpecies()
     species.initDefaults()
     species.setId(small_mol.id)
     species.setName(small_mol.name)
@@ -207,7 +235,7 @@ def _add_small_mol(small_mol: pe.SmallMolecule):
     species.setSBOTerm("SBO:0000247")  # Simple chemical
     species.appendAnnotation(rdf.to_rdf_xml(small_mol))
 
-    init_conc = _get_first_meas_init_conc(small_mol)
+    init_conc = _get_first_meas_init_conc(ctx, small_mol)
 
     if init_conc is not None:
         species.setInitialConcentration(init_conc)
@@ -222,14 +250,15 @@ def _add_small_mol(small_mol: pe.SmallMolecule):
         species.appendAnnotation(annot.to_xml(encoding="unicode"))
 
 
-def _add_protein(protein: pe.Protein):
+def _add_protein(ctx: _SerializerContext, protein: pe.Protein):
     """
     Add proteins to the SBML model as species.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         protein (pe.Protein): The protein to add to the SBML model.
     """
-    species = model.createSpecies()
+    species = ctx.model.createSpecies()
     species.initDefaults()
     species.setId(protein.id)
     species.setName(protein.name)
@@ -238,7 +267,7 @@ def _add_protein(protein: pe.Protein):
     species.setSBOTerm("SBO:0000252")  # Protein
     species.appendAnnotation(rdf.to_rdf_xml(protein))
 
-    init_conc = _get_first_meas_init_conc(protein)
+    init_conc = _get_first_meas_init_conc(ctx, protein)
 
     if init_conc is not None:
         species.setInitialConcentration(init_conc)
@@ -255,14 +284,15 @@ def _add_protein(protein: pe.Protein):
         species.appendAnnotation(annot.to_xml(encoding="unicode"))
 
 
-def _add_complex(complex_: pe.Complex):
+def _add_complex(ctx: _SerializerContext, complex_: pe.Complex):
     """
     Add complexes to the SBML model as species.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         complex_ (pe.Complex): The complex to add to the SBML model.
     """
-    species = model.createSpecies()
+    species = ctx.model.createSpecies()
     species.initDefaults()
     species.setId(complex_.id)
     species.setName(complex_.name)
@@ -277,7 +307,10 @@ def _add_complex(complex_: pe.Complex):
         species.appendAnnotation(annot.to_xml(encoding="unicode"))
 
 
-def _get_first_meas_init_conc(species: pe.SmallMolecule | pe.Protein):
+def _get_first_meas_init_conc(
+    ctx: _SerializerContext,
+    species: pe.SmallMolecule | pe.Protein,
+):
     """
     Extracts the initial concentration of a species from the first measurement.
 
@@ -286,15 +319,16 @@ def _get_first_meas_init_conc(species: pe.SmallMolecule | pe.Protein):
     concentration from the first measurement of the species to fulfill this requirement.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         species (pe.SmallMolecule | pe.Protein): The species to get the initial concentration for.
 
     Returns:
         float | None: The initial concentration of the species or None if not found.
     """
-    if not doc.measurements:
+    if not ctx.doc.measurements:
         return None
 
-    measurement = doc.measurements[0]
+    measurement = ctx.doc.measurements[0]
     meas_species = measurement.filter_species_data(species_id=species.id)
 
     if meas_species:
@@ -303,11 +337,12 @@ def _get_first_meas_init_conc(species: pe.SmallMolecule | pe.Protein):
         return None
 
 
-def _add_reaction(reaction: pe.Reaction, index: int):
+def _add_reaction(ctx: _SerializerContext, reaction: pe.Reaction, index: int):
     """
     Add reactions to the SBML model.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         reaction (pe.Reaction): The reaction to add to the SBML model.
         index (int): The index of the reaction in the EnzymeML document.
 
@@ -315,7 +350,7 @@ def _add_reaction(reaction: pe.Reaction, index: int):
         ValueError: If the stoichiometry of a species is 0.
         AssertionError: If the stoichiometry of a species is not set.
     """
-    sbml_reaction = model.createReaction()
+    sbml_reaction = ctx.model.createReaction()
     sbml_reaction.initDefaults()
     sbml_reaction.setName(reaction.name)
     sbml_reaction.setId(reaction.id)
@@ -382,26 +417,27 @@ def _add_rate_law(equation: pe.Equation, reac: libsbml.Reaction):
         law.setAnnotation(annot.to_xml(encoding="unicode"))
 
 
-def _add_parameter(parameter: pe.Parameter):
+def _add_parameter(ctx: _SerializerContext, parameter: pe.Parameter):
     """
     Add parameters to the SBML model.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         parameter (pe.Parameter): The parameter to add to the SBML model.
     """
-    sbml_param = model.createParameter()
+    sbml_param = ctx.model.createParameter()
     sbml_param.setId(parameter.id)
     sbml_param.setName(parameter.name)
     sbml_param.setConstant(parameter.constant)
     sbml_param.appendAnnotation(rdf.to_rdf_xml(parameter))
 
-    if parameter.value:
+    if parameter.value is not None:
         sbml_param.setValue(parameter.value)
-    elif parameter.initial_value:
+    elif parameter.initial_value is not None:
         sbml_param.setValue(parameter.initial_value)
 
     if parameter.unit:
-        sbml_param.setUnits(_get_unit_id(parameter.unit))
+        sbml_param.setUnits(_get_unit_id(ctx, parameter.unit))
 
     annot = v2.ParameterAnnot(
         lower_bound=parameter.lower_bound,
@@ -413,24 +449,25 @@ def _add_parameter(parameter: pe.Parameter):
         sbml_param.appendAnnotation(annot.to_xml(encoding="unicode"))
 
 
-def _add_equation(equation: pe.Equation):
+def _add_equation(ctx: _SerializerContext, equation: pe.Equation):
     """
     Add equations to the SBML model.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         equation (pe.Equation): The equation to add to the SBML model.
 
     Raises:
         ValueError: If the equation type is not supported.
     """
     if equation.equation_type == pe.EquationType.ODE:
-        sbml_rule = model.createRateRule()  # type: ignore
+        sbml_rule = ctx.model.createRateRule()  # type: ignore
         sbml_rule.setVariable(equation.species_id)
     elif equation.equation_type == pe.EquationType.ASSIGNMENT:
-        sbml_rule = model.createAssignmentRule()  # type: ignore
+        sbml_rule = ctx.model.createAssignmentRule()  # type: ignore
         sbml_rule.setVariable(equation.species_id)
     elif equation.equation_type == pe.EquationType.INITIAL_ASSIGNMENT:
-        sbml_rule = model.createInitialAssignment()  # type: ignore
+        sbml_rule = ctx.model.createInitialAssignment()  # type: ignore
         sbml_rule.setSymbol(equation.species_id)
     else:
         raise ValueError(f"Equation type {equation.equation_type} not supported")
@@ -445,29 +482,34 @@ def _add_equation(equation: pe.Equation):
         sbml_rule.setAnnotation(annot.to_xml(encoding="unicode"))
 
 
-def _add_measurements(measurements: list[pe.Measurement]):
+def _add_measurements(
+    ctx: _SerializerContext,
+    measurements: list[pe.Measurement],
+):
     """
     Adds measurements to the SBML model.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         measurements (list[pe.Measurement]): The measurements to add to the SBML model.
     """
     annot = v2.DataAnnot(file="./data.tsv")
 
-    for measurement in measurements:
-        measurement = deepcopy(measurement)
+    for measurement, (temperature, temperature_unit) in zip(
+        measurements, ctx.temperatures
+    ):
         conditions = v2.ConditionsAnnot(
             ph=v2.PHAnnot(
                 value=measurement.ph,
             ),
             temperature=v2.TemperatureAnnot(
-                value=measurement.temperature,
-                unit=_get_unit_id(measurement.temperature_unit),
+                value=temperature,
+                unit=_get_unit_id(ctx, temperature_unit),
             ),
         )
 
         if len(measurement.species_data) > 0:
-            time_unit = _get_unit_id(measurement.species_data[0].time_unit)
+            time_unit = _get_unit_id(ctx, measurement.species_data[0].time_unit)
         else:
             time_unit = None
 
@@ -488,7 +530,7 @@ def _add_measurements(measurements: list[pe.Measurement]):
                 species_id=species_data.species_id,
                 initial=species_data.initial,
                 type=data_type,
-                unit=_get_unit_id(species_data.data_unit),  # type: ignore
+                unit=_get_unit_id(ctx, species_data.data_unit),  # type: ignore
             )
 
             meas_annot.species_data.append(species_annot)
@@ -496,54 +538,52 @@ def _add_measurements(measurements: list[pe.Measurement]):
         annot.measurements.append(meas_annot)
 
     if not annot.is_empty():
-        model.appendAnnotation(annot.to_xml(encoding="unicode", exclude_none=True))
+        ctx.model.appendAnnotation(annot.to_xml(encoding="unicode", exclude_none=True))
 
 
-def _convert_temperature_to_kelvin(measurement: pe.Measurement) -> None:
+def _temperature_in_kelvin(
+    measurement: pe.Measurement,
+) -> tuple[float | None, pe.UnitDefinition | None]:
     """
-    Converts measurement temperature from Celsius to Kelvin if needed.
+    Returns the temperature of a measurement, converted from Celsius to Kelvin if needed.
+
+    SBML does not support Celsius. The measurement is not modified, instead the
+    converted temperature and a converted copy of its unit are returned.
 
     Args:
-        measurement (pe.Measurement): The measurement object to potentially convert.
-                                    Modified in place if conversion is needed.
-    """
-    if measurement.temperature_unit is None:
-        return
+        measurement (pe.Measurement): The measurement to get the temperature of.
 
+    Returns:
+        tuple[float | None, pe.UnitDefinition | None]: The temperature and its unit.
+    """
     temp_unit = measurement.temperature_unit
 
+    if temp_unit is None or measurement.temperature is None:
+        return measurement.temperature, temp_unit
+
     # Extract the base unit with Celsius
     celsius_unit = next(
         (unit for unit in temp_unit.base_units if unit.kind == pe.UnitType.CELSIUS),
         None,
     )
 
-    if celsius_unit and measurement.temperature is not None:
-        # Store the properties of the Celsius unit before replacing
-        celsius_exponent = celsius_unit.exponent
-        celsius_scale = celsius_unit.scale
-        celsius_multiplier = celsius_unit.multiplier
-
-        # Remove the Celsius unit from base_units
-        measurement.temperature_unit.base_units.remove(celsius_unit)
-        measurement.temperature_unit.name = "Kelvin"
-
-        # Add a new Kelvin unit with the same properties
-        measurement.temperature_unit.add_to_base_units(
-            kind=pe.UnitType.KELVIN,
-            exponent=celsius_exponent,
-            scale=celsius_scale,
-            multiplier=celsius_multiplier,
-        )
+    if celsius_unit is None:
+        return measurement.temperature, temp_unit
 
-        logger.warning(
-            f"Converting measurement ({measurement.id}) temperature from Celsius to Kelvin. This is not supported by SBML."
-        )
+    # Replace the Celsius unit by a Kelvin unit with the same properties
+    base_units = list(temp_unit.base_units)
+    base_units.remove(celsius_unit)
+    base_units.append(celsius_unit.model_copy(update={"kind": pe.UnitType.KELVIN}))
 
-        if measurement.temperature is not None:
-            measurement.temperature = (
-                measurement.temperature + CELSIUS_CONVERSION_FACTOR
-            )
+    kelvin_unit = temp_unit.model_copy(
+        update={"name": "Kelvin", "base_units": base_units}
+    )
+
+    logger.warning(
+        f"Converting measurement ({measurement.id}) temperature from Celsius to Kelvin. This is not supported by SBML."
+    )
+
+    return measurement.temperature + CELSIUS_CONVERSION_FACTOR, kelvin_unit
 
 
 def _get_sbml_kind(unit_type):
@@ -565,11 +605,15 @@ def _get_sbml_kind(unit_type):
         raise ValueError(f"Unit type {unit_type} not found in libsbml")
 
 
-def _get_unit_id(unit: pe.UnitDefinition | None) -> str | None:
+def _get_unit_id(
+    ctx: _SerializerContext,
+    unit: pe.UnitDefinition | None,
+) -> str | None:
     """
     Helper function to get the unit ID from the list of units.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         unit (pe.UnitDefinition | None): The unit to find the ID for.
 
     Returns:
@@ -581,37 +625,36 @@ def _get_unit_id(unit: pe.UnitDefinition | None) -> str | None:
     if unit is None:
         return None
 
-    for unit2 in units:
-        if _same_unit(unit, unit2):
-            return unit2.id
-
-    raise ValueError(f"Unit {unit.name} not found in the list of units")
+    try:
+        return ctx.units[_unit_key(unit)].id
+    except KeyError:
+        raise ValueError(f"Unit {unit.name} not found in the list of units")
 
 
-def _same_unit(unit1: pe.UnitDefinition, unit2: pe.UnitDefinition) -> bool:
+def _unit_key(unit: pe.UnitDefinition) -> str:
     """
-    Check if two units are the same by comparing their model dumps.
+    Returns a key that is equal for units with the same definition, regardless of ID.
 
     Args:
-        unit1 (pe.UnitDefinition): The first unit.
-        unit2 (pe.UnitDefinition): The second unit.
+        unit (pe.UnitDefinition): The unit to get the key for.
 
     Returns:
-        bool: True if the units are the same, False otherwise.
+        str: The JSON dump of the unit without its ID.
     """
-    return unit1.model_dump(exclude={"id"}) == unit2.model_dump(exclude={"id"})
+    return unit.model_dump_json(exclude={"id"})
 
 
-def _validate_sbml(sbmldoc: libsbml.SBMLDocument) -> None:
+def _validate_sbml(ctx: _SerializerContext, sbmldoc: libsbml.SBMLDocument) -> None:
     """
     Validate the SBML document using the libSBML function.
 
     Args:
+        ctx (_SerializerContext): The state of the current serialization.
         sbmldoc (libsbml.SBMLDocument): The SBML document to validate.
     """
     sbml_errors = sbmldoc.checkConsistency()
 
-    if sbml_errors and not print_warnings:
+    if sbml_errors and not ctx.print_warnings:
         logger.warning(
             "The SBML document has warnings that should be checked. Set the `warnings` argument to true to see them."
         )
@@ -623,37 +666,88 @@ def _validate_sbml(sbmldoc: libsbml.SBMLDocument) -> None:
             logger.error(
                 sbmldoc.getError(error).getMessage().strip().replace("\n", " ")
             )
-        elif severity == libsbml.LIBSBML_SEV_WARNING and print_warnings:
+        elif severity == libsbml.LIBSBML_SEV_WARNING and ctx.print_warnings:
             logger.warning(
                 sbmldoc.getError(error).getMessage().strip().replace("\n", " ")
             )
 
 
-def _assign_ids_to_units(doc_units: List[UnitDefinition]) -> List[UnitDefinition]:
+def _assign_ids_to_units(
+    doc_units: List[UnitDefinition],
+) -> dict[str, UnitDefinition]:
     """
     Assign unique IDs to units.
 
+    The units are not modified. Instead, a shallow copy with the assigned ID is
+    created for every unique unit definition.
+
+    Previous releases assigned IDs in two passes over the units of the document
+    and renamed the first unit object of each definition in place, hence the IDs
+    of the second pass depend on the IDs of the other occurrences. Both passes are
+    replayed on the IDs by unit object to keep the exported IDs stable.
+
     Args:
-        doc_units (List[UnitDefinition]): The list of units to assign IDs to.
+        doc_units (List[UnitDefinition]): All occurrences of units in the document,
+            in document order.
 
     Returns:
-        List[UnitDefinition]: The list of units with assigned IDs.
+        dict[str, UnitDefinition]: The copies with assigned IDs, keyed by `_unit_key`.
     """
-    ids = [unit.id for unit in doc_units if unit.id]
-    unique_units = []
+    keys = {id(unit): _unit_key(unit) for unit in doc_units}
+    ids = {id(unit): unit.id for unit in doc_units}
+    ids = _assign_unit_ids_pass(doc_units, keys, ids)
+    ids = _assign_unit_ids_pass(doc_units, keys, ids)
+
+    unique_units = {}
 
     for unit in doc_units:
-        if any(_same_unit(unit, u) for u in unique_units):
-            continue
+        key = keys[id(unit)]
 
-        new_id = next(_id_generator(ids))
-        unit.id = new_id
+        if key in unique_units:
+            continue
 
-        unique_units.append(unit)
+        unique_units[key] = unit.model_copy(update={"id": ids[id(unit)]})
 
     return unique_units
 
 
+def _assign_unit_ids_pass(
+    doc_units: List[UnitDefinition],
+    keys: dict[int, str],
+    ids: dict[int, str | None],
+) -> dict[int, str | None]:
+    """
+    Assigns a new ID to the first unit object of each unit definition.
+
+    Args:
+        doc_units (List[UnitDefinition]): All occurrences of units in the document.
+        keys (dict[int, str]): The `_unit_key` by unit object.
+        ids (dict[int, str | None]): The current IDs by unit object.
+
+    Returns:
+        dict[int, str | None]: The IDs by unit object after the pass.
+    """
+    # Units that are equal including their current ID count once
+    occurrences = {}
+    for unit in doc_units:
+        occurrences.setdefault((keys[id(unit)], ids[id(unit)]), unit)
+
+    generator = _id_generator(
+        [ids[id(unit)] for unit in occurrences.values() if ids[id(unit)]]
+    )
+    new_ids = dict(ids)
+    assigned = set()
+
+    for (key, _), unit in occurrences.items():
+        if key in assigned:
+            continue
+
+        assigned.add(key)
+        new_ids[id(unit)] = next(generator)
+
+    return new_ids
+
+
 def _id_generator(ids: list[str]):
     """
     Generator for creating unique IDs that are not in unit_ids.
@@ -0,0 +1,309 @@
+"""
+Incremental reading of large EnzymeML JSON documents.
+
+`pyenzyme.read_enzymeml` parses the whole file into a dictionary and validates the
+complete document at once, hence peak memory is a multiple of the file size. The
+functions in this module are built on the streaming JSON parser `ijson` and only
+ever hold a single measurement in memory:
+
+    - `iter_measurements` yields the measurements of a document one at a time.
+    - `read_enzymeml_lazy` validates everything but the measurements and returns a
+      document whose measurements are loaded on first access.
+
+`ijson` is an optional dependency and can be installed via `pip install ijson`.
+
+Example:
+    >>> import pyenzyme as pe
+    >>> for measurement in pe.iter_measurements("path/to/enzmldoc.json"):
+    ...     print(measurement.id)
+
+    >>> doc = pe.read_enzymeml("path/to/enzmldoc.json", lazy=True)
+    >>> doc.measurement_ids  # No measurement has been loaded yet
+    ['m0', 'm1']
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional  # noqa: F401
+
+from pydantic import PrivateAttr
+
+from pyenzyme.columnar import ArrayEnzymeMLDocument, ArrayMeasurement
+from pyenzyme.versions import v2
+from pyenzyme.versions.v2 import (  # noqa: F401
+    Complex,
+    Creator,
+    Equation,
+    Measurement,
+    Parameter,
+    Protein,
+    Reaction,
+    SmallMolecule,
+    Vessel,
+)
+
+MEASUREMENTS_KEY = "measurements"
+
+
+def iter_measurements(
+    path: Path | str,
+    ids: Iterable[str] | None = None,
+    columnar: bool = False,
+) -> Iterator[v2.Measurement]:
+    """Yields the measurements of an EnzymeML JSON document one at a time.
+
+    Only a single measurement is parsed and validated at any point in time, hence
+    documents with thousands of measurements can be scanned in bounded memory.
+
+    Args:
+        path (Path | str): Path to the EnzymeML JSON document.
+        ids (Iterable[str] | None, optional): Only yield measurements with these IDs.
+            Defaults to None, which yields all measurements.
+        columnar (bool, optional): If True, yields NumPy-backed measurements. See
+            `pyenzyme.columnar` for details. Defaults to False.
+
+    Yields:
+        v2.Measurement: The measurements in document order.
+
+    Raises:
+        ImportError: If ijson is not installed.
+        FileNotFoundError: If the file does not exist.
+    """
+    ijson = _import_ijson()
+    measurement_cls = ArrayMeasurement if columnar else v2.Measurement
+    wanted = set(ids) if ids is not None else None
+
+    with open(path, "rb") as f:
+        for item in ijson.items(f, f"{MEASUREMENTS_KEY}.item", use_float=True):
+            if wanted is not None and item.get("id") not in wanted:
+                continue
+
+            measurement = measurement_cls.model_validate(item)
+
+            if columnar:
+                measurement.pack()
+
+            yield measurement
+
+
+def read_enzymeml_lazy(
+    path: Path | str,
+    columnar: bool = False,
+) -> v2.EnzymeMLDocument:
+    """Reads an EnzymeML JSON document whose measurements are loaded on demand.
+
+    The document is streamed once to validate all other fields and to collect the
+    measurement IDs. The measurements themselves are parsed the first time
+    `measurements` is accessed, or can be streamed without ever materializing the
+    full list via `iter_measurements`.
+
+    Args:
+        path (Path | str): Path to the EnzymeML JSON document.
+        columnar (bool, optional): If True, measurements are NumPy-backed. See
+            `pyenzyme.columnar` for details. Defaults to False.
+
+    Returns:
+        v2.EnzymeMLDocument: A LazyEnzymeMLDocument or LazyArrayEnzymeMLDocument.
+
+    Raises:
+        ImportError: If ijson is not installed.
+        FileNotFoundError: If the file does not exist.
+        pydantic.ValidationError: If the document is not a valid EnzymeML document.
+    """
+    header, measurement_ids = _scan_document(path)
+
+    cls = LazyArrayEnzymeMLDocument if columnar else LazyEnzymeMLDocument
+    enzmldoc = cls.model_validate(header)
+    enzmldoc._source = Path(path)
+    enzmldoc._measurement_ids = measurement_ids
+    enzmldoc._pending = True
+
+    return enzmldoc
+
+
+class _LazyMeasurementsMixin:
+    """Loads the measurements of a document on first access.
+
+    Pydantic reads fields directly from the instance `__dict__` when dumping,
+    copying or comparing models. These entry points are therefore overridden to
+    load the measurements beforehand.
+    """
+
+    def __getattribute__(self, name: str):
+        if name == MEASUREMENTS_KEY:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and private.get("_pending"):
+                object.__getattribute__(self, "load_measurements")()
+
+        return super().__getattribute__(name)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+
+        if name == MEASUREMENTS_KEY:
+            self._pending = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the measurements have been loaded into memory."""
+        return not self._pending
+
+    @property
+    def measurement_ids(self) -> list[str]:
+        """The IDs of all measurements, without loading them."""
+        if self._pending:
+            return list(self._measurement_ids)
+
+        return [measurement.id for measurement in self.measurements]
+
+    def iter_measurements(
+        self,
+        ids: Iterable[str] | None = None,
+    ) -> Iterator[v2.Measurement]:
+        """Yields the measurements one at a time.
+
+        If the measurements have not been loaded yet, they are streamed from the
+        source file without being kept in memory.
+
+        Args:
+            ids (Iterable[str] | None, optional): Only yield measurements with these
+                IDs. Defaults to None, which yields all measurements.
+
+        Yields:
+            v2.Measurement: The measurements in document order.
+        """
+        if self._pending:
+            yield from iter_measurements(
+                self._source,
+                ids=ids,
+                columnar=isinstance(self, ArrayEnzymeMLDocument),
+            )
+            return
+
+        wanted = set(ids) if ids is not None else None
+        for measurement in self.measurements:
+            if wanted is None or measurement.id in wanted:
+                yield measurement
+
+    def load_measurements(self) -> None:
+        """Parses all measurements from the source file into memory."""
+        if not self._pending:
+            return
+
+        self._pending = False
+        self.__dict__[MEASUREMENTS_KEY] = list(
+            iter_measurements(
+                self._source,
+                columnar=isinstance(self, ArrayEnzymeMLDocument),
+            )
+        )
+
+    def model_dump(self, *args, **kwargs):
+        self.load_measurements()
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs):
+        self.load_measurements()
+        return super().model_dump_json(*args, **kwargs)
+
+    def __copy__(self):
+        self.load_measurements()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        self.load_measurements()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self):
+        self.load_measurements()
+        return super().__getstate__()
+
+    def __eq__(self, other: object) -> bool:
+        self.load_measurements()
+
+        if isinstance(other, _LazyMeasurementsMixin):
+            other.load_measurements()
+
+        return super().__eq__(other)
+
+
+class LazyEnzymeMLDocument(_LazyMeasurementsMixin, v2.EnzymeMLDocument):
+    """EnzymeMLDocument whose measurements are loaded on first access."""
+
+    _source: Optional[Path] = PrivateAttr(default=None)
+    _measurement_ids: list[str] = PrivateAttr(default_factory=list)
+    _pending: bool = PrivateAttr(default=False)
+
+
+class LazyArrayEnzymeMLDocument(_LazyMeasurementsMixin, ArrayEnzymeMLDocument):
+    """NumPy-backed EnzymeMLDocument whose measurements are loaded on first access."""
+
+    _source: Optional[Path] = PrivateAttr(default=None)
+    _measurement_ids: list[str] = PrivateAttr(default_factory=list)
+    _pending: bool = PrivateAttr(default=False)
+
+
+def _scan_document(path: Path | str) -> tuple[dict, list[str]]:
+    """Streams a document and collects all fields except the measurements.
+
+    Args:
+        path (Path | str): Path to the EnzymeML JSON document.
+
+    Returns:
+        tuple[dict, list[str]]: The top-level fields without measurements, and the
+            IDs of all measurements in document order.
+    """
+    ijson = _import_ijson()
+
+    header = {}
+    measurement_ids = []
+    id_prefix = f"{MEASUREMENTS_KEY}.item.id"
+    key = None
+    builder = None
+
+    with open(path, "rb") as f:
+        try:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix == "":
+                    if builder is not None:
+                        header[key] = builder.value
+                        builder = None
+
+                    if event == "map_key":
+                        key = value
+                        if key != MEASUREMENTS_KEY:
+                            builder = ijson.ObjectBuilder()
+
+                elif builder is not None:
+                    builder.event(event, value)
+
+                elif prefix == id_prefix:
+                    measurement_ids.append(value)
+        except ijson.JSONError as e:
+            raise ValueError(f"Malformed JSON in '{path}': {e}") from e
+
+    return header, measurement_ids
+
+
+def _import_ijson():
+    """Imports the optional streaming JSON parser."""
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError(
+            f"Streaming EnzymeML documents requires 'ijson'. Install it via 'pip install ijson': {e}"
+        )
+
+    return ijson
+
+
+LazyEnzymeMLDocument.model_rebuild()
+LazyArrayEnzymeMLDocument.model_rebuild()
+
+__all__ = [
+    "LazyArrayEnzymeMLDocument",
+    "LazyEnzymeMLDocument",
+    "iter_measurements",
+    "read_enzymeml_lazy",
+]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import pathlib as pl
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
 
 from mdmodels.units.unit_definition import UnitDefinition
 
+from .columnar import ArrayMeasurement, ArrayMeasurementData, as_array
 from .versions.v2 import (
     DataTypes,
     Measurement,
@@ -13,6 +16,9 @@ from .versions.v2 import (
     MeasurementData,
 )
 
+DEFAULT_CHUNKSIZE = 10_000
+DEFAULT_MAX_BYTES = 1024**3
+
 
 def to_pandas(
     enzmldoc: EnzymeMLDocument,
@@ -49,7 +55,7 @@ def to_pandas(
         "The input must be an EnzymeMLDocument object"
     )
 
-    dfs = []
+    blocks = []
     for meas in enzmldoc.measurements:
         if meas.id in ignore:
             continue
@@ -59,15 +65,13 @@ def to_pandas(
         if meas.species_data is None:
             raise ValueError("The measurement must contain species data")
 
-        df = _measurement_to_pandas(meas)
-        df["id"] = [meas.id] * len(df)
-        dfs.append(df)
+        blocks.append((meas.id, _measurement_columns(meas)))
 
-    if dfs:
-        return pd.concat(dfs, ignore_index=True).reset_index(drop=True)
-    else:
+    if not blocks:
         return pd.DataFrame()
 
+    return _build_frame(blocks)
+
 
 def _has_measurement_data(enzmldoc: EnzymeMLDocument) -> bool:
     """Checks if the measurement contains species data."""
@@ -78,6 +82,167 @@ def _has_measurement_data(enzmldoc: EnzymeMLDocument) -> bool:
     return False
 
 
+LONG_FORMAT_NUMERIC = ("time", "value")
+LONG_FORMAT_CATEGORICAL = (
+    "measurement_id",
+    "species_id",
+    "data_type",
+    "unit",
+    "time_unit",
+)
+
+
+def to_long_format(
+    enzmldoc: EnzymeMLDocument,
+    ignore: list[str] | None = None,
+) -> pd.DataFrame:
+    """Converts an EnzymeMLDocument object to a long-format (tidy) pandas DataFrame.
+
+    In contrast to `to_pandas`, every data point is a row, hence species within a
+    measurement may have different time grids. The resulting DataFrame contains the
+    following columns:
+
+        - measurement_id: The ID of the measurement.
+        - species_id: The ID of the measured species.
+        - time: The time value of the data point.
+        - value: The measured value.
+        - data_type: The type of the measured value.
+        - unit: The unit of the measured value.
+        - time_unit: The unit of the time value.
+
+    All but the numerical columns are stored as categoricals.
+
+    Args:
+        enzmldoc (EnzymeMLDocument): The EnzymeMLDocument object to convert.
+        ignore (list[str], optional): A list of measurement IDs to ignore. Defaults to [].
+
+    Returns:
+        pd.DataFrame: The measurement data in long format.
+
+    Raises:
+        ValueError: If the data and time arrays of a species differ in length.
+    """
+
+    numeric, categorical = _long_format_columns(enzmldoc.measurements, ignore)
+    data = {
+        name: pd.Categorical.from_codes(codes, categories=categories)
+        for name, (codes, categories) in categorical.items()
+    }
+
+    return pd.DataFrame(
+        {
+            "measurement_id": data["measurement_id"],
+            "species_id": data["species_id"],
+            "time": numeric["time"],
+            "value": numeric["value"],
+            "data_type": data["data_type"],
+            "unit": data["unit"],
+            "time_unit": data["time_unit"],
+        },
+        copy=False,
+    )
+
+
+def _long_format_columns(
+    measurements: Iterable[Measurement],
+    ignore: list[str] | None = None,
+) -> tuple[dict[str, np.ndarray], dict[str, tuple[np.ndarray, list[str]]]]:
+    """Collects the long-format columns of measurements without building DataFrames.
+
+    Numerical columns are preallocated with the total number of data points and
+    filled from the measurement buffers. Categorical columns are dictionary encoded,
+    where a code of -1 denotes a missing value.
+
+    Args:
+        measurements (Iterable[Measurement]): The measurements to convert.
+        ignore (list[str], optional): A list of measurement IDs to ignore. Defaults to [].
+
+    Returns:
+        tuple: The numerical columns, and the categorical columns as tuples of
+            int32 codes and categories.
+
+    Raises:
+        ValueError: If the data and time arrays of a species differ in length.
+    """
+
+    if ignore is None:
+        ignore = []
+
+    series = []
+    for meas in measurements:
+        if meas.id in ignore:
+            continue
+
+        for species in meas.species_data:
+            if len(species.data) == 0:
+                continue
+
+            data = as_array(species.data)
+            time = as_array(species.time)
+
+            if len(time) == 0:
+                time = np.full(len(data), np.nan)
+            elif len(time) != len(data):
+                raise ValueError(
+                    f"Export to long format not possible, the data of species '{species.species_id}' in measurement '{meas.id}' has {len(data)} values, but there are {len(time)} time points."
+                )
+
+            series.append(
+                (
+                    time,
+                    data,
+                    {
+                        "measurement_id": meas.id,
+                        "species_id": species.species_id,
+                        "data_type": _enum_value(species.data_type),
+                        "unit": _unit_name(species.data_unit),
+                        "time_unit": _unit_name(species.time_unit),
+                    },
+                )
+            )
+
+    lengths = np.array([len(data) for _, data, _ in series], dtype=np.intp)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+    numeric = {
+        name: np.empty(int(offsets[-1]), dtype=np.float64)
+        for name in LONG_FORMAT_NUMERIC
+    }
+
+    for (time, data, _), start, stop in zip(series, offsets[:-1], offsets[1:]):
+        numeric["time"][start:stop] = time
+        numeric["value"][start:stop] = data
+
+    categorical = {}
+    for name in LONG_FORMAT_CATEGORICAL:
+        codes, categories = _encode([labels[name] for _, _, labels in series])
+        categorical[name] = (np.repeat(codes, lengths), categories)
+
+    return numeric, categorical
+
+
+def _encode(values: list[str | None]) -> tuple[np.ndarray, list[str]]:
+    """Dictionary encodes values in order of appearance, None is encoded as -1."""
+    categories: dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+        else:
+            codes[i] = categories.setdefault(value, len(categories))
+
+    return codes, list(categories)
+
+
+def _enum_value(value) -> str | None:
+    return value.value if value is not None else None
+
+
+def _unit_name(unit: UnitDefinition | None) -> str | None:
+    return unit.name if unit is not None else None
+
+
 def read_excel(
     path: pl.Path | str,
     data_unit: str,
@@ -184,6 +349,238 @@ def read_csv(
     )
 
 
+def iter_csv(
+    path: pl.Path | str,
+    data_unit: str,
+    time_unit: str,
+    data_type: DataTypes = DataTypes.CONCENTRATION,
+    sep: str = "\t",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_bytes: int | None = DEFAULT_MAX_BYTES,
+    columnar: bool = False,
+) -> Iterator[Measurement]:
+    """Reads a CSV file in chunks and yields its measurements one at a time.
+
+    The file is expected to have the same structure as for `read_csv`. In contrast to
+    `read_csv`, the file is never loaded as a whole. It is read in chunks of
+    `chunksize` rows, and a measurement is yielded as soon as its block of rows ends,
+    hence the rows of each measurement ID must be contiguous. Only the rows of the
+    current measurement are buffered, whose memory is bounded by `max_bytes`.
+
+    The measurements can be appended to a document or written to disk as they arrive:
+
+        >>> doc.measurements.extend(pe.iter_csv(path, "mmol / l", "s", columnar=True))
+        >>> from pyenzyme.arrow import stream_to_parquet
+        >>> stream_to_parquet(pe.iter_csv(path, "mmol / l", "s"), "data.parquet")
+
+    Args:
+        path (str, pathlib.Path): The path to the CSV file.
+        data_unit (str): The unit of the data.
+        time_unit (str): The unit of the time.
+        data_type (DataTypes): The type of the data. Default is DataTypes.CONCENTRATION.
+        sep (str): The separator of the CSV file. Default is '\t'.
+        chunksize (int): The number of rows to read at once. Default is 10000.
+        max_bytes (int | None): The maximum memory in bytes of the buffered rows of
+            a single measurement, as estimated by `DataFrame.memory_usage`. Creating
+            the measurement temporarily takes about as much again. Default is 1 GiB.
+            None disables the limit.
+        columnar (bool): If True, yields NumPy-backed measurements. See
+            `pyenzyme.columnar` for details. Default is False.
+
+    Yields:
+        Measurement: The measurements in file order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the path is not a file, the rows of a measurement are not
+            contiguous, or a measurement exceeds `max_bytes`.
+    """
+
+    path = _check_path(path)
+
+    with pd.read_csv(path, sep=sep, chunksize=chunksize) as chunks:
+        yield from _iter_chunked_measurements(
+            chunks=chunks,
+            meas_id=path.stem,
+            data_unit=data_unit,
+            time_unit=time_unit,
+            data_type=data_type,
+            max_bytes=max_bytes,
+            columnar=columnar,
+        )
+
+
+def iter_excel(
+    path: pl.Path | str,
+    data_unit: str,
+    time_unit: str,
+    data_type: DataTypes = DataTypes.CONCENTRATION,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_bytes: int | None = DEFAULT_MAX_BYTES,
+    columnar: bool = False,
+) -> Iterator[Measurement]:
+    """Reads the first sheet of an Excel file in chunks and yields its measurements.
+
+    See `iter_csv` for details. The sheet is read row by row in read-only mode, which
+    requires `openpyxl` to be installed.
+
+    Args:
+        path (str, pathlib.Path): The path to the Excel file.
+        data_unit (str): The unit of the data.
+        time_unit (str): The unit of the time.
+        data_type (DataTypes): The type of the data. Default is DataTypes.CONCENTRATION.
+        chunksize (int): The number of rows to read at once. Default is 10000.
+        max_bytes (int | None): The maximum memory in bytes of the buffered rows of
+            a single measurement. See `iter_csv` for details. Default is 1 GiB. None
+            disables the limit.
+        columnar (bool): If True, yields NumPy-backed measurements. See
+            `pyenzyme.columnar` for details. Default is False.
+
+    Yields:
+        Measurement: The measurements in file order.
+
+    Raises:
+        ImportError: If openpyxl is not installed.
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the path is not a file, the rows of a measurement are not
+            contiguous, or a measurement exceeds `max_bytes`.
+    """
+
+    path = _check_path(path)
+
+    try:
+        import openpyxl
+    except ImportError as e:
+        raise ImportError(
+            f"Reading Excel files requires 'openpyxl'. Install it via 'pip install openpyxl': {e}"
+        )
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+    try:
+        yield from _iter_chunked_measurements(
+            chunks=_iter_sheet_chunks(workbook.worksheets[0], chunksize),
+            meas_id=path.stem,
+            data_unit=data_unit,
+            time_unit=time_unit,
+            data_type=data_type,
+            max_bytes=max_bytes,
+            columnar=columnar,
+        )
+    finally:
+        workbook.close()
+
+
+def _check_path(path: pl.Path | str) -> pl.Path:
+    """Checks that the path points to an existing file."""
+
+    if isinstance(path, str):
+        path = pl.Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"The file '{path}' does not exist.")
+    elif not path.is_file():
+        raise ValueError(f"The path '{path}' is not a file.")
+
+    return path
+
+
+def _iter_sheet_chunks(sheet, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yields the rows of a read-only worksheet as DataFrames of `chunksize` rows."""
+
+    rows = sheet.iter_rows(values_only=True)
+    header = next(rows, None)
+
+    if header is None:
+        return
+
+    buffer = []
+    for row in rows:
+        buffer.append(row)
+
+        if len(buffer) == chunksize:
+            yield pd.DataFrame(buffer, columns=header)
+            buffer = []
+
+    if buffer:
+        yield pd.DataFrame(buffer, columns=header)
+
+
+def _iter_chunked_measurements(
+    chunks: Iterable[pd.DataFrame],
+    meas_id: str,
+    data_unit: str,
+    time_unit: str,
+    data_type: DataTypes,
+    max_bytes: int | None,
+    columnar: bool,
+) -> Iterator[Measurement]:
+    """Assembles measurements from chunks of rows with contiguous ID blocks.
+
+    The rows of the current measurement are buffered until a different ID follows,
+    at which point the measurement is created and yielded. Files without an 'id'
+    column are treated as a single measurement named `meas_id`.
+    """
+
+    current, pending, n_bytes = None, [], 0
+    completed = set()
+
+    def flush() -> Measurement:
+        return _create_single_measurement(
+            df=pd.concat(pending, ignore_index=True),
+            id=current,
+            data_unit=data_unit,
+            time_unit=time_unit,
+            data_type=data_type,
+            columnar=columnar,
+        )
+
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            _validate_data(chunk)
+        else:
+            _validate_columns(chunk)
+
+        if "id" in chunk:
+            codes, _ = pd.factorize(chunk["id"], sort=False)
+            codes = codes[codes >= 0]
+
+            if len(codes) > 1 and (np.diff(codes) < 0).any():
+                raise ValueError(
+                    "The rows of each measurement must be contiguous to be read in chunks. Sort the file by 'id' or use 'read_csv' instead."
+                )
+
+            blocks = split_by_id(chunk)
+        else:
+            blocks = {meas_id: chunk}
+
+        for id, block in blocks.items():
+            if id != current:
+                if pending:
+                    completed.add(current)
+                    yield flush()
+
+                if id in completed:
+                    raise ValueError(
+                        f"The rows of measurement '{id}' are not contiguous. Sort the file by 'id' or use 'read_csv' instead."
+                    )
+
+                current, pending, n_bytes = id, [], 0
+
+            pending.append(block)
+
+            if max_bytes is not None:
+                n_bytes += int(block.memory_usage(index=False, deep=True).sum())
+
+                if n_bytes > max_bytes:
+                    raise ValueError(
+                        f"Measurement '{id}' exceeds the limit of {max_bytes} buffered bytes. Increase 'max_bytes' to read it."
+                    )
+
+    if pending:
+        yield flush()
+
+
 def from_dataframe(
     df: pd.DataFrame,
     data_unit: str,
@@ -249,24 +646,32 @@ def _create_single_measurement(
     data_unit: str | UnitDefinition,
     time_unit: str | UnitDefinition,
     data_type: DataTypes,
+    columnar: bool = False,
 ) -> Measurement:
-    data = df.to_dict(orient="list")
-    time = data.pop("time")
+    time = df["time"].to_numpy(dtype=np.float64)
     meas_data = []
 
+    if columnar:
+        measurement_cls, meas_data_cls = ArrayMeasurement, ArrayMeasurementData
+    else:
+        measurement_cls, meas_data_cls = Measurement, MeasurementData
+        time = time.tolist()
+
     if isinstance(data_unit, UnitDefinition):
         data_unit = data_unit.name  # type: ignore
     if isinstance(time_unit, UnitDefinition):
         time_unit = time_unit.name  # type: ignore
 
-    for species_id, species_data in data.items():
-        if species_id == "id":
+    for species_id in df.columns:
+        if species_id in ("time", "id"):
             continue
 
+        species_data = df[species_id].to_numpy(dtype=np.float64)
+
         meas_data.append(
-            MeasurementData(
+            meas_data_cls(
                 species_id=str(species_id),
-                data=species_data,
+                data=species_data if columnar else species_data.tolist(),
                 time=time,
                 data_unit=data_unit,  # type: ignore
                 time_unit=time_unit,  # type: ignore
@@ -275,7 +680,12 @@ def _create_single_measurement(
             )
         )
 
-    return Measurement(name=id, id=id, species_data=meas_data)
+    measurement = measurement_cls(name=id, id=id, species_data=meas_data)
+
+    if columnar:
+        measurement.pack()
+
+    return measurement
 
 
 def _process_multiple_measurements(
@@ -284,29 +694,71 @@ def _process_multiple_measurements(
     time_unit: str,
     data_type: DataTypes,
 ) -> list[Measurement]:
-    ids = df["id"].unique()
-    measurements = []
-
-    for id in ids:
-        sub_df = df[df["id"] == id]
-        measurements.append(
-            _create_single_measurement(
-                df=sub_df,  # type: ignore
-                id=id,
-                data_unit=data_unit,
-                time_unit=time_unit,
-                data_type=data_type,
-            )
+    return [
+        _create_single_measurement(
+            df=sub_df,
+            id=id,
+            data_unit=data_unit,
+            time_unit=time_unit,
+            data_type=data_type,
         )
+        for id, sub_df in split_by_id(df).items()
+    ]
+
 
-    return measurements
+def split_by_id(
+    df: pd.DataFrame,
+    column: str = "id",
+    drop: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """Splits a DataFrame into one DataFrame per unique value of a column.
+
+    Instead of filtering the DataFrame once per ID, the rows are grouped in a single
+    pass: the IDs are factorized, the rows are stably sorted by ID unless they already
+    are contiguous, and each group is sliced from the sorted frame by its offset.
+    Hence, the cost is linear in the number of rows regardless of the number of IDs.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to split.
+        column (str): The column holding the IDs. Default is 'id'.
+        drop (bool): Whether to drop the ID column from the results. Default is True.
+
+    Returns:
+        dict[str, pd.DataFrame]: DataFrames with a fresh index, keyed by ID in order
+            of first appearance. Rows without an ID are omitted.
+    """
+
+    codes, ids = pd.factorize(df[column], sort=False)
+    valid = codes >= 0
+
+    if not valid.all():
+        df, codes = df[valid], codes[valid]
+
+    if drop:
+        df = df.drop(columns=[column])
+
+    if len(codes) > 1 and (np.diff(codes) < 0).any():
+        order = np.argsort(codes, kind="stable")
+        df, codes = df.take(order), codes[order]
+
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(ids)))))
+
+    return {
+        id: df.iloc[start:stop].reset_index(drop=True)
+        for id, start, stop in zip(ids, offsets[:-1], offsets[1:])
+    }
 
 
 def _validate_data(data: pd.DataFrame) -> None:
     """Validates the data from a CSV file"""
     assert "time" in data, "The CSV file must contain a 'time' column"
-    assert data["time"][0] == 0, "The time column must start at 0"
+    assert data["time"].iloc[0] == 0, "The time column must start at 0"
+
+    _validate_columns(data)
 
+
+def _validate_columns(data: pd.DataFrame) -> None:
+    """Validates that all but the 'id' column are numerical"""
     for col in data.columns:
         if col == "id":
             continue
@@ -318,35 +770,131 @@ def _validate_data(data: pd.DataFrame) -> None:
 def _measurement_to_pandas(measurement: Measurement) -> pd.DataFrame:
     """Converts a Measurement object to a pandas DataFrame"""
 
+    time, columns = _measurement_columns(measurement)
+
+    return pd.DataFrame({"time": time, **columns})
+
+
+def _measurement_columns(
+    measurement: Measurement,
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Collects the time and species arrays of a measurement.
+
+    Args:
+        measurement (Measurement): The measurement to collect the arrays from.
+
+    Returns:
+        tuple[np.ndarray, dict[str, np.ndarray]]: The time array and the data arrays
+            of all species with data, keyed by species ID.
+
+    Raises:
+        ValueError: If the measurement contains neither time nor data.
+        ValueError: If the time arrays of the species are inconsistent.
+        ValueError: If the data of a species does not match the time array.
+    """
+
     _validate_measurement(measurement)
 
-    data = {"time": _get_time_array(measurement)}
-    for species in measurement.species_data:
-        if len(species.data) > 0:
-            data[species.species_id] = species.data
+    time = _get_time_array(measurement)
+    columns = {
+        species.species_id: as_array(species.data)
+        for species in measurement.species_data
+        if len(species.data) > 0
+    }
+
+    if time is None and not columns:
+        raise ValueError(
+            f"Export to pandas not possible, measurement '{measurement.id}' contains neither time nor data."
+        )
+    elif time is None:
+        n_rows = max(len(data) for data in columns.values())
+        time = np.full(n_rows, np.nan)
+
+    for species_id, data in columns.items():
+        if len(data) != len(time):
+            raise ValueError(
+                f"Export to pandas not possible, the data of species '{species_id}' in measurement '{measurement.id}' has {len(data)} values, but there are {len(time)} time points."
+            )
+
+    return time, columns
 
-    return pd.DataFrame(data)
 
+def _build_frame(
+    blocks: list[tuple[str, tuple[np.ndarray, dict[str, np.ndarray]]]],
+) -> pd.DataFrame:
+    """Builds a single DataFrame from the columns of multiple measurements.
+
+    All columns are preallocated with the total number of rows and filled in a
+    single pass. Species that are missing in a measurement are filled with NaN. The
+    column order matches the one of concatenating the DataFrames of each
+    measurement, and the 'id' column is stored as a categorical.
+
+    Args:
+        blocks (list): Tuples of measurement ID and measurement columns, as returned
+            by `_measurement_columns`.
 
-def _get_time_array(measurement: Measurement):
+    Returns:
+        pd.DataFrame: The combined DataFrame.
+    """
+
+    lengths = np.array([len(time) for _, (time, _) in blocks], dtype=np.intp)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    n_rows = int(offsets[-1])
+
+    order = ["time"]
+    for i, (_, (_, columns)) in enumerate(blocks):
+        order += [species_id for species_id in columns if species_id not in order]
+
+        if i == 0:
+            order.append("id")
+
+    time = np.empty(n_rows, dtype=np.float64)
+    data = {
+        species_id: np.full(n_rows, np.nan)
+        for species_id in order
+        if species_id not in ("time", "id")
+    }
+
+    for (_, (meas_time, columns)), start, stop in zip(
+        blocks, offsets[:-1], offsets[1:]
+    ):
+        time[start:stop] = meas_time
+        for species_id, values in columns.items():
+            data[species_id][start:stop] = values
+
+    ids = [meas_id for meas_id, _ in blocks]
+    categories = pd.unique(np.array(ids, dtype=object))
+    codes = pd.Index(categories).get_indexer(ids)
+
+    data["time"] = time
+    data["id"] = pd.Categorical.from_codes(
+        np.repeat(codes, lengths),
+        categories=categories,
+    )
+
+    return pd.DataFrame({column: data[column] for column in order}, copy=False)
+
+
+def _get_time_array(measurement: Measurement) -> np.ndarray | None:
     for meas_data in measurement.species_data:
         if len(meas_data.time) > 0:
-            return meas_data.time
+            return as_array(meas_data.time)
 
 
 def _validate_measurement(meas: Measurement) -> None:
     """Validates a Measurement object"""
 
+    times = {
+        species.species_id: as_array(species.time)
+        for species in meas.species_data
+        if len(species.time) > 0
+    }
+
+    if not times:
+        return
+
     # Check if the length of time is consistent
-    try:
-        times = pd.DataFrame(
-            {
-                species.species_id + "_time": species.time
-                for species in meas.species_data
-                if len(species.time) > 0
-            }
-        )
-    except ValueError:
+    if len({len(time) for time in times.values()}) > 1:
         time_lengths = {
             species.species_id: len(species.time) for species in meas.species_data
         }
@@ -355,8 +903,14 @@ def _validate_measurement(meas: Measurement) -> None:
         )
 
     # Check if the time arrays are the same
-    all_columns_same = bool(times.apply(lambda col: col.equals(times.iloc[:, 0])).all())
+    reference = next(iter(times.values()))
+    all_columns_same = all(
+        np.array_equal(time, reference, equal_nan=True) for time in times.values()
+    )
     if not all_columns_same:
+        inconsistent = pd.DataFrame(
+            {species_id + "_time": time for species_id, time in times.items()}
+        )
         raise ValueError(
-            f"Export to pandas not possible, the time arrays are inconsistent. Got different time arrays per species: \n\n {times.T} \n\n"
+            f"Export to pandas not possible, the time arrays are inconsistent. Got different time arrays per species: \n\n {inconsistent.T} \n\n"
         )
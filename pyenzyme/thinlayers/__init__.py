@@ -1,4 +1,9 @@
 from .base import BaseThinLayer
+from .cache import MODEL_CACHE, ModelCache
+from .multistart import MultiStart, StartResult
+from .solver import SolverSettings
+from .uncertainty import BootstrapResult, ProfileResult, UncertaintyAnalysis
+
 
 def _get_pysces():
     global ThinLayerPysces
@@ -22,12 +27,52 @@ def _get_copasi():
     return _ThinLayerCopasi
 
 
+def _get_scipy():
+    global ThinLayerScipy
+    try:
+        from .scipy_ode import ThinLayerScipy as _ThinLayerScipy
+    except ImportError as e:
+        raise ImportError(
+            f"ThinLayerScipy is not available because of missing dependencies: {e}"
+        )
+    return _ThinLayerScipy
+
+
+def _get_initial_rates():
+    global ThinLayerInitialRates
+    try:
+        from .initial_rates import ThinLayerInitialRates as _ThinLayerInitialRates
+    except ImportError as e:
+        raise ImportError(
+            f"ThinLayerInitialRates is not available because of missing dependencies: {e}"
+        )
+    return _ThinLayerInitialRates
+
+
 def __getattr__(name):
     if name == "ThinLayerPysces":
         return _get_pysces()
     elif name == "ThinLayerCopasi":
         return _get_copasi()
+    elif name == "ThinLayerScipy":
+        return _get_scipy()
+    elif name == "ThinLayerInitialRates":
+        return _get_initial_rates()
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-__all__ = ["BaseThinLayer", "ThinLayerPysces", "ThinLayerCopasi"]
+__all__ = [
+    "BaseThinLayer",
+    "MODEL_CACHE",
+    "ModelCache",
+    "MultiStart",
+    "StartResult",
+    "SolverSettings",
+    "UncertaintyAnalysis",
+    "ProfileResult",
+    "BootstrapResult",
+    "ThinLayerPysces",
+    "ThinLayerCopasi",
+    "ThinLayerScipy",
+    "ThinLayerInitialRates",
+]
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from functools import cached_property
 from typing import Dict, List, Optional, Set, Tuple, TypeAlias
 
+import numpy as np
 import pandas as pd
 from sympy import Symbol, sympify
 
@@ -56,6 +57,7 @@ class BaseThinLayer(ABC):
         self.measurement_ids = measurement_ids
         self.df_per_measurement = df_per_measurement
         self.exclude_unmodeled_species = exclude_unmodeled_species
+        self._start_values: Dict[str, float] = {}
 
     @staticmethod
     def _remove_unmodeled_species(enzmldoc: v2.EnzymeMLDocument) -> v2.EnzymeMLDocument:
@@ -168,6 +170,7 @@ class BaseThinLayer(ABC):
         t0: float,
         t1: float,
         nsteps: int = 100,
+        times: Optional[Time] = None,
     ) -> Tuple[SimResult, Time]:
         """
         Integrates the model from t0 to t1 with the given initial conditions.
@@ -178,12 +181,19 @@ class BaseThinLayer(ABC):
             t0 (float): Start time for integration.
             t1 (float): End time for integration.
             nsteps (int, optional): Number of time points to generate. Defaults to 100.
+            times (Optional[Time], optional): Time points at which to evaluate the
+                solution, e.g. those of a measurement. The integration starts at t0,
+                while t1 and nsteps are ignored. Defaults to None, which evaluates
+                nsteps equidistant time points from t0 to t1.
 
         Returns:
             Tuple[SimResult, Time]: A tuple containing:
                 - Dict mapping species IDs to concentration trajectories.
                 - List of time points.
 
+        Raises:
+            ValueError: If the time points are not increasing or start before t0.
+
         Examples:
             >>> # Simulate model with initial conditions
             >>> species_data, time_points = thinlayer.integrate(
@@ -193,9 +203,201 @@ class BaseThinLayer(ABC):
             ...     t1=100.0,
             ...     nsteps=200
             ... )
+            >>> # Simulate at the time points of a measurement
+            >>> species_data, time_points = thinlayer.integrate(
+            ...     model=doc,
+            ...     initial_conditions={"S1": 10.0, "S2": 0.0},
+            ...     t0=0.0,
+            ...     t1=100.0,
+            ...     times=[0.0, 15.0, 30.0, 60.0],
+            ... )
         """
         pass
 
+    @staticmethod
+    def _integration_times(
+        t0: float,
+        t1: float,
+        nsteps: int,
+        times: Optional[Time] = None,
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Returns the time grid of `integrate` and the index of its first output.
+
+        Simulators start at the first point of their grid, hence t0 is prepended
+        to output times that start after it and dropped from the result again.
+
+        Args:
+            t0 (float): Start time for integration.
+            t1 (float): End time for integration.
+            nsteps (int): Number of equidistant time points if no times are given.
+            times (Optional[Time]): Time points at which to evaluate the solution.
+
+        Returns:
+            Tuple[np.ndarray, int]: The time grid and the index of its first output.
+
+        Raises:
+            ValueError: If the time points are not increasing or start before t0.
+        """
+        if times is None:
+            return np.linspace(t0, t1, nsteps), 0
+
+        output = np.asarray(times, dtype=np.float64)
+
+        if output.ndim != 1 or output.size == 0:
+            raise ValueError("At least one time point is required")
+
+        if np.any(np.diff(output) <= 0):
+            raise ValueError("Time points must be strictly increasing")
+
+        if output[0] < t0:
+            raise ValueError(
+                f"Time points must not start before t0={t0}, got {output[0]}"
+            )
+
+        if output[0] == t0:
+            return output, 0
+
+        return np.concatenate([[t0], output]), 1
+
+    def integrate_batch(
+        self,
+        model: v2.EnzymeMLDocument,
+        initial_conditions: List[InitCondDict],
+        times: List[Time],
+    ) -> List[Tuple[SimResult, Time]]:
+        """
+        Integrates multiple conditions of the model, each on its own time grid.
+
+        By default, each condition is integrated separately by `integrate`. Thin
+        layers that support batching override this to simulate all conditions at
+        once.
+
+        Args:
+            model (v2.EnzymeMLDocument): EnzymeML document containing the model.
+            initial_conditions (List[InitCondDict]): Initial concentrations per condition.
+            times (List[Time]): Time points per condition. The first time point is the
+                start of the integration.
+
+        Returns:
+            List[Tuple[SimResult, Time]]: The trajectories and time points per condition.
+
+        Raises:
+            ValueError: If the number of conditions and time grids differ.
+
+        Examples:
+            >>> # Simulate two conditions on their own time grids
+            >>> results = thinlayer.integrate_batch(
+            ...     model=doc,
+            ...     initial_conditions=[{"S1": 10.0}, {"S1": 20.0}],
+            ...     times=[[0.0, 5.0, 10.0], [0.0, 2.0, 4.0]],
+            ... )
+        """
+        if len(initial_conditions) != len(times):
+            raise ValueError(
+                f"Got {len(initial_conditions)} initial conditions but {len(times)} time grids"
+            )
+
+        return [
+            self.integrate(model, condition, t0=time[0], t1=time[-1], times=time)
+            for condition, time in zip(initial_conditions, times)
+        ]
+
+    def set_start_values(self, values: Dict[str, float]):
+        """
+        Sets the values from which the next optimization starts.
+
+        The values are kept by the thin layer and take precedence over the `value`
+        and `initial_value` of the parameters in the next call of `optimize`. The
+        wrapped document is left unchanged, hence `integrate` still accepts the
+        document the thin layer was created from.
+
+        Args:
+            values (Dict[str, float]): Start values by parameter symbol.
+
+        Raises:
+            ValueError: If a symbol does not refer to a parameter of the document.
+
+        Examples:
+            >>> # Restart the fit from a different point
+            >>> thinlayer.set_start_values({"k_cat": 1.0, "K_M": 50.0})
+            >>> thinlayer.optimize()
+        """
+        parameters = {param.symbol: param for param in self.enzmldoc.parameters}
+        unknown = set(values) - set(parameters)
+
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+        self._start_values.update(values)
+
+    def set_measurement_data(self, data: Dict[str, Dict[str, List[float]]]):
+        """
+        Replaces the observed data of the measurements of the wrapped document.
+
+        Time points and initial concentrations are kept, hence the next call of
+        `optimize` fits the same model to the new observations. Used to refit
+        resampled data, e.g. in a bootstrap.
+
+        Args:
+            data (Dict[str, Dict[str, List[float]]]): The observations by measurement
+                ID and species ID. Each list must match the time points of the
+                species data it replaces.
+
+        Raises:
+            ValueError: If a measurement or species data does not exist, or the
+                number of observations differs from the number of time points.
+
+        Examples:
+            >>> # Refit with a perturbed observation
+            >>> thinlayer.set_measurement_data({"m0": {"s1": [0.0, 1.1, 2.0]}})
+            >>> thinlayer.optimize()
+        """
+        measurements = {meas.id: meas for meas in self.enzmldoc.measurements}
+
+        for meas_id, species in data.items():
+            if meas_id not in measurements:
+                raise ValueError(f"Measurement {meas_id} not found")
+
+            species_data = {s.species_id: s for s in measurements[meas_id].species_data}
+
+            for species_id, values in species.items():
+                if species_id not in species_data:
+                    raise ValueError(
+                        f"Species {species_id} not found in measurement {meas_id}"
+                    )
+
+                if len(values) != len(species_data[species_id].time):
+                    raise ValueError(
+                        f"Got {len(values)} observations of {species_id} in measurement "
+                        f"{meas_id}, expected {len(species_data[species_id].time)}"
+                    )
+
+                species_data[species_id].data = list(values)
+
+        # The tabular views are derived from the data and rebuilt on next access
+        self.__dict__.pop("df", None)
+        self.__dict__.pop("df_map", None)
+
+    def objective_value(self) -> float:
+        """
+        Returns the objective value reached by the last optimization.
+
+        For least-squares fits this is the sum of squared residuals. Values of
+        different optimizations of the same thin layer are comparable, which is
+        required to rank the starts of a multi-start optimization.
+
+        Returns:
+            float: The objective value.
+
+        Raises:
+            NotImplementedError: If the thin layer does not report its objective.
+            ValueError: If the model has not been optimized yet.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not report its objective value"
+        )
+
     @abstractmethod
     def optimize(self, **kwargs):
         """
@@ -14,7 +14,10 @@ import os
 
 from typing import Dict, List, Optional, Tuple
 
+from pyenzyme.tabular import split_by_id
 from pyenzyme.thinlayers.base import BaseThinLayer, SimResult, Time, InitCondDict
+from pyenzyme.thinlayers.cache import MODEL_CACHE, ModelCache, model_key, model_values
+from pyenzyme.thinlayers.solver import SolverSettings
 from pyenzyme.versions import v2
 
 try:
@@ -27,6 +30,15 @@ except ModuleNotFoundError as e:
         f"{e}"
     )
 
+# Integrators of the COPASI time course task by solver method
+METHODS = {
+    "LSODA": "Deterministic (LSODA)",
+    "Radau": "Deterministic (RADAU5)",
+}
+
+# Value COPASI assigns to global parameters without a value in the SBML document
+UNSET_PARAMETER_VALUE = 1.0
+
 
 class ThinLayerCopasi(BaseThinLayer):
     """
@@ -41,6 +53,8 @@ class ThinLayerCopasi(BaseThinLayer):
         inits (list[InitMap]): Initial conditions for each measurement.
         cols (list[str]): Column names for the experimental data.
         parameters (list[dict[str, float]]): Optimizable parameters for the model.
+        cache (ModelCache | None): Cache of compiled models shared across instances.
+        solver (SolverSettings | None): Settings of the COPASI integrator.
     """
 
     model: basico.COPASI.CDataModel
@@ -49,12 +63,16 @@ class ThinLayerCopasi(BaseThinLayer):
     cols: list[str]
     parameters: list
     nu_enzmldoc: v2.EnzymeMLDocument
+    cache: Optional[ModelCache]
+    solver: Optional[SolverSettings]
 
     def __init__(
         self,
         enzmldoc: v2.EnzymeMLDocument,
         model_dir: Path | str = "./copasi_models",
         measurement_ids: Optional[List[str]] = None,
+        cache: Optional[ModelCache] = MODEL_CACHE,
+        solver: Optional[SolverSettings] = None,
     ):
         """
         Initialize the ThinLayerCopasi instance.
@@ -64,6 +82,17 @@ class ThinLayerCopasi(BaseThinLayer):
             model_dir (Path | str): Directory where COPASI model files will be stored.
             measurement_ids (Optional[List[str]]): IDs of measurements to include in the analysis.
                 If None, all measurements will be used.
+            cache (Optional[ModelCache]): Cache of compiled models. Instances whose
+                documents describe the same model load it from a COPASI file instead
+                of importing the SBML document again. Defaults to the cache shared by
+                all thin layers, which keeps models in memory only unless
+                `PYENZYME_CACHE_DIR` is set. None disables caching.
+            solver (Optional[SolverSettings]): Settings of the integrator, used for
+                simulations and parameter estimation. COPASI supports "LSODA" and
+                "Radau". Defaults to None, which keeps the defaults of COPASI.
+
+        Raises:
+            ValueError: If the solver settings are not supported by COPASI.
 
         Examples:
             >>> import pyenzyme as pe
@@ -75,6 +104,9 @@ class ThinLayerCopasi(BaseThinLayer):
         # not sure this is needed, everything ought to be supported
         self._check_compliance(enzmldoc)
 
+        if solver is not None:
+            self._check_solver(solver)
+
         super().__init__(
             enzmldoc=enzmldoc,
             measurement_ids=measurement_ids,
@@ -89,9 +121,12 @@ class ThinLayerCopasi(BaseThinLayer):
             os.makedirs(model_dir, exist_ok=True)
 
         self.model_dir = model_dir
+        self.cache = cache
+        self.solver = solver
 
         # load the model into COPASI
         self._get_copasi_model(model_dir)
+        self._apply_solver()
 
     def _check_compliance(self, enzmldoc: v2.EnzymeMLDocument):
         """
@@ -106,6 +141,38 @@ class ThinLayerCopasi(BaseThinLayer):
         if not has_kinetic_laws and not has_odes:
             raise ValueError("EnzymeML document must contain kinetic laws or ODEs")
 
+    @staticmethod
+    def _check_solver(solver: SolverSettings):
+        """
+        Check if the solver settings are supported by COPASI.
+        """
+        solver.check("ThinLayerCopasi", list(METHODS))
+
+        if solver.method == "Radau" and solver.max_step is not None:
+            raise ValueError("The RADAU5 integrator of COPASI does not support a maximum step")
+
+    def _apply_solver(self):
+        """
+        Applies the solver settings to the time course task of the COPASI model.
+
+        Parameter estimation simulates the experiments with this task, hence the
+        settings apply to fits as well.
+        """
+        if self.solver is None:
+            return
+
+        method = {
+            'name': METHODS[self.solver.method],
+            'Relative Tolerance': self.solver.rtol,
+            'Absolute Tolerance': self.solver.atol,
+        }
+
+        if self.solver.method == "LSODA":
+            # a maximum step of zero means unbounded in COPASI
+            method['Max Internal Step Size'] = self.solver.max_step or 0.0
+
+        basico.set_task_settings(basico.T.TIME_COURSE, {'method': method}, model=self.model)
+
     def integrate(
         self,
         model: v2.EnzymeMLDocument,
@@ -113,6 +180,7 @@ class ThinLayerCopasi(BaseThinLayer):
         t0: float,
         t1: float,
         nsteps: int = 100,
+        times: Optional[Time] = None,
     ) -> Tuple[SimResult, Time]:
         """
         Integrates the model from t0 to t1 with the given initial conditions.
@@ -126,6 +194,8 @@ class ThinLayerCopasi(BaseThinLayer):
             t0 (float): Start time for integration.
             t1 (float): End time for integration.
             nsteps (int, optional): Number of time points to generate. Defaults to 100.
+            times (Optional[Time], optional): Time points at which to evaluate the
+                solution. If given, t1 and nsteps are ignored. Defaults to None.
 
         Returns:
             Tuple[SimResult, Time]: A tuple containing:
@@ -133,7 +203,8 @@ class ThinLayerCopasi(BaseThinLayer):
                 - List of time points.
 
         Raises:
-            ValueError: If the provided model is different from the one used for initialization.
+            ValueError: If the provided model is different from the one used for
+                initialization, or the time points are invalid.
 
         Examples:
             >>> # Get initial conditions from a measurement
@@ -150,17 +221,20 @@ class ThinLayerCopasi(BaseThinLayer):
             )
 
         # Convert the initial conditions to a InitMap
-        time = np.linspace(t0, t1, nsteps).tolist()
+        time, start = self._integration_times(t0, t1, nsteps, times)
+
+        # COPASI always integrates from zero, hence the grid of the autonomous
+        # model is shifted to start there
         init_map = InitMap(
-            time=time,
+            time=(time - t0).tolist(),
             species=initial_conditions,
         )
 
         out, species_order = self._simulate_condition(init_map)
 
         return (
-            {species: traj.tolist() for species, traj in zip(species_order, out)},
-            time,
+            {species: traj[start:].tolist() for species, traj in zip(species_order, out)},
+            time[start:].tolist(),
         )
 
     def optimize(self, method="Levenberg - Marquardt"):
@@ -231,7 +305,7 @@ class ThinLayerCopasi(BaseThinLayer):
             >>> pe.write_enzymeml(optimized_doc, "optimized_model.json")
         """
         nu_enzmldoc = self.enzmldoc.model_copy(deep=True)
-        results = basico.get_fit_statistic(include_parameters=True)  # type: ignore
+        results = basico.get_fit_statistic(include_parameters=True, model=self.model)  # type: ignore
 
         # update the parameters in the enzmldoc
         for parameter in nu_enzmldoc.parameters:
@@ -241,11 +315,23 @@ class ThinLayerCopasi(BaseThinLayer):
                     break
         return nu_enzmldoc
 
+    def objective_value(self) -> float:
+        """
+        Returns the objective value reached by the last optimization.
+
+        Returns:
+            float: The objective value reported by the COPASI parameter estimation.
+        """
+        return float(basico.get_fit_statistic(model=self.model)["obj"])
+
     # ! Helper methods
     def _initialize_parameters(self):
         """
         Initializes Parameters instance with model parameters.
 
+        Parameters with `fit=False` are set to their value in the model and are not
+        added to the fit.
+
         Returns:
             list[dict[str, float]]: Parameters object ready for optimization.
 
@@ -267,7 +353,9 @@ class ThinLayerCopasi(BaseThinLayer):
                 param_dict["upper"] = param.upper_bound
 
             # Determine parameter value
-            if param.value:
+            if param.symbol in self._start_values:
+                param_dict["start"] = self._start_values[param.symbol]
+            elif param.value:
                 param_dict["start"] = param.value
             elif param.initial_value:
                 param_dict["start"] = param.initial_value
@@ -276,6 +364,10 @@ class ThinLayerCopasi(BaseThinLayer):
                     f"Neither initial_value nor value given for parameter {param.name} in global parameters"
                 )
 
+            if param.fit is False:
+                basico.set_parameters(param.symbol, exact=True, initial_value=param_dict["start"], model=self.model)
+                continue
+
             param_dict["name"] = 'Values[' + param.symbol + ']'
 
             # add only if lower and upper bound are not np.nan
@@ -303,12 +395,11 @@ class ThinLayerCopasi(BaseThinLayer):
         # construct sbml_id to name mapping dictionary
         sbml_id_to_name = {row['sbml_id']: row['name'] for _, row in species_df.iterrows()}
 
-        # loop over 'id' colum of self.df and create a new experiment for each id
-        for id in self.df['id'].unique():
-            # get the dataframe for the id
-            df = self.df[self.df['id'] == id]
-            # drop id column
-            df = df.drop(columns=["id"])
+        # replace the experiments of previous optimizations, the data may have changed
+        basico.remove_experiments(model=self.model)
+
+        # split self.df by 'id' and create a new experiment for each id
+        for id, df in split_by_id(self.df).items():
             # initializations
             inits = self.inits[id]
 
@@ -340,12 +431,75 @@ class ThinLayerCopasi(BaseThinLayer):
                     df.loc[df.index[0], f"[{species}]_0"] = inits.species[species]
 
             # now add as experiment to basico
-            basico.add_experiment(name=id, data=df, data_dir=self.model_dir)
+            basico.add_experiment(name=id, data=df, data_dir=self.model_dir, model=self.model)
 
     def _get_copasi_model(self, model_dir: Path | str):
         """
         Converts an EnzymeML document to a COPASI model.
 
+        Compiled models are looked up in the model cache first and loaded from
+        their COPASI file instead of importing the SBML document again. The
+        parameter values and species defaults of the document are then applied
+        to the loaded model.
+
+        Args:
+            model_dir (Path | str): Directory for storing model files.
+        """
+        if self.cache is not None:
+            key = model_key(self.enzmldoc, "copasi", basico.__version__)
+            cps = self.cache.get(key)
+
+            if cps is None:
+                cpsfile_path = self.cache.lookup(key, ".cps")
+
+                if cpsfile_path is not None:
+                    cps = cpsfile_path.read_text()
+
+            if cps is None:
+                self._compile_copasi_model(model_dir)
+                cps = basico.save_model_to_string(model=self.model)
+                self.cache.store(key, ".cps", cps)
+            else:
+                self.model = basico.load_model_from_string(cps)
+                self._apply_model_values()
+
+            self.cache.put(key, cps)
+            return
+
+        self._compile_copasi_model(model_dir)
+
+    def _apply_model_values(self):
+        """
+        Applies the parameter values and species defaults of the document to the model.
+
+        The model cache is keyed on the structure of the model only, hence a cached
+        model may carry the values of another document. Parameters without a value
+        are reset to the value COPASI assigns when compiling the document.
+        """
+        parameters, species = model_values(self.enzmldoc)
+
+        for symbol, value in parameters.items():
+            if value is None:
+                value = UNSET_PARAMETER_VALUE
+
+            basico.set_parameters(symbol, exact=True, initial_value=value, model=self.model)
+
+        species_df = basico.get_species(model=self.model).reset_index()
+        sbml_id_to_name = {row['sbml_id']: row['name'] for _, row in species_df.iterrows()}
+
+        for species_id, value in species.items():
+            if species_id in sbml_id_to_name:
+                basico.set_species(
+                    sbml_id_to_name[species_id],
+                    exact=True,
+                    initial_concentration=value,
+                    model=self.model,
+                )
+
+    def _compile_copasi_model(self, model_dir: Path | str):
+        """
+        Exports the EnzymeML document to SBML and loads it into COPASI.
+
         Args:
             model_dir (Path | str): Directory for storing model files.
         """
@@ -434,11 +588,11 @@ class InitMap:
     time points for COPASI model simulations.
 
     Attributes:
-        time (List[float]): List of time points for simulation.
+        time (np.ndarray | List[float]): Time points for simulation.
         species (Dict[str, float]): Dictionary mapping species IDs to initial concentrations.
     """
 
-    time: List[float]
+    time: np.ndarray | List[float]
     species: Dict[str, float]
 
     @classmethod
@@ -454,7 +608,7 @@ class InitMap:
             InitMap: Initialized instance with time points and species initial values.
         """
         return cls(
-            time=df["time"].tolist(),
+            time=df["time"].to_numpy(dtype=np.float64),
             species={
                 s.species_id: s.initial
                 for s in meas.species_data
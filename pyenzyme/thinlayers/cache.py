@@ -0,0 +1,317 @@
+"""
+Content-addressed cache of compiled thin-layer models.
+
+Thin layers that hand the model to an external simulator (PySCeS, COPASI) export the
+EnzymeML document to SBML and import it again on every construction. Thin layers
+that are created over and over for the same model, e.g. to fit different sets of
+measurements, repeat this work although the model does not change.
+
+`ModelCache` stores the compiled models under a hash of the structure of the model,
+namely vessels, species, reactions, equations and the symbols and units of the
+parameters. Values do not enter the hash, hence sweeps over parameter values or
+measurements reuse the compiled model. Thin layers apply the values of their
+document, see `model_values`, to a model taken from the cache instead.
+Recently used models are kept in memory. Optionally, the files of compiled models
+are also kept in a directory that is shared across processes, which holds at most
+`maxfiles` models and evicts the least recently used ones beyond that.
+
+The cache shared by all thin layers, `MODEL_CACHE`, is memory-only unless the
+environment variable `PYENZYME_CACHE_DIR` is set, in which case its subdirectory
+"models" is used.
+
+Example:
+    >>> from pyenzyme.thinlayers import ModelCache, ThinLayerPysces
+    >>> cache = ModelCache(maxsize=8, directory="path/to/cache")
+    >>> tl = ThinLayerPysces(doc, cache=cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from pyenzyme.tools import to_dict_wo_json_ld
+from pyenzyme.versions import v2
+
+# Parameter fields that make up the structure of the compiled model
+STRUCTURE_FIELDS = ("id", "symbol", "name", "unit", "constant")
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Returns the directory of the on-disk cache, None if `PYENZYME_CACHE_DIR` is unset."""
+    directory = os.environ.get("PYENZYME_CACHE_DIR")
+
+    if not directory:
+        return None
+
+    return Path(directory) / "models"
+
+
+def model_key(enzmldoc: v2.EnzymeMLDocument, *tags: str) -> str:
+    """
+    Computes the cache key of the model described by an EnzymeML document.
+
+    Args:
+        enzmldoc (v2.EnzymeMLDocument): The document describing the model.
+        *tags (str): Additional strings distinguishing compiled models of the same
+            document, such as the simulator and its version.
+
+    Returns:
+        str: The hex digest of the SHA-256 hash.
+    """
+    parameters = [to_dict_wo_json_ld(param) for param in enzmldoc.parameters]
+    parameters = [
+        {name: param.get(name) for name in STRUCTURE_FIELDS} for param in parameters
+    ]
+
+    content = {
+        "tags": tags,
+        "vessels": [to_dict_wo_json_ld(vessel) for vessel in enzmldoc.vessels],
+        "small_molecules": [to_dict_wo_json_ld(s) for s in enzmldoc.small_molecules],
+        "proteins": [to_dict_wo_json_ld(protein) for protein in enzmldoc.proteins],
+        "complexes": [to_dict_wo_json_ld(c) for c in enzmldoc.complexes],
+        "reactions": [to_dict_wo_json_ld(r) for r in enzmldoc.reactions],
+        "equations": [to_dict_wo_json_ld(eq) for eq in enzmldoc.equations],
+        "parameters": parameters,
+    }
+
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def model_values(
+    enzmldoc: v2.EnzymeMLDocument,
+) -> Tuple[Dict[str, Optional[float]], Dict[str, float]]:
+    """
+    Returns the values the SBML export writes into the model of a document.
+
+    These are not part of `model_key`, hence a model taken from the cache may carry
+    the values of another document and has to be updated with these.
+
+    Args:
+        enzmldoc (v2.EnzymeMLDocument): The document describing the model.
+
+    Returns:
+        Tuple[Dict[str, Optional[float]], Dict[str, float]]: The values of all
+            parameters by symbol, None for parameters the export leaves unset, and
+            the initial concentrations of the first measurement by species ID.
+    """
+    parameters = {
+        param.symbol: param.value if param.value is not None else param.initial_value
+        for param in enzmldoc.parameters
+    }
+
+    species = {}
+    if enzmldoc.measurements:
+        species = {
+            data.species_id: data.initial
+            for data in enzmldoc.measurements[0].species_data
+            if data.initial is not None
+        }
+
+    return parameters, species
+
+
+class ModelCache:
+    """
+    A least-recently-used cache of compiled models, backed by a directory.
+
+    The in-memory cache holds arbitrary objects, typically serialized models from
+    which each thin layer creates its own copy. The on-disk cache holds the model
+    files written by the simulators. Both are safe to use from multiple threads and,
+    for the directory, from multiple processes.
+
+    Attributes:
+        maxsize (int): The maximum number of models kept in memory.
+        directory (Optional[Path]): The directory of the on-disk cache, None to
+            disable it.
+        maxfiles (int): The maximum number of model files kept on disk.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 32,
+        directory: Optional[Path | str] = None,
+        maxfiles: int = 256,
+    ):
+        """
+        Initialize the ModelCache instance.
+
+        Args:
+            maxsize (int, optional): The maximum number of models kept in memory.
+                A value of 0 disables the in-memory cache. Defaults to 32.
+            directory (Optional[Path | str], optional): The directory of the on-disk
+                cache. Defaults to None, which disables it.
+            maxfiles (int, optional): The maximum number of model files kept on
+                disk. Storing a file beyond it removes the least recently used
+                ones. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self.maxfiles = maxfiles
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Copies in other processes start empty, the directory is shared anyway
+        return {
+            "maxsize": self.maxsize,
+            "directory": self.directory,
+            "maxfiles": self.maxfiles,
+        }
+
+    def __setstate__(self, state: dict):
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns a model from memory and marks it as recently used.
+
+        Args:
+            key (str): The key of the model, see `model_key`.
+
+        Returns:
+            Optional[Any]: The cached model, None if it is not in memory.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, value: Any):
+        """
+        Stores a model in memory, evicting the least recently used ones.
+
+        Args:
+            key (str): The key of the model, see `model_key`.
+            value (Any): The model to store.
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def path(self, key: str, suffix: str) -> Optional[Path]:
+        """
+        Returns the path of a model file in the on-disk cache.
+
+        Args:
+            key (str): The key of the model, see `model_key`.
+            suffix (str): The file extension, including the leading dot.
+
+        Returns:
+            Optional[Path]: The path, which may not exist yet. None if the on-disk
+                cache is disabled.
+        """
+        if self.directory is None:
+            return None
+
+        return self.directory / f"{key}{suffix}"
+
+    def lookup(self, key: str, suffix: str) -> Optional[Path]:
+        """
+        Returns the path of a model file on disk and marks it as recently used.
+
+        Args:
+            key (str): The key of the model, see `model_key`.
+            suffix (str): The file extension, including the leading dot.
+
+        Returns:
+            Optional[Path]: The path, None if the file does not exist or the on-disk
+                cache is disabled.
+        """
+        path = self.path(key, suffix)
+
+        if path is None:
+            return None
+
+        try:
+            # Eviction goes by modification time, which hence is the access time
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return path
+
+    def store(self, key: str, suffix: str, content: str) -> Optional[Path]:
+        """
+        Writes a model file to the on-disk cache.
+
+        The file is written to a temporary file first and then moved into place,
+        hence concurrent processes never read a partially written file. If the
+        directory then holds more than `maxfiles` files, the least recently used
+        are removed.
+
+        Args:
+            key (str): The key of the model, see `model_key`.
+            suffix (str): The file extension, including the leading dot.
+            content (str): The content of the model file.
+
+        Returns:
+            Optional[Path]: The path of the file, None if the on-disk cache is disabled.
+        """
+        path = self.path(key, suffix)
+
+        if path is None:
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._evict(path.parent)
+
+        return path
+
+    def clear(self):
+        """Removes all models from memory. Files on disk are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, directory: Path):
+        """Removes the least recently used model files beyond `maxfiles`."""
+        files = []
+        for path in directory.iterdir():
+            try:
+                if path.suffix != ".tmp":
+                    files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Removed by another process in the meantime
+                continue
+
+        files.sort()
+
+        for _, path in files[: max(len(files) - self.maxfiles, 0)]:
+            path.unlink(missing_ok=True)
+
+
+# The cache shared by all thin layers of this process, on disk only if
+# PYENZYME_CACHE_DIR is set
+MODEL_CACHE = ModelCache(directory=default_cache_dir())
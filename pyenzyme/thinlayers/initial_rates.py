@@ -0,0 +1,383 @@
+"""
+Initial-rate fitting of kinetic laws without integrating the model.
+
+Many assays only report how fast a reaction starts, e.g. plate-reader screens
+with thousands of wells. `ThinLayerInitialRates` estimates the initial rate of
+every observed species and measurement from the first points of its time course
+and fits the rate equations of the model, evaluated at the initial
+concentrations, to these rates. Both steps are vectorized across measurements,
+hence no ODE is integrated during the fit.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import sympy as sp
+
+from pyenzyme.thinlayers.scipy_ode import (
+    TIME_SYMBOL,
+    ThinLayerScipy,
+    _bound,
+    _stack,
+    _standard_errors,
+)
+from pyenzyme.versions import v2
+
+try:
+    from scipy.optimize import OptimizeResult, least_squares
+except ModuleNotFoundError as e:
+    raise ModuleNotFoundError(
+        "ThinLayerInitialRates is not available. "
+        "To use it, please install the following dependencies: "
+        f"{e}"
+    )
+
+
+class ThinLayerInitialRates(ThinLayerScipy):
+    """
+    Fits the rate equations of a model to initial rates.
+
+    The initial rate of each observed species is the slope at the first time point
+    of a polynomial fitted to the first `n_points` observations of a measurement,
+    see `estimate_initial_rates`. The model rate is the derivative of the species
+    as compiled by `ODESystem`, i.e. the kinetic laws weighted by the
+    stoichiometry, evaluated at the initial concentrations of the measurement.
+
+    Only parameters that appear in the rate of an observed species can be
+    identified from initial rates. All other parameters are kept at their value.
+    Integration methods, such as `integrate` and `integrate_batch`, are inherited
+    from `ThinLayerScipy` and simulate full time courses with the fitted values.
+
+    Attributes:
+        n_points (int): The number of observations the initial rates are estimated from.
+        degree (int): The degree of the polynomial fitted to these observations.
+        rates (pd.DataFrame): The estimated initial rates, one row per measurement
+            and one column per observed species. Set by `optimize`.
+    """
+
+    n_points: int
+    degree: int
+    rates: pd.DataFrame
+
+    def __init__(
+        self,
+        enzmldoc: v2.EnzymeMLDocument,
+        measurement_ids: Optional[List[str]] = None,
+        n_points: int = 4,
+        degree: int = 1,
+        **kwargs,
+    ):
+        """
+        Initialize the ThinLayerInitialRates instance.
+
+        Args:
+            enzmldoc (v2.EnzymeMLDocument): EnzymeML document containing the model.
+            measurement_ids (Optional[List[str]]): IDs of measurements to include in the analysis.
+                If None, all measurements will be used.
+            n_points (int): The number of leading observations of each time course
+                used to estimate its initial rate. Defaults to 4.
+            degree (int): The degree of the polynomial fitted to these observations.
+                A degree of 2 accounts for the curvature caused by substrate
+                depletion. Defaults to 1.
+            **kwargs: Integrator settings passed to `ThinLayerScipy`, used by `integrate`.
+
+        Raises:
+            ValueError: If the degree is below 1 or fewer than `degree + 1` points
+                are requested.
+
+        Examples:
+            >>> import pyenzyme as pe
+            >>> import pyenzyme.thinlayers as tls
+            >>> doc = pe.read_enzymeml("path/to/enzmldoc.json")
+            >>> tl = tls.ThinLayerInitialRates(doc, n_points=5, degree=2)
+            >>> result = tl.optimize()
+        """
+        if degree < 1:
+            raise ValueError(f"The polynomial degree must be at least 1, got {degree}")
+
+        if n_points < degree + 1:
+            raise ValueError(
+                f"A polynomial of degree {degree} requires at least {degree + 1} points, "
+                f"got n_points={n_points}"
+            )
+
+        super().__init__(enzmldoc, measurement_ids=measurement_ids, **kwargs)
+
+        self.n_points = n_points
+        self.degree = degree
+
+    @cached_property
+    def rate_gradient(self) -> Callable[[np.ndarray, np.ndarray, np.ndarray], list]:
+        """
+        The lambdified derivatives of the model rates with respect to the parameters.
+
+        Follows the conventions of `ODESystem.rhs_func` and returns one row per
+        state species and one column per parameter.
+        """
+        t = sp.Symbol(TIME_SYMBOL)
+        y = [sp.Symbol(s) for s in self.system.species]
+        parameters = [sp.Symbol(p) for p in self.system.parameters]
+        args = parameters + [sp.Symbol(c) for c in self.system.constants]
+        gradient = sp.Matrix(self.system.derivatives).jacobian(parameters)
+
+        return sp.lambdify((t, y, args), gradient.tolist(), modules="numpy", cse=True)
+
+    def optimize(self, method: str = "trf", **kwargs) -> OptimizeResult:
+        """
+        Fits the model rates to the estimated initial rates.
+
+        Parameters with `fit=False` and parameters that do not appear in the rate
+        of any observed species are kept at their current value. The Jacobian of the
+        residuals is derived analytically from the rate equations.
+
+        Args:
+            method (str, optional): Algorithm of `scipy.optimize.least_squares`.
+                Defaults to "trf".
+            **kwargs: Additional keyword arguments passed to `least_squares`.
+
+        Returns:
+            OptimizeResult: Result of the optimization.
+
+        Raises:
+            ValueError: If no initial rate could be estimated or no fitted parameter
+                affects the observed rates.
+
+        Examples:
+            >>> tl = ThinLayerInitialRates(doc)
+            >>> result = tl.optimize()
+            >>> print(tl.rates)
+        """
+        self._get_experimental_data()
+
+        observed = {self.system.species[i] for i in self._observed}
+        rate_symbols = {
+            symbol.name
+            for species, expr in zip(self.system.species, self.system.derivatives)
+            if species in observed
+            for symbol in expr.free_symbols
+        }
+        fitted = [
+            p
+            for p in self.enzmldoc.parameters
+            if p.fit is not False and p.symbol in rate_symbols
+        ]
+
+        if not fitted:
+            raise ValueError(
+                "None of the fitted parameters affects the rates of the observed species"
+            )
+
+        self._fit_index = np.array(
+            [self.system.parameters.index(p.symbol) for p in fitted], dtype=int
+        )
+
+        lower = np.array([_bound(p.lower_bound, -np.inf) for p in fitted])
+        upper = np.array([_bound(p.upper_bound, np.inf) for p in fitted])
+        x0 = np.clip([self.values[p.symbol] for p in fitted], lower, upper)
+
+        if method != "lm":
+            kwargs.setdefault("bounds", (lower, upper))
+
+        kwargs.setdefault("x_scale", "jac")
+        kwargs.setdefault("jac", self._calculate_rate_jacobian)
+
+        theta = self._parameter_vector()
+        result = least_squares(
+            self._calculate_rate_residual,
+            x0,
+            args=(theta,),
+            method=method,
+            **kwargs,
+        )
+
+        for param, value in zip(fitted, result.x):
+            self.values[param.symbol] = float(value)
+
+        result.params = dict(zip([p.symbol for p in fitted], result.x.tolist()))
+        result.stderr = dict(
+            zip([p.symbol for p in fitted], _standard_errors(result).tolist())
+        )
+
+        self.result = result
+
+        return result
+
+    # ! Helper methods
+    def _get_experimental_data(self):
+        """
+        Estimates the initial rates and collects the initial concentrations.
+
+        Reads the arrays of the measurement data directly instead of building
+        DataFrames, which dominates for documents with many small measurements.
+        """
+        measurements = [
+            meas
+            for meas in self.enzmldoc.measurements
+            if meas.id in self.measurement_ids
+        ]
+        species = self.system.species
+        rates = estimate_initial_rates(
+            measurements, species, n_points=self.n_points, degree=self.degree
+        )
+
+        # Observed species are those with at least one estimated rate
+        self._observed = np.flatnonzero(~np.isnan(rates).all(axis=0))
+
+        if self._observed.size == 0:
+            raise ValueError("No initial rate could be estimated from the measurements")
+
+        self.rates = pd.DataFrame(
+            rates[:, self._observed],
+            index=pd.Index([meas.id for meas in measurements], name="id"),
+            columns=[species[i] for i in self._observed],
+        )
+
+        rates = rates[:, self._observed].T
+        self._mask = ~np.isnan(rates)
+        self._rates = rates[self._mask]
+
+        initial = [
+            {s.species_id: s.initial for s in meas.species_data}
+            for meas in measurements
+        ]
+        states, constants = zip(
+            *(self.system.initial_state(values) for values in initial)
+        )
+
+        self._t0 = np.array(
+            [
+                next((s.time[0] for s in meas.species_data if s.time), 0.0)
+                for meas in measurements
+            ],
+            dtype=np.float64,
+        )
+        self._y0 = np.stack(states, axis=1)
+        self._constants = np.stack(constants, axis=1)
+
+    def _arguments(self, x: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        """Returns the arguments of the rate functions, one column per measurement."""
+        theta = theta.copy()
+        theta[self._fit_index] = x
+        n = self._y0.shape[1]
+
+        return np.vstack([np.repeat(theta[:, None], n, axis=1), self._constants])
+
+    def _calculate_rate_residual(self, x: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        """
+        Calculates residuals between the model rates and the estimated initial rates.
+
+        Args:
+            x (np.ndarray): Values of the fitted parameters.
+            theta (np.ndarray): Values of all parameters, the fitted ones are replaced.
+
+        Returns:
+            np.ndarray: The residuals of all estimated rates.
+        """
+        args = self._arguments(x, theta)
+        n = args.shape[1]
+        rates = _stack(self.system.rhs_func(self._t0, self._y0, args), n)
+
+        return rates[self._observed][self._mask] - self._rates
+
+    def _calculate_rate_jacobian(self, x: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        """
+        Calculates the derivatives of the residuals with respect to the fitted parameters.
+
+        Args:
+            x (np.ndarray): Values of the fitted parameters.
+            theta (np.ndarray): Values of all parameters, the fitted ones are replaced.
+
+        Returns:
+            np.ndarray: The Jacobian of shape (n_residuals, n_fitted).
+        """
+        args = self._arguments(x, theta)
+        n = args.shape[1]
+        gradient = self.rate_gradient(self._t0, self._y0, args)
+        gradient = np.stack([_stack(gradient[i], n) for i in self._observed])
+
+        # (observed, parameters, measurements) -> (observed, measurements, fitted)
+        gradient = gradient[:, self._fit_index].transpose(0, 2, 1)
+
+        return gradient[self._mask]
+
+
+def estimate_initial_rates(
+    measurements: List[v2.Measurement],
+    species_ids: List[str],
+    n_points: int = 4,
+    degree: int = 1,
+) -> np.ndarray:
+    """
+    Estimates the initial rates of species from the start of their time courses.
+
+    A polynomial of the given degree is fitted to the first `n_points` observations
+    of each species and measurement, and its slope at the first time point is the
+    initial rate. Time courses that share their first time points are fitted
+    together in a single least-squares solve.
+
+    Args:
+        measurements (List[v2.Measurement]): The measurements to estimate rates for.
+        species_ids (List[str]): The species to estimate rates for.
+        n_points (int, optional): The number of leading observations per time course.
+            Defaults to 4.
+        degree (int, optional): The degree of the polynomial. Defaults to 1.
+
+    Returns:
+        np.ndarray: The initial rates of shape (n_measurements, n_species). NaN where
+            a species has fewer than `degree + 1` finite leading observations.
+
+    Examples:
+        >>> rates = estimate_initial_rates(doc.measurements, ["s0"], n_points=5)
+    """
+    rates = np.full((len(measurements), len(species_ids)), np.nan)
+    columns = {species: j for j, species in enumerate(species_ids)}
+    groups: Dict[Tuple[float, ...], List[Tuple[int, int, List[float]]]] = defaultdict(
+        list
+    )
+
+    for i, meas in enumerate(measurements):
+        for data in meas.species_data:
+            j = columns.get(data.species_id)
+
+            if j is None or len(data.data) < degree + 1:
+                continue
+
+            window = min(n_points, len(data.data), len(data.time))
+            groups[tuple(data.time[:window])].append((i, j, data.data[:window]))
+
+    for time, members in groups.items():
+        if len(time) < degree + 1:
+            continue
+
+        rows, cols, values = zip(*members)
+        rows, cols = np.array(rows), np.array(cols)
+        values = np.array(values, dtype=np.float64)
+        vandermonde = np.vander(np.subtract(time, time[0]), degree + 1, increasing=True)
+
+        complete = ~np.isnan(values).any(axis=1)
+        if complete.any():
+            coefficients, *_ = np.linalg.lstsq(
+                vandermonde, values[complete].T, rcond=None
+            )
+            rates[rows[complete], cols[complete]] = coefficients[1]
+
+        # Time courses with missing observations are fitted on their own
+        for row, col, series in zip(
+            rows[~complete], cols[~complete], values[~complete]
+        ):
+            present = ~np.isnan(series)
+
+            if present.sum() < degree + 1:
+                continue
+
+            coefficients, *_ = np.linalg.lstsq(
+                vandermonde[present], series[present], rcond=None
+            )
+            rates[row, col] = coefficients[1]
+
+    return rates
@@ -0,0 +1,445 @@
+"""
+Multi-start optimization of thin layers.
+
+Local fits of kinetic models frequently end in local minima, depending on where
+they start. `MultiStart` samples starting points within the bounds of the fitted
+parameters, runs a local fit of the thin layer from each of them and keeps the best
+one. The fits run in parallel worker processes, each of which receives a copy of
+the thin layer once. Sampling stops early as soon as the best fits agree.
+
+Example:
+    >>> import pyenzyme as pe
+    >>> from pyenzyme.thinlayers import MultiStart, ThinLayerScipy
+    >>> doc = pe.read_enzymeml("path/to/enzmldoc.json")
+    >>> multistart = MultiStart(ThinLayerScipy(doc), n_starts=32)
+    >>> best = multistart.run()
+    >>> fitted_doc = multistart.write()
+    >>> summary = multistart.to_pandas()
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Literal, Optional, TypeVar
+
+import dill
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from pyenzyme.thinlayers.base import BaseThinLayer
+from pyenzyme.versions import v2
+
+T = TypeVar("T")
+
+
+@dataclass
+class StartResult:
+    """The outcome of a local fit from a single starting point.
+
+    Attributes:
+        index (int): The index of the starting point.
+        start (Dict[str, float]): The start values of the fitted parameters.
+        values (Dict[str, float]): The fitted values.
+        stderr (Dict[str, Optional[float]]): The standard errors of the fitted values.
+        objective (float): The objective value of the fit, see
+            `BaseThinLayer.objective_value`.
+        error (str | None): A description of the error, None if the fit succeeded.
+    """
+
+    index: int
+    start: Dict[str, float]
+    values: Dict[str, float] = field(default_factory=dict)
+    stderr: Dict[str, Optional[float]] = field(default_factory=dict)
+    objective: float = np.inf
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fit succeeded."""
+        return self.error is None and bool(np.isfinite(self.objective))
+
+
+class MultiStart:
+    """
+    Runs local fits of a thin layer from many starting points.
+
+    Starting points are drawn from a Latin hypercube or a scrambled Sobol sequence
+    spanning the `lower_bound` and `upper_bound` of each fitted parameter. Once
+    `n_agree` fits share the best objective value and parameter values within
+    `rtol`, the remaining starts are cancelled. Afterwards, the thin layer is refitted
+    from the best fit, hence `write` and `integrate` of the thin layer reflect it.
+
+    Attributes:
+        thinlayer (BaseThinLayer): The thin layer to optimize.
+        n_starts (int): The maximum number of starting points.
+        sampler (Literal["lhs", "sobol"]): How starting points are sampled.
+        scale (Literal["linear", "log"]): Whether starting points are spread evenly
+            on a linear or a logarithmic scale.
+        n_agree (int): The number of agreeing fits after which sampling stops early.
+        rtol (float): The relative tolerance within which fits agree.
+        n_workers (int): The number of worker processes.
+        results (List[StartResult]): The fits of the last run in the order of their
+            starting points. Cancelled starts are not included.
+    """
+
+    def __init__(
+        self,
+        thinlayer: BaseThinLayer,
+        n_starts: int = 20,
+        sampler: Literal["lhs", "sobol"] = "lhs",
+        scale: Literal["linear", "log"] = "linear",
+        n_agree: int = 3,
+        rtol: float = 1e-3,
+        n_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the MultiStart instance.
+
+        Args:
+            thinlayer (BaseThinLayer): The thin layer to optimize. It must implement
+                `objective_value`.
+            n_starts (int, optional): The maximum number of starting points.
+                Defaults to 20.
+            sampler (Literal["lhs", "sobol"], optional): Latin hypercube sampling or a
+                scrambled Sobol sequence. Sobol sampling requires SciPy. Defaults to "lhs".
+            scale (Literal["linear", "log"], optional): The scale on which starting
+                points are spread. A logarithmic scale requires positive bounds.
+                Defaults to "linear".
+            n_agree (int, optional): The number of agreeing fits after which sampling
+                stops early. A value of 0 runs all starts. Defaults to 3.
+            rtol (float, optional): The relative tolerance within which fits agree.
+                Defaults to 1e-3.
+            n_workers (Optional[int], optional): The number of worker processes. If
+                None, the number of CPUs is used. A value of 1 fits in the calling
+                process, as do thin layers that cannot be serialized.
+            seed (Optional[int], optional): The seed of the sampler. Defaults to None.
+
+        Raises:
+            ValueError: If the sampler or scale is unknown, or a fitted parameter has
+                no finite bounds.
+        """
+        if sampler not in ("lhs", "sobol"):
+            raise ValueError(f"Unknown sampler '{sampler}'. Expected 'lhs' or 'sobol'")
+        if scale not in ("linear", "log"):
+            raise ValueError(f"Unknown scale '{scale}'. Expected 'linear' or 'log'")
+
+        self.thinlayer = thinlayer
+        self.n_starts = n_starts
+        self.sampler = sampler
+        self.scale = scale
+        self.n_agree = n_agree
+        self.rtol = rtol
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.seed = seed
+        self.results: List[StartResult] = []
+
+        self._fitted = [
+            param for param in thinlayer.enzmldoc.parameters if param.fit is not False
+        ]
+        self._check_bounds()
+
+    def run(self, **kwargs) -> StartResult:
+        """
+        Runs the local fits and refits the thin layer from the best one.
+
+        Args:
+            **kwargs: Keyword arguments passed to `optimize` of the thin layer.
+
+        Returns:
+            StartResult: The fit with the lowest objective value.
+
+        Raises:
+            RuntimeError: If no fit succeeded.
+        """
+        starts = self.sample()
+        payload = self._serialize()
+
+        if self.n_workers <= 1 or payload is None:
+            results = self._run_serial(starts, kwargs)
+        else:
+            results = self._run_parallel(starts, kwargs, payload)
+
+        self.results = sorted(results, key=lambda result: result.index)
+        succeeded = [result for result in self.results if result.ok]
+
+        if not succeeded:
+            errors = {result.error for result in self.results}
+            raise RuntimeError(f"All fits failed: {'; '.join(map(str, errors))}")
+
+        best = min(succeeded, key=lambda result: result.objective)
+
+        self.thinlayer.set_start_values(best.values)
+        self.thinlayer.optimize(**kwargs)
+
+        return best
+
+    def write(self) -> v2.EnzymeMLDocument:
+        """
+        Creates a new EnzymeML document with the parameters of the best fit.
+
+        Returns:
+            v2.EnzymeMLDocument: A new EnzymeML document with optimized parameters.
+
+        Raises:
+            ValueError: If `run` has not been called yet.
+        """
+        if not self.results:
+            raise ValueError("The multi-start optimization has not been run yet")
+
+        return self.thinlayer.write()
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Summarizes the fits of the last run, one row per starting point.
+
+        Returns:
+            pd.DataFrame: The index, objective value and error of each fit, followed
+                by the start and fitted value of each parameter, sorted by the
+                objective value.
+        """
+        rows = []
+        for result in self.results:
+            row = {
+                "start": result.index,
+                "objective": result.objective,
+                "error": result.error,
+            }
+
+            for param in self._fitted:
+                row[f"{param.symbol}_start"] = result.start[param.symbol]
+                row[param.symbol] = result.values.get(param.symbol, np.nan)
+
+            rows.append(row)
+
+        return (
+            pd.DataFrame(rows)
+            .sort_values("objective", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def sample(self) -> List[Dict[str, float]]:
+        """
+        Samples the starting points within the bounds of the fitted parameters.
+
+        Returns:
+            List[Dict[str, float]]: The start values by parameter symbol.
+        """
+        rng = np.random.default_rng(self.seed)
+        dim = len(self._fitted)
+
+        if self.sampler == "sobol":
+            unit = _sobol(self.n_starts, dim, rng)
+        else:
+            unit = _latin_hypercube(self.n_starts, dim, rng)
+
+        lower = np.array([param.lower_bound for param in self._fitted], dtype=float)
+        upper = np.array([param.upper_bound for param in self._fitted], dtype=float)
+
+        if self.scale == "log":
+            points = 10 ** (np.log10(lower) + unit * np.log10(upper / lower))
+        else:
+            points = lower + unit * (upper - lower)
+
+        return [
+            {param.symbol: float(value) for param, value in zip(self._fitted, point)}
+            for point in points
+        ]
+
+    def _check_bounds(self):
+        """
+        Checks that all fitted parameters have finite bounds.
+
+        Raises:
+            ValueError: If a bound is missing or not valid for the scale.
+        """
+        missing = [
+            param.symbol
+            for param in self._fitted
+            if param.lower_bound is None
+            or param.upper_bound is None
+            or not np.isfinite([param.lower_bound, param.upper_bound]).all()
+        ]
+
+        if missing:
+            raise ValueError(
+                f"Multi-start optimization requires lower and upper bounds for {missing}"
+            )
+
+        if self.scale == "log":
+            invalid = [
+                param.symbol
+                for param in self._fitted
+                if param.lower_bound <= 0  # type: ignore
+            ]
+
+            if invalid:
+                raise ValueError(
+                    f"Sampling on a logarithmic scale requires positive bounds for {invalid}"
+                )
+
+    def _serialize(self) -> Optional[bytes]:
+        """Serializes the thin layer for the workers, None if it cannot be copied."""
+        if self.n_workers <= 1:
+            return None
+
+        try:
+            return dill.dumps(self.thinlayer)
+        except Exception as e:
+            logger.warning(
+                f"{type(self.thinlayer).__name__} cannot be copied to worker processes "
+                f"({e}). Running the fits in the calling process."
+            )
+            return None
+
+    def _run_serial(
+        self, starts: List[Dict[str, float]], kwargs: dict
+    ) -> List[StartResult]:
+        """Runs the fits one after another in the calling process."""
+        results = []
+        for index, start in enumerate(starts):
+            results.append(_fit(self.thinlayer, index, start, kwargs))
+
+            if self._converged(results):
+                break
+
+        return results
+
+    def _run_parallel(
+        self, starts: List[Dict[str, float]], kwargs: dict, payload: bytes
+    ) -> List[StartResult]:
+        """Runs the fits in worker processes until they agree."""
+        results = []
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.n_workers, len(starts)),
+            initializer=_init_worker,
+            initargs=(payload,),
+        ) as pool:
+            futures: Dict[Future, int] = {
+                pool.submit(_fit_in_worker, index, start, kwargs): index
+                for index, start in enumerate(starts)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # The worker itself failed, e.g. a crashed process
+                    results.append(
+                        StartResult(
+                            index=index,
+                            start=starts[index],
+                            error=f"{type(e).__name__}: {e}",
+                        )
+                    )
+
+                if self._converged(results):
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    break
+
+        return results
+
+    def _converged(self, results: List[StartResult]) -> bool:
+        """Whether the n_agree best fits agree in objective and parameters."""
+        if self.n_agree <= 0:
+            return False
+
+        succeeded = sorted(
+            (result for result in results if result.ok),
+            key=lambda result: result.objective,
+        )
+
+        if len(succeeded) < self.n_agree:
+            return False
+
+        best, *others = succeeded[: self.n_agree]
+
+        return all(
+            np.isclose(other.objective, best.objective, rtol=self.rtol, atol=0.0)
+            and all(
+                np.isclose(other.values[name], value, rtol=self.rtol, atol=0.0)
+                for name, value in best.values.items()
+            )
+            for other in others
+        )
+
+
+def _fit(
+    thinlayer: BaseThinLayer,
+    index: int,
+    start: Dict[str, float],
+    kwargs: dict,
+) -> StartResult:
+    """Fits the thin layer from a starting point, reporting errors in the result."""
+    try:
+        thinlayer.set_start_values(start)
+        thinlayer.optimize(**kwargs)
+
+        fitted = {param.symbol: param for param in thinlayer.write().parameters}
+
+        return StartResult(
+            index=index,
+            start=start,
+            values={name: fitted[name].value for name in start},  # type: ignore
+            stderr={name: fitted[name].stderr for name in start},
+            objective=thinlayer.objective_value(),
+        )
+    except Exception as e:
+        return StartResult(index=index, start=start, error=f"{type(e).__name__}: {e}")
+
+
+# The thin layer of a worker process, set once by the pool initializer
+_worker_thinlayer: Optional[BaseThinLayer] = None
+
+
+def _init_worker(payload: bytes):
+    """Loads the thin layer once per worker process."""
+    global _worker_thinlayer
+    _worker_thinlayer = dill.loads(payload)
+
+    # Fits already run in parallel, a thin layer must not start a pool of its own
+    if hasattr(_worker_thinlayer, "n_workers"):
+        _worker_thinlayer.n_workers = 1  # type: ignore
+
+
+def _run_in_worker(func: Callable[..., T], *args) -> T:
+    """Calls a function with the thin layer of the worker process as first argument."""
+    assert _worker_thinlayer is not None, "Worker has not been initialized"
+    return func(_worker_thinlayer, *args)
+
+
+def _fit_in_worker(index: int, start: Dict[str, float], kwargs: dict) -> StartResult:
+    """Fits the thin layer of the worker process from a starting point."""
+    return _run_in_worker(_fit, index, start, kwargs)
+
+
+def _latin_hypercube(n: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """Samples n points of a Latin hypercube in the unit cube."""
+    strata = rng.permuted(np.tile(np.arange(n), (dim, 1)), axis=1).T
+
+    return (strata + rng.random((n, dim))) / n
+
+
+def _sobol(n: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """Samples n points of a scrambled Sobol sequence in the unit cube."""
+    try:
+        from scipy.stats import qmc
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Sobol sampling is not available. "
+            "To use it, please install the following dependencies: "
+            f"{e}"
+        )
+
+    # Sobol sequences are balanced for powers of two, hence draw the next one
+    points = qmc.Sobol(d=dim, scramble=True, seed=rng).random_base2(
+        int(np.ceil(np.log2(max(n, 1))))
+    )
+
+    return points[:n]
@@ -9,16 +9,20 @@ from __future__ import annotations
 import contextlib
 import io
 import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import dill
 import numpy as np
 import pandas as pd
-from joblib import Parallel, delayed
 
 from pyenzyme.thinlayers.base import BaseThinLayer, InitCondDict, SimResult, Time
+from pyenzyme.thinlayers.cache import MODEL_CACHE, ModelCache, model_key, model_values
+from pyenzyme.thinlayers.solver import SolverSettings
 from pyenzyme.versions import v2
 
 try:
@@ -36,6 +40,12 @@ except ModuleNotFoundError as e:
         f"{e}"
     )
 
+# Integrators of PySCeS, CVODE requires Assimulo
+METHODS = ("LSODA", "CVODE")
+
+# Value PySCeS assigns to parameters without a value in the SBML document
+UNSET_PARAMETER_VALUE = 0.0
+
 
 class ThinLayerPysces(BaseThinLayer):
     """
@@ -50,6 +60,10 @@ class ThinLayerPysces(BaseThinLayer):
         inits (list[InitMap]): Initial conditions for each measurement.
         cols (list[str]): Column names for the experimental data.
         parameters (lmfit.Parameters): Optimizable parameters for the model.
+        n_workers (int | None): Number of worker processes used to simulate the
+            measurements during optimization.
+        cache (ModelCache | None): Cache of compiled models shared across instances.
+        solver (SolverSettings | None): Settings of the PySCeS integrator.
     """
 
     model: pysces.model
@@ -58,12 +72,18 @@ class ThinLayerPysces(BaseThinLayer):
     cols: list[str]
     parameters: lmfit.Parameters
     nu_enzmldoc: v2.EnzymeMLDocument
+    n_workers: Optional[int]
+    cache: Optional[ModelCache]
+    solver: Optional[SolverSettings]
 
     def __init__(
         self,
         enzmldoc: v2.EnzymeMLDocument,
         model_dir: Path | str = "./pysces_models",
         measurement_ids: Optional[List[str]] = None,
+        n_workers: Optional[int] = None,
+        cache: Optional[ModelCache] = MODEL_CACHE,
+        solver: Optional[SolverSettings] = None,
     ):
         """
         Initialize the ThinLayerPysces instance.
@@ -73,18 +93,37 @@ class ThinLayerPysces(BaseThinLayer):
             model_dir (Path | str): Directory where PySCeS model files will be stored.
             measurement_ids (Optional[List[str]]): IDs of measurements to include in the analysis.
                 If None, all measurements will be used.
+            n_workers (Optional[int]): Number of worker processes used to simulate the
+                measurements during optimization. The pool is started on the first
+                optimization and kept alive until `close` is called. If None, the
+                number of CPUs is used. A value of 1 simulates in the calling process.
+            cache (Optional[ModelCache]): Cache of compiled models. Instances whose
+                documents describe the same model skip the SBML export and the
+                conversion to PSC. Defaults to the cache shared by all thin layers,
+                which keeps models in memory only unless `PYENZYME_CACHE_DIR` is
+                set. None disables caching.
+            solver (Optional[SolverSettings]): Settings of the integrator. PySCeS
+                supports "LSODA" and, if Assimulo is installed, "CVODE". Defaults
+                to None, which keeps the defaults of PySCeS.
+
+        Raises:
+            ValueError: If the solver settings are not supported by PySCeS.
 
         Examples:
             >>> import pyenzyme as pe
             >>> import pyenzyme.thinlayers as tls
             >>> doc = pe.read_enzymeml("path/to/enzmldoc.json")
-            >>> tl = tls.ThinLayerPysces(doc)
+            >>> with tls.ThinLayerPysces(doc) as tl:
+            ...     tl.optimize()
         """
 
         # Currently, the ThinLayerPysces only supports the reaction model
         # TODO: Add support for Rate Rules
         self._check_compliance(enzmldoc)
 
+        if solver is not None:
+            self._check_solver(solver)
+
         super().__init__(
             enzmldoc=enzmldoc,
             measurement_ids=measurement_ids,
@@ -99,8 +138,48 @@ class ThinLayerPysces(BaseThinLayer):
             # Create model directory if it doesn't exist
             os.makedirs(model_dir, exist_ok=True)
 
+        self.n_workers = n_workers
+        self.cache = cache
+        self.solver = solver
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_size = 0
+        self._pool_finalizer: Optional[weakref.finalize] = None
+
         # Convert model to PSC
         self._get_pysces_model(model_dir)
+        self._apply_solver()
+        self._simulator = _PyscesSimulator(self.model)
+
+    def __enter__(self) -> "ThinLayerPysces":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker pool, if one was started.
+
+        The pool is also shut down once the thin layer is garbage collected, but
+        closing it explicitly releases the worker processes immediately.
+        """
+        if self._pool_finalizer is not None:
+            # Releases the reference of the finalizer to the pool
+            self._pool_finalizer.detach()
+            self._pool_finalizer = None
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def __getstate__(self) -> dict:
+        # The worker pool is bound to this process, a copy starts its own
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_size"] = 0
+        state["_pool_finalizer"] = None
+
+        return state
 
     def _check_compliance(self, enzmldoc: v2.EnzymeMLDocument):
         """
@@ -121,6 +200,41 @@ class ThinLayerPysces(BaseThinLayer):
                 "Support for ODEs will be added in the future.",
             )
 
+    @staticmethod
+    def _check_solver(solver: SolverSettings):
+        """
+        Check if the solver settings are supported by PySCeS.
+        """
+        solver.check("ThinLayerPysces", METHODS)
+
+        if solver.method == "CVODE" and not pysces.PyscesModel._HAVE_ASSIMULO:
+            raise ValueError("The CVODE integrator of PySCeS requires Assimulo")
+
+    def _apply_solver(self):
+        """
+        Applies the solver settings to the PySCeS model.
+
+        The settings are part of the model, hence they are sent to the worker
+        processes along with it. A maximum step of zero means unbounded in PySCeS.
+        """
+        if self.solver is None:
+            return
+
+        settings = self.model.__settings__
+        prefix = self.solver.method.lower()
+        max_step = self.solver.max_step or 0.0
+
+        self.model.mode_integrator = self.solver.method
+
+        if self.solver.method == "CVODE":
+            settings["cvode_reltol"] = self.solver.rtol
+            settings["cvode_abstol"] = self.solver.atol
+        else:
+            settings["lsoda_rtol"] = self.solver.rtol
+            settings["lsoda_atol"] = self.solver.atol
+
+        settings[f"{prefix}_hmax"] = max_step
+
     def integrate(
         self,
         model: v2.EnzymeMLDocument,
@@ -128,6 +242,7 @@ class ThinLayerPysces(BaseThinLayer):
         t0: float,
         t1: float,
         nsteps: int = 100,
+        times: Optional[Time] = None,
     ) -> Tuple[SimResult, Time]:
         """
         Integrates the model from t0 to t1 with the given initial conditions.
@@ -141,6 +256,8 @@ class ThinLayerPysces(BaseThinLayer):
             t0 (float): Start time for integration.
             t1 (float): End time for integration.
             nsteps (int, optional): Number of time points to generate. Defaults to 100.
+            times (Optional[Time], optional): Time points at which to evaluate the
+                solution. If given, t1 and nsteps are ignored. Defaults to None.
 
         Returns:
             Tuple[SimResult, Time]: A tuple containing:
@@ -148,7 +265,8 @@ class ThinLayerPysces(BaseThinLayer):
                 - List of time points.
 
         Raises:
-            ValueError: If the provided model is different from the one used for initialization.
+            ValueError: If the provided model is different from the one used for
+                initialization, or the time points are invalid.
 
         Examples:
             >>> # Get initial conditions from a measurement
@@ -165,17 +283,23 @@ class ThinLayerPysces(BaseThinLayer):
             )
 
         # Convert the initial conditions to a InitMap
-        time = np.linspace(t0, t1, nsteps).tolist()
+        time, start = self._integration_times(t0, t1, nsteps, times)
+
+        # PySCeS always integrates from zero, hence the grid of the autonomous
+        # model is shifted to start there
         init_map = InitMap(
-            time=time,
+            time=time - t0,
             species=initial_conditions,
         )
 
         out, species_order = self._simulate_condition(init_map)
 
         return (
-            {species: traj.tolist() for species, traj in zip(species_order, out)},
-            time,
+            {
+                species: traj[start:].tolist()
+                for species, traj in zip(species_order, out)
+            },
+            time[start:].tolist(),
         )
 
     def optimize(self, method="leastsq"):
@@ -233,6 +357,11 @@ class ThinLayerPysces(BaseThinLayer):
         self.parameters = parameters
 
         result = self.minimizer.minimize(method=method)
+
+        # Residuals are evaluated in the worker processes, hence the fitted
+        # parameters are applied to the local model used by `integrate`
+        self.model.__dict__.update(result.params.valuesdict())
+
         # add standard error if available in enzmldoc and if param.fit=False
         # (e.g. if parameter was fitted before)
         for param in self.enzmldoc.parameters:
@@ -278,6 +407,21 @@ class ThinLayerPysces(BaseThinLayer):
 
         return nu_enzmldoc
 
+    def objective_value(self) -> float:
+        """
+        Returns the sum of squared residuals reached by the last optimization.
+
+        Returns:
+            float: The chi-square of the lmfit result.
+
+        Raises:
+            ValueError: If the model has not been optimized yet.
+        """
+        if getattr(self, "minimizer", None) is None:
+            raise ValueError("The model has not been optimized yet")
+
+        return float(self.minimizer.result.chisqr)  # type: ignore
+
     # ! Helper methods
     def _initialize_parameters(self):
         """
@@ -302,7 +446,9 @@ class ThinLayerPysces(BaseThinLayer):
             }
 
             # Determine parameter value
-            if param.value:
+            if param.symbol in self._start_values:
+                kwargs["value"] = self._start_values[param.symbol]
+            elif param.value:
                 kwargs["value"] = param.value
             elif param.initial_value:
                 kwargs["value"] = param.initial_value
@@ -319,7 +465,9 @@ class ThinLayerPysces(BaseThinLayer):
         """
         Extracts measurement data from the EnzymeML document.
 
-        Populates the inits, experimental_data, and cols attributes.
+        Populates the inits, experimental_data, and cols attributes. The observed
+        columns are mapped once onto the rows of the simulated species, such that
+        residuals are computed on plain arrays without aligning DataFrames.
         """
         enzmldoc = self._remove_unmodeled_species(self.enzmldoc)
         self.inits = [
@@ -328,16 +476,87 @@ class ThinLayerPysces(BaseThinLayer):
             if measurement.id in self.measurement_ids
         ]
 
-        self.experimental_data = self.df.drop(columns=["id", "time"])
-        self.cols = list(self.experimental_data.columns)
+        species = [str(species) for species in self.model.species]
+        observed = self.df.drop(columns=["id", "time"])
+
+        self.cols = [col for col in observed.columns if col in species]
+        self.experimental_data = observed[self.cols]
+
+        data = self.experimental_data.to_numpy(dtype=np.float64)
+        self._observed = np.array([species.index(col) for col in self.cols], dtype=int)
+        self._missing = np.isnan(data)
+        self._data = np.where(self._missing, 0.0, data)
 
     def _get_pysces_model(self, model_dir: Path | str):
         """
         Converts an EnzymeML document to a PySCeS model.
 
+        Compiled models are looked up in the model cache first. A model in memory
+        is copied, a PSC file on disk is loaded without exporting and converting
+        the SBML document again. Either way, the parameter values and species
+        defaults of the document are then applied to the model.
+
         Args:
             model_dir (Path | str): Directory for storing model files.
         """
+        if self.cache is None:
+            self._compile_pysces_model(model_dir)
+            return
+
+        key = model_key(self.enzmldoc, "pysces", pysces.__version__)
+        cached = self.cache.get(key)
+
+        if cached is not None:
+            self.model = dill.loads(cached)
+            self._apply_model_values()
+            return
+
+        pscfile_path = self.cache.lookup(key, ".psc")
+
+        if pscfile_path is not None:
+            self._load_pysces_model(pscfile_path.name, str(pscfile_path.parent))
+            self._fix_compartment_sizes()
+        else:
+            pscfile_path = self._compile_pysces_model(model_dir)
+            self.cache.store(key, ".psc", Path(pscfile_path).read_text())
+
+        self.cache.put(key, dill.dumps(self.model))
+        self._apply_model_values()
+
+    def _apply_model_values(self):
+        """
+        Applies the parameter values and species defaults of the document to the model.
+
+        The model cache is keyed on the structure of the model only, hence a cached
+        model may carry the values of another document. Parameters without a value
+        are reset to the value PySCeS assigns when compiling the document.
+        """
+        parameters, species = model_values(self.enzmldoc)
+        self.model.__dict__.update(
+            {
+                symbol: value if value is not None else UNSET_PARAMETER_VALUE
+                for symbol, value in parameters.items()
+            }
+        )
+        self.model.__dict__.update(
+            {
+                name: value
+                for species_id, value in species.items()
+                for name in (species_id, f"{species_id}_init")
+                if hasattr(self.model, name)
+            }
+        )
+
+    def _compile_pysces_model(self, model_dir: Path | str) -> str:
+        """
+        Exports the EnzymeML document to SBML and loads it as a PySCeS model.
+
+        Args:
+            model_dir (Path | str): Directory for storing model files.
+
+        Returns:
+            str: Path of the PSC file of the model.
+        """
         model_dir = self._prepare_model_directory(model_dir)
         sbmlfile_name = self._create_sbml_file(model_dir)
 
@@ -345,6 +564,8 @@ class ThinLayerPysces(BaseThinLayer):
         self._load_pysces_model(sbmlfile_name, model_dir)
         self._fix_compartment_sizes()
 
+        return os.path.join(model_dir, f"{sbmlfile_name}.psc")
+
     def _prepare_model_directory(self, model_dir: Path | str) -> str:
         """
         Ensures the model directory exists and returns it as a string.
@@ -412,6 +633,7 @@ class ThinLayerPysces(BaseThinLayer):
             model_dir (str): Directory containing the file.
         """
         self.model = pysces.model(sbmlfile_name, dir=model_dir)
+        self.model.SetQuiet()
 
     def _fix_compartment_sizes(self):
         """
@@ -429,22 +651,56 @@ class ThinLayerPysces(BaseThinLayer):
                 setattr(self.model, comp, 1.0)
                 setattr(self.model, f"{comp}_init", 1.0)
 
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Returns the worker pool, starting it on first use.
+
+        Each worker deserializes the simulator, including the PySCeS model and its
+        pristine initial values, once in its initializer. Afterwards,
+        only the parameter values and the initial conditions are sent per call.
+
+        Returns:
+            Optional[ProcessPoolExecutor]: The worker pool, or None if the
+                measurements are simulated in the calling process.
+        """
+        n_workers = min(self.n_workers or os.cpu_count() or 1, len(self.inits))
+
+        if n_workers <= 1:
+            return None
+
+        if self._pool is None or self._pool_size != n_workers:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(dill.dumps(self._simulator),),
+            )
+            self._pool_size = n_workers
+            self._pool_finalizer = weakref.finalize(
+                self, self._pool.shutdown, wait=False
+            )
+
+        return self._pool
+
     def _calculate_residual(self, parameters) -> np.ndarray:
         """
         Calculates residuals between experimental and simulated data.
 
+        Missing observations contribute zero. A new array is returned on every
+        call, since optimizers keep references to previous residuals.
+
         Args:
             parameters: The parameter values to use for simulation.
 
         Returns:
-            np.ndarray: Array of residuals.
+            np.ndarray: Array of residuals of shape (n_time, n_observed).
         """
-        simulated_data = self._simulate_experiment(parameters)
-        simulated_data = simulated_data.drop(
-            simulated_data.columns.difference(self.cols), axis=1
-        )
+        simulated = self._simulate_experiment(parameters)
 
-        return np.array(self.experimental_data - simulated_data)
+        residual = self._data - simulated[self._observed].T
+        residual[self._missing] = 0.0
+
+        return residual
 
     def _simulate_experiment(self, parameters):
         """
@@ -454,18 +710,29 @@ class ThinLayerPysces(BaseThinLayer):
             parameters: Parameter values for the simulation.
 
         Returns:
-            pd.DataFrame: DataFrame with simulation results.
-        """
-        self.model.SetQuiet()
-        self.model.__dict__.update(parameters.valuesdict())
-
-        # Now iterate over all initial concentrations and simulate in parallel
-        output = Parallel(n_jobs=-1)(
-            delayed(lambda x: self._simulate_condition(x)[0])(init_conc)
-            for init_conc in self.inits
-        )
-
-        return pd.DataFrame(np.hstack(output).T, columns=self.model.species)  # type: ignore
+            np.ndarray: Array of shape (n_species, n_time) with the trajectories of
+                all measurements concatenated along the time axis, in the order of
+                the model species.
+        """
+        values = parameters.valuesdict()
+        pool = self._get_pool()
+
+        if pool is None:
+            output = self._simulator.simulate(self.inits, values)
+        else:
+            # One contiguous chunk of conditions per worker keeps the order intact
+            chunks = [
+                [self.inits[i] for i in chunk]
+                for chunk in np.array_split(np.arange(len(self.inits)), self._pool_size)
+                if len(chunk) > 0
+            ]
+            output = [
+                trajectory
+                for result in pool.map(_simulate_in_worker, chunks, repeat(values))
+                for trajectory in result
+            ]
+
+        return np.hstack(output)
 
     def _simulate_condition(
         self, init_concs: InitMap
@@ -481,14 +748,84 @@ class ThinLayerPysces(BaseThinLayer):
                 - List of arrays containing trajectory data for each species
                 - List of species IDs
         """
-        model = init_concs.to_pysces_model(self.model)
-        model.Simulate(userinit=1)
+        (output,) = self._simulator.simulate([init_concs])
         return (
-            [getattr(model.sim, species) for species in model.species],
-            [str(species) for species in model.species],
+            list(output),
+            [str(species) for species in self.model.species],
         )
 
 
+class _PyscesSimulator:
+    """
+    Simulates experimental conditions on a single, reused PySCeS model.
+
+    Instead of copying the model for every condition, the initial values present
+    at construction are restored before each simulation.
+
+    Attributes:
+        model (pysces.model): The PySCeS model to simulate.
+        defaults (Dict[str, float]): The pristine initial values of all species.
+    """
+
+    def __init__(self, model: pysces.model):
+        self.model = model
+        self.defaults = {
+            name: getattr(model, name)
+            for species in model.species
+            for name in (species, f"{species}_init")
+            if hasattr(model, name)
+        }
+
+    def simulate(
+        self,
+        inits: List[InitMap],
+        parameters: Optional[Dict[str, float]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Simulates the given conditions.
+
+        Args:
+            inits (List[InitMap]): The conditions to simulate.
+            parameters (Optional[Dict[str, float]]): Parameter values to apply
+                before simulating. If None, the current values are used.
+
+        Returns:
+            List[np.ndarray]: One array of shape (n_species, n_time) per condition.
+        """
+        if parameters is not None:
+            self.model.__dict__.update(parameters)
+
+        output = []
+        for init_map in inits:
+            self.model.__dict__.update(self.defaults)
+            init_map.apply_to_model(self.model)
+            self.model.Simulate(userinit=1)
+            output.append(
+                np.vstack([getattr(self.model.sim, s) for s in self.model.species])
+            )
+
+        return output
+
+
+# The simulator of a worker process, set once by the pool initializer
+_worker_simulator: Optional[_PyscesSimulator] = None
+
+
+def _init_worker(payload: bytes):
+    """Loads the simulator and its PySCeS model once per worker process."""
+    global _worker_simulator
+    _worker_simulator = dill.loads(payload)
+    _worker_simulator.model.SetQuiet()
+
+
+def _simulate_in_worker(
+    inits: List[InitMap], parameters: Dict[str, float]
+) -> List[np.ndarray]:
+    """Simulates a chunk of conditions on the model of the worker process."""
+    assert _worker_simulator is not None, "Worker has not been initialized"
+    return _worker_simulator.simulate(inits, parameters)
+
+
 @dataclass
 class InitMap:
     """
@@ -498,11 +835,11 @@ class InitMap:
     time points for PySCeS model simulations.
 
     Attributes:
-        time (List[float]): List of time points for simulation.
+        time (np.ndarray | List[float]): Time points for simulation.
         species (Dict[str, float]): Dictionary mapping species IDs to initial concentrations.
     """
 
-    time: List[float]
+    time: np.ndarray | List[float]
     species: Dict[str, float]
 
     @classmethod
@@ -518,7 +855,7 @@ class InitMap:
             InitMap: Initialized instance with time points and species initial values.
         """
         return cls(
-            time=df["time"].tolist(),
+            time=df["time"].to_numpy(dtype=np.float64),
             species={
                 s.species_id: s.initial
                 for s in meas.species_data
@@ -539,8 +876,22 @@ class InitMap:
         Returns:
             pysces.model: The updated model with initial conditions set.
         """
-        model = dill.loads(dill.dumps(model))
-        model.sim_time = np.array(self.time)
+        return self.apply_to_model(dill.loads(dill.dumps(model)))
+
+    def apply_to_model(self, model: pysces.model):
+        """
+        Apply initial conditions to a PySCeS model in place.
+
+        Args:
+            model (pysces.model): The PySCeS model to update.
+
+        Returns:
+            pysces.model: The same model with initial conditions set.
+
+        Raises:
+            ValueError: If a species is not part of the model.
+        """
+        model.sim_time = np.asarray(self.time, dtype=np.float64)
 
         for species, value in self.species.items():
             if hasattr(model, f"{species}_init"):
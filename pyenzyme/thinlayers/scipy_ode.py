@@ -0,0 +1,1145 @@
+# File: scipy_ode.py
+# Project: ThinLayers
+# Authors: Jan Range (jan.range@simtech.uni-stuttgart.de)
+# License: BSD-2 clause
+# Copyright (c) 2025 University of Stuttgart
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import sympy as sp
+
+from pyenzyme.thinlayers.base import BaseThinLayer, InitCondDict, SimResult, Time
+from pyenzyme.thinlayers.solver import SolverSettings
+from pyenzyme.versions import v2
+
+try:
+    from scipy.integrate import OdeSolution, solve_ivp
+    from scipy.optimize import OptimizeResult, least_squares
+    from scipy.sparse import bsr_array
+except ModuleNotFoundError as e:
+    raise ModuleNotFoundError(
+        "ThinLayerScipy is not available. "
+        "To use it, please install the following dependencies: "
+        f"{e}"
+    )
+
+# Symbol that refers to the simulation time within equations
+TIME_SYMBOL = "t"
+
+# Methods of `solve_ivp`, the implicit ones use the analytic Jacobian
+METHODS = ("LSODA", "BDF", "Radau", "RK45", "RK23", "DOP853")
+
+
+class ThinLayerScipy(BaseThinLayer):
+    """
+    SciPy implementation of the BaseThinLayer for kinetic modeling.
+
+    The reactions, kinetic laws and ODE equations of the EnzymeML document are
+    compiled into a NumPy right-hand side and an analytically derived Jacobian
+    using `sympy.lambdify`. The model is integrated with `scipy.integrate.solve_ivp`
+    and fitted with `scipy.optimize.least_squares`. Unlike the PySCeS and COPASI
+    thin layers, no model files are written to disk.
+
+    Attributes:
+        system (ODESystem): The compiled model.
+        inits (list[InitMap]): Initial conditions for each measurement.
+        solver (SolverSettings): Settings of `solve_ivp`.
+        batched (bool): Whether the measurements are integrated as one stacked system
+            during optimization.
+        values (dict[str, float]): The current parameter values, updated by `optimize`.
+        result (Optional[OptimizeResult]): The result of the last optimization.
+        solution (Optional[OdeSolution]): The continuous solution of the last call of
+            `integrate`, kept if the solver settings request dense output.
+    """
+
+    system: ODESystem
+    inits: list[InitMap]
+    solver: SolverSettings
+    batched: bool
+    values: dict[str, float]
+    result: Optional[OptimizeResult]
+    solution: Optional[OdeSolution]
+
+    def __init__(
+        self,
+        enzmldoc: v2.EnzymeMLDocument,
+        measurement_ids: Optional[List[str]] = None,
+        method: str = "LSODA",
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        batched: bool = False,
+        solver: Optional[SolverSettings] = None,
+    ):
+        """
+        Initialize the ThinLayerScipy instance.
+
+        Args:
+            enzmldoc (v2.EnzymeMLDocument): EnzymeML document containing the model.
+            measurement_ids (Optional[List[str]]): IDs of measurements to include in the analysis.
+                If None, all measurements will be used.
+            method (str): Integration method of `solve_ivp`. The implicit methods
+                "LSODA", "BDF" and "Radau" use the analytic Jacobian. Defaults to "LSODA".
+            rtol (float): Relative tolerance of the integrator. Defaults to 1e-6.
+            atol (float): Absolute tolerance of the integrator. Defaults to 1e-9.
+            batched (bool): Whether to integrate all measurements as one stacked system
+                during optimization, see `integrate_batch`. Pays off for many
+                measurements of the same model. Defaults to False.
+            solver (Optional[SolverSettings]): Settings of the integrator, including
+                the maximum step and dense output. Replaces method, rtol and atol
+                if given. Defaults to None.
+
+        Raises:
+            ValueError: If the solver settings request an unsupported method.
+
+        Examples:
+            >>> import pyenzyme as pe
+            >>> import pyenzyme.thinlayers as tls
+            >>> doc = pe.read_enzymeml("path/to/enzmldoc.json")
+            >>> tl = tls.ThinLayerScipy(doc)
+        """
+        self._check_compliance(enzmldoc)
+
+        if solver is None:
+            solver = SolverSettings(method=method, rtol=rtol, atol=atol)
+
+        solver.check(type(self).__name__, METHODS, dense_output=True)
+
+        super().__init__(
+            enzmldoc=enzmldoc,
+            measurement_ids=measurement_ids,
+            df_per_measurement=False,
+            exclude_unmodeled_species=True,
+        )
+
+        self.solver = solver
+        self.batched = batched
+        self.result = None
+        self.solution = None
+        self._last_evaluation = None
+
+        self.system = ODESystem.from_enzmldoc(self.enzmldoc)
+        self.values = {
+            param.symbol: _initial_value(param) for param in self.enzmldoc.parameters
+        }
+
+    @property
+    def method(self) -> str:
+        """Integration method passed to `solve_ivp`."""
+        return self.solver.method
+
+    @property
+    def rtol(self) -> float:
+        """Relative tolerance of the integrator."""
+        return self.solver.rtol
+
+    @property
+    def atol(self) -> float:
+        """Absolute tolerance of the integrator."""
+        return self.solver.atol
+
+    @cached_property
+    def sensitivity_system(self) -> ODESystem:
+        """The model augmented by its forward sensitivity equations, compiled on first use."""
+        return self.system.with_sensitivities()
+
+    def _check_compliance(self, enzmldoc: v2.EnzymeMLDocument):
+        """
+        Check if the EnzymeML document can be compiled into an ODE system.
+        """
+        has_kinetic_laws = any(m.kinetic_law is not None for m in enzmldoc.reactions)
+
+        has_odes = any(
+            m.equation_type == v2.EquationType.ODE for m in enzmldoc.equations
+        )
+
+        if not has_kinetic_laws and not has_odes:
+            raise ValueError("EnzymeML document must contain kinetic laws or ODEs")
+
+        if any(
+            m.equation_type == v2.EquationType.INITIAL_ASSIGNMENT
+            for m in enzmldoc.equations
+        ):
+            raise ValueError("The SciPy thinlayer does not support initial assignments")
+
+    def integrate(
+        self,
+        model: v2.EnzymeMLDocument,
+        initial_conditions: InitCondDict,
+        t0: float,
+        t1: float,
+        nsteps: int = 100,
+        times: Optional[Time] = None,
+    ) -> Tuple[SimResult, Time]:
+        """
+        Integrates the model from t0 to t1 with the given initial conditions.
+
+        The current parameter values are used, which are the fitted ones after
+        `optimize` has been called. If the solver settings request dense output,
+        the continuous solution is kept as `solution`.
+
+        Args:
+            model (v2.EnzymeMLDocument): EnzymeML document containing the model.
+            initial_conditions (InitCondDict): Dictionary mapping species IDs to initial concentrations.
+            t0 (float): Start time for integration.
+            t1 (float): End time for integration.
+            nsteps (int, optional): Number of time points to generate. Defaults to 100.
+            times (Optional[Time], optional): Time points at which to evaluate the
+                solution. If given, t1 and nsteps are ignored. Defaults to None.
+
+        Returns:
+            Tuple[SimResult, Time]: A tuple containing:
+                - Dict mapping species IDs to concentration trajectories.
+                - List of time points.
+
+        Raises:
+            ValueError: If the provided model is different from the one used for
+                initialization, or the time points are invalid.
+
+        Examples:
+            >>> # Simulate from time 0 to 10
+            >>> results, time = tl.integrate(doc, {"S1": 10.0, "S2": 0.0}, 0, 10)
+        """
+        if model != self.enzmldoc:
+            raise ValueError(
+                "Model must be the same as the one used to initialize the ThinLayerScipy. Otherwise, rerun the Thin Layer optimization with the new model."
+            )
+
+        time, start = self._integration_times(t0, t1, nsteps, times)
+        init_map = InitMap(time=time, species=initial_conditions)
+        out = self._simulate_condition(
+            init_map, self._parameter_vector(), dense_output=self.solver.dense_output
+        )
+
+        return (
+            {
+                species: out[start:, i].tolist()
+                for i, species in enumerate(self.system.outputs)
+            },
+            time[start:].tolist(),
+        )
+
+    def integrate_batch(
+        self,
+        model: v2.EnzymeMLDocument,
+        initial_conditions: List[InitCondDict],
+        times: List[Time],
+    ) -> List[Tuple[SimResult, Time]]:
+        """
+        Integrates multiple conditions as one stacked system.
+
+        The states of all conditions are stacked into a single vector of length
+        n_conditions * n_species and integrated in one `solve_ivp` call. The
+        right-hand side is evaluated for all conditions at once and the Jacobian is
+        passed in block-diagonal form (banded for LSODA, sparse for BDF and Radau).
+        Conditions that start at different times are integrated in separate groups.
+
+        Args:
+            model (v2.EnzymeMLDocument): EnzymeML document containing the model.
+            initial_conditions (List[InitCondDict]): Initial concentrations per condition.
+            times (List[Time]): Time points per condition at which the trajectories
+                are evaluated. The first time point is the start of the integration.
+
+        Returns:
+            List[Tuple[SimResult, Time]]: The trajectories and time points per condition.
+
+        Raises:
+            ValueError: If the provided model is different from the one used for
+                initialization or the number of conditions and time grids differ.
+
+        Examples:
+            >>> results = tl.integrate_batch(
+            ...     doc,
+            ...     initial_conditions=[{"S1": 10.0}, {"S1": 20.0}],
+            ...     times=[[0, 5, 10], [0, 2, 4, 6]],
+            ... )
+            >>> species_data, time = results[1]
+        """
+        if model != self.enzmldoc:
+            raise ValueError(
+                "Model must be the same as the one used to initialize the ThinLayerScipy. Otherwise, rerun the Thin Layer optimization with the new model."
+            )
+
+        if len(initial_conditions) != len(times):
+            raise ValueError(
+                f"Got {len(initial_conditions)} initial conditions but {len(times)} time grids"
+            )
+
+        inits = [
+            InitMap(time=np.asarray(time, dtype=np.float64), species=species)
+            for species, time in zip(initial_conditions, times)
+        ]
+        outputs = self._simulate_batch(inits, self._parameter_vector())
+
+        return [
+            (
+                {
+                    species: out[:, i].tolist()
+                    for i, species in enumerate(self.system.outputs)
+                },
+                init_map.time.tolist(),  # type: ignore
+            )
+            for init_map, out in zip(inits, outputs)
+        ]
+
+    def optimize(
+        self,
+        method: str = "trf",
+        jac: str = "sensitivities",
+        **kwargs,
+    ) -> OptimizeResult:
+        """
+        Optimizes model parameters to fit experimental data.
+
+        Parameters with `fit=False` are kept at their current value. The bounds of
+        the fitted parameters are passed to the optimizer.
+
+        By default, the Jacobian of the residuals is computed by integrating the
+        forward sensitivity equations alongside the model, see
+        `ODESystem.with_sensitivities`. A single integration then yields the
+        residuals and their exact derivatives, whereas finite differences require
+        one additional simulation of every measurement per fitted parameter.
+
+        Args:
+            method (str, optional): Algorithm of `scipy.optimize.least_squares`.
+                Defaults to "trf".
+                Available methods include:
+                - trf: Trust Region Reflective (default)
+                - dogbox: dogleg algorithm with rectangular trust regions
+                - lm: Levenberg-Marquardt, does not support bounds
+            jac (str, optional): How to compute the Jacobian of the residuals.
+                Either "sensitivities" or a finite difference scheme of
+                `least_squares` ("2-point", "3-point"). Defaults to "sensitivities".
+            **kwargs: Additional keyword arguments passed to `least_squares`.
+
+        Returns:
+            OptimizeResult: Result of the optimization.
+
+        Examples:
+            >>> # Optimize model parameters
+            >>> tl = ThinLayerScipy(doc)
+            >>> result = tl.optimize()
+            >>> print(f"Optimization success: {result.success}")
+        """
+        self._get_experimental_data()
+
+        fitted = [p for p in self.enzmldoc.parameters if p.fit is not False]
+        self._fit_index = np.array(
+            [self.system.parameters.index(p.symbol) for p in fitted], dtype=int
+        )
+
+        lower = np.array([_bound(p.lower_bound, -np.inf) for p in fitted])
+        upper = np.array([_bound(p.upper_bound, np.inf) for p in fitted])
+        x0 = np.clip([self.values[p.symbol] for p in fitted], lower, upper)
+
+        if method != "lm":
+            kwargs.setdefault("bounds", (lower, upper))
+
+        kwargs.setdefault("x_scale", "jac")
+
+        if jac == "sensitivities":
+            self._last_evaluation = None
+            residual = self._sensitivity_residual
+            kwargs["jac"] = self._sensitivity_jacobian
+        else:
+            residual = self._calculate_residual
+            kwargs["jac"] = jac
+
+        theta = self._parameter_vector()
+        result = least_squares(
+            residual,
+            x0,
+            args=(theta,),
+            method=method,
+            **kwargs,
+        )
+
+        for param, value in zip(fitted, result.x):
+            self.values[param.symbol] = float(value)
+
+        result.params = dict(zip([p.symbol for p in fitted], result.x.tolist()))
+        result.stderr = dict(
+            zip([p.symbol for p in fitted], _standard_errors(result).tolist())
+        )
+
+        self.result = result
+
+        return result
+
+    def write(self) -> v2.EnzymeMLDocument:
+        """
+        Creates a new EnzymeML document with optimized parameter values.
+
+        Returns:
+            v2.EnzymeMLDocument: A new EnzymeML document with optimized parameters.
+
+        Raises:
+            ValueError: If the model has not been optimized yet.
+
+        Examples:
+            >>> # Optimize and save optimized document
+            >>> tl = ThinLayerScipy(doc)
+            >>> tl.optimize()
+            >>> optimized_doc = tl.write()
+            >>> pe.write_enzymeml(optimized_doc, "optimized_model.json")
+        """
+        if self.result is None:
+            raise ValueError("The model has not been optimized yet")
+
+        nu_enzmldoc = self.enzmldoc.model_copy(deep=True)
+
+        for parameter in nu_enzmldoc.parameters:
+            if parameter.symbol not in self.result.params:
+                continue
+
+            parameter.value = self.values[parameter.symbol]
+            stderr = self.result.stderr[parameter.symbol]
+
+            if np.isfinite(stderr):
+                parameter.stderr = float(stderr)
+
+        return nu_enzmldoc
+
+    def set_start_values(self, values: Dict[str, float]):
+        """
+        Sets the values from which the next optimization starts.
+
+        Args:
+            values (Dict[str, float]): Start values by parameter symbol.
+
+        Raises:
+            ValueError: If a symbol does not refer to a parameter of the document.
+        """
+        super().set_start_values(values)
+        self.values.update(values)
+
+    def objective_value(self) -> float:
+        """
+        Returns the sum of squared residuals reached by the last optimization.
+
+        Returns:
+            float: Twice the cost of the `least_squares` result.
+
+        Raises:
+            ValueError: If the model has not been optimized yet.
+        """
+        if self.result is None:
+            raise ValueError("The model has not been optimized yet")
+
+        return 2 * float(self.result.cost)
+
+    # ! Helper methods
+    def _parameter_vector(self) -> np.ndarray:
+        """
+        Returns the current parameter values in the order of the compiled model.
+
+        Raises:
+            ValueError: If a parameter has neither an initial value nor a value.
+        """
+        missing = [name for name, value in self.values.items() if value is None]
+
+        if missing:
+            raise ValueError(
+                f"Neither initial_value nor value given for parameters {missing}"
+            )
+
+        return np.array(
+            [self.values[name] for name in self.system.parameters], dtype=np.float64
+        )
+
+    def _get_experimental_data(self):
+        """
+        Extracts measurement data from the EnzymeML document.
+
+        Populates the inits attribute. Each InitMap holds the observed data of the
+        measurement along with the indices of the observed species in the model
+        outputs, hence residuals are computed without aligning DataFrames.
+        """
+        enzmldoc = self._remove_unmodeled_species(self.enzmldoc)
+        self.inits = [
+            InitMap.from_measurement(
+                measurement,
+                self.df_map[measurement.id],
+                self.system.outputs,
+            )
+            for measurement in enzmldoc.measurements
+            if measurement.id in self.measurement_ids
+        ]
+
+    def _calculate_residual(self, x: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        """
+        Calculates residuals between simulated and experimental data.
+
+        Args:
+            x (np.ndarray): Values of the fitted parameters.
+            theta (np.ndarray): Values of all parameters. The fitted ones are
+                overwritten by `x`.
+
+        Returns:
+            np.ndarray: The flattened residuals. Missing observations contribute zero.
+        """
+        theta = theta.copy()
+        theta[self._fit_index] = x
+
+        residuals = []
+        for init_map, simulated in zip(self.inits, self._simulate(theta, self.system)):
+            residual = simulated[:, init_map.observed] - init_map.data
+            residuals.append(np.where(init_map.mask, residual, 0.0).ravel())
+
+        return np.concatenate(residuals)
+
+    def _calculate_sensitivities(
+        self, x: np.ndarray, theta: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the residuals and their Jacobian from the sensitivity equations.
+
+        `least_squares` requests the residuals and the Jacobian at the same point
+        in separate calls, hence the result of the last evaluation is cached and
+        both are obtained from a single integration.
+
+        Args:
+            x (np.ndarray): Values of the fitted parameters.
+            theta (np.ndarray): Values of all parameters. The fitted ones are
+                overwritten by `x`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The flattened residuals and the Jacobian
+                of shape (n_residuals, n_fitted). Missing observations contribute zero.
+        """
+        key = x.tobytes()
+
+        if self._last_evaluation is not None and self._last_evaluation[0] == key:
+            return self._last_evaluation[1]
+
+        theta = theta.copy()
+        theta[self._fit_index] = x
+
+        n_species = len(self.system.species)
+        n_states = n_species * (1 + len(self.system.parameters))
+
+        residuals, jacobians = [], []
+        for init_map, simulated in zip(
+            self.inits, self._simulate(theta, self.sensitivity_system)
+        ):
+            n_time = simulated.shape[0]
+            outputs = np.hstack([simulated[:, :n_species], simulated[:, n_states:]])
+            sensitivities = np.concatenate(
+                [
+                    simulated[:, n_species:n_states].reshape(n_time, n_species, -1),
+                    # Constant species do not depend on the parameters
+                    np.zeros((n_time, len(self.system.constants), theta.size)),
+                ],
+                axis=1,
+            )
+
+            residual = outputs[:, init_map.observed] - init_map.data
+            jacobian = sensitivities[:, init_map.observed][..., self._fit_index]
+
+            residuals.append(np.where(init_map.mask, residual, 0.0).ravel())
+            jacobians.append(
+                np.where(init_map.mask[..., None], jacobian, 0.0).reshape(
+                    -1, self._fit_index.size
+                )
+            )
+
+        evaluation = (np.concatenate(residuals), np.concatenate(jacobians))
+        self._last_evaluation = (key, evaluation)
+
+        return evaluation
+
+    def _sensitivity_residual(self, x: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        """Returns the residuals of `_calculate_sensitivities`."""
+        return self._calculate_sensitivities(x, theta)[0]
+
+    def _sensitivity_jacobian(self, x: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        """Returns the Jacobian of `_calculate_sensitivities`."""
+        return self._calculate_sensitivities(x, theta)[1]
+
+    def _simulate(self, theta: np.ndarray, system: ODESystem) -> List[np.ndarray]:
+        """
+        Simulates all measurements, either stacked or one by one.
+
+        Args:
+            theta (np.ndarray): Parameter values in the order of the compiled model.
+            system (ODESystem): The system to integrate.
+
+        Returns:
+            List[np.ndarray]: Arrays of shape (n_time, n_outputs) per measurement.
+        """
+        if self.batched:
+            return self._simulate_batch(self.inits, theta, system)
+
+        return [
+            self._simulate_condition(init_map, theta, system) for init_map in self.inits
+        ]
+
+    def _simulate_condition(
+        self,
+        init_map: InitMap,
+        theta: np.ndarray,
+        system: Optional[ODESystem] = None,
+        dense_output: bool = False,
+    ) -> np.ndarray:
+        """
+        Simulates a single experimental condition.
+
+        Args:
+            init_map (InitMap): Initial concentrations and time points.
+            theta (np.ndarray): Parameter values in the order of the compiled model.
+            system (Optional[ODESystem]): The system to integrate. Defaults to None,
+                which uses the compiled model.
+            dense_output (bool): Whether to keep the continuous solution as
+                `solution`. Defaults to False.
+
+        Returns:
+            np.ndarray: Array of shape (n_time, n_outputs) in the order of `system.outputs`.
+
+        Raises:
+            RuntimeError: If the integration fails.
+        """
+        system = system or self.system
+        time = np.asarray(init_map.time, dtype=np.float64)
+        y0, constants = system.initial_state(init_map.species)
+        args = np.concatenate([theta, constants])
+
+        if time.size == 0:
+            return np.empty((0, len(system.outputs)))
+
+        solution = solve_ivp(
+            system.rhs,
+            (time[0], time[-1]),
+            y0,
+            t_eval=time,
+            jac=system.jac,
+            args=(args,),
+            dense_output=dense_output,
+            **self._solver_options(),
+        )
+
+        if not solution.success:
+            raise RuntimeError(f"Integration failed: {solution.message}")
+
+        if dense_output:
+            self.solution = solution.sol
+
+        return np.hstack(
+            [solution.y.T, np.broadcast_to(constants, (time.size, constants.size))]
+        )
+
+    def _simulate_batch(
+        self,
+        inits: List[InitMap],
+        theta: np.ndarray,
+        system: Optional[ODESystem] = None,
+    ) -> List[np.ndarray]:
+        """
+        Simulates multiple experimental conditions as one stacked system.
+
+        Args:
+            inits (List[InitMap]): Initial concentrations and time points per condition.
+            theta (np.ndarray): Parameter values in the order of the compiled model.
+            system (Optional[ODESystem]): The system to integrate. Defaults to None,
+                which uses the compiled model.
+
+        Returns:
+            List[np.ndarray]: Arrays of shape (n_time, n_outputs) per condition.
+
+        Raises:
+            RuntimeError: If the integration fails.
+        """
+        system = system or self.system
+        n_species = len(system.species)
+        outputs: List[np.ndarray] = [np.empty((0, len(system.outputs))) for _ in inits]
+
+        # Conditions can only share an integration if they start at the same time
+        groups: Dict[float, List[int]] = {}
+        for i, init_map in enumerate(inits):
+            if len(init_map.time) > 0:
+                groups.setdefault(float(init_map.time[0]), []).append(i)
+
+        for t0, indices in groups.items():
+            y0, constants = map(
+                np.stack,
+                zip(*(system.initial_state(inits[i].species) for i in indices)),
+            )
+            n = len(indices)
+            args = np.vstack([np.repeat(theta[:, None], n, axis=1), constants.T])
+            t_eval = np.unique(np.concatenate([inits[i].time for i in indices]))
+
+            solution = solve_ivp(
+                system.rhs_batch,
+                (t0, t_eval[-1]),
+                y0.ravel(),
+                t_eval=t_eval,
+                args=(args,),
+                **self._solver_options(),
+                **self._batch_jacobian(n, system),
+            )
+
+            if not solution.success:
+                raise RuntimeError(f"Integration failed: {solution.message}")
+
+            states = solution.y.reshape(n, n_species, -1)
+
+            for k, i in enumerate(indices):
+                index = np.searchsorted(t_eval, inits[i].time)
+                outputs[i] = np.hstack(
+                    [
+                        states[k][:, index].T,
+                        np.broadcast_to(constants[k], (index.size, constants.shape[1])),
+                    ]
+                )
+
+        return outputs
+
+    def _solver_options(self) -> dict:
+        """Returns the integrator settings as keyword arguments of `solve_ivp`."""
+        return {
+            "method": self.solver.method,
+            "rtol": self.solver.rtol,
+            "atol": self.solver.atol,
+            "max_step": self.solver.max_step or np.inf,
+        }
+
+    def _batch_jacobian(self, n: int, system: ODESystem) -> dict:
+        """
+        Returns the Jacobian options of `solve_ivp` for n stacked conditions.
+
+        The stacked Jacobian is block diagonal. LSODA receives it in packed banded
+        format, BDF and Radau as a sparse matrix. Explicit methods do not use it.
+
+        Args:
+            n (int): The number of stacked conditions.
+            system (ODESystem): The integrated system.
+
+        Returns:
+            dict: Keyword arguments for `solve_ivp`.
+        """
+        s = len(system.species)
+
+        if self.method == "LSODA":
+
+            def banded(t, y, args):
+                blocks = system.jac_batch(t, y, args)
+                packed = np.zeros((2 * s - 1, n * s))
+
+                # LSODA expects packed[uband + i - j, j] = J[i, j]
+                for a in range(s):
+                    for b in range(s):
+                        packed[s - 1 + a - b, b::s] = blocks[:, a, b]
+
+                return packed
+
+            return {"jac": banded, "lband": s - 1, "uband": s - 1}
+
+        if self.method in ("BDF", "Radau"):
+
+            def sparse(t, y, args):
+                blocks = system.jac_batch(t, y, args)
+                return bsr_array(
+                    (blocks, np.arange(n), np.arange(n + 1)), shape=(n * s, n * s)
+                ).tocsc()
+
+            return {"jac": sparse}
+
+        return {}
+
+
+@dataclass
+class ODESystem:
+    """
+    An EnzymeML model compiled into NumPy functions.
+
+    The state vector `y` holds the concentrations of all species whose derivative
+    is not zero. Species that appear in the equations but do not change, such as
+    constant species, are treated as inputs and appended to the parameter vector.
+
+    Attributes:
+        species (List[str]): IDs of the species in the state vector.
+        constants (List[str]): IDs of the species that are held constant.
+        parameters (List[str]): Symbols of the parameters.
+        derivatives (List[sp.Expr]): Symbolic derivatives of the state species.
+        rhs_func (Callable): The lambdified derivatives `f(t, y, args) -> list`, where
+            `args` holds the parameter values followed by the values of the constant
+            species. Evaluates element-wise if `y` and `args` hold one column per
+            condition.
+        jac_func (Callable): The lambdified Jacobian `f(t, y, args) -> list[list]`,
+            with the same conventions as `rhs_func`.
+    """
+
+    species: List[str]
+    constants: List[str]
+    parameters: List[str]
+    derivatives: List[sp.Expr]
+    rhs_func: Callable[[float, np.ndarray, np.ndarray], list]
+    jac_func: Callable[[float, np.ndarray, np.ndarray], list]
+
+    @property
+    def outputs(self) -> List[str]:
+        """IDs of all simulated species, the state species followed by the constants."""
+        return self.species + self.constants
+
+    @classmethod
+    def from_enzmldoc(cls, enzmldoc: v2.EnzymeMLDocument) -> "ODESystem":
+        """
+        Compiles the reactions and equations of an EnzymeML document.
+
+        Each reaction with a kinetic law contributes its rate, weighted by the
+        stoichiometry, to the derivatives of its reactants and products. ODE
+        equations are added to the derivative of their species and assignment
+        equations are substituted into all other expressions.
+
+        Args:
+            enzmldoc (v2.EnzymeMLDocument): The document to compile.
+
+        Returns:
+            ODESystem: The compiled model.
+
+        Raises:
+            ValueError: If an equation refers to an undefined symbol.
+        """
+        all_species = BaseThinLayer._get_all_species(enzmldoc)
+        constant = {
+            species.id
+            for species in enzmldoc.small_molecules
+            + enzmldoc.proteins
+            + enzmldoc.complexes
+            if species.constant
+        }
+        parameters = [param.symbol for param in enzmldoc.parameters]
+        symbols = {
+            name: sp.Symbol(name)
+            for name in [TIME_SYMBOL, *sorted(all_species), *parameters]
+        }
+
+        def parse(equation: str) -> sp.Expr:
+            return sp.sympify(equation, locals=symbols)
+
+        derivatives: Dict[str, sp.Expr] = {}
+
+        for reaction in enzmldoc.reactions:
+            if reaction.kinetic_law is None:
+                continue
+
+            rate = parse(reaction.kinetic_law.equation)
+            terms = [
+                (e, -sp.nsimplify(e.stoichiometry)) for e in reaction.reactants
+            ] + [(e, sp.nsimplify(e.stoichiometry)) for e in reaction.products]
+
+            for element, stoichiometry in terms:
+                if element.species_id in constant:
+                    continue
+
+                derivatives[element.species_id] = (
+                    derivatives.get(element.species_id, sp.Integer(0))
+                    + stoichiometry * rate
+                )
+
+        assignments = {}
+        for equation in enzmldoc.equations:
+            if equation.equation_type == v2.EquationType.ODE:
+                derivatives[equation.species_id] = derivatives.get(
+                    equation.species_id, sp.Integer(0)
+                ) + parse(equation.equation)
+            elif equation.equation_type == v2.EquationType.ASSIGNMENT:
+                assignments[symbols.get(equation.species_id, equation.species_id)] = (
+                    parse(equation.equation)
+                )
+
+        # Resolve assignments that refer to other assignments
+        for _ in range(len(assignments)):
+            derivatives = {
+                k: expr.xreplace(assignments) for k, expr in derivatives.items()
+            }
+
+        species = [s for s, expr in derivatives.items() if expr != 0]
+        exprs = [derivatives[s] for s in species]
+
+        used = {symbol.name for expr in exprs for symbol in expr.free_symbols}
+        unknown = used - all_species - set(parameters) - {TIME_SYMBOL}
+
+        if unknown:
+            raise ValueError(
+                f"Equations refer to undefined symbols: {', '.join(sorted(unknown))}"
+            )
+
+        constants = sorted((used & all_species) - set(species))
+
+        return cls.compile(species, constants, parameters, exprs)
+
+    @classmethod
+    def compile(
+        cls,
+        species: List[str],
+        constants: List[str],
+        parameters: List[str],
+        derivatives: List[sp.Expr],
+    ) -> "ODESystem":
+        """
+        Lambdifies symbolic derivatives and their Jacobian.
+
+        Args:
+            species (List[str]): IDs of the species in the state vector.
+            constants (List[str]): IDs of the species that are held constant.
+            parameters (List[str]): Symbols of the parameters.
+            derivatives (List[sp.Expr]): Symbolic derivatives of the state species.
+
+        Returns:
+            ODESystem: The compiled model.
+        """
+        t = sp.Symbol(TIME_SYMBOL)
+        y = [sp.Symbol(s) for s in species]
+        args = [sp.Symbol(p) for p in parameters + constants]
+
+        return cls(
+            species=species,
+            constants=constants,
+            parameters=parameters,
+            derivatives=derivatives,
+            rhs_func=sp.lambdify((t, y, args), derivatives, modules="numpy", cse=True),
+            jac_func=sp.lambdify(
+                (t, y, args),
+                sp.Matrix(derivatives).jacobian(y).tolist(),
+                modules="numpy",
+                cse=True,
+            ),
+        )
+
+    def with_sensitivities(self) -> "ODESystem":
+        """
+        Augments the system by its forward sensitivity equations.
+
+        The sensitivities S = dy/dp of the states with respect to the parameters obey
+
+            dS/dt = J_y S + J_p,
+
+        where J_y and J_p are the Jacobians of the derivatives with respect to the
+        states and the parameters. Both are derived symbolically. The augmented state
+        vector holds the states followed by the row-major flattened sensitivities,
+        which start at zero since initial concentrations do not depend on the
+        parameters.
+
+        Returns:
+            ODESystem: The augmented system with n_species * (1 + n_parameters) states.
+        """
+        f = sp.Matrix(self.derivatives)
+        y = [sp.Symbol(s) for s in self.species]
+        p = [sp.Symbol(p) for p in self.parameters]
+
+        names = [
+            _sensitivity_name(species, param)
+            for species in self.species
+            for param in self.parameters
+        ]
+        S = sp.Matrix(len(y), len(p), [sp.Symbol(name) for name in names])
+        J_p = f.jacobian(p) if p else sp.zeros(len(y), 0)
+        dS = f.jacobian(y) * S + J_p
+
+        return self.compile(
+            species=self.species + names,
+            constants=self.constants,
+            parameters=self.parameters,
+            derivatives=list(f) + list(dS),
+        )
+
+    def rhs(self, t: float, y: np.ndarray, args: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the right-hand side of a single condition.
+
+        Args:
+            t (float): The time.
+            y (np.ndarray): The state of shape (n_species,).
+            args (np.ndarray): The parameter values followed by the constants.
+
+        Returns:
+            np.ndarray: The derivatives of shape (n_species,).
+        """
+        return np.asarray(self.rhs_func(t, y, args), dtype=np.float64)
+
+    def jac(self, t: float, y: np.ndarray, args: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the Jacobian of a single condition.
+
+        Args:
+            t (float): The time.
+            y (np.ndarray): The state of shape (n_species,).
+            args (np.ndarray): The parameter values followed by the constants.
+
+        Returns:
+            np.ndarray: The Jacobian of shape (n_species, n_species).
+        """
+        return np.asarray(self.jac_func(t, y, args), dtype=np.float64)
+
+    def rhs_batch(self, t: float, y: np.ndarray, args: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the right-hand side of stacked conditions in one call.
+
+        Args:
+            t (float): The time.
+            y (np.ndarray): The flattened states of shape (n_conditions * n_species,),
+                ordered by condition.
+            args (np.ndarray): The arguments of shape (n_args, n_conditions).
+
+        Returns:
+            np.ndarray: The flattened derivatives in the order of `y`.
+        """
+        n = args.shape[1]
+        out = self.rhs_func(t, y.reshape(n, -1).T, args)
+
+        return _stack(out, n).T.ravel()
+
+    def jac_batch(self, t: float, y: np.ndarray, args: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the Jacobian blocks of stacked conditions in one call.
+
+        The Jacobian of the stacked system is block diagonal, hence only the blocks
+        are returned.
+
+        Args:
+            t (float): The time.
+            y (np.ndarray): The flattened states, see `rhs_batch`.
+            args (np.ndarray): The arguments of shape (n_args, n_conditions).
+
+        Returns:
+            np.ndarray: The blocks of shape (n_conditions, n_species, n_species).
+        """
+        n = args.shape[1]
+        out = self.jac_func(t, y.reshape(n, -1).T, args)
+
+        return np.stack([_stack(row, n) for row in out]).transpose(2, 0, 1)
+
+    def initial_state(self, initial: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Splits initial concentrations into the state vector and the constants.
+
+        State species without an initial concentration start at zero.
+
+        Args:
+            initial (Dict[str, float]): Initial concentrations by species ID.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The initial state and the constant values.
+
+        Raises:
+            ValueError: If the concentration of a constant species is not given.
+        """
+        missing = [s for s in self.constants if initial.get(s) is None]
+
+        if missing:
+            raise ValueError(f"Initial concentrations of {missing} are required")
+
+        return (
+            np.array([initial.get(s) or 0.0 for s in self.species], dtype=np.float64),
+            np.array([initial[s] for s in self.constants], dtype=np.float64),
+        )
+
+
+@dataclass
+class InitMap:
+    """
+    Helper class for managing species initial concentrations and observations.
+
+    Attributes:
+        time (np.ndarray | List[float]): Time points for simulation.
+        species (Dict[str, float]): Dictionary mapping species IDs to initial concentrations.
+        observed (np.ndarray): Indices of the observed species in the model outputs.
+        data (np.ndarray): Observations of shape (n_time, n_observed).
+        mask (np.ndarray): Whether an observation is present, of the same shape as data.
+    """
+
+    time: np.ndarray | List[float]
+    species: Dict[str, float]
+    observed: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=int))
+    data: np.ndarray = field(default_factory=lambda: np.empty((0, 0)))
+    mask: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=bool))
+
+    @classmethod
+    def from_measurement(
+        cls,
+        meas: v2.Measurement,
+        df: pd.DataFrame,
+        outputs: List[str],
+    ) -> "InitMap":
+        """
+        Create an InitMap instance from a measurement and its dataframe.
+
+        Args:
+            meas (v2.Measurement): The measurement containing species data.
+            df (pd.DataFrame): DataFrame with time and species data of the measurement.
+            outputs (List[str]): IDs of the simulated species.
+
+        Returns:
+            InitMap: Initialized instance with time points, initial values and observations.
+        """
+        columns = [col for col in df.columns if col in outputs]
+        data = df[columns].to_numpy(dtype=np.float64)
+
+        return cls(
+            time=df["time"].to_numpy(dtype=np.float64),
+            species={
+                s.species_id: s.initial
+                for s in meas.species_data
+                if s.initial is not None
+            },
+            observed=np.array([outputs.index(col) for col in columns], dtype=int),
+            data=np.nan_to_num(data),
+            mask=~np.isnan(data),
+        )
+
+
+def _stack(values: list, n: int) -> np.ndarray:
+    """Stacks lambdified outputs, broadcasting constant entries to n conditions."""
+    return np.stack(
+        [np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)) for v in values]
+    )
+
+
+def _sensitivity_name(species: str, parameter: str) -> str:
+    """Returns the name of the sensitivity of a species with respect to a parameter."""
+    return f"d({species})/d({parameter})"
+
+
+def _initial_value(param: v2.Parameter) -> Optional[float]:
+    """Returns the value of a parameter, falling back to its initial value."""
+    if param.value is not None:
+        return param.value
+
+    return param.initial_value
+
+
+def _bound(value: Optional[float], default: float) -> float:
+    """Returns a parameter bound, replacing missing values by the default."""
+    if value is None or np.isnan(value):
+        return default
+
+    return value
+
+
+def _standard_errors(result: OptimizeResult) -> np.ndarray:
+    """
+    Estimates the standard errors of the fitted parameters.
+
+    The covariance is approximated by the inverse of J^T J at the optimum, scaled
+    by the residual variance.
+
+    Args:
+        result (OptimizeResult): The result of `least_squares`.
+
+    Returns:
+        np.ndarray: The standard errors, NaN if the covariance is singular.
+    """
+    n_obs, n_params = result.jac.shape
+    dof = max(n_obs - n_params, 1)
+
+    try:
+        covariance = np.linalg.inv(result.jac.T @ result.jac)
+    except np.linalg.LinAlgError:
+        return np.full(n_params, np.nan)
+
+    return np.sqrt(np.abs(np.diag(covariance)) * 2 * result.cost / dof)
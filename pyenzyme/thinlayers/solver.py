@@ -0,0 +1,87 @@
+"""
+Integrator settings shared by all thin layers.
+
+Each thin layer hands the model to a different integrator, which all expose the
+same few controls under different names. `SolverSettings` collects these controls
+in one object that is accepted by every thin layer and translated to its
+simulator:
+
+- `ThinLayerScipy` passes them to `scipy.integrate.solve_ivp` and supports
+  "LSODA", "BDF" and "Radau", as well as the explicit methods of SciPy.
+- `ThinLayerPysces` supports "LSODA" and, if Assimulo is installed, "CVODE".
+- `ThinLayerCopasi` supports "LSODA" and "Radau" (RADAU5).
+
+Settings a simulator does not support raise a ValueError when the thin layer is
+created, instead of silently falling back to a different integrator.
+
+Example:
+    >>> from pyenzyme.thinlayers import SolverSettings, ThinLayerScipy
+    >>> solver = SolverSettings(method="BDF", rtol=1e-8, atol=1e-10)
+    >>> tl = ThinLayerScipy(doc, solver=solver)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Optional
+
+
+@dataclass(frozen=True)
+class SolverSettings:
+    """
+    Settings of the integrator that simulates the model.
+
+    Attributes:
+        method (str): The integration method. "LSODA" switches automatically
+            between non-stiff and stiff steps, "BDF", "Radau" and "CVODE" are
+            implicit methods for stiff systems.
+        rtol (float): Relative tolerance of the integrator.
+        atol (float): Absolute tolerance of the integrator.
+        max_step (Optional[float]): Largest step the integrator may take. Bounding
+            it prevents the integrator from stepping over short transients. None
+            leaves the step size unbounded.
+        dense_output (bool): Whether to keep a continuous solution of the last
+            integration, which can be evaluated at arbitrary time points.
+    """
+
+    method: str = "LSODA"
+    rtol: float = 1e-6
+    atol: float = 1e-9
+    max_step: Optional[float] = None
+    dense_output: bool = False
+
+    def __post_init__(self):
+        if not self.rtol > 0 or not self.atol > 0:
+            raise ValueError(
+                f"Tolerances must be positive, got rtol={self.rtol} and atol={self.atol}"
+            )
+
+        if self.max_step is not None and not self.max_step > 0:
+            raise ValueError(f"The maximum step must be positive, got {self.max_step}")
+
+    def check(
+        self,
+        thinlayer: str,
+        methods: Collection[str],
+        dense_output: bool = False,
+    ):
+        """
+        Checks whether a thin layer supports these settings.
+
+        Args:
+            thinlayer (str): The name of the thin layer, used in the error message.
+            methods (Collection[str]): The methods the thin layer supports.
+            dense_output (bool, optional): Whether the thin layer supports dense
+                output. Defaults to False.
+
+        Raises:
+            ValueError: If the method or dense output is not supported.
+        """
+        if self.method not in methods:
+            raise ValueError(
+                f"{thinlayer} does not support the method '{self.method}'. "
+                f"Available methods: {', '.join(methods)}"
+            )
+
+        if self.dense_output and not dense_output:
+            raise ValueError(f"{thinlayer} does not support dense output")
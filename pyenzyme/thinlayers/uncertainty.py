@@ -0,0 +1,777 @@
+"""
+Profile likelihoods and bootstrap confidence intervals of fitted parameters.
+
+Standard errors derived from the covariance at the optimum assume that the model
+is close to linear in its parameters, which rarely holds for enzyme kinetics.
+`UncertaintyAnalysis` refits the thin layer many times instead:
+
+- The profile likelihood of a parameter fixes it at a sequence of values on either
+  side of its estimate and refits the remaining parameters, each fit starting from
+  the fit at the neighbouring value. The confidence interval comprises all values
+  whose likelihood ratio to the optimum stays below the chi-square quantile.
+- The bootstrap refits the model to resampled data, i.e. the fitted trajectories
+  plus resampled residuals (nonparametric) or plus Gaussian noise (parametric).
+  The percentiles of the refitted values form the confidence interval.
+
+Independent fits run in parallel worker processes, namely both directions of the
+profile of each parameter and all bootstrap samples.
+
+Example:
+    >>> import pyenzyme as pe
+    >>> from pyenzyme.thinlayers import ThinLayerScipy, UncertaintyAnalysis
+    >>> doc = pe.read_enzymeml("path/to/enzmldoc.json")
+    >>> analysis = UncertaintyAnalysis(ThinLayerScipy(doc), level=0.95)
+    >>> profiles = analysis.profile()
+    >>> bootstrap = analysis.bootstrap(n_samples=200)
+    >>> fitted_doc = analysis.write()
+    >>> summary = analysis.to_pandas()
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Dict, List, Literal, Optional, Tuple
+
+import dill
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from pyenzyme.thinlayers.base import BaseThinLayer
+from pyenzyme.thinlayers.multistart import _init_worker, _run_in_worker
+from pyenzyme.versions import v2
+
+Observations = Dict[str, Dict[str, np.ndarray]]
+
+
+@dataclass
+class ProfileResult:
+    """The profile likelihood of a single parameter.
+
+    Attributes:
+        symbol (str): The symbol of the parameter.
+        estimate (float): The fitted value of the parameter.
+        values (List[float]): The values at which the parameter was fixed in
+            ascending order, including the estimate.
+        objective (List[float]): The objective value of the refit at each value.
+        ratio (List[float]): The likelihood ratio statistic at each value.
+        threshold (float): The likelihood ratio up to which values lie within the
+            confidence interval.
+        lower (float): The lower end of the confidence interval, -inf if the profile
+            does not cross the threshold within the bounds of the parameter.
+        upper (float): The upper end of the confidence interval, inf if the profile
+            does not cross the threshold within the bounds of the parameter.
+        errors (List[str]): The errors of failed refits, each of which ends one
+            direction of the profile.
+    """
+
+    symbol: str
+    estimate: float
+    values: List[float]
+    objective: List[float]
+    ratio: List[float]
+    threshold: float
+    lower: float = -np.inf
+    upper: float = np.inf
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def identifiable(self) -> bool:
+        """Whether the confidence interval is finite on both sides."""
+        return bool(np.isfinite(self.lower) and np.isfinite(self.upper))
+
+
+@dataclass
+class BootstrapResult:
+    """The refitted parameter values of a bootstrap.
+
+    Attributes:
+        kind (str): Either "nonparametric" or "parametric".
+        samples (List[Dict[str, float]]): The refitted values of each successful
+            bootstrap sample.
+        lower (Dict[str, float]): The lower percentile of each parameter.
+        upper (Dict[str, float]): The upper percentile of each parameter.
+        stderr (Dict[str, float]): The standard deviation of each parameter.
+        errors (List[str]): The errors of failed refits.
+    """
+
+    kind: str
+    samples: List[Dict[str, float]]
+    lower: Dict[str, float] = field(default_factory=dict)
+    upper: Dict[str, float] = field(default_factory=dict)
+    stderr: Dict[str, float] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+
+class UncertaintyAnalysis:
+    """
+    Computes confidence intervals of the fitted parameters of a thin layer.
+
+    Both methods assume independent, normally distributed measurement errors of
+    equal variance, which is what least-squares fits imply. The variance is
+    treated as unknown, hence the likelihood ratio of a fit with objective value
+    `S` to the optimum `S_min` is `n * log(S / S_min)` for `n` observations.
+
+    Each analysis starts with a fit of the thin layer, whose values serve as
+    estimates and starting points. Afterwards, the thin layer is refitted to the
+    original data, hence `write` and `integrate` of the thin layer reflect the
+    estimates.
+
+    Attributes:
+        thinlayer (BaseThinLayer): The thin layer to analyze.
+        level (float): The confidence level of the intervals.
+        n_workers (int): The number of worker processes.
+        seed (Optional[int]): The seed of the bootstrap resampling.
+        estimate (Dict[str, float]): The fitted values by parameter symbol.
+        objective (float): The objective value of the fit.
+        n_observations (int): The number of fitted observations.
+        profiles (Dict[str, ProfileResult]): The profiles of the last call of
+            `profile` by parameter symbol.
+        bootstrap_result (Optional[BootstrapResult]): The result of the last call
+            of `bootstrap`.
+    """
+
+    def __init__(
+        self,
+        thinlayer: BaseThinLayer,
+        level: float = 0.95,
+        n_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the UncertaintyAnalysis instance.
+
+        Args:
+            thinlayer (BaseThinLayer): The thin layer to analyze. It must implement
+                `objective_value`.
+            level (float, optional): The confidence level of the intervals.
+                Defaults to 0.95.
+            n_workers (Optional[int], optional): The number of worker processes. If
+                None, the number of CPUs is used. A value of 1 fits in the calling
+                process, as do thin layers that cannot be serialized.
+            seed (Optional[int], optional): The seed of the bootstrap resampling.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the level is not between 0 and 1.
+        """
+        if not 0.0 < level < 1.0:
+            raise ValueError(f"Confidence level must be between 0 and 1, got {level}")
+
+        self.thinlayer = thinlayer
+        self.level = level
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.seed = seed
+        self.estimate: Dict[str, float] = {}
+        self.objective = np.nan
+        self.n_observations = _count_observations(thinlayer)
+        self.profiles: Dict[str, ProfileResult] = {}
+        self.bootstrap_result: Optional[BootstrapResult] = None
+
+        self._fitted = [
+            param for param in thinlayer.enzmldoc.parameters if param.fit is not False
+        ]
+
+    @property
+    def threshold(self) -> float:
+        """The chi-square quantile with one degree of freedom at the confidence level."""
+        return NormalDist().inv_cdf(0.5 + self.level / 2) ** 2
+
+    def profile(
+        self,
+        symbols: Optional[List[str]] = None,
+        step: float = 0.1,
+        max_steps: int = 30,
+        scale: Literal["linear", "log"] = "log",
+        **kwargs,
+    ) -> Dict[str, ProfileResult]:
+        """
+        Computes the profile likelihood of each parameter.
+
+        Starting from the estimate, the parameter is fixed at successive values and
+        the remaining parameters are refitted, until the likelihood ratio exceeds
+        the threshold, the bound of the parameter is reached or `max_steps` fits
+        are done. The step between values adapts to the curvature of the profile:
+        it is halved while the likelihood ratio rises by more than a quarter of
+        the threshold and doubled while it rises by less than a sixteenth. The
+        ends of the confidence interval are interpolated between the last value
+        within and the first value beyond the threshold.
+
+        Args:
+            symbols (Optional[List[str]], optional): The parameters to profile.
+                Defaults to all fitted parameters.
+            step (float, optional): The first step relative to the estimate. On a
+                logarithmic scale, values grow by a factor of `exp(step)`.
+                Defaults to 0.1.
+            max_steps (int, optional): The maximum number of fits per direction.
+                Defaults to 30.
+            scale (Literal["linear", "log"], optional): Whether values are spaced
+                evenly on a linear or a logarithmic scale. A logarithmic scale
+                requires positive estimates. Defaults to "log".
+            **kwargs: Keyword arguments passed to `optimize` of the thin layer.
+
+        Returns:
+            Dict[str, ProfileResult]: The profiles by parameter symbol.
+
+        Raises:
+            ValueError: If a symbol does not refer to a fitted parameter, the scale
+                is unknown or an estimate is not positive on a logarithmic scale.
+        """
+        if scale not in ("linear", "log"):
+            raise ValueError(f"Unknown scale '{scale}'. Expected 'linear' or 'log'")
+
+        fitted = {param.symbol: param for param in self._fitted}
+        symbols = symbols or list(fitted)
+        unknown = set(symbols) - set(fitted)
+
+        if unknown:
+            raise ValueError(f"Unknown fitted parameters: {', '.join(sorted(unknown))}")
+
+        self._fit_reference(kwargs)
+
+        if scale == "log":
+            invalid = [symbol for symbol in symbols if self.estimate[symbol] <= 0]
+
+            if invalid:
+                raise ValueError(
+                    f"Profiling on a logarithmic scale requires positive estimates for {invalid}"
+                )
+
+        settings = _ChainSettings(
+            step=step,
+            max_steps=max_steps,
+            scale=scale,
+            objective=self.objective,
+            n_observations=self.n_observations,
+            threshold=self.threshold,
+        )
+        tasks = [
+            (
+                symbol,
+                direction,
+                fitted[symbol].upper_bound
+                if direction > 0
+                else fitted[symbol].lower_bound,
+                self.estimate,
+                settings,
+                kwargs,
+            )
+            for symbol in symbols
+            for direction in (-1, 1)
+        ]
+        chains = dict(
+            zip(
+                [(symbol, direction) for symbol, direction, *_ in tasks],
+                self._map(_profile_chain, tasks),
+            )
+        )
+
+        self.profiles = {
+            symbol: self._assemble_profile(
+                symbol,
+                {direction: chains[(symbol, direction)] for direction in (-1, 1)},
+            )
+            for symbol in symbols
+        }
+
+        self._restore(kwargs)
+
+        return self.profiles
+
+    def bootstrap(
+        self,
+        n_samples: int = 200,
+        kind: Literal["nonparametric", "parametric"] = "nonparametric",
+        **kwargs,
+    ) -> BootstrapResult:
+        """
+        Refits the model to resampled data.
+
+        Each sample adds noise to the fitted trajectories at the observed time
+        points. The nonparametric bootstrap draws the noise from the residuals of
+        the fit with replacement, while the parametric bootstrap draws it from a
+        normal distribution with the residual variance. Missing observations stay
+        missing.
+
+        Args:
+            n_samples (int, optional): The number of bootstrap samples. Defaults to 200.
+            kind (Literal["nonparametric", "parametric"], optional): How the noise is
+                drawn. Defaults to "nonparametric".
+            **kwargs: Keyword arguments passed to `optimize` of the thin layer.
+
+        Returns:
+            BootstrapResult: The refitted values and their percentiles.
+
+        Raises:
+            ValueError: If the kind is unknown.
+            RuntimeError: If no refit succeeded.
+        """
+        if kind not in ("nonparametric", "parametric"):
+            raise ValueError(
+                f"Unknown bootstrap '{kind}'. Expected 'nonparametric' or 'parametric'"
+            )
+
+        self._fit_reference(kwargs)
+
+        observed = _observed_data(self.thinlayer)
+        simulated = _simulate_observations(self.thinlayer, observed)
+        residuals = np.concatenate(
+            [
+                observed[meas_id][species] - values
+                for meas_id, species_values in simulated.items()
+                for species, values in species_values.items()
+            ]
+        )
+        residuals = residuals[~np.isnan(residuals)]
+        dof = max(self.n_observations - len(self._fitted), 1)
+        sigma = np.sqrt(self.objective / dof)
+
+        rng = np.random.default_rng(self.seed)
+        tasks = []
+
+        for _ in range(n_samples):
+            data = {}
+
+            for meas_id, species_values in simulated.items():
+                data[meas_id] = {}
+
+                for species, values in species_values.items():
+                    if kind == "parametric":
+                        noise = rng.normal(0.0, sigma, size=values.shape)
+                    else:
+                        noise = rng.choice(residuals, size=values.shape)
+
+                    sample = np.where(
+                        np.isnan(observed[meas_id][species]), np.nan, values + noise
+                    )
+                    data[meas_id][species] = sample.tolist()
+
+            tasks.append((data, self.estimate, kwargs))
+
+        try:
+            fits = self._map(_bootstrap_fit, tasks)
+        finally:
+            self.thinlayer.set_measurement_data(_as_lists(observed))
+
+        samples = [values for values, error in fits if error is None]
+        errors = [error for _, error in fits if error is not None]
+
+        if not samples:
+            raise RuntimeError(f"All fits failed: {'; '.join(set(errors))}")
+
+        matrix = np.array(
+            [[sample[name] for name in self.estimate] for sample in samples]
+        )
+        lower, upper = np.percentile(
+            matrix, [50 * (1 - self.level), 50 * (1 + self.level)], axis=0
+        )
+        stderr = (
+            np.std(matrix, axis=0, ddof=1)
+            if len(samples) > 1
+            else [np.nan] * len(self.estimate)
+        )
+
+        self.bootstrap_result = BootstrapResult(
+            kind=kind,
+            samples=samples,
+            lower=dict(zip(self.estimate, lower.tolist())),
+            upper=dict(zip(self.estimate, upper.tolist())),
+            stderr=dict(zip(self.estimate, map(float, stderr))),
+            errors=errors,
+        )
+
+        self._restore(kwargs)
+
+        return self.bootstrap_result
+
+    def write(
+        self, method: Optional[Literal["profile", "bootstrap"]] = None
+    ) -> v2.EnzymeMLDocument:
+        """
+        Creates a new EnzymeML document with the estimates and their uncertainty.
+
+        The standard errors of the fitted parameters are replaced by the standard
+        deviation of the bootstrap samples or, for profiles, by the half-width of
+        the confidence interval divided by the normal quantile of the level.
+        Parameters without a finite interval keep the standard error of the fit.
+
+        Args:
+            method (Optional[Literal["profile", "bootstrap"]], optional): The
+                analysis to take the standard errors from. Defaults to the bootstrap
+                if it has been run and to the profiles otherwise.
+
+        Returns:
+            v2.EnzymeMLDocument: A new EnzymeML document with the fitted parameters.
+
+        Raises:
+            ValueError: If the requested analysis has not been run yet.
+        """
+        if method is None:
+            method = "bootstrap" if self.bootstrap_result is not None else "profile"
+
+        if method == "bootstrap":
+            if self.bootstrap_result is None:
+                raise ValueError("The bootstrap has not been run yet")
+
+            stderr = self.bootstrap_result.stderr
+        elif method == "profile":
+            if not self.profiles:
+                raise ValueError("The profile likelihood has not been computed yet")
+
+            z = np.sqrt(self.threshold)
+            stderr = {
+                symbol: (profile.upper - profile.lower) / (2 * z)
+                for symbol, profile in self.profiles.items()
+            }
+        else:
+            raise ValueError(
+                f"Unknown method '{method}'. Expected 'profile' or 'bootstrap'"
+            )
+
+        enzmldoc = self.thinlayer.write()
+
+        for param in enzmldoc.parameters:
+            if param.symbol in stderr and np.isfinite(stderr[param.symbol]):
+                param.stderr = float(stderr[param.symbol])
+
+        return enzmldoc
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Summarizes the confidence intervals, one row per fitted parameter.
+
+        Returns:
+            pd.DataFrame: The estimate and the profile and bootstrap intervals of
+                each parameter. Intervals that have not been computed are NaN.
+        """
+        rows = []
+        for symbol, estimate in self.estimate.items():
+            profile = self.profiles.get(symbol)
+            bootstrap = self.bootstrap_result
+
+            rows.append(
+                {
+                    "symbol": symbol,
+                    "estimate": estimate,
+                    "profile_lower": profile.lower if profile else np.nan,
+                    "profile_upper": profile.upper if profile else np.nan,
+                    "bootstrap_lower": bootstrap.lower[symbol] if bootstrap else np.nan,
+                    "bootstrap_upper": bootstrap.upper[symbol] if bootstrap else np.nan,
+                    "bootstrap_stderr": bootstrap.stderr[symbol]
+                    if bootstrap
+                    else np.nan,
+                }
+            )
+
+        return pd.DataFrame(rows)
+
+    def _fit_reference(self, kwargs: dict):
+        """Fits the thin layer and stores the estimates and the objective value."""
+        self.thinlayer.optimize(**kwargs)
+
+        fitted = {param.symbol: param for param in self.thinlayer.write().parameters}
+
+        self.estimate = {
+            param.symbol: float(fitted[param.symbol].value)  # type: ignore
+            for param in self._fitted
+        }
+        self.objective = self.thinlayer.objective_value()
+
+    def _restore(self, kwargs: dict):
+        """Refits the thin layer from the estimates after fits in this process."""
+        self.thinlayer.set_start_values(self.estimate)
+        self.thinlayer.optimize(**kwargs)
+
+    def _assemble_profile(
+        self,
+        symbol: str,
+        chains: Dict[int, Tuple[List[float], List[float], Optional[str]]],
+    ) -> ProfileResult:
+        """Joins both directions of a profile and locates the interval ends."""
+        estimate = self.estimate[symbol]
+        ends = {}
+        errors = []
+
+        for direction, (values, objective, error) in chains.items():
+            ends[direction] = _crossing(
+                estimate, values, self._ratio(objective), self.threshold, direction
+            )
+
+            if error is not None:
+                errors.append(error)
+
+        lower_values, lower_objective, _ = chains[-1]
+        upper_values, upper_objective, _ = chains[1]
+        objective = [*reversed(lower_objective), self.objective, *upper_objective]
+
+        return ProfileResult(
+            symbol=symbol,
+            estimate=estimate,
+            values=[*reversed(lower_values), estimate, *upper_values],
+            objective=objective,
+            ratio=self._ratio(objective),
+            threshold=self.threshold,
+            lower=ends[-1],
+            upper=ends[1],
+            errors=errors,
+        )
+
+    def _ratio(self, objective: List[float]) -> List[float]:
+        """Returns the likelihood ratio statistics of objective values."""
+        return (
+            self.n_observations * np.log(np.asarray(objective) / self.objective)
+        ).tolist()
+
+    def _map(self, func: Callable, tasks: List[tuple]) -> list:
+        """Applies func to the thin layer and each task, in worker processes if possible."""
+        payload = self._serialize() if len(tasks) > 1 else None
+
+        if payload is None:
+            return [func(self.thinlayer, *args) for args in tasks]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.n_workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(payload,),
+        ) as pool:
+            futures = [pool.submit(_run_in_worker, func, *args) for args in tasks]
+            return [future.result() for future in futures]
+
+    def _serialize(self) -> Optional[bytes]:
+        """Serializes the thin layer for the workers, None if it cannot be copied."""
+        if self.n_workers <= 1:
+            return None
+
+        try:
+            return dill.dumps(self.thinlayer)
+        except Exception as e:
+            logger.warning(
+                f"{type(self.thinlayer).__name__} cannot be copied to worker processes "
+                f"({e}). Running the fits in the calling process."
+            )
+            return None
+
+
+@dataclass
+class _ChainSettings:
+    """The settings shared by all directions of a profile."""
+
+    step: float
+    max_steps: int
+    scale: str
+    objective: float
+    n_observations: int
+    threshold: float
+
+    def ratio(self, objective: float) -> float:
+        """Returns the likelihood ratio statistic of an objective value."""
+        return self.n_observations * float(np.log(objective / self.objective))
+
+    def advance(
+        self, value: float, step: float, reference: float, direction: int
+    ) -> float:
+        """Returns the value one step further in the direction of the profile."""
+        if self.scale == "log":
+            return value * float(np.exp(direction * step))
+
+        return value + direction * step * (abs(reference) or 1.0)
+
+
+# Bounds of the rise of the likelihood ratio per step, relative to the threshold
+MAX_RISE = 1 / 4
+MIN_RISE = 1 / 16
+
+# Steps are not refined below this fraction of the first step
+MIN_STEP_FRACTION = 1 / 64
+
+
+def _profile_chain(
+    thinlayer: BaseThinLayer,
+    symbol: str,
+    direction: int,
+    bound: Optional[float],
+    start: Dict[str, float],
+    settings: _ChainSettings,
+    kwargs: dict,
+) -> Tuple[List[float], List[float], Optional[str]]:
+    """
+    Fits the thin layer with a parameter fixed at successive values.
+
+    Each fit starts from the fitted values at the previous value. A step whose
+    likelihood ratio rises too steeply is retried with half the step.
+
+    Returns:
+        Tuple[List[float], List[float], Optional[str]]: The values and objective
+            values of the accepted fits in the order of the chain, and the error
+            that ended it, if any.
+    """
+    param = next(p for p in thinlayer.enzmldoc.parameters if p.symbol == symbol)
+    fit = param.fit
+    estimate = start[symbol]
+    start = dict(start)
+    value, ratio, step = estimate, 0.0, settings.step
+    values, objective = [], []
+
+    if bound is not None and not np.isfinite(bound):
+        bound = None
+
+    try:
+        param.fit = False
+
+        for _ in range(settings.max_steps):
+            if bound is not None and value * direction >= bound * direction:
+                break
+
+            candidate = settings.advance(value, step, estimate, direction)
+            if bound is not None and candidate * direction > bound * direction:
+                candidate = bound
+
+            start[symbol] = candidate
+            thinlayer.set_start_values(start)
+            thinlayer.optimize(**kwargs)
+            current = thinlayer.objective_value()
+            rise = settings.ratio(current) - ratio
+
+            if (
+                rise > MAX_RISE * settings.threshold
+                and step > settings.step * MIN_STEP_FRACTION
+            ):
+                step /= 2
+                continue
+
+            value, ratio = candidate, ratio + rise
+            values.append(value)
+            objective.append(current)
+
+            if ratio > settings.threshold:
+                break
+
+            if rise < MIN_RISE * settings.threshold:
+                step *= 2
+
+            fitted = {p.symbol: p.value for p in thinlayer.write().parameters}
+            start.update({name: fitted[name] for name in start if name != symbol})  # type: ignore
+    except Exception as e:
+        return values, objective, f"{type(e).__name__}: {e}"
+    finally:
+        param.fit = fit
+
+    return values, objective, None
+
+
+def _bootstrap_fit(
+    thinlayer: BaseThinLayer,
+    data: Dict[str, Dict[str, List[float]]],
+    start: Dict[str, float],
+    kwargs: dict,
+) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+    """Fits the thin layer to a bootstrap sample, reporting errors in the result."""
+    try:
+        thinlayer.set_measurement_data(data)
+        thinlayer.set_start_values(start)
+        thinlayer.optimize(**kwargs)
+
+        fitted = {param.symbol: param.value for param in thinlayer.write().parameters}
+
+        return {name: float(fitted[name]) for name in start}, None  # type: ignore
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _crossing(
+    estimate: float,
+    values: List[float],
+    ratio: List[float],
+    threshold: float,
+    direction: int,
+) -> float:
+    """
+    Interpolates where one direction of a profile crosses the threshold.
+
+    Returns:
+        float: The crossing, or an infinity in the direction of the profile if the
+            threshold is not crossed.
+    """
+    previous_value, previous_ratio = estimate, 0.0
+
+    for value, current in zip(values, ratio):
+        if current > threshold:
+            weight = (threshold - previous_ratio) / (current - previous_ratio)
+            return previous_value + weight * (value - previous_value)
+
+        previous_value, previous_ratio = value, current
+
+    return direction * np.inf
+
+
+def _count_observations(thinlayer: BaseThinLayer) -> int:
+    """Counts the observations the thin layer fits."""
+    observed = thinlayer.df.drop(columns=["id", "time"])
+    return int(observed.notna().to_numpy().sum())
+
+
+def _observed_data(thinlayer: BaseThinLayer) -> Observations:
+    """Returns the fitted observations by measurement ID and species ID."""
+    columns = set(thinlayer.df.columns) - {"id", "time"}
+
+    return {
+        meas.id: {
+            data.species_id: np.asarray(data.data, dtype=np.float64)
+            for data in meas.species_data
+            if data.data and data.species_id in columns
+        }
+        for meas in thinlayer.enzmldoc.measurements
+        if meas.id in thinlayer.measurement_ids
+    }
+
+
+def _simulate_observations(
+    thinlayer: BaseThinLayer, observed: Observations
+) -> Observations:
+    """Simulates the fitted model at the time points of the observations."""
+    simulated = {}
+    measurements = {meas.id: meas for meas in thinlayer.enzmldoc.measurements}
+
+    for meas_id, species_values in observed.items():
+        species_data = {
+            data.species_id: data for data in measurements[meas_id].species_data
+        }
+        initial_conditions = {
+            species: data.initial
+            for species, data in species_data.items()
+            if data.initial is not None
+        }
+        # Species may be observed at different times, all are simulated at once
+        times = np.unique(
+            np.concatenate([species_data[species].time for species in species_values])
+        )
+
+        trajectories, _ = thinlayer.integrate(
+            model=thinlayer.enzmldoc,
+            initial_conditions=initial_conditions,
+            t0=float(times[0]),
+            t1=float(times[-1]),
+            times=times.tolist(),
+        )
+
+        simulated[meas_id] = {
+            species: np.asarray(trajectories[species])[
+                np.searchsorted(times, species_data[species].time)
+            ]
+            for species in species_values
+        }
+
+    return simulated
+
+
+def _as_lists(observations: Observations) -> Dict[str, Dict[str, List[float]]]:
+    """Converts observations to the lists of `set_measurement_data`."""
+    return {
+        meas_id: {
+            species: values.tolist() for species, values in species_values.items()
+        }
+        for meas_id, species_values in observations.items()
+    }
@@ -3,6 +3,7 @@ import json
 from enum import Enum
 from typing import Literal
 
+import numpy as np
 from pydantic import BaseModel
 
 from pyenzyme.versions.v2 import EnzymeMLDocument, Measurement
@@ -346,6 +347,7 @@ def _is_basetype(obj):
             complex,
             list,
             dict,
+            np.ndarray,
             type(None),
         ),
     )
@@ -0,0 +1,160 @@
+"""
+Format detection for EnzymeML documents.
+
+EnzymeML documents come either as OMEX archives containing an SBML model and the
+measurement data, or as plain JSON files. Instead of trying every parser in turn,
+`read_enzymeml` inspects the first bytes of a file and dispatches to the reader that
+was registered for the detected format:
+
+    - OMEX archives start with the zip magic bytes.
+    - JSON documents start with an opening brace.
+    - Plain SBML files start with an XML prolog or tag.
+
+Additional formats can be added via `register_format`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from pydantic import ValidationError
+
+from pyenzyme.columnar import ArrayEnzymeMLDocument, to_columnar
+from pyenzyme.sbml.parser import read_sbml
+from pyenzyme.streaming import read_enzymeml_lazy
+from pyenzyme.versions import v2
+
+SNIFF_SIZE = 64
+
+ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06")
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(frozen=True)
+class DocumentFormat:
+    """A file format an EnzymeML document can be read from.
+
+    Attributes:
+        name (str): Name of the format, used in error messages.
+        sniff (Callable[[bytes], bool]): Returns True if the leading bytes of a file
+            belong to this format.
+        read (Callable[..., v2.EnzymeMLDocument]): Reads a document from a path. Is
+            called with the keyword arguments `columnar` and `lazy`.
+    """
+
+    name: str
+    sniff: Callable[[bytes], bool]
+    read: Callable[..., v2.EnzymeMLDocument]
+
+
+_FORMATS: list[DocumentFormat] = []
+
+
+def register_format(document_format: DocumentFormat) -> None:
+    """Registers a format to be considered by `detect_format`.
+
+    Formats are sniffed in registration order. Registering a format with an existing
+    name replaces the previous registration.
+
+    Args:
+        document_format (DocumentFormat): The format to register.
+    """
+    for i, registered in enumerate(_FORMATS):
+        if registered.name == document_format.name:
+            _FORMATS[i] = document_format
+            return
+
+    _FORMATS.append(document_format)
+
+
+def detect_format(path: Path | str) -> DocumentFormat:
+    """Detects the format of a file from its leading bytes.
+
+    Args:
+        path (Path | str): Path to the file.
+
+    Returns:
+        DocumentFormat: The registered format matching the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file matches none of the registered formats.
+    """
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_SIZE)
+
+    for document_format in _FORMATS:
+        if document_format.sniff(head):
+            return document_format
+
+    expected = ", ".join(document_format.name for document_format in _FORMATS)
+    raise ValueError(
+        f"Could not detect the format of '{path}'. Expected one of: {expected}"
+    )
+
+
+def _strip(head: bytes) -> bytes:
+    """Removes a byte order mark and leading whitespace."""
+    return head.removeprefix(UTF8_BOM).lstrip()
+
+
+def _is_omex(head: bytes) -> bool:
+    return head.startswith(ZIP_MAGIC)
+
+
+def _is_json(head: bytes) -> bool:
+    return _strip(head).startswith(b"{")
+
+
+def _is_xml(head: bytes) -> bool:
+    return _strip(head).startswith(b"<")
+
+
+def _read_omex(
+    path: Path | str,
+    columnar: bool = False,
+    lazy: bool = False,
+) -> v2.EnzymeMLDocument:
+    """Reads an EnzymeML document from an OMEX archive."""
+    enzmldoc = read_sbml(v2.EnzymeMLDocument, path)
+    return to_columnar(enzmldoc) if columnar else enzmldoc
+
+
+def _read_json(
+    path: Path | str,
+    columnar: bool = False,
+    lazy: bool = False,
+) -> v2.EnzymeMLDocument:
+    """Reads an EnzymeML document from a JSON file."""
+    cls = ArrayEnzymeMLDocument if columnar else v2.EnzymeMLDocument
+
+    try:
+        if lazy:
+            return read_enzymeml_lazy(path, columnar=columnar)
+
+        with open(path, "rb") as f:
+            return cls.model_validate_json(f.read())
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise ValueError(f"Malformed JSON in '{path}': {e}") from e
+
+        raise ValueError(f"'{path}' is not a valid EnzymeML document: {e}") from e
+
+
+def _read_xml(
+    path: Path | str,
+    columnar: bool = False,
+    lazy: bool = False,
+) -> v2.EnzymeMLDocument:
+    """Rejects plain SBML files, which lack the measurement data."""
+    raise ValueError(
+        f"'{path}' is a plain XML file. SBML-based EnzymeML documents must be "
+        "provided as an OMEX archive that also contains the measurement data."
+    )
+
+
+register_format(DocumentFormat(name="omex", sniff=_is_omex, read=_read_omex))
+register_format(DocumentFormat(name="json", sniff=_is_json, read=_read_json))
+register_format(DocumentFormat(name="xml", sniff=_is_xml, read=_read_xml))
@@ -1,17 +1,32 @@
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import pandas as pd
 import rich
 from pydantic import ValidationError
 
+from pyenzyme.arrow import to_arrow, to_parquet
+from pyenzyme.columnar import ArrayEnzymeMLDocument
 from pyenzyme.petab.io import to_petab
 from pyenzyme.petab.petab import PEtab
 from pyenzyme.sbml.parser import read_sbml
 from pyenzyme.sbml.serializer import to_sbml
-from pyenzyme.tabular import from_dataframe, read_csv, read_excel, to_pandas
+from pyenzyme.streaming import iter_measurements
+from pyenzyme.tabular import (
+    DEFAULT_CHUNKSIZE,
+    DEFAULT_MAX_BYTES,
+    from_dataframe,
+    iter_csv,
+    iter_excel,
+    read_csv,
+    read_excel,
+    split_by_id,
+    to_long_format,
+    to_pandas,
+)
 from pyenzyme.versions import v2
+from pyenzyme.versions.formats import detect_format
 
 AVAILABLE_VERSIONS = ["v1", "v2"]
 
@@ -24,47 +39,72 @@ class EnzymeMLHandler:
     """
 
     @classmethod
-    def read_enzymeml(cls, path: str) -> v2.EnzymeMLDocument:  # noqa: F405
+    def read_enzymeml(
+        cls,
+        path: str,
+        columnar: bool = False,
+        lazy: bool = False,
+    ) -> v2.EnzymeMLDocument:  # noqa: F405
         """Read an EnzymeML document from a file.
 
-        Attempts to read the document using different version parsers until successful.
+        The format of the file is detected from its leading bytes, and the document
+        is read by the reader registered for that format. See
+        `pyenzyme.versions.formats` for the supported formats.
 
         Args:
             path: Path to the EnzymeML document file
+            columnar: If True, measurement data is stored in NumPy buffers instead of
+                lists. See `pyenzyme.columnar` for details.
+            lazy: If True, JSON documents are streamed and their measurements are only
+                loaded on first access. See `pyenzyme.streaming` for details.
 
         Returns:
             An EnzymeMLDocument object
 
         Raises:
-            ValueError: If the document cannot be parsed with any available version
+            FileNotFoundError: If the file does not exist
+            ValueError: If the format is not supported or the document is malformed
         """
-        error = None
-        for version in AVAILABLE_VERSIONS:
-            if version == "v1":
-                try:
-                    return read_sbml(v2.EnzymeMLDocument, path)
-                except Exception:
-                    continue
-            elif version == "v2":
-                try:
-                    with open(path, "r") as f:
-                        data = json.load(f)
+        document_format = detect_format(path)
+        return document_format.read(path, columnar=columnar, lazy=lazy)
 
-                    return v2.EnzymeMLDocument.model_validate(data)
-                except ValidationError as e:
-                    error = e
-                    continue
+    @classmethod
+    def iter_measurements(
+        cls,
+        path: Path | str,
+        ids: list[str] | None = None,
+        columnar: bool = False,
+    ) -> Iterator[v2.Measurement]:  # noqa: F405
+        """Yield the measurements of an EnzymeML JSON document one at a time.
+
+        The document is parsed incrementally, hence only a single measurement is held
+        in memory at any point in time.
 
-        raise ValueError(f"Invalid EnzymeML version: {path}") from error
+        Args:
+            path: Path to the EnzymeML JSON document
+            ids: Only yield measurements with these IDs. Defaults to all measurements.
+            columnar: If True, measurement data is stored in NumPy buffers instead of
+                lists. See `pyenzyme.columnar` for details.
+
+        Returns:
+            An iterator over Measurement objects
+        """
+        return iter_measurements(path, ids=ids, columnar=columnar)
 
     @classmethod
-    def read_enzymeml_from_string(cls, data: str) -> v2.EnzymeMLDocument:  # noqa: F405
+    def read_enzymeml_from_string(
+        cls,
+        data: str,
+        columnar: bool = False,
+    ) -> v2.EnzymeMLDocument:  # noqa: F405
         """Read an EnzymeML document from a string.
 
         Attempts to read the document using different version parsers until successful.
 
         Args:
             data: The EnzymeML document as a string
+            columnar: If True, measurement data is stored in NumPy buffers instead of
+                lists. See `pyenzyme.columnar` for details.
 
         Returns:
             An EnzymeMLDocument object
@@ -75,7 +115,7 @@ class EnzymeMLHandler:
         for version in AVAILABLE_VERSIONS:
             if version == "v2":
                 try:
-                    return v2.EnzymeMLDocument.model_validate(data)
+                    return _document_class(columnar).model_validate(data)
                 except ValidationError:
                     continue
 
@@ -277,6 +317,67 @@ class EnzymeMLHandler:
 
         return df
 
+    @classmethod
+    def to_long_format(
+        cls,
+        enzmldoc: v2.EnzymeMLDocument,
+    ) -> pd.DataFrame:  # noqa: F405
+        """Convert an EnzymeML document to a long-format (tidy) pandas DataFrame.
+
+        Every data point is a row, hence species within a measurement may have
+        different time grids. The resulting DataFrame contains the following columns:
+
+            - measurement_id: The ID of the measurement.
+            - species_id: The ID of the measured species.
+            - time: The time value of the data point.
+            - value: The measured value.
+            - data_type: The type of the measured value.
+            - unit: The unit of the measured value.
+            - time_unit: The unit of the time value.
+
+        Args:
+            enzmldoc (EnzymeMLDocument): The EnzymeMLDocument object to convert
+
+        Returns:
+            pd.DataFrame containing the measurement data in long format
+        """
+        return to_long_format(enzmldoc)
+
+    @classmethod
+    def to_arrow(
+        cls,
+        enzmldoc: v2.EnzymeMLDocument,
+    ):  # noqa: F405
+        """Convert the measurement data of an EnzymeML document to an Arrow table.
+
+        The table has the same columns as `to_long_format` and is built directly from
+        the measurement data. Requires the optional dependency `pyarrow`.
+
+        Args:
+            enzmldoc (EnzymeMLDocument): The EnzymeMLDocument object to convert
+
+        Returns:
+            pyarrow.Table containing the measurement data in long format
+        """
+        return to_arrow(enzmldoc)
+
+    @classmethod
+    def to_parquet(
+        cls,
+        enzmldoc: v2.EnzymeMLDocument,
+        path: Path | str,
+    ) -> None:  # noqa: F405
+        """Write the measurement data of an EnzymeML document to a Parquet file.
+
+        The file has the same columns as `to_long_format`. Requires the optional
+        dependency `pyarrow`.
+
+        Args:
+            enzmldoc (EnzymeMLDocument): The EnzymeMLDocument object to convert
+            path (Path | str): The path of the Parquet file
+        """
+        to_parquet(enzmldoc, path)
+
     @classmethod
     def from_csv(
         cls,
@@ -351,6 +452,113 @@ class EnzymeMLHandler:
         """
         return read_excel(path, data_unit, time_unit, data_type)
 
+    @classmethod
+    def iter_csv(
+        cls,
+        path: Path | str,
+        data_unit: str,
+        time_unit: str,
+        data_type: v2.DataTypes = v2.DataTypes.CONCENTRATION,
+        sep: str = "\t",
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        columnar: bool = False,
+    ) -> Iterator[v2.Measurement]:  # noqa: F405
+        """Reads a CSV file in chunks and yields its measurements one at a time.
+
+        The file has the same structure as for `from_csv`, but the rows of each
+        measurement must be contiguous. A measurement is yielded as soon as its rows
+        end, hence only a single measurement is buffered at any point in time. The
+        measurements can be appended to a document via `doc.measurements.extend(...)`
+        or written to disk via `pyenzyme.arrow.stream_to_parquet`.
+
+        Args:
+            path (str, pathlib.Path): The path to the CSV file.
+            data_unit (str): The unit of the data.
+            time_unit (str): The unit of the time.
+            data_type (DataTypes): The type of the data. Default is DataTypes.CONCENTRATION.
+            sep (str): The separator of the CSV file. Default is '\t'.
+            chunksize (int): The number of rows to read at once. Default is 10000.
+            max_bytes (int | None): The maximum memory in bytes of the buffered rows
+                of a single measurement. Default is 1 GiB. None disables the limit.
+            columnar (bool): If True, measurement data is stored in NumPy buffers
+                instead of lists. See `pyenzyme.columnar` for details.
+
+        Returns:
+            An iterator over Measurement objects.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the rows of a measurement are not contiguous or exceed
+                `max_bytes`.
+        """
+        return iter_csv(
+            path,
+            data_unit,
+            time_unit,
+            data_type,
+            sep=sep,
+            chunksize=chunksize,
+            max_bytes=max_bytes,
+            columnar=columnar,
+        )
+
+    @classmethod
+    def iter_excel(
+        cls,
+        path: Path | str,
+        data_unit: str,
+        time_unit: str,
+        data_type: v2.DataTypes = v2.DataTypes.CONCENTRATION,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        columnar: bool = False,
+    ) -> Iterator[v2.Measurement]:  # noqa: F405
+        """Reads an Excel file in chunks and yields its measurements one at a time.
+
+        See `iter_csv` for details. Requires the optional dependency `openpyxl`.
+
+        Args:
+            path (str, pathlib.Path): The path to the Excel file.
+            data_unit (str): The unit of the data.
+            time_unit (str): The unit of the time.
+            data_type (DataTypes): The type of the data. Default is DataTypes.CONCENTRATION.
+            chunksize (int): The number of rows to read at once. Default is 10000.
+            max_bytes (int | None): The maximum memory in bytes of the buffered rows
+                of a single measurement. Default is 1 GiB. None disables the limit.
+            columnar (bool): If True, measurement data is stored in NumPy buffers
+                instead of lists. See `pyenzyme.columnar` for details.
+
+        Returns:
+            An iterator over Measurement objects.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the rows of a measurement are not contiguous or exceed
+                `max_bytes`.
+        """
+        return iter_excel(
+            path,
+            data_unit,
+            time_unit,
+            data_type,
+            chunksize=chunksize,
+            max_bytes=max_bytes,
+            columnar=columnar,
+        )
+
+
+def _document_class(columnar: bool) -> type[v2.EnzymeMLDocument]:
+    """Returns the document class to validate against.
+
+    Args:
+        columnar: Whether to use the NumPy-backed document class
+
+    Returns:
+        The EnzymeMLDocument class or its columnar counterpart
+    """
+    return ArrayEnzymeMLDocument if columnar else v2.EnzymeMLDocument
+
 
 def sort_by_ld(d: dict) -> dict:
     """Sort a dictionary according to JSON-LD conventions.
@@ -405,15 +613,6 @@ def split_by_measurement(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
         df: DataFrame to split
 
     Returns:
-        Dictionary of DataFrames, keyed by measurement ID
+        Dictionary of DataFrames without the ID column, keyed by measurement ID
     """
-    measurement_dfs = {}
-    for measurement_id in df["id"].unique():
-        measurement = df[df["id"] == measurement_id].reset_index(drop=True)
-
-        # Remove ID column
-        measurement = measurement.drop(columns=["id"])
-
-        measurement_dfs[measurement_id] = measurement
-
-    return measurement_dfs
+    return split_by_id(df, column="id")
@@ -1,8 +1,12 @@
 import tempfile
 
+import basico
 import pytest
 import pyenzyme as pe
 from pyenzyme.thinlayers.basico import ThinLayerCopasi
+from pyenzyme.thinlayers.cache import ModelCache
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy
+from pyenzyme.thinlayers.solver import SolverSettings
 from pyenzyme.versions import v2
 
 
@@ -39,6 +43,75 @@ class TestCopasiThinLayer:
                 f"K_M is not correct, got {K_M.value} expected {expected_km}"
             )
 
+    def test_solver_settings(self):
+        """Test that the solver settings are applied and times are evaluated exactly"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        solver = SolverSettings(method="Radau", rtol=1e-10, atol=1e-12)
+        initial_conditions = {"abts": 5.0, "slac": 0.079}
+        times = [87.0, 175.0, 262.0, 350.0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Act
+            layer = ThinLayerCopasi(doc, tmp_dir, cache=None, solver=solver)
+            result, result_time = layer.integrate(
+                layer.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+            )
+
+            # Assert
+            method = basico.get_task_settings(basico.T.TIME_COURSE, model=layer.model)[
+                "method"
+            ]
+            assert method["name"] == "Deterministic (RADAU5)"
+            assert method["Relative Tolerance"] == 1e-10
+
+            with pytest.raises(ValueError):
+                ThinLayerCopasi(doc, tmp_dir, solver=SolverSettings(method="BDF"))
+
+            with pytest.raises(ValueError):
+                ThinLayerCopasi(
+                    doc, tmp_dir, solver=SolverSettings(method="Radau", max_step=50.0)
+                )
+
+        scipy_layer = ThinLayerScipy(doc, rtol=1e-10, atol=1e-12)
+        expected, _ = scipy_layer.integrate(
+            scipy_layer.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+        )
+
+        assert result_time == times
+        assert result["abts"] == pytest.approx(expected["abts"], rel=1e-6), (
+            "Trajectory differs from the SciPy thin layer"
+        )
+
+    def test_integrate_start_time(self):
+        """Test that the initial conditions are applied at t0 instead of zero"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        solver = SolverSettings(method="LSODA", rtol=1e-10, atol=1e-12)
+        initial_conditions = {"abts": 5.0, "slac": 0.079}
+        times = [5.0, 10.0, 20.0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Act
+            layer = ThinLayerCopasi(doc, tmp_dir, cache=None, solver=solver)
+            result, result_time = layer.integrate(
+                layer.enzmldoc, initial_conditions, 5.0, 0.0, times=times
+            )
+
+        scipy_layer = ThinLayerScipy(doc, rtol=1e-10, atol=1e-12)
+        expected, _ = scipy_layer.integrate(
+            scipy_layer.enzmldoc, initial_conditions, 5.0, 0.0, times=times
+        )
+
+        # Assert
+        assert result_time == times
+        assert result["abts"][0] == pytest.approx(5.0), (
+            "Initial condition is not applied at t0"
+        )
+        assert result["abts"] == pytest.approx(expected["abts"], rel=1e-6), (
+            "Trajectory differs from the SciPy thin layer"
+        )
+
     def test_plot(self):
         doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
 
@@ -93,6 +166,73 @@ class TestCopasiThinLayer:
                 out=out_file,
             )
 
+    def test_model_cache(self):
+        """Test that cached models give the same fit as freshly compiled ones"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ModelCache(directory=f"{tmp_dir}/cache")
+
+            # Act
+            compiled = ThinLayerCopasi(doc, tmp_dir, cache=None)
+            first = ThinLayerCopasi(doc, tmp_dir, cache=cache)
+            from_memory = ThinLayerCopasi(doc, tmp_dir, cache=cache)
+
+            cache.clear()
+            from_disk = ThinLayerCopasi(doc, tmp_dir, cache=cache)
+
+            docs = []
+            for layer in (compiled, first, from_memory, from_disk):
+                layer.optimize()
+                docs.append(layer.write())
+
+        # Assert
+        assert len(cache) == 1
+        assert from_memory.model is not first.model, "Cached model is shared"
+
+        for opt_doc in docs[1:]:
+            for param in opt_doc.parameters:
+                expected = self._extract_parameter(docs[0], param.symbol)
+                assert param.value == pytest.approx(expected.value, rel=1e-6), (
+                    f"{param.symbol} differs between compiled and cached model"
+                )
+
+    def test_model_cache_values(self):
+        """Test that cached models take the values of the document"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        other = doc.model_copy(deep=True)
+        other.parameters[0].value = 4.2
+        other.measurements = other.measurements[1:]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ModelCache(directory=f"{tmp_dir}/cache")
+            ThinLayerCopasi(doc, tmp_dir, cache=cache)
+
+            # Act
+            compiled = ThinLayerCopasi(other, tmp_dir, cache=None)
+            from_memory = ThinLayerCopasi(other, tmp_dir, cache=cache)
+
+            cache.clear()
+            from_disk = ThinLayerCopasi(other, tmp_dir, cache=cache)
+
+            expected = basico.get_species(model=compiled.model)["initial_concentration"]
+
+            # Assert
+            assert len(cache) == 1, "Values are part of the key"
+
+            for layer in (from_memory, from_disk):
+                k_cat = basico.get_parameters("k_cat", exact=True, model=layer.model)
+                species = basico.get_species(model=layer.model)
+
+                assert k_cat["initial_value"].iloc[0] == 4.2, (
+                    "Cached parameter value is used"
+                )
+                assert species["initial_concentration"].to_dict() == pytest.approx(
+                    expected.to_dict()
+                ), "Cached species defaults are used"
+
     @staticmethod
     def _extract_parameter(doc: v2.EnzymeMLDocument, symbol: str) -> v2.Parameter:
         param = next(p for p in doc.parameters if p.symbol == symbol)
@@ -0,0 +1,90 @@
+import json
+import re
+import shutil
+
+import pytest
+
+from pyenzyme.batch import convert_directory, main
+
+
+@pytest.fixture
+def archives(tmp_path):
+    source = tmp_path / "archives"
+    source.mkdir()
+
+    for name in ["odes_example", "v1_example"]:
+        shutil.copy(f"tests/fixtures/sbml/{name}.omex", source / f"{name}.omex")
+
+    (source / "broken.omex").write_bytes(b"PK\x03\x04 not an archive")
+
+    return source
+
+
+class TestBatchConversion:
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_convert_directory(self, archives, tmp_path, executor):
+        """Test that archives are converted and failures are isolated"""
+        # Arrange
+        out = tmp_path / "out"
+
+        # Act
+        results = convert_directory(
+            archives,
+            out,
+            max_workers=2,
+            executor=executor,
+            progress=False,
+        )
+
+        # Assert
+        assert [r.source.stem for r in results] == [
+            "broken",
+            "odes_example",
+            "v1_example",
+        ], "Results are not in the order of the sorted file paths"
+
+        assert not results[0].ok, "Expected the broken archive to fail"
+        assert results[0].target is None
+
+        for result in results[1:]:
+            assert result.ok, f"Conversion of {result.source} failed: {result.error}"
+            assert result.target == out / f"{result.source.stem}.json"
+            assert isinstance(json.loads(result.target.read_text()), dict)
+
+    def test_serial_matches_parallel(self, archives, tmp_path):
+        """Test that the output does not depend on the number of workers"""
+        # Act
+        serial = convert_directory(
+            archives, tmp_path / "serial", max_workers=1, progress=False
+        )
+        parallel = convert_directory(
+            archives,
+            tmp_path / "parallel",
+            max_workers=4,
+            executor="thread",
+            progress=False,
+        )
+
+        # Assert
+        for a, b in zip(serial, parallel):
+            if a.ok:
+                assert _remove_uuid(a.target.read_text()) == _remove_uuid(
+                    b.target.read_text()
+                ), f"Output of {a.source.stem} differs"
+
+    def test_main(self, archives, tmp_path):
+        """Test that the console script reports failures via its exit code"""
+        # Act
+        code = main([str(archives), "-o", str(tmp_path / "out"), "-j", "1", "-q"])
+
+        # Assert
+        assert code == 1, f"Expected exit code 1. Got {code}"
+        assert len(list((tmp_path / "out").glob("*.json"))) == 2
+
+
+def _remove_uuid(s: str) -> str:
+    return re.sub(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+        "",
+        s,
+    )
@@ -1,5 +1,11 @@
+import asyncio
+
+import httpx
 import pytest
+from pytest_httpx import HTTPXMock
+
 import pyenzyme as pe
+from pyenzyme.fetcher import FetchEngine
 from pyenzyme.tools import to_dict_wo_json_ld
 
 
@@ -78,3 +84,84 @@ class TestComposer:
                 name="test",
                 reactions=["RHEA:22864", "INVALID"],
             )
+
+    def test_compose_routing(self, httpx_mock: HTTPXMock):
+        # Arrange
+        def response(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "pubchem.ncbi.nlm.nih.gov":
+                return httpx.Response(404)
+
+            chebi_id = request.url.params["term"]
+            source = {"chebi_accession": chebi_id, "ascii_name": chebi_id[6:]}
+            return httpx.Response(
+                200,
+                json={"results": [{"_source": source}], "total": 1, "number_pages": 1},
+            )
+
+        httpx_mock.add_callback(response, is_reusable=True)
+
+        # Act
+        doc, engine = self._compose(small_molecules=["CHEBI:16236", "15377"])
+
+        # Assert
+        assert [sm.id for sm in doc.small_molecules] == ["15377", "16236"]
+
+        hosts = [request.url.host for request in httpx_mock.get_requests()]
+        assert hosts.count("pubchem.ncbi.nlm.nih.gov") == 1, (
+            "Prefixed ChEBI ID is sent to PubChem"
+        )
+        assert hosts.count("www.ebi.ac.uk") == 2
+        assert engine.resolver.routed == {"prefix": 1, "fallback": 1}
+        assert engine.resolver.calls_saved == {"prefix": 1}
+
+    def test_compose_numeric_ids(self, httpx_mock: HTTPXMock):
+        # Arrange
+        def response(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "pubchem.ncbi.nlm.nih.gov":
+                if request.url.path.split("/")[-3] != "2244":
+                    return httpx.Response(404)
+
+                compound = {
+                    "id": {"id": {"cid": 2244}},
+                    "props": [
+                        {
+                            "urn": {"label": "IUPAC Name", "name": "Preferred"},
+                            "value": {"sval": "aspirin"},
+                        }
+                    ],
+                }
+                return httpx.Response(200, json={"PC_Compounds": [compound]})
+
+            results = []
+            if request.url.params["term"] == "CHEBI:15377":
+                source = {"chebi_accession": "CHEBI:15377", "ascii_name": "water"}
+                results.append({"_source": source})
+
+            return httpx.Response(
+                200,
+                json={"results": results, "total": len(results), "number_pages": 1},
+            )
+
+        httpx_mock.add_callback(response, is_reusable=True)
+
+        # Act
+        doc, engine = self._compose(small_molecules=["2244", "15377"])
+
+        # Assert
+        assert sorted(sm.name for sm in doc.small_molecules) == ["aspirin", "water"], (
+            "Four-digit CID or bare ChEBI number is not resolved"
+        )
+        assert engine.resolver.routed == {"fallback": 2}
+        assert not engine.resolver.calls_saved
+
+    @staticmethod
+    def _compose(**kwargs):
+        """Composes a document with an own engine and returns both."""
+
+        async def compose():
+            async with FetchEngine() as engine:
+                doc = await pe.compose_async(name="test", engine=engine, **kwargs)
+
+            return doc, engine
+
+        return asyncio.run(compose())
@@ -0,0 +1,185 @@
+import re
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pyenzyme.fetcher import (
+    FetcherCache,
+    fetch_chebi_batch,
+    fetch_pubchem_batch,
+    fetch_uniprot_batch,
+    set_fetcher_cache,
+)
+from pyenzyme.fetcher import chebi, pubchem, uniprot
+from pyenzyme.fetcher.chebi import ChEBIError
+
+UNIPROT_ENTRIES = {
+    "P07327": ("ADH1A_HUMAN", "Alcohol dehydrogenase 1A"),
+    "P00330": ("ADH1_YEAST", "Alcohol dehydrogenase 1"),
+    "P69905": ("HBA_HUMAN", "Hemoglobin subunit alpha"),
+}
+
+PUBCHEM_NAMES = {702: "ethanol", 962: "oxidane", 177: "acetaldehyde"}
+
+CHEBI_NAMES = {"CHEBI:15377": "water", "CHEBI:16236": "ethanol"}
+
+
+def uniprot_entry(accession: str) -> dict:
+    entry_id, name = UNIPROT_ENTRIES[accession]
+    return {
+        "primaryAccession": accession,
+        "secondaryAccessions": [f"Q{accession[1:]}"],
+        "uniProtkbId": entry_id,
+        "annotationScore": 5.0,
+        "proteinDescription": {
+            "recommendedName": {"fullName": {"value": name}, "ecNumbers": None}
+        },
+    }
+
+
+def uniprot_response(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/accessions"):
+        requested = request.url.params["accessions"].split(",")
+        results = [
+            uniprot_entry(accession)
+            for accession in UNIPROT_ENTRIES
+            if accession in requested or f"Q{accession[1:]}" in requested
+        ]
+        return httpx.Response(200, json={"results": results})
+
+    accession = request.url.path.split("/")[-1].removesuffix(".json")
+    if accession not in UNIPROT_ENTRIES:
+        return httpx.Response(404)
+
+    return httpx.Response(200, json=uniprot_entry(accession))
+
+
+def pubchem_compound(cid: int) -> dict:
+    return {
+        "id": {"id": {"cid": cid}},
+        "props": [
+            {
+                "urn": {"label": "IUPAC Name", "name": "Preferred"},
+                "value": {"sval": PUBCHEM_NAMES[cid]},
+            },
+            {"urn": {"label": "InChIKey"}, "value": {"sval": f"KEY-{cid}"}},
+        ],
+    }
+
+
+def pubchem_response(request: httpx.Request) -> httpx.Response:
+    cids = [int(cid) for cid in request.url.path.split("/")[-3].split(",")]
+
+    if any(cid not in PUBCHEM_NAMES for cid in cids):
+        # PubChem rejects a request as soon as one CID is unknown
+        return httpx.Response(404)
+
+    return httpx.Response(
+        200, json={"PC_Compounds": [pubchem_compound(cid) for cid in cids]}
+    )
+
+
+def chebi_response(request: httpx.Request) -> httpx.Response:
+    terms = request.url.params["term"].split(" OR ")
+    results = [
+        {"_source": {"chebi_accession": term, "ascii_name": CHEBI_NAMES[term]}}
+        for term in terms
+        if term in CHEBI_NAMES
+    ]
+
+    return httpx.Response(
+        200, json={"results": results, "total": len(results), "number_pages": 1}
+    )
+
+
+class TestFetchBatch:
+    def test_uniprot(self, httpx_mock: HTTPXMock, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(uniprot, "BATCH_SIZE", 2)
+        httpx_mock.add_callback(uniprot_response, is_reusable=True)
+        ids = ["P69905", "uniprot:p07327", "INVALID", "Q00330", "P69905"]
+
+        # Act
+        proteins = fetch_uniprot_batch(ids, vessel_id="v0", return_exceptions=True)
+
+        # Assert
+        assert [p.ld_id for p in proteins[:2]] == ["uniprot:P69905", "uniprot:P07327"]
+        assert isinstance(proteins[2], ConnectionError)
+        assert proteins[3].ld_id == "uniprot:P00330", "Secondary accession not mapped"
+        assert proteins[4].ld_id == "uniprot:P69905"
+        assert all(
+            p.vessel_id == "v0" for p in proteins if not isinstance(p, Exception)
+        )
+
+        urls = [request.url for request in httpx_mock.get_requests()]
+        assert len(urls) == 3, "Duplicate or resolved IDs are requested again"
+        assert sum(url.path.endswith("/accessions") for url in urls) == 2
+        assert urls[-1].path.endswith("/INVALID.json")
+
+    def test_uniprot_raises(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(uniprot_response, is_reusable=True)
+
+        # Act & Assert
+        with pytest.raises(ConnectionError, match="INVALID"):
+            fetch_uniprot_batch(["P69905", "INVALID"])
+
+    def test_pubchem(self, httpx_mock: HTTPXMock, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(pubchem, "BATCH_SIZE", 2)
+        httpx_mock.add_callback(pubchem_response, is_reusable=True)
+        cids = ["702", "pubchem:962", "177", "1", "ethanol"]
+
+        # Act
+        molecules = fetch_pubchem_batch(cids, return_exceptions=True)
+
+        # Assert
+        assert [m.id for m in molecules[:3]] == ["ethanol", "oxidane", "acetaldehyde"]
+        assert molecules[0].inchikey == "KEY-702"
+        assert isinstance(molecules[3], ValueError), "Unknown CID is not reported"
+        assert isinstance(molecules[4], ValueError), "Invalid CID is not reported"
+
+        # One chunk succeeds, the other fails and falls back to single CIDs
+        assert len(httpx_mock.get_requests()) == 4
+
+    def test_chebi(self, httpx_mock: HTTPXMock, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(chebi, "BATCH_SIZE", 10)
+        httpx_mock.add_callback(chebi_response, is_reusable=True)
+
+        # Act
+        molecules = fetch_chebi_batch(
+            ["CHEBI:15377", "16236", "CHEBI:1"], return_exceptions=True
+        )
+
+        # Assert
+        assert [m.id for m in molecules[:2]] == ["water", "ethanol"]
+        assert isinstance(molecules[2], ChEBIError)
+        assert len(httpx_mock.get_requests()) == 2
+
+        with pytest.raises(ChEBIError):
+            fetch_chebi_batch(["CHEBI:15377", "CHEBI:1"])
+
+    def test_cache(self, tmp_path, httpx_mock: HTTPXMock):
+        # Arrange
+        cache = set_fetcher_cache(FetcherCache(tmp_path / "fetcher.sqlite"))
+        httpx_mock.add_callback(
+            chebi_response,
+            url=re.compile(re.escape(chebi.ChEBIClient.SEARCH_URL) + ".*"),
+            is_reusable=True,
+        )
+
+        try:
+            # Act
+            fetch_chebi_batch(["CHEBI:15377"])
+            molecules = fetch_chebi_batch(["CHEBI:15377", "CHEBI:16236"])
+        finally:
+            set_fetcher_cache(None)
+            cache.close()
+
+        # Assert
+        assert [m.id for m in molecules] == ["water", "ethanol"]
+        assert cache.hits == 1
+        requested = [r.url.params["term"] for r in httpx_mock.get_requests()]
+        assert requested == ["CHEBI:15377", "CHEBI:16236"]
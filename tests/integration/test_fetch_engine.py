@@ -0,0 +1,254 @@
+import asyncio
+import re
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import pyenzyme as pe
+from pyenzyme.fetcher import FetchEngine, fetch_chebi_async, fetch_rhea_async
+from pyenzyme.fetcher.chebi import ChEBIClient
+from pyenzyme.fetcher.rhea import RheaClient
+
+CHEBI_ENTRIES = {
+    "CHEBI:15377": "water",
+    "CHEBI:16236": "ethanol",
+    "CHEBI:15343": "acetaldehyde",
+}
+
+
+def chebi_response(request: httpx.Request) -> httpx.Response:
+    """Answers a ChEBI search request with a minimal entry."""
+    chebi_id = request.url.params["term"]
+
+    if chebi_id not in CHEBI_ENTRIES:
+        return httpx.Response(200, json={"results": [], "total": 0, "number_pages": 0})
+
+    source = {
+        "chebi_accession": chebi_id,
+        "ascii_name": CHEBI_ENTRIES[chebi_id],
+        "inchikey": f"{CHEBI_ENTRIES[chebi_id].upper()}-KEY",
+    }
+
+    return httpx.Response(
+        200,
+        json={"results": [{"_source": source}], "total": 1, "number_pages": 1},
+    )
+
+
+class TestFetchEngine:
+    def test_concurrency_limit(self, httpx_mock: HTTPXMock):
+        # Arrange
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_response(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        httpx_mock.add_callback(slow_response, is_reusable=True)
+
+        async def main():
+            async with FetchEngine(max_concurrency=3, default_rate=None) as engine:
+                await asyncio.gather(
+                    *(engine.get(f"https://test_url/{i}") for i in range(12))
+                )
+                return engine.requests
+
+        # Act
+        requests = asyncio.run(main())
+
+        # Assert
+        assert requests == 12
+        assert max_in_flight == 3, "Requests in flight are not bounded"
+
+    def test_rate_limit(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_response(json={}, is_reusable=True)
+
+        async def main():
+            async with FetchEngine(rate_limits={"test_url": 50.0}) as engine:
+                start = time.monotonic()
+                await asyncio.gather(
+                    *(engine.get(f"https://test_url/{i}") for i in range(6))
+                )
+                return time.monotonic() - start
+
+        # Act
+        elapsed = asyncio.run(main())
+
+        # Assert
+        assert elapsed >= 5 / 50.0 * 0.9, "Requests to the host are not spaced"
+
+    def test_rate_limit_keeps_slots_free(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_response(json={}, is_reusable=True)
+
+        async def main():
+            async with FetchEngine(
+                max_concurrency=2, rate_limits={"slow_url": 10.0}, default_rate=None
+            ) as engine:
+                slow = asyncio.gather(
+                    *(engine.get(f"https://slow_url/{i}") for i in range(6))
+                )
+
+                # Lets the slow requests queue up for their host first
+                await asyncio.sleep(0.01)
+                start = time.monotonic()
+                await engine.get("https://fast_url/0")
+                elapsed = time.monotonic() - start
+                await slow
+                return elapsed
+
+        # Act
+        elapsed = asyncio.run(main())
+
+        # Assert
+        assert elapsed < 0.2, "Rate-limited requests block other hosts"
+
+    def test_retry_failed_request(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(json={"ok": True})
+
+        async def main():
+            async with FetchEngine() as engine:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await engine.get("https://test_url/0")
+
+                response = await engine.get("https://test_url/0")
+                return response.json(), engine.requests
+
+        # Act
+        content, requests = asyncio.run(main())
+
+        # Assert
+        assert content == {"ok": True}, "Failed response was replayed"
+        assert requests == 2
+
+    def test_coalesce_requests(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(chebi_response, is_reusable=True)
+
+        async def main():
+            async with FetchEngine() as engine:
+                molecules = await asyncio.gather(
+                    *(fetch_chebi_async("CHEBI:15377", engine) for _ in range(5)),
+                    fetch_chebi_async("16236", engine, vessel_id="v0"),
+                )
+                return molecules, engine.requests
+
+        # Act
+        molecules, requests = asyncio.run(main())
+
+        # Assert
+        assert requests == 2, "Identical requests are not coalesced"
+        assert [m.id for m in molecules] == ["water"] * 5 + ["ethanol"]
+        assert molecules[-1].vessel_id == "v0"
+        assert molecules[0].inchikey == "WATER-KEY"
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_fetch_errors(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(
+            chebi_response,
+            url=httpx.URL(ChEBIClient.SEARCH_URL, params=self._params("CHEBI:1")),
+        )
+        httpx_mock.add_response(
+            status_code=404,
+            url=httpx.URL(ChEBIClient.SEARCH_URL, params=self._params("CHEBI:2")),
+        )
+
+        async def main(chebi_id: str):
+            async with FetchEngine() as engine:
+                return await fetch_chebi_async(chebi_id, engine)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            asyncio.run(main("CHEBI:1"))
+
+        with pytest.raises(ValueError):
+            asyncio.run(main("CHEBI:2"))
+
+    def test_fetch_rhea(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(
+            chebi_response,
+            url=re.compile(re.escape(ChEBIClient.SEARCH_URL) + ".*"),
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            text=(
+                "Reaction identifier\tEquation\tChEBI identifier\n"
+                "RHEA:1\tethanol = acetaldehyde + water\t"
+                "CHEBI:16236;CHEBI:15343;CHEBI:15377\n"
+            ),
+            url=httpx.URL(RheaClient.BASE_URL.format("1", "tsv")),
+        )
+        httpx_mock.add_response(
+            json={
+                "count": 1,
+                "results": [
+                    {
+                        "id": "1",
+                        "equation": "ethanol = acetaldehyde + water",
+                        "balanced": True,
+                        "transport": False,
+                    }
+                ],
+            },
+            url=httpx.URL(RheaClient.BASE_URL.format("1", "json")),
+        )
+
+        async def main():
+            async with FetchEngine() as engine:
+                return await fetch_rhea_async("RHEA:1", engine)
+
+        # Act
+        reaction, small_molecules = asyncio.run(main())
+
+        # Assert
+        assert [r.species_id for r in reaction.reactants] == ["ethanol"]
+        assert [p.species_id for p in reaction.products] == ["acetaldehyde", "water"]
+        assert [sm.id for sm in small_molecules] == ["ethanol", "acetaldehyde", "water"]
+        assert reaction.id == "RHEA:1"
+
+    def test_compose(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(chebi_response, is_reusable=True)
+
+        # Act
+        doc = pe.compose(
+            name="test",
+            small_molecules=["CHEBI:16236", "CHEBI:15377", "CHEBI:15377"],
+            vessel=pe.Vessel(id="v0", name="vessel", volume=1, unit="ml"),
+        )
+
+        # Assert
+        assert [sm.id for sm in doc.small_molecules] == ["ethanol", "water"]
+        assert all(sm.vessel_id == "v0" for sm in doc.small_molecules)
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_compose_invalid_id(self, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(chebi_response, is_reusable=True)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="CHEBI:1"):
+            pe.compose(name="test", small_molecules=["CHEBI:15377", "CHEBI:1"])
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            FetchEngine(max_concurrency=0)
+
+        with pytest.raises(ValueError):
+            FetchEngine(rate_limits={"test_url": 0.0})
+
+    @staticmethod
+    def _params(chebi_id: str) -> dict:
+        return {"term": chebi_id, "page": "1", "size": "1"}
@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pyenzyme.fetcher import (
+    FetchEngine,
+    FetcherCache,
+    fetch_chebi,
+    fetch_chebi_async,
+    set_fetcher_cache,
+)
+from pyenzyme.fetcher.chebi import ChebiSearchSource
+
+
+def chebi_response(request: httpx.Request) -> httpx.Response:
+    """Answers a ChEBI search request with a minimal entry."""
+    source = {"chebi_accession": request.url.params["term"], "ascii_name": "water"}
+
+    return httpx.Response(
+        200,
+        json={"results": [{"_source": source}], "total": 1, "number_pages": 1},
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = set_fetcher_cache(FetcherCache(tmp_path / "fetcher.sqlite"))
+    yield cache
+    set_fetcher_cache(None)
+    cache.close()
+
+
+class TestFetcherCache:
+    def test_get_set(self, tmp_path):
+        # Arrange
+        path = tmp_path / "fetcher.sqlite"
+        source = ChebiSearchSource(chebi_accession="CHEBI:15377", ascii_name="water")
+
+        # Act
+        cache = FetcherCache(path)
+        cache.set("chebi", "CHEBI:15377", source)
+        cache.close()
+
+        cache = FetcherCache(path)
+        cached = cache.get("chebi", "CHEBI:15377")
+
+        # Assert
+        assert isinstance(cached, ChebiSearchSource)
+        assert cached == source
+        assert cache.get("chebi", "CHEBI:1") is None
+        assert cache.get("pubchem", "CHEBI:15377") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+        assert len(cache) == 1
+
+    def test_ttl(self):
+        # Arrange
+        cache = FetcherCache(":memory:", ttl=0.05)
+        cache.set("chebi", "CHEBI:15377", "water")
+
+        # Act
+        fresh = cache.get("chebi", "CHEBI:15377")
+        time.sleep(0.1)
+        expired = cache.get("chebi", "CHEBI:15377")
+        cache.offline = True
+        stale = cache.get("chebi", "CHEBI:15377")
+
+        # Assert
+        assert fresh == "water"
+        assert expired is None, "Expired entry is served"
+        assert stale == "water", "Expired entry is not served offline"
+
+    def test_lru_eviction(self):
+        # Arrange
+        entry = "x" * 1000
+        cache = FetcherCache(":memory:", max_size=3500)
+
+        # Act
+        for key in ["a", "b", "c"]:
+            cache.set("test", key, entry)
+            time.sleep(0.01)
+
+        cache.get("test", "a")
+        cache.set("test", "d", entry)
+
+        # Assert
+        assert len(cache) == 3
+        assert cache.size <= 3500
+        assert cache.get("test", "b") is None, "Least recently used entry is kept"
+        assert cache.get("test", "a") == entry, "Recently used entry is evicted"
+
+    def test_fetch_chebi(self, cache, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(chebi_response, is_reusable=True)
+
+        async def fetch_async():
+            async with FetchEngine() as engine:
+                return await fetch_chebi_async("CHEBI:15377", engine, vessel_id="v0")
+
+        # Act
+        first = fetch_chebi("CHEBI:15377")
+        second = fetch_chebi("15377", smallmol_id="h2o")
+        third = asyncio.run(fetch_async())
+
+        # Assert
+        assert len(httpx_mock.get_requests()) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert first.id == "water"
+        assert second.id == "h2o", "Custom ID is not applied to cached entry"
+        assert third.vessel_id == "v0"
+
+    def test_offline(self, cache, httpx_mock: HTTPXMock):
+        # Arrange
+        httpx_mock.add_callback(chebi_response)
+        fetch_chebi("CHEBI:15377")
+
+        # Act
+        cache.offline = True
+        water = fetch_chebi("CHEBI:15377")
+
+        # Assert
+        assert water.id == "water"
+        with pytest.raises(ConnectionError):
+            fetch_chebi("CHEBI:16236")
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            FetcherCache(":memory:", ttl=0)
+
+        with pytest.raises(ValueError):
+            FetcherCache(":memory:", max_size=-1)
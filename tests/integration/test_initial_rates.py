@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.versions import v2
+
+pytest.importorskip("scipy")
+
+from pyenzyme.thinlayers.initial_rates import (  # noqa: E402
+    ThinLayerInitialRates,
+    estimate_initial_rates,
+)
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy  # noqa: E402
+
+TRUTH = {"k_cat": 0.85, "K_M": 82.0, "k_ie": 0.0012}
+
+
+class TestInitialRates:
+    def test_estimate_initial_rates(self):
+        # Arrange
+        time = [0.0, 1.0, 2.0, 3.0, 4.0]
+        shifted = [10.0, 11.0, 12.0, 13.0]
+        measurements = [
+            self._measurement("m0", {"s": (time, [1.0 + 2.0 * t for t in time])}),
+            self._measurement(
+                "m1", {"s": (time, [5.0 - 3.0 * t + t**2 for t in time])}
+            ),
+            self._measurement("m2", {"s": (shifted, [4.0 * t for t in shifted])}),
+            self._measurement(
+                "m3", {"s": (time, [0.5 * t if t != 1.0 else np.nan for t in time])}
+            ),
+            self._measurement("m4", {"p": (time, [1.0] * 5)}),
+        ]
+
+        # Act
+        rates = estimate_initial_rates(measurements, ["s", "p"], n_points=4, degree=2)
+
+        # Assert
+        assert rates.shape == (5, 2)
+        assert rates[0, 0] == pytest.approx(2.0)
+        assert rates[1, 0] == pytest.approx(-3.0), "Slope is not taken at the start"
+        assert rates[2, 0] == pytest.approx(4.0), "Time grids are mixed up"
+        assert rates[3, 0] == pytest.approx(0.5), "Missing observation is not skipped"
+        assert rates[4, 1] == pytest.approx(0.0)
+        assert np.isnan(rates[:4, 1]).all(), "Unobserved species got a rate"
+        assert np.isnan(rates[4, 0])
+
+    def test_optimize(self):
+        # Arrange
+        doc = self._create_screen(n_wells=24)
+        layer = ThinLayerInitialRates(doc, n_points=5, degree=2)
+
+        # Act
+        result = layer.optimize()
+        opt_doc = layer.write()
+
+        # Assert
+        assert result.success
+        assert set(result.params) == {"k_cat", "K_M"}, (
+            "k_ie does not affect the initial rates and must not be fitted"
+        )
+        assert list(layer.rates.columns) == ["abts"]
+        assert len(layer.rates) == 24
+
+        for param in opt_doc.parameters:
+            assert param.value == pytest.approx(TRUTH[param.symbol], rel=0.02), (
+                f"{param.symbol} is not correct, got {param.value}"
+            )
+
+        assert layer.objective_value() == pytest.approx(2 * result.cost)
+
+    def test_jacobian(self):
+        # Arrange
+        layer = ThinLayerInitialRates(self._create_screen(n_wells=6))
+        layer.optimize(max_nfev=1)
+
+        theta = layer._parameter_vector()
+        x = theta[layer._fit_index]
+
+        # Act
+        jacobian = layer._calculate_rate_jacobian(x, theta)
+
+        # Assert
+        residual = layer._calculate_rate_residual(x, theta)
+        for k in range(len(x)):
+            step = np.zeros_like(x)
+            step[k] = 1e-6 * x[k]
+            numeric = (
+                layer._calculate_rate_residual(x + step, theta) - residual
+            ) / step[k]
+
+            assert jacobian[:, k] == pytest.approx(numeric, rel=1e-4, abs=1e-10)
+
+    def test_invalid_window(self):
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        with pytest.raises(ValueError):
+            ThinLayerInitialRates(doc, n_points=2, degree=2)
+
+        with pytest.raises(ValueError):
+            ThinLayerInitialRates(doc, degree=0)
+
+    @staticmethod
+    def _measurement(id: str, series: dict) -> v2.Measurement:
+        measurement = v2.Measurement(id=id, name=id)
+
+        for species_id, (time, data) in series.items():
+            measurement.add_to_species_data(
+                species_id=species_id, initial=data[0], time=time, data=data
+            )
+
+        return measurement
+
+    @staticmethod
+    def _create_screen(n_wells: int) -> v2.EnzymeMLDocument:
+        """Simulates noise-free time courses of a substrate screen."""
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        doc.measurements = doc.measurements[:1]
+
+        simulator = ThinLayerScipy(doc, rtol=1e-10, atol=1e-12)
+        simulator.set_start_values(TRUTH)
+
+        substrate = np.geomspace(5.0, 500.0, n_wells)
+        times = np.linspace(0.0, 300.0, 7)
+        results = simulator.integrate_batch(
+            simulator.enzmldoc,
+            [{"abts": float(s), "slac": 0.079} for s in substrate],
+            [times] * n_wells,
+        )
+
+        measurements = []
+        for i, (s0, (trajectories, _)) in enumerate(zip(substrate, results)):
+            measurement = v2.Measurement(id=f"well{i}", name=f"well{i}")
+            measurement.add_to_species_data(
+                species_id="abts",
+                initial=float(s0),
+                time=times.tolist(),
+                data=trajectories["abts"],
+            )
+            measurement.add_to_species_data(species_id="slac", initial=0.079)
+            measurements.append(measurement)
+
+        doc.measurements = measurements
+
+        for param in doc.parameters:
+            param.value = {"k_cat": 0.5, "K_M": 50.0}.get(param.symbol, TRUTH["k_ie"])
+
+        return doc
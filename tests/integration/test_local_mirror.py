@@ -0,0 +1,215 @@
+import gzip
+import json
+import re
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pyenzyme.fetcher import (
+    LocalMirror,
+    fetch_chebi,
+    fetch_chebi_batch,
+    fetch_rhea,
+    set_local_mirror,
+)
+from pyenzyme.fetcher.chebi import search_chebi
+from pyenzyme.fetcher.rhea import RheaClient
+
+CHEBI_ENTRIES = {
+    "CHEBI:15377": ("water", "O", "XLYOFNOQVPJJNP-UHFFFAOYSA-N", ["oxidane", "H2O"]),
+    "CHEBI:16236": ("ethanol", "CCO", "LFQSCWFLJHTTHZ-UHFFFAOYSA-N", ["ethyl alcohol"]),
+    "CHEBI:15343": ("acetaldehyde", "CC=O", "IKHGUXGNUITLKF-UHFFFAOYSA-N", []),
+    "CHEBI:57540": ("NAD(+)", "NC(=O)c1ccc[n+]c1", "BAWFJGJZGIEFAR-NKWVEPMBSA-M", []),
+    "CHEBI:57945": ("NADH", "NC(=O)C1=CN(C=CC1)", "BOPGDPNILDQYTO-NKWVEPMBSA-L", []),
+    "CHEBI:15378": ("hydron", "[H+]", "GPRLSGONYQIRFK-UHFFFAOYSA-N", ["H+"]),
+}
+
+RHEA_FLAT_FILE = """ENTRY       RHEA:25290
+DEFINITION  ethanol + NAD(+) = acetaldehyde + H(+) + NADH
+EQUATION    CHEBI:16236 + CHEBI:57540 = CHEBI:15343 + CHEBI:15378 + CHEBI:57945
+///
+"""
+
+RHEA_TSV = (
+    "Reaction identifier\tEquation\tChEBI identifier\n"
+    "RHEA:25290\tethanol + NAD(+) = acetaldehyde + H(+) + NADH\t"
+    "CHEBI:16236;CHEBI:57540;CHEBI:15343;CHEBI:15378;CHEBI:57945\n"
+)
+
+RHEA_JSON = {
+    "count": 1,
+    "results": [
+        {
+            "id": "25290",
+            "equation": "ethanol + NAD(+) = acetaldehyde + H(+) + NADH",
+            "balanced": True,
+            "transport": False,
+        }
+    ],
+}
+
+
+def write_sdf(path):
+    records = []
+    for accession, (name, smiles, inchikey, synonyms) in CHEBI_ENTRIES.items():
+        fields = {
+            "ChEBI ID": accession,
+            "ChEBI Name": name,
+            "Star": "3",
+            "SMILES": smiles,
+            "InChIKey": inchikey,
+            "Charge": "0",
+            "Mass": "18.01528",
+            "Synonyms": "\n".join(synonyms),
+        }
+        data = "".join(
+            f"> <{key}>\n{value}\n\n" for key, value in fields.items() if value
+        )
+        records.append(
+            f"\n  Marvin\n\n  0  0  0  0  0  0  0  0  0  0999 V2000\nM  END\n{data}$$$$\n"
+        )
+
+    with gzip.open(path, "wt") as handle:
+        handle.write("".join(records))
+
+    return path
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = LocalMirror(tmp_path / "mirror.sqlite")
+    mirror.import_chebi(write_sdf(tmp_path / "chebi.sdf.gz"))
+    (tmp_path / "rhea-reactions.txt").write_text(RHEA_FLAT_FILE)
+    mirror.import_rhea(tmp_path / "rhea-reactions.txt")
+    (tmp_path / "rhea.json").write_text(json.dumps(RHEA_JSON))
+    mirror.import_rhea(tmp_path / "rhea.json")
+
+    set_local_mirror(mirror)
+    yield mirror
+    set_local_mirror(None)
+    mirror.close()
+
+
+@pytest.fixture
+def chebi_mirror(tmp_path):
+    mirror = LocalMirror(tmp_path / "chebi.sqlite")
+    mirror.import_chebi(write_sdf(tmp_path / "chebi-only.sdf.gz"))
+
+    yield mirror
+    set_local_mirror(None)
+    mirror.close()
+
+
+class TestLocalMirror:
+    def test_import(self, mirror, tmp_path):
+        # Arrange
+        (tmp_path / "rhea.tsv").write_text(RHEA_TSV)
+
+        # Act
+        n_reactions = mirror.import_rhea(tmp_path / "rhea.tsv")
+
+        # Assert
+        assert n_reactions == 1
+        assert mirror.n_chebi == len(CHEBI_ENTRIES)
+        assert mirror.n_rhea == 1
+
+        with pytest.raises(ValueError):
+            mirror.import_chebi(tmp_path / "rhea.tsv")
+
+    def test_lookup(self, mirror):
+        # Act
+        water = mirror.get_chebi("15377")
+        ethanol = mirror.get_chebi_by_inchikey("lfqscwfljhtthz-uhfffaoysa-n")
+        reaction = mirror.get_rhea("RHEA:25290")
+
+        # Assert
+        assert water.ascii_name == "water"
+        assert water.smiles == "O"
+        assert water.stars == 3
+        assert [source.chebi_accession for source in ethanol] == ["CHEBI:16236"]
+        assert reaction.chebi_ids[:2] == ["CHEBI:16236", "CHEBI:57540"]
+        assert reaction.json_content.balanced is True
+        assert reaction.json_content.transport is False
+        assert mirror.get_chebi("CHEBI:1") is None
+        assert mirror.get_rhea("1") is None
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("water", "CHEBI:15377"),
+            ("Oxidane", "CHEBI:15377"),
+            ("ethyl", "CHEBI:16236"),
+            ("acetaldehyd", "CHEBI:15343"),
+            ("ethanl", "CHEBI:16236"),
+        ],
+    )
+    def test_search(self, mirror, query, expected):
+        # Act
+        results = mirror.search_chebi(query)
+
+        # Assert
+        assert results[0].chebi_accession == expected
+
+    def test_fetchers(self, mirror, httpx_mock: HTTPXMock):
+        # Act
+        water = fetch_chebi("CHEBI:15377", vessel_id="v0")
+        molecules = fetch_chebi_batch(["CHEBI:16236", "15343"])
+        reaction, small_molecules = fetch_rhea("RHEA:25290")
+        results = search_chebi("NADH")
+
+        # Assert
+        assert water.name == "water"
+        assert water.vessel_id == "v0"
+        assert [m.name for m in molecules] == ["ethanol", "acetaldehyde"]
+        assert reaction.id == "RHEA:25290"
+        assert reaction.reversible is True
+        assert len(reaction.reactants) == 2
+        assert len(reaction.products) == 3
+        assert len(small_molecules) == 5
+        assert results[0].name == "NADH"
+        assert not httpx_mock.get_requests(), "Mirrored entries are requested"
+
+    def test_rhea_matches_api(self, mirror, chebi_mirror, httpx_mock: HTTPXMock):
+        # Arrange
+        self.add_rhea_responses(httpx_mock)
+        mirrored, _ = fetch_rhea("RHEA:25290")
+        set_local_mirror(chebi_mirror)
+
+        # Act
+        fetched, _ = fetch_rhea("RHEA:25290")
+
+        # Assert
+        assert len(httpx_mock.get_requests()) == 2
+        assert self.without_ld_ids(mirrored) == self.without_ld_ids(fetched)
+
+    def test_rhea_without_flags(self, chebi_mirror, tmp_path, httpx_mock: HTTPXMock):
+        # Arrange
+        self.add_rhea_responses(httpx_mock)
+        (tmp_path / "rhea-reactions.txt").write_text(RHEA_FLAT_FILE)
+        chebi_mirror.import_rhea(tmp_path / "rhea-reactions.txt")
+        set_local_mirror(chebi_mirror)
+
+        # Act
+        reaction, _ = fetch_rhea("RHEA:25290")
+
+        # Assert
+        assert chebi_mirror.get_rhea("RHEA:25290") is None
+        assert len(httpx_mock.get_requests()) == 2, "Reaction was not requested"
+        assert reaction.reversible is True
+
+    @staticmethod
+    def without_ld_ids(reaction):
+        # JSON-LD IDs are random UUIDs
+        return re.sub(r'"ld_id":"[^"]*"', "", reaction.model_dump_json())
+
+    @staticmethod
+    def add_rhea_responses(httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=RHEA_TSV,
+            url=httpx.URL(RheaClient.BASE_URL.format("25290", "tsv")),
+        )
+        httpx_mock.add_response(
+            json=RHEA_JSON,
+            url=httpx.URL(RheaClient.BASE_URL.format("25290", "json")),
+        )
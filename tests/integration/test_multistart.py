@@ -0,0 +1,59 @@
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.thinlayers import MultiStart
+
+pytest.importorskip("scipy")
+
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy  # noqa: E402
+
+# Bounds spanning several orders of magnitude around the known optimum
+BOUNDS = {
+    "k_cat": (0.01, 10.0),
+    "K_M": (1.0, 1000.0),
+    "k_ie": (1e-5, 0.1),
+}
+
+
+class TestMultiStart:
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_run(self, n_workers):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        for param in doc.parameters:
+            param.lower_bound, param.upper_bound = BOUNDS[param.symbol]
+
+        multistart = MultiStart(
+            ThinLayerScipy(doc),
+            n_starts=8,
+            scale="log",
+            n_workers=n_workers,
+            seed=0,
+        )
+
+        # Act
+        best = multistart.run()
+        opt_doc = multistart.write()
+
+        # Assert
+        assert best.ok, "Best fit failed"
+        assert multistart.thinlayer.objective_value() == pytest.approx(
+            best.objective, rel=1e-4
+        ), "Thin layer was not refitted from the best fit"
+
+        expected = {"k_cat": 0.85, "K_M": 82.0, "k_ie": 0.0012}
+        for param in opt_doc.parameters:
+            assert param.value == pytest.approx(expected[param.symbol], rel=0.1), (
+                f"{param.symbol} is not correct, got {param.value}"
+            )
+
+        summary = multistart.to_pandas()
+        assert len(summary) == len(multistart.results)
+        assert summary["objective"].iloc[0] == pytest.approx(best.objective)
+
+        # The wrapped document is unchanged, hence still accepted for integration
+        assert multistart.thinlayer.enzmldoc == doc, "Wrapped document was modified"
+        multistart.thinlayer.integrate(
+            model=doc, initial_conditions={"abts": 100.0, "slac": 0.079}, t0=0, t1=10
+        )
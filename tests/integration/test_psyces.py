@@ -1,7 +1,11 @@
 import tempfile
 
+import numpy as np
 import pytest
 import pyenzyme as pe
+from pyenzyme.thinlayers.cache import ModelCache
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy
+from pyenzyme.thinlayers.solver import SolverSettings
 from pyenzyme.thinlayers.psyces import ThinLayerPysces
 from pyenzyme.versions import v2
 
@@ -39,6 +43,223 @@ class TestPsycesThinLayer:
                 f"K_M is not correct, got {K_M.value}"
             )
 
+    def test_optimize_worker_pool(self):
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with ThinLayerPysces(doc, tmp_dir, n_workers=1) as layer:
+                serial = layer.optimize()
+
+            with ThinLayerPysces(doc, tmp_dir, n_workers=2) as layer:
+                pooled = layer.optimize()
+                pool = layer._pool
+                finalizer = layer._pool_finalizer
+
+                # Repeated optimizations reuse the running pool
+                layer.optimize()
+
+                assert pool is not None, "Worker pool is not started"
+                assert layer._pool is pool, "Worker pool is not reused"
+
+            assert layer._pool is None, "Worker pool is not closed"
+            assert not finalizer.alive, "Finalizer still holds the closed pool"
+
+            for name in serial.params:
+                assert pooled.params[name].value == pytest.approx(
+                    serial.params[name].value, rel=1e-6
+                ), f"{name} differs between serial and pooled simulation"
+
+    def test_residual_missing_observations(self):
+        """Test that missing observations do not contribute to the residuals"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        species_data = next(s for s in doc.measurements[0].species_data if s.data)
+        species_data.data[3] = float("nan")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with ThinLayerPysces(doc, tmp_dir, n_workers=1) as layer:
+                layer._get_experimental_data()
+                parameters = layer._initialize_parameters()
+
+                # Act
+                residual = layer._calculate_residual(parameters)
+                result = layer.optimize()
+
+        # Assert
+        column = layer.cols.index(species_data.species_id)
+
+        assert residual.shape == layer.experimental_data.shape
+        assert residual[3, column] == 0.0, "Missing observation is not masked"
+        assert np.isfinite(residual).all(), "Residuals contain NaN"
+        assert result.success, "Optimization did not converge"
+
+    def test_model_cache(self):
+        """Test that cached models give the same fit as freshly compiled ones"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ModelCache(directory=f"{tmp_dir}/cache")
+
+            # Act
+            compiled = ThinLayerPysces(doc, tmp_dir, n_workers=1, cache=None)
+            first = ThinLayerPysces(doc, tmp_dir, n_workers=1, cache=cache)
+            from_memory = ThinLayerPysces(doc, tmp_dir, n_workers=1, cache=cache)
+
+            # A new process starts with an empty memory but shares the directory
+            cache.clear()
+            from_disk = ThinLayerPysces(doc, tmp_dir, n_workers=1, cache=cache)
+
+            results = [
+                layer.optimize() for layer in (compiled, first, from_memory, from_disk)
+            ]
+
+        # Assert
+        assert len(cache) == 1
+        assert from_memory.model is not first.model, "Cached model is shared"
+
+        for result in results[1:]:
+            for name in results[0].params:
+                assert result.params[name].value == pytest.approx(
+                    results[0].params[name].value, rel=1e-6
+                ), f"{name} differs between compiled and cached model"
+
+    def test_model_cache_values(self):
+        """Test that cached models take the values of the document"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        other = doc.model_copy(deep=True)
+        other.parameters[0].value = 4.2
+        other.measurements = other.measurements[1:]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ModelCache(directory=f"{tmp_dir}/cache")
+            ThinLayerPysces(doc, tmp_dir, n_workers=1, cache=cache)
+
+            # Act
+            compiled = ThinLayerPysces(other, tmp_dir, n_workers=1, cache=None)
+            from_memory = ThinLayerPysces(other, tmp_dir, n_workers=1, cache=cache)
+
+            cache.clear()
+            from_disk = ThinLayerPysces(other, tmp_dir, n_workers=1, cache=cache)
+
+        # Assert
+        assert len(cache) == 1, "Values are part of the key"
+        assert compiled.model.k_cat == 4.2
+
+        for layer in (from_memory, from_disk):
+            assert layer.model.k_cat == 4.2, "Cached parameter value is used"
+
+            for species in compiled.model.species:
+                assert getattr(layer.model, f"{species}_init") == pytest.approx(
+                    getattr(compiled.model, f"{species}_init")
+                ), f"Cached default of {species} is used"
+
+    def test_model_cache_zero_value(self):
+        """Test that a cached model matches a fresh compile for zero and unset values"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        other = doc.model_copy(deep=True)
+        other.parameters[0].value = 0.0
+        other.parameters[2].value = None
+        other.parameters[2].initial_value = None
+        initial_conditions = {"abts": 5.0, "slac": 0.079}
+        times = [87.0, 175.0, 262.0, 350.0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ModelCache()
+            ThinLayerPysces(doc, tmp_dir, n_workers=1, cache=cache)
+
+            # Act
+            compiled = ThinLayerPysces(other, tmp_dir, n_workers=1, cache=None)
+            cached = ThinLayerPysces(other, tmp_dir, n_workers=1, cache=cache)
+
+            expected, _ = compiled.integrate(
+                compiled.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+            )
+            result, _ = cached.integrate(
+                cached.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+            )
+
+        # Assert
+        assert len(cache) == 1, "Values are part of the key"
+        assert compiled.model.k_cat == 0.0
+        assert cached.model.k_cat == compiled.model.k_cat, "Cached k_cat is used"
+        assert cached.model.k_ie == compiled.model.k_ie, "Cached k_ie is used"
+
+        for species in expected:
+            assert result[species] == pytest.approx(expected[species]), (
+                f"Trajectory of {species} differs between compiled and cached model"
+            )
+
+    def test_solver_settings(self):
+        """Test that the solver settings are applied and times are evaluated exactly"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        solver = SolverSettings(method="LSODA", rtol=1e-10, atol=1e-12, max_step=50.0)
+        initial_conditions = {"abts": 5.0, "slac": 0.079}
+        times = [87.0, 175.0, 262.0, 350.0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Act
+            layer = ThinLayerPysces(
+                doc, tmp_dir, n_workers=1, cache=None, solver=solver
+            )
+            result, result_time = layer.integrate(
+                layer.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+            )
+
+            # Assert
+            assert layer.model.mode_integrator == "LSODA"
+            assert layer.model.__settings__["lsoda_rtol"] == 1e-10
+            assert layer.model.__settings__["lsoda_hmax"] == 50.0
+
+            with pytest.raises(ValueError):
+                ThinLayerPysces(doc, tmp_dir, solver=SolverSettings(method="BDF"))
+
+            with pytest.raises(ValueError):
+                ThinLayerPysces(doc, tmp_dir, solver=SolverSettings(method="Radau"))
+
+        scipy_layer = ThinLayerScipy(doc, rtol=1e-10, atol=1e-12)
+        expected, _ = scipy_layer.integrate(
+            scipy_layer.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+        )
+
+        assert result_time == times
+        assert result["abts"] == pytest.approx(expected["abts"], rel=1e-6), (
+            "Trajectory differs from the SciPy thin layer"
+        )
+
+    def test_integrate_batch(self):
+        """Test that conditions are integrated on their own time grids"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        solver = SolverSettings(method="LSODA", rtol=1e-10, atol=1e-12)
+        initial_conditions = [{"abts": 5.0, "slac": 0.079}, {"abts": 2.0, "slac": 0.1}]
+        times = [[0.0, 87.0, 175.0], [10.0, 50.0, 100.0, 350.0]]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            layer = ThinLayerPysces(
+                doc, tmp_dir, n_workers=1, cache=None, solver=solver
+            )
+
+            # Act
+            results = layer.integrate_batch(layer.enzmldoc, initial_conditions, times)
+
+        # Assert
+        scipy_layer = ThinLayerScipy(doc, rtol=1e-10, atol=1e-12)
+        expected = scipy_layer.integrate_batch(
+            scipy_layer.enzmldoc, initial_conditions, times
+        )
+
+        assert len(results) == 2
+
+        for (result, result_time), (species, time) in zip(results, expected):
+            assert result_time == time
+            assert result["abts"] == pytest.approx(species["abts"], rel=1e-6), (
+                "Trajectory differs from the batched SciPy thin layer"
+            )
+
     def test_plot(self):
         doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
 
@@ -1,6 +1,11 @@
+import os
+import re
 import tempfile
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 from pydantic import BaseModel
 
 import pyenzyme as pe
@@ -159,6 +164,25 @@ class TestSBML:
             else:
                 raise ValueError("Temperature unit is None")
 
+    def test_temperature_conversion_mixed(self):
+        # Arrange
+        enzmldoc = pe.read_enzymeml("tests/fixtures/petab/enzmldoc_reaction.json")
+        enzmldoc.measurements[0].temperature = 25.0
+        enzmldoc.measurements[0].temperature_unit = "°C"  # type: ignore
+        enzmldoc.measurements[1].temperature = None
+        enzmldoc.measurements[1].temperature_unit = "°C"  # type: ignore
+
+        # Act
+        xml_string, _ = pe.to_sbml(enzmldoc)
+
+        # Assert
+        unit_names = re.findall(r'<unitDefinition id="[^"]+" name="([^"]*)"', xml_string)
+        assert "Kelvin" in unit_names, "Converted temperature unit is missing"
+        assert enzmldoc.measurements[1].temperature_unit.name in unit_names, (
+            "Celsius unit of the measurement without temperature is missing"
+        )
+        assert enzmldoc.measurements[0].temperature == 25.0, "Document was modified"
+
     def set_unit_name_as_id(self, obj):
         for key, value in obj:
             if isinstance(value, pe.UnitDefinition):
@@ -169,3 +193,96 @@ class TestSBML:
                 for item in value:
                     if isinstance(item, BaseModel):
                         self.set_unit_name_as_id(item)
+
+
+class TestSBMLConcurrency:
+    N_CONVERSIONS = 200
+    N_WORKERS = 16
+
+    def test_concurrent_serialization(self):
+        """Test that concurrent exports match the serial export byte for byte"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        celsius_doc = doc.model_copy(deep=True)
+        celsius_doc.measurements = [celsius_doc.measurements[0]]
+        celsius_doc.measurements[0].temperature = 25.0
+        celsius_doc.measurements[0].temperature_unit = "°C"  # type: ignore
+
+        docs = [doc, celsius_doc]
+        expected = [pe.to_sbml(doc)[0] for doc in docs]
+        jobs = [i % len(docs) for i in range(self.N_CONVERSIONS)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=self.N_WORKERS) as pool:
+            results = list(pool.map(lambda i: pe.to_sbml(docs[i])[0], jobs))
+
+        # Assert
+        for i, xml_string in zip(jobs, results):
+            assert xml_string.encode() == expected[i].encode(), (
+                f"Concurrent export of document {i} differs from the serial export"
+            )
+
+    def test_concurrent_parsing(self):
+        """Test that concurrent imports match the serial import"""
+        # Arrange
+        paths = [
+            "tests/fixtures/sbml/odes_example.omex",
+            "tests/fixtures/sbml/v1_example.omex",
+        ]
+        expected = [to_dict_wo_json_ld(pe.from_sbml(path)) for path in paths]
+        jobs = [i % len(paths) for i in range(self.N_CONVERSIONS)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=self.N_WORKERS) as pool:
+            results = list(
+                pool.map(lambda i: to_dict_wo_json_ld(pe.from_sbml(paths[i])), jobs)
+            )
+
+        # Assert
+        for i, dumped in zip(jobs, results):
+            assert dumped == expected[i], (
+                f"Concurrent import of '{paths[i]}' differs from the serial import"
+            )
+
+
+class TestSBMLMemory:
+    # Size of the measurement data in MB. Set PYENZYME_BENCHMARK_MB=500 to run the
+    # benchmark on a 500 MB document.
+    SIZE_MB = float(os.environ.get("PYENZYME_BENCHMARK_MB", 20))
+
+    # Approximate size of a float in a Python list, including the pointer
+    BYTES_PER_VALUE = 32
+
+    def test_export_memory(self):
+        """Test that the SBML export does not copy the measurement data"""
+        # Arrange
+        rng = np.random.default_rng(0)
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        n_series = sum(len(meas.species_data) for meas in doc.measurements)
+        n_points = int(self.SIZE_MB * 1e6 / (n_series * self.BYTES_PER_VALUE))
+        time = np.linspace(0.0, 100.0, n_points).tolist()
+
+        tracemalloc.start()
+
+        try:
+            for meas in doc.measurements:
+                for species_data in meas.species_data:
+                    species_data.time = time
+                    species_data.data = rng.random(n_points).tolist()
+                    species_data.time_unit = "s"  # type: ignore
+
+            doc_size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            # Act
+            pe.to_sbml(doc)
+
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Assert
+        overhead = peak - doc_size
+        assert overhead < 0.75 * doc_size, (
+            f"Export allocated {overhead / 1e6:.1f} MB for a document of {doc_size / 1e6:.1f} MB"
+        )
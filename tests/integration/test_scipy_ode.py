@@ -0,0 +1,294 @@
+import numpy as np
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.versions import v2
+
+pytest.importorskip("scipy")
+
+from pyenzyme.thinlayers.scipy_ode import InitMap, ODESystem, ThinLayerScipy  # noqa: E402
+from pyenzyme.thinlayers.solver import SolverSettings  # noqa: E402
+
+
+class TestScipyThinLayer:
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "tests/fixtures/modeling/enzmldoc_reaction.json",
+            "tests/fixtures/modeling/enzmldoc.json",
+        ],
+    )
+    def test_optimize(self, path):
+        # Arrange
+        doc = pe.read_enzymeml(path)
+        layer = ThinLayerScipy(doc)
+
+        # Act
+        result = layer.optimize()
+        opt_doc = layer.write()
+
+        # Assert
+        assert result.success, "Optimization did not converge"
+
+        k_cat = self._extract_parameter(opt_doc, "k_cat")
+        k_ie = self._extract_parameter(opt_doc, "k_ie")
+        K_M = self._extract_parameter(opt_doc, "K_M")
+
+        expected_km = 82.0
+        expected_kcat = 0.85
+        expected_kie = 0.0012
+
+        assert k_cat.value is not None, "k_cat is not set"
+        assert k_ie.value is not None, "k_ie is not set"
+        assert K_M.value is not None, "K_M is not set"
+
+        assert expected_kcat * 0.95 < k_cat.value < expected_kcat * 1.1, (
+            f"k_cat is not correct, got {k_cat.value}"
+        )
+        assert expected_kie * 0.75 < k_ie.value < expected_kie * 1.1, (
+            f"k_ie is not correct, got {k_ie.value}"
+        )
+        assert expected_km * 0.95 < K_M.value < expected_km * 1.1, (
+            f"K_M is not correct, got {K_M.value}"
+        )
+        assert K_M.stderr is not None, "Standard error of K_M is not set"
+
+    def test_optimize_batched(self):
+        """Test that the batched integration yields the same fit"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        # Act
+        serial = ThinLayerScipy(doc).optimize()
+        batched = ThinLayerScipy(doc, batched=True).optimize()
+
+        # Assert
+        for name, value in serial.params.items():
+            assert batched.params[name] == pytest.approx(value, rel=1e-2), (
+                f"{name} differs between serial and batched integration"
+            )
+
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_optimize_sensitivities(self, batched):
+        """Test that the sensitivity Jacobian yields the finite difference fit"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        # Act
+        numeric = ThinLayerScipy(doc, batched=batched).optimize(jac="3-point")
+        analytic = ThinLayerScipy(doc, batched=batched).optimize(jac="sensitivities")
+
+        # Assert
+        assert analytic.success, "Optimization did not converge"
+
+        for name, value in numeric.params.items():
+            assert analytic.params[name] == pytest.approx(value, rel=1e-2), (
+                f"{name} differs between analytic and finite difference Jacobian"
+            )
+
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_sensitivities(self, batched):
+        """Test that the residual Jacobian matches finite differences"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        layer = ThinLayerScipy(
+            doc, method="BDF", batched=batched, rtol=1e-10, atol=1e-12
+        )
+        layer._get_experimental_data()
+        layer._fit_index = np.arange(len(layer.system.parameters))
+        layer._last_evaluation = None
+
+        theta = layer._parameter_vector()
+        steps = theta * 1e-6
+
+        # Act
+        residual, jacobian = layer._calculate_sensitivities(theta, theta)
+        numeric = np.column_stack(
+            [
+                (
+                    layer._calculate_residual(theta + step * unit, theta)
+                    - layer._calculate_residual(theta - step * unit, theta)
+                )
+                / (2 * step)
+                for step, unit in zip(steps, np.eye(theta.size))
+            ]
+        )
+
+        # Assert
+        assert jacobian.shape == (residual.size, theta.size)
+        assert np.allclose(
+            residual, layer._calculate_residual(theta, theta), atol=1e-6
+        ), "Residuals of the augmented system differ"
+        error = np.abs(jacobian - numeric).max(axis=0) / np.abs(numeric).max(axis=0)
+        assert np.all(error < 1e-4), "Sensitivities do not match finite differences"
+
+    def test_with_sensitivities(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        system = ODESystem.from_enzmldoc(doc)
+
+        # Act
+        augmented = system.with_sensitivities()
+
+        # Assert
+        assert augmented.species[: len(system.species)] == system.species
+        assert augmented.species[len(system.species)] == "d(abts)/d(k_cat)"
+        assert len(augmented.species) == len(system.species) * (
+            1 + len(system.parameters)
+        )
+        assert augmented.parameters == system.parameters
+
+    @pytest.mark.parametrize("method", ["LSODA", "BDF", "Radau", "RK45"])
+    def test_integrate_batch(self, method):
+        """Test that batched conditions match separate integrations"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        layer = ThinLayerScipy(doc, method=method)
+
+        initial_conditions = [
+            {"abts": float(abts), "slac": 0.079} for abts in np.linspace(5, 150, 20)
+        ]
+        times = [np.linspace(i % 2, 10 + i, 5 + i) for i in range(20)]
+
+        # Act
+        batch = layer.integrate_batch(layer.enzmldoc, initial_conditions, times)
+
+        # Assert
+        assert len(batch) == len(initial_conditions)
+
+        for init, time, (result, result_time) in zip(initial_conditions, times, batch):
+            expected = layer._simulate_condition(
+                InitMap(time=time, species=init), layer._parameter_vector()
+            )
+
+            assert result_time == time.tolist(), "Time grid is not preserved"
+            assert np.allclose(result["abts"], expected[:, 0], rtol=1e-4), (
+                "Batched trajectory differs from the separate integration"
+            )
+
+    @pytest.mark.parametrize("method", ["LSODA", "BDF", "Radau"])
+    def test_integrate_times(self, method):
+        """Test that the solution is evaluated at the given time points"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        solver = SolverSettings(
+            method=method, rtol=1e-10, atol=1e-12, max_step=50.0, dense_output=True
+        )
+        layer = ThinLayerScipy(doc, solver=solver)
+        initial_conditions = {"abts": 5.0, "slac": 0.079}
+        times = [87.0, 175.0, 262.0, 350.0]
+
+        # Act
+        result, result_time = layer.integrate(
+            layer.enzmldoc, initial_conditions, 0.0, 0.0, times=times
+        )
+        reference, _ = layer.integrate(
+            layer.enzmldoc, initial_conditions, 0.0, 350.0, nsteps=351
+        )
+
+        # Assert
+        assert result_time == times
+        assert result["abts"] == pytest.approx(
+            [reference["abts"][int(t)] for t in times], rel=1e-8
+        ), "Integration does not start at t0"
+        assert layer.solution is not None, "Dense output was not kept"
+        assert layer.solution(175.0)[0] == pytest.approx(result["abts"][1], rel=1e-6)
+        assert layer.method == method
+
+    def test_solver_settings(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        # Act
+        layer = ThinLayerScipy(doc, method="BDF", rtol=1e-8, atol=1e-10)
+
+        # Assert
+        assert layer.solver == SolverSettings(method="BDF", rtol=1e-8, atol=1e-10)
+        assert layer.solution is None
+
+        with pytest.raises(ValueError):
+            ThinLayerScipy(doc, solver=SolverSettings(method="CVODE"))
+
+    def test_plot(self):
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        layer = ThinLayerScipy(doc)
+        layer.optimize()
+
+        fig, axs = pe.plot(
+            layer.enzmldoc,
+            thinlayer=layer,
+            measurement_ids=["measurement0", "measurement1"],
+        )
+
+        assert fig is not None, "Figure is not created"
+        assert axs is not None, "Axes are not created"
+
+    def test_compile(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        # Act
+        system = ODESystem.from_enzmldoc(doc)
+
+        # Assert
+        assert system.species == ["abts", "abts_radical", "slac", "slac_inactive"]
+        assert system.constants == []
+        assert system.parameters == ["k_cat", "K_M", "k_ie"]
+
+    def test_jacobian(self):
+        """Test that the analytic Jacobian matches finite differences"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        system = ODESystem.from_enzmldoc(doc)
+        y = np.array([50.0, 5.0, 0.08, 0.01])
+        args = np.array([0.85, 82.0, 0.0012])
+        eps = 1e-6
+
+        # Act
+        jac = system.jac(0.0, y, args)
+        numeric = np.column_stack(
+            [
+                (
+                    system.rhs(0.0, y + eps * np.eye(len(y))[i], args)
+                    - system.rhs(0.0, y - eps * np.eye(len(y))[i], args)
+                )
+                / (2 * eps)
+                for i in range(len(y))
+            ]
+        )
+
+        # Assert
+        assert jac.shape == (4, 4)
+        assert np.allclose(jac, numeric, atol=1e-8), "Jacobian is not correct"
+
+    def test_constant_species(self):
+        """Test that constant species are treated as inputs"""
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        doc.reactions = [doc.reactions[0]]
+        doc.filter_proteins(id="slac")[0].constant = True
+
+        layer = ThinLayerScipy(doc)
+
+        # Act
+        result, time = layer.integrate(
+            layer.enzmldoc, {"abts": 10.0, "slac": 0.1}, 0.0, 10.0, nsteps=5
+        )
+
+        # Assert
+        assert layer.system.constants == ["slac"]
+        assert result["slac"] == [0.1] * 5, "Constant species changed"
+        assert result["abts"][-1] < 10.0, "Substrate is not consumed"
+
+    def test_undefined_symbol(self):
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        doc.reactions[1].kinetic_law.equation = "k_unknown * slac"  # type: ignore
+
+        with pytest.raises(ValueError):
+            ThinLayerScipy(doc)
+
+    @staticmethod
+    def _extract_parameter(doc: v2.EnzymeMLDocument, symbol: str) -> v2.Parameter:
+        param = next(p for p in doc.parameters if p.symbol == symbol)
+        assert param is not None, f"{symbol} is not set"
+        return param
@@ -0,0 +1,77 @@
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.thinlayers import UncertaintyAnalysis
+
+pytest.importorskip("scipy")
+
+from pyenzyme.thinlayers.scipy_ode import ThinLayerScipy  # noqa: E402
+
+
+class TestUncertaintyAnalysis:
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_profile(self, n_workers):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        thinlayer = ThinLayerScipy(doc)
+        analysis = UncertaintyAnalysis(thinlayer, n_workers=n_workers)
+
+        # Act
+        profile = analysis.profile(["k_cat"], step=0.02)["k_cat"]
+        opt_doc = analysis.write()
+
+        # Assert
+        assert profile.identifiable, f"Profile is not closed: {profile.errors}"
+        assert profile.lower < profile.estimate < profile.upper
+        assert profile.estimate == pytest.approx(0.85, rel=0.1)
+
+        # The profile is close to quadratic, hence agrees with the covariance
+        k_cat = next(p for p in opt_doc.parameters if p.symbol == "k_cat")
+        covariance_stderr = thinlayer.result.stderr  # type: ignore
+        assert k_cat.stderr == pytest.approx(covariance_stderr["k_cat"], rel=0.25)
+        assert k_cat.value == pytest.approx(profile.estimate, rel=1e-4), (
+            "Thin layer was not refitted from the estimate"
+        )
+        assert all(param.fit for param in thinlayer.enzmldoc.parameters)
+
+        # The wrapped document is unchanged, hence still accepted for integration
+        assert thinlayer.enzmldoc == doc, "Wrapped document was modified"
+        thinlayer.integrate(
+            model=doc, initial_conditions={"abts": 100.0, "slac": 0.079}, t0=0, t1=10
+        )
+
+    @pytest.mark.parametrize("kind", ["nonparametric", "parametric"])
+    def test_bootstrap(self, kind):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        thinlayer = ThinLayerScipy(doc)
+        analysis = UncertaintyAnalysis(thinlayer, n_workers=2, seed=0)
+        original = [
+            data.data
+            for meas in thinlayer.enzmldoc.measurements
+            for data in meas.species_data
+        ]
+
+        # Act
+        result = analysis.bootstrap(n_samples=8, kind=kind)
+        opt_doc = analysis.write()
+
+        # Assert
+        assert len(result.samples) == 8, f"Fits failed: {result.errors}"
+
+        covariance_stderr = thinlayer.result.stderr  # type: ignore
+
+        for param in opt_doc.parameters:
+            assert (
+                result.lower[param.symbol] <= param.value <= result.upper[param.symbol]
+            ), f"{param.symbol} is not within its interval"
+            assert param.stderr == result.stderr[param.symbol]
+            assert param.stderr == pytest.approx(
+                covariance_stderr[param.symbol], rel=1.0
+            )
+
+        assert [
+            data.data
+            for meas in thinlayer.enzmldoc.measurements
+            for data in meas.species_data
+        ] == original, "Original data was not restored"
@@ -0,0 +1,70 @@
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.arrow import stream_to_parquet
+from pyenzyme.tabular import to_long_format
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestArrowExport:
+    def test_to_arrow(self, measurement_valid):
+        """Test that the Arrow table matches the long-format DataFrame"""
+
+        # Act
+        table = pe.to_arrow(measurement_valid)
+
+        # Assert
+        assert isinstance(table, pa.Table), f"Expected a Table. Got {type(table)}"
+        assert pa.types.is_dictionary(table.schema.field("measurement_id").type), (
+            "Expected a dictionary encoded measurement ID"
+        )
+        assert table.to_pandas().equals(to_long_format(measurement_valid)), (
+            "Arrow table and long-format DataFrame differ"
+        )
+
+    def test_to_parquet(self, measurement_valid, tmp_path):
+        """Test that the measurement data can be written to Parquet"""
+
+        # Arrange
+        path = tmp_path / "measurements.parquet"
+
+        # Act
+        pe.to_parquet(measurement_valid, path)
+        table = pq.read_table(path, filters=[("measurement_id", "=", "m1")])
+
+        # Assert
+        expected = sum(
+            len(s.data) for s in measurement_valid.measurements[1].species_data
+        )
+        assert table.num_rows == expected, (
+            f"Expected {expected} rows. Got {table.num_rows}"
+        )
+        assert set(table.column("measurement_id").to_pylist()) == {"m1"}, (
+            "Expected only rows of 'm1'"
+        )
+
+    def test_stream_to_parquet(self, tmp_path):
+        """Test that streamed measurements are written in row groups"""
+
+        # Arrange
+        path = tmp_path / "measurements.parquet"
+        measurements = pe.iter_csv(
+            "tests/fixtures/tabular/data.tsv",
+            data_unit="mmol / l",
+            time_unit="s",
+        )
+
+        # Act
+        n_measurements = stream_to_parquet(measurements, path, row_group_size=1)
+        parquet = pq.ParquetFile(path)
+
+        # Assert
+        assert n_measurements == 2, f"Expected 2 measurements. Got {n_measurements}"
+        assert parquet.metadata.num_row_groups == 2, (
+            f"Expected 2 row groups. Got {parquet.metadata.num_row_groups}"
+        )
+        assert parquet.metadata.num_rows == 44, (
+            f"Expected 44 rows. Got {parquet.metadata.num_rows}"
+        )
@@ -0,0 +1,117 @@
+import json
+
+import numpy as np
+
+import pyenzyme as pe
+from pyenzyme.columnar import (
+    ArrayEnzymeMLDocument,
+    ArrayMeasurementData,
+    as_array,
+    to_columnar,
+)
+from pyenzyme.tabular import to_pandas
+
+DOC_PATH = "tests/fixtures/tabular/measurement_valid.json"
+
+
+class TestColumnar:
+    def test_read_columnar(self):
+        """Test that documents can be read into NumPy-backed measurement data"""
+        # Act
+        doc = pe.read_enzymeml(DOC_PATH, columnar=True)
+
+        # Assert
+        assert isinstance(doc, ArrayEnzymeMLDocument), (
+            f"Expected an ArrayEnzymeMLDocument. Got {type(doc)}"
+        )
+
+        for meas in doc.measurements:
+            for meas_data in meas.species_data:
+                assert isinstance(meas_data.data, np.ndarray), (
+                    f"Expected an array. Got {type(meas_data.data)}"
+                )
+                assert meas_data.data.dtype == np.float64, (
+                    f"Expected float64. Got {meas_data.data.dtype}"
+                )
+
+    def test_same_json(self):
+        """Test that the columnar representation serializes to the same JSON"""
+        # Arrange
+        doc = pe.read_enzymeml(DOC_PATH)
+
+        # Act
+        columnar = to_columnar(doc)
+
+        # Assert
+        assert json.loads(columnar.model_dump_json()) == json.loads(
+            doc.model_dump_json()
+        ), "Columnar document serializes differently"
+        assert pe.write_enzymeml(columnar) == pe.write_enzymeml(doc), (
+            "Written documents differ"
+        )
+
+    def test_packed_buffers(self):
+        """Test that species data of a measurement shares one contiguous buffer"""
+        # Act
+        doc = to_columnar(pe.read_enzymeml(DOC_PATH))
+
+        # Assert
+        for meas in doc.measurements:
+            with_data = [m for m in meas.species_data if len(m.data) > 0]
+            bases = {id(m.data.base) for m in with_data}
+
+            assert len(bases) == 1, f"Expected one shared buffer. Got {len(bases)}"
+            assert all(m.data.flags["C_CONTIGUOUS"] for m in with_data), (
+                "Expected contiguous row views"
+            )
+            assert all(m.time is with_data[0].time for m in with_data), (
+                "Expected identical time arrays to be shared"
+            )
+
+    def test_zero_copy_assignment(self):
+        """Test that assigning a float64 array does not copy it"""
+        # Arrange
+        meas_data = ArrayMeasurementData(species_id="s0")
+        values = np.linspace(0.0, 1.0, 10)
+
+        # Act
+        meas_data.data = values
+
+        # Assert
+        assert meas_data.data is values, "Expected the assigned array to be kept"
+        assert as_array(meas_data.data) is values, "Expected as_array to not copy"
+
+    def test_add_to_species_data(self):
+        """Test that the add_to_* helpers create columnar objects"""
+        # Arrange
+        doc = ArrayEnzymeMLDocument(name="Test")
+
+        # Act
+        meas = doc.add_to_measurements(id="m0", name="m0")
+        meas_data = meas.add_to_species_data(
+            species_id="s0",
+            data=[1.0, 2.0],
+            time=[0.0, 1.0],
+        )
+
+        # Assert
+        assert doc.measurements[0] is meas, "Expected the measurement to be returned"
+        assert isinstance(meas_data, ArrayMeasurementData), (
+            f"Expected ArrayMeasurementData. Got {type(meas_data)}"
+        )
+        assert isinstance(meas_data.time, np.ndarray), (
+            f"Expected an array. Got {type(meas_data.time)}"
+        )
+
+    def test_to_pandas(self):
+        """Test that the pandas export is identical for both representations"""
+        # Arrange
+        doc = pe.read_enzymeml(DOC_PATH)
+
+        # Act
+        expected = to_pandas(doc)
+        df = to_pandas(to_columnar(doc))
+
+        # Assert
+        assert df is not None and expected is not None, "Expected a DataFrame"
+        assert df.equals(expected), "DataFrames differ"
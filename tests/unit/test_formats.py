@@ -0,0 +1,111 @@
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.versions import formats
+from pyenzyme.versions.formats import DocumentFormat, detect_format, register_format
+
+JSON_PATH = "tests/fixtures/tabular/measurement_valid.json"
+OMEX_PATH = "tests/fixtures/sbml/v1_example.omex"
+XML_PATH = "tests/fixtures/sbml/v1_sbml.xml"
+
+
+class TestFormats:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            (JSON_PATH, "json"),
+            (OMEX_PATH, "omex"),
+            (XML_PATH, "xml"),
+        ],
+    )
+    def test_detect_format(self, path, expected):
+        """Test that formats are detected from the leading bytes"""
+        # Act
+        document_format = detect_format(path)
+
+        # Assert
+        assert document_format.name == expected, (
+            f"Expected '{expected}'. Got '{document_format.name}'"
+        )
+
+    def test_detect_json_with_bom(self, tmp_path):
+        """Test that a byte order mark and whitespace do not hide JSON"""
+        # Arrange
+        path = tmp_path / "doc.json"
+        path.write_bytes(b'\xef\xbb\xbf\n  {"name": "Test"}')
+
+        # Act
+        document_format = detect_format(path)
+
+        # Assert
+        assert document_format.name == "json", (
+            f"Expected 'json'. Got '{document_format.name}'"
+        )
+
+    def test_json_skips_omex(self, monkeypatch):
+        """Test that reading JSON never attempts to parse an OMEX archive"""
+
+        # Arrange
+        def fail(*args, **kwargs):
+            raise AssertionError("The OMEX reader should not be called")
+
+        monkeypatch.setattr(formats, "read_sbml", fail)
+
+        # Act
+        doc = pe.read_enzymeml(JSON_PATH)
+
+        # Assert
+        assert len(doc.measurements) == 2, "Expected two measurements"
+
+    def test_unknown_format(self):
+        """Test that unsupported files raise a precise error"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Could not detect the format"):
+            pe.read_enzymeml("tests/fixtures/tabular/data.tsv")
+
+    def test_malformed_json(self, tmp_path):
+        """Test that truncated JSON raises a precise error"""
+        # Arrange
+        path = tmp_path / "doc.json"
+        path.write_text('{"name": "Test", "measurements": [')
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Malformed JSON"):
+            pe.read_enzymeml(path)
+
+    def test_invalid_document(self, tmp_path):
+        """Test that valid JSON with an invalid schema raises a precise error"""
+        # Arrange
+        path = tmp_path / "doc.json"
+        path.write_text('{"measurements": "not a list"}')
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="not a valid EnzymeML document"):
+            pe.read_enzymeml(path)
+
+    def test_plain_xml(self):
+        """Test that plain SBML files point to the OMEX format"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="OMEX archive"):
+            pe.read_enzymeml(XML_PATH)
+
+    def test_register_format(self, monkeypatch, tmp_path):
+        """Test that custom formats can be registered"""
+        # Arrange
+        monkeypatch.setattr(formats, "_FORMATS", list(formats._FORMATS))
+        path = tmp_path / "doc.custom"
+        path.write_bytes(b"CUSTOM")
+
+        register_format(
+            DocumentFormat(
+                name="custom",
+                sniff=lambda head: head.startswith(b"CUSTOM"),
+                read=lambda path, **kwargs: pe.EnzymeMLDocument(name="Custom"),
+            )
+        )
+
+        # Act
+        doc = pe.read_enzymeml(path)
+
+        # Assert
+        assert doc.name == "Custom", f"Expected the custom reader. Got {doc.name}"
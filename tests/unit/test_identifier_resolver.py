@@ -0,0 +1,64 @@
+import pytest
+
+from pyenzyme.fetcher.resolver import IdentifierResolver, Resolution
+
+
+class TestIdentifierResolver:
+    @pytest.mark.parametrize(
+        "identifier, expected",
+        [
+            ("CHEBI:15377", Resolution("chebi", "CHEBI:15377", "prefix")),
+            ("chebi:15377", Resolution("chebi", "CHEBI:15377", "prefix")),
+            ("PUBCHEM:702", Resolution("pubchem", "702", "prefix")),
+            ("CID:702", Resolution("pubchem", "702", "prefix")),
+            ("RHEA:22864", Resolution("rhea", "RHEA:22864", "prefix")),
+            ("uniprot:P07327", Resolution("uniprot", "P07327", "prefix")),
+            ("PDB:1a23", Resolution("pdb", "1a23", "prefix")),
+            ("P07327", Resolution("uniprot", "P07327", "pattern")),
+            ("A0A023GPI8", Resolution("uniprot", "A0A023GPI8", "pattern")),
+            ("1a23", Resolution("pdb", "1a23", "pattern")),
+            ("702", Resolution(None, "702", "fallback")),
+            ("ADH1_YEAST", Resolution(None, "ADH1_YEAST", "fallback")),
+            ("P0732", Resolution(None, "P0732", "fallback")),
+        ],
+    )
+    def test_classify(self, identifier, expected):
+        # Act
+        resolution = IdentifierResolver().classify(identifier)
+
+        # Assert
+        assert resolution == expected
+
+    def test_route(self):
+        # Arrange
+        resolver = IdentifierResolver()
+
+        # Act
+        resolver.route("P07327", ["uniprot", "pdb"])
+        resolver.route("1A23", ["uniprot", "pdb"])
+        resolver.route("CHEBI:15377", ["pubchem", "chebi"])
+        resolver.route("CHEBI:15377", ["uniprot", "pdb"])
+        resolver.route("702", ["pubchem", "chebi"])
+
+        # Assert
+        assert resolver.routed == {"pattern": 2, "prefix": 2, "fallback": 1}
+        assert resolver.calls_saved == {"pattern": 1, "prefix": 1}, (
+            "Identifiers outside of the chain count as saved calls"
+        )
+
+        resolver.reset()
+        assert not resolver.routed and not resolver.calls_saved
+
+    def test_route_pattern_outside_chain(self):
+        # Arrange
+        resolver = IdentifierResolver()
+
+        # Act
+        resolution = resolver.route("2244", ["pubchem", "chebi"])
+
+        # Assert
+        assert resolution == Resolution(None, "2244", "fallback"), (
+            "Four-digit CID is routed to PDB"
+        )
+        assert resolver.routed == {"fallback": 1}
+        assert not resolver.calls_saved
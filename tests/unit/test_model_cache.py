@@ -0,0 +1,182 @@
+import os
+import pickle
+
+import pyenzyme as pe
+from pyenzyme.thinlayers.cache import (
+    ModelCache,
+    default_cache_dir,
+    model_key,
+    model_values,
+)
+
+
+class TestModelCache:
+    def test_lru_eviction(self):
+        # Arrange
+        cache = ModelCache(maxsize=2)
+
+        # Act
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        # Assert
+        assert len(cache) == 2
+        assert "b" not in cache, "Least recently used entry was not evicted"
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_disabled_memory(self):
+        # Arrange
+        cache = ModelCache(maxsize=0)
+
+        # Act
+        cache.put("a", 1)
+
+        # Assert
+        assert cache.get("a") is None
+
+    def test_store(self, tmp_path):
+        # Arrange
+        cache = ModelCache(directory=tmp_path / "models")
+
+        # Act
+        path = cache.store("key", ".psc", "content")
+
+        # Assert
+        assert path == cache.path("key", ".psc")
+        assert path.read_text() == "content"
+        assert list(path.parent.iterdir()) == [path], "Temporary file was left behind"
+
+    def test_file_eviction(self, tmp_path):
+        # Arrange
+        cache = ModelCache(directory=tmp_path, maxfiles=2)
+
+        # Act
+        for i, key in enumerate(["a", "b", "c"]):
+            path = cache.store(key, ".psc", "content")
+            os.utime(path, (i, i))
+
+        cache.store("d", ".psc", "content")
+
+        # Assert
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["c.psc", "d.psc"]
+
+    def test_lookup(self, tmp_path):
+        # Arrange
+        cache = ModelCache(directory=tmp_path, maxfiles=2)
+
+        for i, key in enumerate(["a", "b"]):
+            os.utime(cache.store(key, ".psc", "content"), (i, i))
+
+        # Act
+        path = cache.lookup("a", ".psc")
+        cache.store("c", ".psc", "content")
+
+        # Assert
+        assert path == cache.path("a", ".psc")
+        assert cache.lookup("missing", ".psc") is None
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["a.psc", "c.psc"], (
+            "Recently read file was evicted"
+        )
+
+    def test_default_directory(self, tmp_path, monkeypatch):
+        # Act & Assert
+        monkeypatch.delenv("PYENZYME_CACHE_DIR", raising=False)
+        assert default_cache_dir() is None, "Shared cache writes to disk by default"
+
+        monkeypatch.setenv("PYENZYME_CACHE_DIR", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "models"
+
+    def test_store_without_directory(self):
+        # Arrange
+        cache = ModelCache()
+
+        # Act & Assert
+        assert cache.path("key", ".psc") is None
+        assert cache.lookup("key", ".psc") is None
+        assert cache.store("key", ".psc", "content") is None
+
+    def test_pickle(self, tmp_path):
+        # Arrange
+        cache = ModelCache(maxsize=4, directory=tmp_path)
+        cache.put("a", 1)
+
+        # Act
+        copy = pickle.loads(pickle.dumps(cache))
+
+        # Assert
+        assert copy.maxsize == 4
+        assert copy.maxfiles == 256
+        assert copy.directory == tmp_path
+        assert len(copy) == 0, "Copies should start with an empty memory cache"
+
+
+class TestModelKey:
+    def test_ignores_values(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        other = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+
+        other.parameters[0].stderr = 0.1
+        other.parameters[0].upper_bound = 1e6
+        other.parameters[0].value = 42.0
+        other.parameters[0].initial_value = 4.2
+        other.measurements = other.measurements[1:]
+
+        # Act & Assert
+        assert model_key(doc, "pysces") == model_key(other, "pysces"), (
+            "Parameter values or measurements are part of the key"
+        )
+
+    def test_changes_with_model(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        key = model_key(doc, "pysces")
+
+        # Act
+        changed_symbol = doc.model_copy(deep=True)
+        changed_symbol.parameters[0].symbol = "k_2"
+
+        changed_species = doc.model_copy(deep=True)
+        changed_species.small_molecules = changed_species.small_molecules[1:]
+
+        # Assert
+        assert model_key(doc, "copasi") != key, "Tags are not part of the key"
+        assert model_key(changed_symbol) != model_key(doc)
+        assert model_key(changed_species) != model_key(doc)
+
+
+class TestModelValues:
+    def test_model_values(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        doc.parameters[0].value = None
+
+        # Act
+        parameters, species = model_values(doc)
+
+        # Assert
+        assert parameters == {"k_cat": 0.01, "K_M": 20.0, "k_ie": 0.001}, (
+            "Initial value is not the fallback of a missing value"
+        )
+        assert species == {
+            data.species_id: data.initial for data in doc.measurements[0].species_data
+        }
+
+    def test_model_values_zero_and_unset(self):
+        # Arrange
+        doc = pe.read_enzymeml("tests/fixtures/modeling/enzmldoc_reaction.json")
+        doc.parameters[0].value = 0.0
+        doc.parameters[1].value = None
+        doc.parameters[1].initial_value = None
+
+        # Act
+        parameters, _ = model_values(doc)
+
+        # Assert
+        assert parameters["k_cat"] == 0.0, "Zero value is replaced by the initial value"
+        assert parameters == {"k_cat": 0.0, "K_M": None, "k_ie": 0.001}, (
+            "Parameters without a value are left out"
+        )
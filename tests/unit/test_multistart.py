@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+
+from pyenzyme.thinlayers.base import BaseThinLayer
+from pyenzyme.thinlayers.multistart import MultiStart
+from pyenzyme.versions.v2 import EnzymeMLDocument
+
+# Local minima of the mock objective and the start value separating their basins
+LOCAL_MINIMUM = 0.5
+GLOBAL_MINIMUM = 4.0
+BASIN_BOUNDARY = 1.0
+
+
+class TestMultiStart:
+    def test_finds_global_minimum(self):
+        # Arrange
+        multistart = MultiStart(
+            TwoBasinThinLayer(self._create_enzmldoc()),
+            n_starts=10,
+            n_agree=0,
+            n_workers=1,
+            seed=0,
+        )
+
+        # Act
+        best = multistart.run()
+        doc = multistart.write()
+
+        # Assert
+        assert len(multistart.results) == 10, "Not all starts were run"
+        assert best.values["x"] == GLOBAL_MINIMUM
+        assert best.objective == 0.0
+        assert doc.parameters[0].value == GLOBAL_MINIMUM, "Best fit is not written"
+
+    def test_early_stop(self):
+        # Arrange
+        multistart = MultiStart(
+            TwoBasinThinLayer(self._create_enzmldoc()),
+            n_starts=20,
+            n_agree=3,
+            n_workers=1,
+            seed=0,
+        )
+
+        # Act
+        best = multistart.run()
+
+        # Assert
+        assert len(multistart.results) < 20, "Sampling did not stop early"
+        assert best.values["x"] == GLOBAL_MINIMUM
+        assert (
+            sum(result.values["x"] == GLOBAL_MINIMUM for result in multistart.results)
+            == 3
+        )
+
+    def test_summary(self):
+        # Arrange
+        multistart = MultiStart(
+            TwoBasinThinLayer(self._create_enzmldoc()),
+            n_starts=8,
+            n_agree=0,
+            n_workers=1,
+            seed=1,
+        )
+
+        # Act
+        multistart.run()
+        summary = multistart.to_pandas()
+
+        # Assert
+        assert list(summary.columns) == ["start", "objective", "error", "x_start", "x"]
+        assert len(summary) == 8
+        assert summary["objective"].is_monotonic_increasing
+        assert (
+            (summary["x_start"] < BASIN_BOUNDARY)
+            .eq(summary["x"] == LOCAL_MINIMUM)
+            .all()
+        ), "Fits did not converge to the minimum of their basin"
+
+    def test_failed_fits(self):
+        # Arrange
+        thinlayer = TwoBasinThinLayer(self._create_enzmldoc())
+        thinlayer.fail = True
+        multistart = MultiStart(thinlayer, n_starts=4, n_workers=1)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            multistart.run()
+
+        assert all(not result.ok for result in multistart.results)
+        assert all("ValueError" in str(result.error) for result in multistart.results)
+
+    @pytest.mark.parametrize("scale", ["linear", "log"])
+    def test_latin_hypercube(self, scale):
+        # Arrange
+        enzmldoc = self._create_enzmldoc()
+        enzmldoc.parameters[0].lower_bound = 1e-3
+        multistart = MultiStart(
+            TwoBasinThinLayer(enzmldoc), n_starts=50, scale=scale, seed=0
+        )
+
+        # Act
+        starts = np.array([start["x"] for start in multistart.sample()])
+
+        # Assert
+        if scale == "log":
+            unit = np.log10(starts / 1e-3) / np.log10(5.0 / 1e-3)
+        else:
+            unit = (starts - 1e-3) / (5.0 - 1e-3)
+
+        assert np.array_equal(np.sort(np.floor(unit * 50)), np.arange(50)), (
+            "Each stratum must hold exactly one start"
+        )
+
+    def test_sobol(self):
+        # Arrange
+        pytest.importorskip("scipy")
+        multistart = MultiStart(
+            TwoBasinThinLayer(self._create_enzmldoc()),
+            n_starts=12,
+            sampler="sobol",
+            seed=0,
+        )
+
+        # Act
+        starts = [start["x"] for start in multistart.sample()]
+
+        # Assert
+        assert len(starts) == 12
+        assert all(0.0 <= x <= 5.0 for x in starts)
+
+    def test_missing_bounds(self):
+        # Arrange
+        enzmldoc = self._create_enzmldoc()
+        enzmldoc.parameters[0].upper_bound = None
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            MultiStart(TwoBasinThinLayer(enzmldoc))
+
+    def test_log_scale_requires_positive_bounds(self):
+        with pytest.raises(ValueError):
+            MultiStart(TwoBasinThinLayer(self._create_enzmldoc()), scale="log")
+
+    @staticmethod
+    def _create_enzmldoc() -> EnzymeMLDocument:
+        enzmldoc = EnzymeMLDocument(name="Test")
+        enzmldoc.add_to_parameters(
+            id="x",
+            name="x",
+            symbol="x",
+            initial_value=2.0,
+            lower_bound=0.0,
+            upper_bound=5.0,
+        )
+
+        return enzmldoc
+
+
+class TwoBasinThinLayer(BaseThinLayer):
+    """Mock thin layer whose fit converges to the minimum of the start's basin."""
+
+    def __init__(self, enzmldoc: EnzymeMLDocument):
+        super().__init__(enzmldoc)
+        self.x = None
+        self.fail = False
+
+    def integrate(self, model, initial_conditions, t0, t1, nsteps=100):
+        raise NotImplementedError
+
+    def optimize(self, **kwargs):
+        if self.fail:
+            raise ValueError("Fit failed")
+
+        start = self._start_values.get("x")
+        assert start is not None, "Start value is not set"
+
+        self.x = LOCAL_MINIMUM if start < BASIN_BOUNDARY else GLOBAL_MINIMUM
+
+    def write(self) -> EnzymeMLDocument:
+        enzmldoc = self.enzmldoc.model_copy(deep=True)
+        enzmldoc.parameters[0].value = self.x
+        return enzmldoc
+
+    def objective_value(self) -> float:
+        return 1.0 if self.x == LOCAL_MINIMUM else 0.0
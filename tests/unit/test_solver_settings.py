@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from pyenzyme.thinlayers.base import BaseThinLayer
+from pyenzyme.thinlayers.solver import SolverSettings
+
+
+class TestSolverSettings:
+    def test_defaults(self):
+        # Act
+        solver = SolverSettings()
+
+        # Assert
+        assert solver.method == "LSODA"
+        assert solver.max_step is None, "Step size is bounded by default"
+        assert not solver.dense_output
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            SolverSettings(rtol=0.0)
+
+        with pytest.raises(ValueError):
+            SolverSettings(atol=-1e-9)
+
+        with pytest.raises(ValueError):
+            SolverSettings(max_step=0.0)
+
+    def test_check(self):
+        # Arrange
+        solver = SolverSettings(method="CVODE", dense_output=True)
+
+        # Act & Assert
+        solver.check("Simulator", ["CVODE"], dense_output=True)
+
+        with pytest.raises(ValueError, match="does not support the method"):
+            solver.check("Simulator", ["LSODA", "Radau"], dense_output=True)
+
+        with pytest.raises(ValueError, match="dense output"):
+            solver.check("Simulator", ["CVODE"])
+
+    def test_integration_times(self):
+        # Act
+        linspace, linspace_start = BaseThinLayer._integration_times(0.0, 10.0, 11)
+        measured, measured_start = BaseThinLayer._integration_times(
+            0.0, 10.0, 11, times=[0.0, 2.5, 7.0]
+        )
+        later, later_start = BaseThinLayer._integration_times(
+            0.0, 10.0, 11, times=[2.5, 7.0]
+        )
+
+        # Assert
+        assert linspace.tolist() == np.linspace(0.0, 10.0, 11).tolist()
+        assert linspace_start == 0
+        assert measured.tolist() == [0.0, 2.5, 7.0]
+        assert measured_start == 0
+        assert later.tolist() == [0.0, 2.5, 7.0], "Integration does not start at t0"
+        assert later[later_start:].tolist() == [2.5, 7.0]
+
+    def test_invalid_integration_times(self):
+        with pytest.raises(ValueError):
+            BaseThinLayer._integration_times(0.0, 10.0, 11, times=[])
+
+        with pytest.raises(ValueError):
+            BaseThinLayer._integration_times(0.0, 10.0, 11, times=[0.0, 5.0, 5.0])
+
+        with pytest.raises(ValueError):
+            BaseThinLayer._integration_times(1.0, 10.0, 11, times=[0.0, 5.0])
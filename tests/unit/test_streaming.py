@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+import pyenzyme as pe
+from pyenzyme.streaming import LazyEnzymeMLDocument, iter_measurements
+
+pytest.importorskip("ijson")
+
+DOC_PATH = "tests/fixtures/tabular/measurement_valid.json"
+
+
+def _species_data(measurement):
+    return [
+        (meas_data.species_id, list(meas_data.data), list(meas_data.time))
+        for meas_data in measurement.species_data
+    ]
+
+
+class TestStreaming:
+    def test_iter_measurements(self):
+        """Test that streamed measurements match the eagerly read ones"""
+        # Arrange
+        expected = pe.read_enzymeml(DOC_PATH).measurements
+
+        # Act
+        measurements = list(iter_measurements(DOC_PATH))
+
+        # Assert
+        assert [m.id for m in measurements] == [m.id for m in expected], (
+            "Measurement IDs differ"
+        )
+        for streamed, eager in zip(measurements, expected):
+            assert _species_data(streamed) == _species_data(eager), (
+                f"Species data of measurement '{eager.id}' differs"
+            )
+
+    def test_iter_measurements_filter(self):
+        """Test that only the requested measurements are yielded"""
+        # Act
+        measurements = list(pe.iter_measurements(DOC_PATH, ids=["m1"]))
+
+        # Assert
+        assert [m.id for m in measurements] == ["m1"], (
+            f"Expected only 'm1'. Got {[m.id for m in measurements]}"
+        )
+
+    def test_iter_measurements_columnar(self):
+        """Test that streamed measurements can be NumPy-backed"""
+        # Act
+        measurement = next(iter_measurements(DOC_PATH, columnar=True))
+
+        # Assert
+        assert isinstance(measurement.species_data[0].data, np.ndarray), (
+            f"Expected an array. Got {type(measurement.species_data[0].data)}"
+        )
+
+    def test_lazy_document(self):
+        """Test that measurements of a lazy document load on first access"""
+        # Arrange
+        expected = pe.read_enzymeml(DOC_PATH)
+
+        # Act
+        doc = pe.read_enzymeml(DOC_PATH, lazy=True)
+
+        # Assert
+        assert isinstance(doc, LazyEnzymeMLDocument), (
+            f"Expected a LazyEnzymeMLDocument. Got {type(doc)}"
+        )
+        assert not doc.is_loaded, "Measurements should not be loaded yet"
+        assert doc.measurement_ids == ["m0", "m1"], (
+            f"Unexpected measurement IDs: {doc.measurement_ids}"
+        )
+        assert doc.name == expected.name, "Document fields differ"
+        assert len(doc.small_molecules) == len(expected.small_molecules), (
+            "Small molecules differ"
+        )
+
+        streamed = [m.id for m in doc.iter_measurements()]
+        assert streamed == ["m0", "m1"], f"Unexpected streamed IDs: {streamed}"
+        assert not doc.is_loaded, "Streaming should not load the measurements"
+
+        assert len(doc.measurements) == 2, "Expected two measurements"
+        assert doc.is_loaded, "Measurements should be loaded after access"
+
+    def test_lazy_document_serialization(self):
+        """Test that an unloaded lazy document writes all measurements"""
+        # Arrange
+        expected = pe.read_enzymeml(DOC_PATH)
+        doc = pe.read_enzymeml(DOC_PATH, lazy=True)
+
+        # Act
+        data = doc.model_dump()
+
+        # Assert
+        assert len(data["measurements"]) == len(expected.measurements), (
+            "Measurements are missing from the dump"
+        )
+        assert pe.to_pandas(doc).equals(pe.to_pandas(expected)), "DataFrames differ"
+
+    def test_lazy_document_assignment(self):
+        """Test that assigned measurements are not overwritten by the lazy load"""
+        # Arrange
+        doc = pe.read_enzymeml(DOC_PATH, lazy=True)
+
+        # Act
+        doc.measurements = []
+
+        # Assert
+        assert doc.is_loaded, "Assignment should mark measurements as loaded"
+        assert doc.measurements == [], "Assigned measurements were overwritten"
@@ -1,8 +1,15 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 import pyenzyme as pe
-from pyenzyme.tabular import _measurement_to_pandas, to_pandas
+from pyenzyme.tabular import (
+    _measurement_to_pandas,
+    split_by_id,
+    to_long_format,
+    to_pandas,
+)
+from pyenzyme.tools import to_dict_wo_json_ld
 
 
 class TestTabularExport:
@@ -56,6 +63,59 @@ class TestTabularExport:
                     f"Expected column for {species}"
                 )
 
+    def test_categorical_id(self, measurement_valid):
+        """Test that the measurement ID column is stored as a categorical"""
+
+        # Act
+        df = to_pandas(measurement_valid)
+
+        # Assert
+        assert isinstance(df, pd.DataFrame), f"Expected a DataFrame. Got {type(df)}"
+        assert isinstance(df["id"].dtype, pd.CategoricalDtype), (
+            f"Expected a categorical. Got {df['id'].dtype}"
+        )
+        assert list(df["id"].cat.categories) == ["m0", "m1"], (
+            f"Unexpected categories: {list(df['id'].cat.categories)}"
+        )
+
+    def test_missing_species(self):
+        """Test that species missing in a measurement are filled with NaN"""
+
+        # Arrange
+        doc = pe.EnzymeMLDocument(name="Test")
+        first = doc.add_to_measurements(id="m0", name="m0")
+        first.add_to_species_data(species_id="s0", data=[1.0, 2.0], time=[0.0, 1.0])
+        second = doc.add_to_measurements(id="m1", name="m1")
+        second.add_to_species_data(species_id="s1", data=[3.0], time=[0.0])
+
+        # Act
+        df = to_pandas(doc)
+
+        # Assert
+        assert isinstance(df, pd.DataFrame), f"Expected a DataFrame. Got {type(df)}"
+        assert list(df.columns) == ["time", "s0", "id", "s1"], (
+            f"Unexpected columns: {list(df.columns)}"
+        )
+        assert df["s0"].isna().tolist() == [False, False, True], (
+            "Expected NaN for the missing species"
+        )
+        assert df["s1"].isna().tolist() == [True, True, False], (
+            "Expected NaN for the missing species"
+        )
+
+    def test_inconsistent_time(self):
+        """Test that differing time arrays within a measurement raise a ValueError"""
+
+        # Arrange
+        doc = pe.EnzymeMLDocument(name="Test")
+        meas = doc.add_to_measurements(id="m0", name="m0")
+        meas.add_to_species_data(species_id="s0", data=[1.0, 2.0], time=[0.0, 1.0])
+        meas.add_to_species_data(species_id="s1", data=[1.0, 2.0], time=[0.0, 2.0])
+
+        # Act
+        with pytest.raises(ValueError, match="time arrays are inconsistent"):
+            to_pandas(doc)
+
 
 class TestTabularImport:
     def test_csv_import(self):
@@ -213,3 +273,184 @@ class TestTabularImport:
                 data_unit="mmol / l",
                 time_unit="s",
             )
+
+    def test_split_by_id(self):
+        """Test that interleaved IDs are split in order of first appearance"""
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "id": ["m2", "m1", "m2", None, "m1"],
+                "time": [0.0, 0.0, 1.0, 2.0, 1.0],
+                "s1": [1.0, 2.0, 3.0, 4.0, 5.0],
+            }
+        )
+
+        # Act
+        splits = split_by_id(df)
+
+        # Assert
+        assert list(splits) == ["m2", "m1"], f"Unexpected IDs: {list(splits)}"
+        assert list(splits["m2"].columns) == ["time", "s1"]
+        assert splits["m2"]["s1"].tolist() == [1.0, 3.0]
+        assert splits["m1"]["s1"].tolist() == [2.0, 5.0]
+        assert splits["m1"].index.tolist() == [0, 1]
+        assert "id" in split_by_id(df, drop=False)["m1"].columns
+
+    def test_from_dataframe_interleaved(self):
+        """Test that measurements are assembled from interleaved rows"""
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "id": ["m1", "m2", "m1", "m2"],
+                "time": [0.0, 0.0, 1.0, 1.0],
+                "s1": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+
+        # Act
+        measurements = pe.from_dataframe(df, data_unit="mmol / l", time_unit="s")
+
+        # Assert
+        assert [m.id for m in measurements] == ["m1", "m2"]
+        assert measurements[1].species_data[0].data == [2.0, 4.0]
+        assert measurements[1].species_data[0].time == [0.0, 1.0]
+
+
+class TestChunkedImport:
+    def test_iter_csv(self):
+        """Test that chunked CSV import yields the same measurements as read_csv"""
+        # Arrange
+        path = "tests/fixtures/tabular/data.tsv"
+        expected = pe.from_csv(path, data_unit="mmol / l", time_unit="s")
+
+        # Act
+        measurements = list(
+            pe.iter_csv(path, data_unit="mmol / l", time_unit="s", chunksize=3)
+        )
+
+        # Assert
+        assert [m.id for m in measurements] == [m.id for m in expected], (
+            "Measurement IDs differ"
+        )
+        for chunked, eager in zip(measurements, expected):
+            assert to_dict_wo_json_ld(chunked) == to_dict_wo_json_ld(eager), (
+                f"Measurement '{eager.id}' differs"
+            )
+
+    def test_iter_excel(self):
+        """Test that chunked Excel import yields NumPy-backed measurements"""
+        pytest.importorskip("openpyxl")
+
+        # Arrange
+        path = "tests/fixtures/tabular/data.xlsx"
+        expected = pe.from_excel(path, data_unit="mmol / l", time_unit="s")
+
+        # Act
+        measurements = list(
+            pe.iter_excel(
+                path,
+                data_unit="mmol / l",
+                time_unit="s",
+                chunksize=4,
+                columnar=True,
+            )
+        )
+
+        # Assert
+        assert [m.id for m in measurements] == [m.id for m in expected], (
+            "Measurement IDs differ"
+        )
+        assert isinstance(measurements[0].species_data[0].data, np.ndarray), (
+            f"Expected an array. Got {type(measurements[0].species_data[0].data)}"
+        )
+
+    def test_non_contiguous_ids(self, tmp_path):
+        """Test that interleaved measurement IDs raise a ValueError"""
+        # Arrange
+        path = tmp_path / "data.tsv"
+        path.write_text("time\ts0\tid\n0\t1\tm0\n1\t2\tm1\n2\t3\tm0\n")
+
+        # Act
+        with pytest.raises(ValueError):
+            list(pe.iter_csv(path, data_unit="mmol / l", time_unit="s", chunksize=1))
+
+    def test_max_bytes(self):
+        """Test that measurements exceeding the memory limit raise a ValueError"""
+        # Arrange
+        path = "tests/fixtures/tabular/data.tsv"
+        df = pd.read_csv(path, sep="\t")
+        n_bytes = df.memory_usage(index=False, deep=True).sum()
+
+        # Act
+        measurements = list(
+            pe.iter_csv(
+                path,
+                data_unit="mmol / l",
+                time_unit="s",
+                chunksize=2,
+                max_bytes=int(n_bytes),
+            )
+        )
+
+        # Assert
+        assert len(measurements) == df["id"].nunique()
+
+        with pytest.raises(ValueError):
+            list(pe.iter_csv(path, data_unit="mmol / l", time_unit="s", max_bytes=64))
+
+
+class TestLongFormatExport:
+    def test_long_format(self, measurement_valid):
+        """Test that every data point becomes a row of the long format"""
+
+        # Act
+        df = to_long_format(measurement_valid)
+
+        # Assert
+        n_points = sum(
+            len(species.data)
+            for meas in measurement_valid.measurements
+            for species in meas.species_data
+        )
+
+        assert list(df.columns) == [
+            "measurement_id",
+            "species_id",
+            "time",
+            "value",
+            "data_type",
+            "unit",
+            "time_unit",
+        ], f"Unexpected columns: {list(df.columns)}"
+        assert len(df) == n_points, f"Expected {n_points} rows. Got {len(df)}"
+
+        for meas in measurement_valid.measurements:
+            for species in meas.species_data:
+                df_sub = df[
+                    (df["measurement_id"] == meas.id)
+                    & (df["species_id"] == species.species_id)
+                ]
+                assert df_sub["value"].tolist() == species.data, (
+                    f"Values of {species.species_id} in {meas.id} differ"
+                )
+                assert df_sub["time"].tolist() == species.time, (
+                    f"Times of {species.species_id} in {meas.id} differ"
+                )
+
+    def test_different_time_grids(self):
+        """Test that species with different time grids can be exported"""
+
+        # Arrange
+        doc = pe.EnzymeMLDocument(name="Test")
+        meas = doc.add_to_measurements(id="m0", name="m0")
+        meas.add_to_species_data(species_id="s0", data=[1.0, 2.0], time=[0.0, 1.0])
+        meas.add_to_species_data(species_id="s1", data=[3.0], time=[0.5])
+
+        # Act
+        df = to_long_format(doc)
+
+        # Assert
+        assert df["time"].tolist() == [0.0, 1.0, 0.5], (
+            f"Unexpected time values: {df['time'].tolist()}"
+        )
+        assert df["unit"].isna().all(), "Expected missing units to be NaN"
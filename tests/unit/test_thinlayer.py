@@ -1,3 +1,5 @@
+import pytest
+
 from pyenzyme.thinlayers.base import BaseThinLayer
 from pyenzyme.versions.v2 import EnzymeMLDocument, Equation, EquationType
 
@@ -295,6 +297,63 @@ class TestThinLayer:
             f"but it was removed. Remaining species: {[s.id for s in tl_enzmldoc.small_molecules]}"
         )
 
+    def test_integrate_batch_default(self):
+        """Test that thin layers without batching integrate each condition"""
+        thinlayer = MockThinLayer(self._create_enzmldoc())
+
+        results = thinlayer.integrate_batch(
+            thinlayer.enzmldoc, [{"S1": 1.0}, {"S1": 2.0}], [[0.0, 1.0], [2.0, 3.0]]
+        )
+
+        assert results == [
+            ({"S1": [1.0, 1.0]}, [0.0, 1.0]),
+            ({"S1": [2.0, 2.0]}, [2.0, 3.0]),
+        ]
+
+        with pytest.raises(ValueError):
+            thinlayer.integrate_batch(thinlayer.enzmldoc, [{}], [])
+
+    def test_set_start_values(self):
+        """Test that start values are kept by the thin layer, not in the document"""
+        enzmldoc = self._create_enzmldoc()
+        enzmldoc.add_to_parameters(id="k", name="k", symbol="k", value=1.0)
+        thinlayer = MockThinLayer(enzmldoc)
+
+        thinlayer.set_start_values({"k": 2.0})
+
+        assert thinlayer._start_values == {"k": 2.0}, "Start value was not set"
+        assert thinlayer.enzmldoc == enzmldoc, "Wrapped document was modified"
+
+        with pytest.raises(ValueError):
+            thinlayer.set_start_values({"unknown": 1.0})
+
+        with pytest.raises(NotImplementedError):
+            thinlayer.objective_value()
+
+    def test_set_measurement_data(self):
+        """Test that new observations replace the data of the wrapped document"""
+        enzmldoc = self._create_enzmldoc()
+        thinlayer = MockThinLayer(enzmldoc, exclude_unmodeled_species=False)
+        n_time = len(MOCK_DATA["time"])
+        before = thinlayer.df
+
+        thinlayer.set_measurement_data({"M2": {"Product": [42.0] * n_time}})
+
+        species_data = thinlayer.enzmldoc.measurements[1].species_data[1]
+        assert species_data.data == [42.0] * n_time, "Data was not replaced"
+        assert species_data.time == MOCK_DATA["time"], "Time points were changed"
+        assert thinlayer.df is not before, "Cached DataFrame was not rebuilt"
+        assert (thinlayer.df[thinlayer.df["id"] == "M2"]["Product"] == 42.0).all()
+        assert enzmldoc.measurements[1].species_data[1].data == MOCK_DATA["data"], (
+            "Original document was modified"
+        )
+
+        with pytest.raises(ValueError):
+            thinlayer.set_measurement_data({"M2": {"Product": [1.0]}})
+
+        with pytest.raises(ValueError):
+            thinlayer.set_measurement_data({"unknown": {"Product": [1.0]}})
+
     def _create_enzmldoc(self) -> EnzymeMLDocument:
         """
         Create a test EnzymeML document with various measurement scenarios.
@@ -347,9 +406,15 @@ class MockThinLayer(BaseThinLayer):
     a full thin layer implementation.
     """
 
-    def integrate(self, *args, **kwargs):
-        """Mock integration method that does nothing."""
-        pass
+    def integrate(self, model, initial_conditions, t0, t1, nsteps=100, times=None):
+        """Mock integration method that keeps the initial conditions constant."""
+        times, _ = self._integration_times(t0, t1, nsteps, times)
+        species = {
+            species_id: [value] * len(times)
+            for species_id, value in initial_conditions.items()
+        }
+
+        return species, times.tolist()
 
     def optimize(self, *args, **kwargs):
         """Mock optimization method that does nothing."""
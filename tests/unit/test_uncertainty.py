@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyenzyme.thinlayers.base import BaseThinLayer
+from pyenzyme.thinlayers.uncertainty import UncertaintyAnalysis
+from pyenzyme.versions.v2 import EnzymeMLDocument
+
+# Objective of the mock: MINIMUM + CURVATURE * (x - OPTIMUM)^2, y follows x
+MINIMUM = 10.0
+CURVATURE = 40.0
+OPTIMUM = 2.0
+N_OBSERVATIONS = 50
+
+
+class TestUncertaintyAnalysis:
+    def test_profile(self):
+        # Arrange
+        analysis = UncertaintyAnalysis(
+            QuadraticThinLayer(self._create_enzmldoc()), n_workers=1
+        )
+
+        # Act
+        profiles = analysis.profile(step=0.05)
+
+        # Assert
+        expected = self._expected_half_width(analysis.threshold)
+        profile = profiles["x"]
+
+        assert profile.identifiable
+        assert profile.lower == pytest.approx(OPTIMUM - expected, rel=1e-3)
+        assert profile.upper == pytest.approx(OPTIMUM + expected, rel=1e-3)
+        assert profile.values == sorted(profile.values)
+        assert profile.ratio[profile.values.index(OPTIMUM)] == 0.0
+        assert profile.ratio[0] > analysis.threshold
+        assert profile.ratio[-1] > analysis.threshold
+        assert np.diff(profile.ratio[1:-1]).max() <= analysis.threshold / 4 + 1e-9, (
+            "Steps were not refined"
+        )
+
+        # y only follows x, hence its profile is flat
+        assert not profiles["y"].identifiable
+
+    def test_profile_restores_thinlayer(self):
+        # Arrange
+        thinlayer = QuadraticThinLayer(self._create_enzmldoc())
+        analysis = UncertaintyAnalysis(thinlayer, n_workers=1)
+
+        # Act
+        analysis.profile(["x"])
+
+        # Assert
+        assert all(param.fit for param in thinlayer.enzmldoc.parameters), (
+            "Profiled parameter is still fixed"
+        )
+        assert thinlayer.x == OPTIMUM, "Thin layer was not refitted"
+        assert analysis.estimate == {"x": OPTIMUM, "y": OPTIMUM}
+
+    def test_profile_bound(self):
+        # Arrange
+        enzmldoc = self._create_enzmldoc()
+        enzmldoc.parameters[0].lower_bound = OPTIMUM * 0.99
+        analysis = UncertaintyAnalysis(QuadraticThinLayer(enzmldoc), n_workers=1)
+
+        # Act
+        profile = analysis.profile(["x"])["x"]
+
+        # Assert
+        assert profile.lower == -np.inf, "Interval does not end at the bound"
+        assert profile.values[0] == OPTIMUM * 0.99
+        assert np.isfinite(profile.upper)
+        assert not profile.identifiable
+
+    def test_write(self):
+        # Arrange
+        analysis = UncertaintyAnalysis(
+            QuadraticThinLayer(self._create_enzmldoc()), n_workers=1
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            analysis.write()
+
+        analysis.profile(["x"])
+        doc = analysis.write()
+
+        expected = self._expected_half_width(analysis.threshold)
+        x, y = doc.parameters
+
+        assert x.value == OPTIMUM
+        assert x.stderr == pytest.approx(
+            expected / np.sqrt(analysis.threshold), rel=1e-3
+        )
+        assert y.stderr is None, "Unprofiled parameter got a standard error"
+
+        summary = analysis.to_pandas()
+        assert list(summary["symbol"]) == ["x", "y"]
+        assert summary["bootstrap_lower"].isna().all()
+
+    def test_invalid_arguments(self):
+        # Arrange
+        thinlayer = QuadraticThinLayer(self._create_enzmldoc())
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UncertaintyAnalysis(thinlayer, level=1.5)
+
+        with pytest.raises(ValueError):
+            UncertaintyAnalysis(thinlayer).profile(["unknown"])
+
+        with pytest.raises(ValueError):
+            UncertaintyAnalysis(thinlayer).bootstrap(kind="unknown")  # type: ignore
+
+    @staticmethod
+    def _expected_half_width(threshold: float) -> float:
+        """Distance from the optimum at which the likelihood ratio hits the threshold."""
+        return np.sqrt(MINIMUM * np.expm1(threshold / N_OBSERVATIONS) / CURVATURE)
+
+    @staticmethod
+    def _create_enzmldoc() -> EnzymeMLDocument:
+        enzmldoc = EnzymeMLDocument(name="Test")
+
+        for symbol in ("x", "y"):
+            enzmldoc.add_to_parameters(
+                id=symbol,
+                name=symbol,
+                symbol=symbol,
+                initial_value=1.0,
+                lower_bound=0.0,
+                upper_bound=10.0,
+            )
+
+        return enzmldoc
+
+
+class QuadraticThinLayer(BaseThinLayer):
+    """Mock thin layer whose fit minimizes a quadratic objective exactly."""
+
+    def __init__(self, enzmldoc: EnzymeMLDocument):
+        super().__init__(enzmldoc)
+        self.x = None
+        self.y = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "id": ["m0"] * N_OBSERVATIONS,
+                "time": np.arange(N_OBSERVATIONS, dtype=float),
+                "s": np.ones(N_OBSERVATIONS),
+            }
+        )
+
+    def integrate(self, model, initial_conditions, t0, t1, nsteps=100):
+        raise NotImplementedError
+
+    def optimize(self, **kwargs):
+        x, y = self.enzmldoc.parameters
+
+        self.x = OPTIMUM if x.fit else self._start_values[x.symbol]
+        self.y = self.x if y.fit else self._start_values[y.symbol]
+
+    def write(self) -> EnzymeMLDocument:
+        enzmldoc = self.enzmldoc.model_copy(deep=True)
+        enzmldoc.parameters[0].value = self.x
+        enzmldoc.parameters[1].value = self.y
+        return enzmldoc
+
+    def objective_value(self) -> float:
+        return MINIMUM + CURVATURE * (self.x - OPTIMUM) ** 2  # type: ignore